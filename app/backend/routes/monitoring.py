@@ -746,6 +746,38 @@ async def get_trading_guardrails():
         }
 
 
+@router.get("/data-sources")
+async def get_data_source_health():
+    """
+    Get data source routing health.
+    
+    Returns rolling latency and error-rate statistics and the circuit
+    breaker state per source and data type, plus the current routing order.
+    """
+    try:
+        from src.tools.data_providers import get_data_provider
+        
+        provider = get_data_provider()
+        
+        return {
+            "success": True,
+            "sources": provider.get_source_stats(),
+            "routing": {
+                data_type: [s.value for s in provider.get_routing_order(data_type)]
+                for data_type in ("prices", "financials", "news")
+            },
+        }
+        
+    except Exception as e:
+        logger.error(f"Failed to get data source health: {e}")
+        return {
+            "success": False,
+            "error": str(e),
+            "sources": {},
+            "routing": {},
+        }
+
+
 @router.get("/data-sources/fmp")
 async def get_fmp_module_status():
     """
@@ -952,6 +984,23 @@ async def get_execution_quality(
         raise HTTPException(500, str(e))
 
 
+@router.get("/metrics/llm-cache")
+async def get_llm_cache_metrics():
+    """Get LLM response cache hit rates (overall and per agent) since startup."""
+    try:
+        from src.monitoring import get_event_logger
+        from src.llm.response_cache import llm_cache_enabled
+        
+        return {
+            "enabled": llm_cache_enabled(),
+            **get_event_logger().get_llm_cache_stats(),
+        }
+        
+    except Exception as e:
+        logger.error(f"Failed to get LLM cache metrics: {e}")
+        raise HTTPException(500, str(e))
+
+
 @router.get("/metrics/freshness", response_model=DataFreshnessInfo)
 async def get_data_freshness():
     """Get data freshness timestamps for all key metrics."""
@@ -8,13 +8,9 @@ from src.graph.state import AgentState, show_agent_reasoning
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.messages import HumanMessage
 
-from src.tools.api import (
-    get_financial_metrics,
-    get_market_cap,
-    search_line_items,
-)
+from src.data.run_context import get_data_context
 from src.utils.api_key import get_api_key_from_state
-from src.utils.llm import call_llm
+from src.utils.llm import call_llm, call_llm_per_ticker
 from src.utils.progress import progress
 
 
@@ -37,6 +33,7 @@ def aswath_damodaran_agent(state: AgentState, agent_id: str = "aswath_damodaran_
     end_date  = data["end_date"]
     tickers   = data["tickers"]
     api_key  = get_api_key_from_state(state, "FINANCIAL_DATASETS_API_KEY")
+    data_context = get_data_context(state)
 
     analysis_data: dict[str, dict] = {}
     damodaran_signals: dict[str, dict] = {}
@@ -44,10 +41,10 @@ def aswath_damodaran_agent(state: AgentState, agent_id: str = "aswath_damodaran_
     for ticker in tickers:
         # ─── Fetch core data ────────────────────────────────────────────────────
         progress.update_status(agent_id, ticker, "Fetching financial metrics")
-        metrics = get_financial_metrics(ticker, end_date, period="ttm", limit=5, api_key=api_key)
+        metrics = data_context.get_financial_metrics(ticker, end_date, period="ttm", limit=5, api_key=api_key)
 
         progress.update_status(agent_id, ticker, "Fetching financial line items")
-        line_items = search_line_items(
+        line_items = data_context.search_line_items(
             ticker,
             [
                 "free_cash_flow",
@@ -64,7 +61,7 @@ def aswath_damodaran_agent(state: AgentState, agent_id: str = "aswath_damodaran_
         )
 
         progress.update_status(agent_id, ticker, "Getting market cap")
-        market_cap = get_market_cap(ticker, end_date, api_key=api_key)
+        market_cap = data_context.get_market_cap(ticker, end_date, api_key=api_key)
 
         # ─── Analyses ───────────────────────────────────────────────────────────
         progress.update_status(agent_id, ticker, "Analyzing growth and reinvestment")
@@ -112,15 +109,19 @@ def aswath_damodaran_agent(state: AgentState, agent_id: str = "aswath_damodaran_
             "market_cap": market_cap,
         }
 
-        # ─── LLM: craft Damodaran-style narrative ──────────────────────────────
-        progress.update_status(agent_id, ticker, "Generating Damodaran analysis")
-        damodaran_output = generate_damodaran_output(
+    # ─── LLM: craft Damodaran-style narrative ──────────────────────────────
+    outputs = call_llm_per_ticker(
+        tickers,
+        lambda ticker: generate_damodaran_output(
             ticker=ticker,
             analysis_data=analysis_data,
             state=state,
             agent_id=agent_id,
-        )
-
+        ),
+        agent_name=agent_id,
+        status="Generating Damodaran analysis",
+    )
+    for ticker, damodaran_output in outputs.items():
         damodaran_signals[ticker] = damodaran_output.model_dump()
 
         progress.update_status(agent_id, ticker, "Done", analysis=damodaran_output.reasoning)
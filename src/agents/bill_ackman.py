@@ -1,12 +1,12 @@
 from src.graph.state import AgentState, show_agent_reasoning
-from src.tools.api import get_financial_metrics, get_market_cap, search_line_items
+from src.data.run_context import get_data_context
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.messages import HumanMessage
 from pydantic import BaseModel
 import json
 from typing_extensions import Literal
 from src.utils.progress import progress
-from src.utils.llm import call_llm
+from src.utils.llm import call_llm, call_llm_per_ticker
 from src.utils.api_key import get_api_key_from_state
 
 
@@ -26,16 +26,17 @@ def bill_ackman_agent(state: AgentState, agent_id: str = "bill_ackman_agent"):
     end_date = data["end_date"]
     tickers = data["tickers"]
     api_key = get_api_key_from_state(state, "FINANCIAL_DATASETS_API_KEY")
+    data_context = get_data_context(state)
     analysis_data = {}
     ackman_analysis = {}
     
     for ticker in tickers:
         progress.update_status(agent_id, ticker, "Fetching financial metrics")
-        metrics = get_financial_metrics(ticker, end_date, period="annual", limit=5, api_key=api_key)
+        metrics = data_context.get_financial_metrics(ticker, end_date, period="annual", limit=5, api_key=api_key)
         
         progress.update_status(agent_id, ticker, "Gathering financial line items")
         # Request multiple periods of data (annual or TTM) for a more robust long-term view.
-        financial_line_items = search_line_items(
+        financial_line_items = data_context.search_line_items(
             ticker,
             [
                 "revenue",
@@ -56,7 +57,7 @@ def bill_ackman_agent(state: AgentState, agent_id: str = "bill_ackman_agent"):
         )
         
         progress.update_status(agent_id, ticker, "Getting market cap")
-        market_cap = get_market_cap(ticker, end_date, api_key=api_key)
+        market_cap = data_context.get_market_cap(ticker, end_date, api_key=api_key)
         
         progress.update_status(agent_id, ticker, "Analyzing business quality")
         quality_analysis = analyze_business_quality(metrics, financial_line_items)
@@ -96,21 +97,25 @@ def bill_ackman_agent(state: AgentState, agent_id: str = "bill_ackman_agent"):
             "activism_analysis": activism_analysis,
             "valuation_analysis": valuation_analysis
         }
-        
-        progress.update_status(agent_id, ticker, "Generating Bill Ackman analysis")
-        ackman_output = generate_ackman_output(
-            ticker=ticker, 
+
+    outputs = call_llm_per_ticker(
+        tickers,
+        lambda ticker: generate_ackman_output(
+            ticker=ticker,
             analysis_data=analysis_data,
             state=state,
             agent_id=agent_id,
-        )
-        
+        ),
+        agent_name=agent_id,
+        status="Generating Bill Ackman analysis",
+    )
+    for ticker, ackman_output in outputs.items():
         ackman_analysis[ticker] = {
             "signal": ackman_output.signal,
             "confidence": ackman_output.confidence,
             "reasoning": ackman_output.reasoning
         }
-        
+
         progress.update_status(agent_id, ticker, "Done", analysis=ackman_output.reasoning)
     
     # Wrap results in a single message for the chain
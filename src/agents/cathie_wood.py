@@ -1,12 +1,12 @@
 from src.graph.state import AgentState, show_agent_reasoning
-from src.tools.api import get_financial_metrics, get_market_cap, search_line_items
+from src.data.run_context import get_data_context
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.messages import HumanMessage
 from pydantic import BaseModel
 import json
 from typing_extensions import Literal
 from src.utils.progress import progress
-from src.utils.llm import call_llm
+from src.utils.llm import call_llm, call_llm_per_ticker
 from src.utils.api_key import get_api_key_from_state
 
 
@@ -28,16 +28,17 @@ def cathie_wood_agent(state: AgentState, agent_id: str = "cathie_wood_agent"):
     end_date = data["end_date"]
     tickers = data["tickers"]
     api_key = get_api_key_from_state(state, "FINANCIAL_DATASETS_API_KEY")
+    data_context = get_data_context(state)
     analysis_data = {}
     cw_analysis = {}
 
     for ticker in tickers:
         progress.update_status(agent_id, ticker, "Fetching financial metrics")
-        metrics = get_financial_metrics(ticker, end_date, period="annual", limit=5, api_key=api_key)
+        metrics = data_context.get_financial_metrics(ticker, end_date, period="annual", limit=5, api_key=api_key)
 
         progress.update_status(agent_id, ticker, "Gathering financial line items")
         # Request multiple periods of data (annual or TTM) for a more robust view.
-        financial_line_items = search_line_items(
+        financial_line_items = data_context.search_line_items(
             ticker,
             [
                 "revenue",
@@ -60,7 +61,7 @@ def cathie_wood_agent(state: AgentState, agent_id: str = "cathie_wood_agent"):
         )
 
         progress.update_status(agent_id, ticker, "Getting market cap")
-        market_cap = get_market_cap(ticker, end_date, api_key=api_key)
+        market_cap = data_context.get_market_cap(ticker, end_date, api_key=api_key)
 
         progress.update_status(agent_id, ticker, "Analyzing disruptive potential")
         disruptive_analysis = analyze_disruptive_potential(metrics, financial_line_items)
@@ -84,14 +85,18 @@ def cathie_wood_agent(state: AgentState, agent_id: str = "cathie_wood_agent"):
 
         analysis_data[ticker] = {"signal": signal, "score": total_score, "max_score": max_possible_score, "disruptive_analysis": disruptive_analysis, "innovation_analysis": innovation_analysis, "valuation_analysis": valuation_analysis}
 
-        progress.update_status(agent_id, ticker, "Generating Cathie Wood analysis")
-        cw_output = generate_cathie_wood_output(
+    outputs = call_llm_per_ticker(
+        tickers,
+        lambda ticker: generate_cathie_wood_output(
             ticker=ticker,
             analysis_data=analysis_data,
             state=state,
             agent_id=agent_id,
-        )
-
+        ),
+        agent_name=agent_id,
+        status="Generating Cathie Wood analysis",
+    )
+    for ticker, cw_output in outputs.items():
         cw_analysis[ticker] = {"signal": cw_output.signal, "confidence": cw_output.confidence, "reasoning": cw_output.reasoning}
 
         progress.update_status(agent_id, ticker, "Done", analysis=cw_output.reasoning)
@@ -1,12 +1,12 @@
 from src.graph.state import AgentState, show_agent_reasoning
-from src.tools.api import get_financial_metrics, get_market_cap, search_line_items, get_insider_trades, get_company_news
+from src.data.run_context import get_data_context
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.messages import HumanMessage
 from pydantic import BaseModel
 import json
 from typing_extensions import Literal
 from src.utils.progress import progress
-from src.utils.llm import call_llm
+from src.utils.llm import call_llm, call_llm_per_ticker
 from src.utils.api_key import get_api_key_from_state
 
 class CharlieMungerSignal(BaseModel):
@@ -24,15 +24,16 @@ def charlie_munger_agent(state: AgentState, agent_id: str = "charlie_munger_agen
     end_date = data["end_date"]
     tickers = data["tickers"]
     api_key = get_api_key_from_state(state, "FINANCIAL_DATASETS_API_KEY")
+    data_context = get_data_context(state)
     analysis_data = {}
     munger_analysis = {}
     
     for ticker in tickers:
         progress.update_status(agent_id, ticker, "Fetching financial metrics")
-        metrics = get_financial_metrics(ticker, end_date, period="annual", limit=10, api_key=api_key)  # Munger looks at longer periods
+        metrics = data_context.get_financial_metrics(ticker, end_date, period="annual", limit=10, api_key=api_key)  # Munger looks at longer periods
         
         progress.update_status(agent_id, ticker, "Gathering financial line items")
-        financial_line_items = search_line_items(
+        financial_line_items = data_context.search_line_items(
             ticker,
             [
                 "revenue",
@@ -57,11 +58,11 @@ def charlie_munger_agent(state: AgentState, agent_id: str = "charlie_munger_agen
         )
         
         progress.update_status(agent_id, ticker, "Getting market cap")
-        market_cap = get_market_cap(ticker, end_date, api_key=api_key)
+        market_cap = data_context.get_market_cap(ticker, end_date, api_key=api_key)
         
         progress.update_status(agent_id, ticker, "Fetching insider trades")
         # Munger values management with skin in the game
-        insider_trades = get_insider_trades(
+        insider_trades = data_context.get_insider_trades(
             ticker,
             end_date,
             limit=100,
@@ -70,7 +71,7 @@ def charlie_munger_agent(state: AgentState, agent_id: str = "charlie_munger_agen
         
         progress.update_status(agent_id, ticker, "Fetching company news")
         # Munger avoids businesses with frequent negative press
-        company_news = get_company_news(
+        company_news = data_context.get_company_news(
             ticker,
             end_date,
             limit=10,
@@ -119,22 +120,26 @@ def charlie_munger_agent(state: AgentState, agent_id: str = "charlie_munger_agen
             # Include some qualitative assessment from news
             "news_sentiment": analyze_news_sentiment(company_news) if company_news else "No news data available"
         }
-        
-        progress.update_status(agent_id, ticker, "Generating Charlie Munger analysis")
-        munger_output = generate_munger_output(
-            ticker=ticker, 
+
+    outputs = call_llm_per_ticker(
+        tickers,
+        lambda ticker: generate_munger_output(
+            ticker=ticker,
             analysis_data=analysis_data[ticker],
             state=state,
             agent_id=agent_id,
-            confidence_hint=compute_confidence(analysis_data[ticker], signal)
-        )
-        
+            confidence_hint=compute_confidence(analysis_data[ticker], analysis_data[ticker]["signal"]),
+        ),
+        agent_name=agent_id,
+        status="Generating Charlie Munger analysis",
+    )
+    for ticker, munger_output in outputs.items():
         munger_analysis[ticker] = {
             "signal": munger_output.signal,
             "confidence": munger_output.confidence,
             "reasoning": munger_output.reasoning
         }
-        
+
         progress.update_status(agent_id, ticker, "Done", analysis=munger_output.reasoning)
     
     # Wrap results in a single message for the chain
@@ -4,7 +4,7 @@ from src.utils.api_key import get_api_key_from_state
 from src.utils.progress import progress
 import json
 
-from src.tools.api import get_financial_metrics
+from src.data.run_context import get_data_context
 
 
 ##### Fundamental Agent #####
@@ -14,6 +14,7 @@ def fundamentals_analyst_agent(state: AgentState, agent_id: str = "fundamentals_
     end_date = data["end_date"]
     tickers = data["tickers"]
     api_key = get_api_key_from_state(state, "FINANCIAL_DATASETS_API_KEY")
+    data_context = get_data_context(state)
     # Initialize fundamental analysis for each ticker
     fundamental_analysis = {}
 
@@ -21,7 +22,7 @@ def fundamentals_analyst_agent(state: AgentState, agent_id: str = "fundamentals_
         progress.update_status(agent_id, ticker, "Fetching financial metrics")
 
         # Get the financial metrics
-        financial_metrics = get_financial_metrics(
+        financial_metrics = data_context.get_financial_metrics(
             ticker=ticker,
             end_date=end_date,
             period="ttm",
@@ -11,10 +11,7 @@ from langchain_core.messages import HumanMessage
 from src.graph.state import AgentState, show_agent_reasoning
 from src.utils.progress import progress
 from src.utils.api_key import get_api_key_from_state
-from src.tools.api import (
-    get_financial_metrics,
-    get_insider_trades,
-)
+from src.data.run_context import get_data_context
 
 def growth_analyst_agent(state: AgentState, agent_id: str = "growth_analyst_agent"):
     """Run growth analysis across tickers and write signals back to `state`."""
@@ -23,13 +20,14 @@ def growth_analyst_agent(state: AgentState, agent_id: str = "growth_analyst_agen
     end_date = data["end_date"]
     tickers = data["tickers"]
     api_key = get_api_key_from_state(state, "FINANCIAL_DATASETS_API_KEY")
+    data_context = get_data_context(state)
     growth_analysis: dict[str, dict] = {}
 
     for ticker in tickers:
         progress.update_status(agent_id, ticker, "Fetching financial data")
 
         # --- Historical financial metrics ---
-        financial_metrics = get_financial_metrics(
+        financial_metrics = data_context.get_financial_metrics(
             ticker=ticker,
             end_date=end_date,
             period="ttm",
@@ -49,7 +47,7 @@ def growth_analyst_agent(state: AgentState, agent_id: str = "growth_analyst_agen
         most_recent_metrics = financial_metrics[0]
 
         # --- Insider Trades ---
-        insider_trades = get_insider_trades(
+        insider_trades = data_context.get_insider_trades(
             ticker=ticker,
             end_date=end_date,
             limit=1000,
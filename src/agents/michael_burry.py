@@ -9,14 +9,8 @@ from langchain_core.messages import HumanMessage
 from langchain_core.prompts import ChatPromptTemplate
 from pydantic import BaseModel
 
-from src.tools.api import (
-    get_company_news,
-    get_financial_metrics,
-    get_insider_trades,
-    get_market_cap,
-    search_line_items,
-)
-from src.utils.llm import call_llm
+from src.data.run_context import get_data_context
+from src.utils.llm import call_llm, call_llm_per_ticker
 from src.utils.progress import progress
 from src.utils.api_key import get_api_key_from_state
 
@@ -32,6 +26,7 @@ class MichaelBurrySignal(BaseModel):
 def michael_burry_agent(state: AgentState, agent_id: str = "michael_burry_agent"):
     """Analyse stocks using Michael Burry's deep‑value, contrarian framework."""
     api_key = get_api_key_from_state(state, "FINANCIAL_DATASETS_API_KEY")
+    data_context = get_data_context(state)
     data = state["data"]
     end_date: str = data["end_date"]  # YYYY‑MM‑DD
     tickers: list[str] = data["tickers"]
@@ -47,10 +42,10 @@ def michael_burry_agent(state: AgentState, agent_id: str = "michael_burry_agent"
         # Fetch raw data
         # ------------------------------------------------------------------
         progress.update_status(agent_id, ticker, "Fetching financial metrics")
-        metrics = get_financial_metrics(ticker, end_date, period="ttm", limit=5, api_key=api_key)
+        metrics = data_context.get_financial_metrics(ticker, end_date, period="ttm", limit=5, api_key=api_key)
 
         progress.update_status(agent_id, ticker, "Fetching line items")
-        line_items = search_line_items(
+        line_items = data_context.search_line_items(
             ticker,
             [
                 "free_cash_flow",
@@ -67,13 +62,13 @@ def michael_burry_agent(state: AgentState, agent_id: str = "michael_burry_agent"
         )
 
         progress.update_status(agent_id, ticker, "Fetching insider trades")
-        insider_trades = get_insider_trades(ticker, end_date=end_date, start_date=start_date)
+        insider_trades = data_context.get_insider_trades(ticker, end_date=end_date, start_date=start_date)
 
         progress.update_status(agent_id, ticker, "Fetching company news")
-        news = get_company_news(ticker, end_date=end_date, start_date=start_date, limit=250)
+        news = data_context.get_company_news(ticker, end_date=end_date, start_date=start_date, limit=250)
 
         progress.update_status(agent_id, ticker, "Fetching market cap")
-        market_cap = get_market_cap(ticker, end_date, api_key=api_key)
+        market_cap = data_context.get_market_cap(ticker, end_date, api_key=api_key)
 
         # ------------------------------------------------------------------
         # Run sub‑analyses
@@ -127,14 +122,18 @@ def michael_burry_agent(state: AgentState, agent_id: str = "michael_burry_agent"
             "market_cap": market_cap,
         }
 
-        progress.update_status(agent_id, ticker, "Generating LLM output")
-        burry_output = _generate_burry_output(
+    outputs = call_llm_per_ticker(
+        tickers,
+        lambda ticker: _generate_burry_output(
             ticker=ticker,
             analysis_data=analysis_data,
             state=state,
             agent_id=agent_id,
-        )
-
+        ),
+        agent_name=agent_id,
+        status="Generating LLM output",
+    )
+    for ticker, burry_output in outputs.items():
         burry_analysis[ticker] = {
             "signal": burry_output.signal,
             "confidence": burry_output.confidence,
@@ -8,7 +8,7 @@ import numpy as np
 import json
 
 from src.graph.state import AgentState, show_agent_reasoning
-from src.tools.api import get_company_news
+from src.data.run_context import get_data_context
 from src.utils.api_key import get_api_key_from_state
 from src.utils.llm import call_llm
 from src.utils.progress import progress
@@ -41,11 +41,12 @@ def news_sentiment_agent(state: AgentState, agent_id: str = "news_sentiment_agen
     end_date = data.get("end_date")
     tickers = data.get("tickers")
     api_key = get_api_key_from_state(state, "FINANCIAL_DATASETS_API_KEY")
+    data_context = get_data_context(state)
     sentiment_analysis = {}
 
     for ticker in tickers:
         progress.update_status(agent_id, ticker, "Fetching company news")
-        company_news = get_company_news(
+        company_news = data_context.get_company_news(
             ticker=ticker,
             end_date=end_date,
             limit=100,
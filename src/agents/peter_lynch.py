@@ -1,17 +1,12 @@
 from src.graph.state import AgentState, show_agent_reasoning
-from src.tools.api import (
-    get_market_cap,
-    search_line_items,
-    get_insider_trades,
-    get_company_news,
-)
+from src.data.run_context import get_data_context
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.messages import HumanMessage
 from pydantic import BaseModel
 import json
 from typing_extensions import Literal
 from src.utils.progress import progress
-from src.utils.llm import call_llm
+from src.utils.llm import call_llm, call_llm_per_ticker
 from src.utils.api_key import get_api_key_from_state
 
 
@@ -45,6 +40,7 @@ def peter_lynch_agent(state: AgentState, agent_id: str = "peter_lynch_agent"):
     end_date = data["end_date"]
     tickers = data["tickers"]
     api_key = get_api_key_from_state(state, "FINANCIAL_DATASETS_API_KEY")
+    data_context = get_data_context(state)
     analysis_data = {}
     lynch_analysis = {}
     data_quality_issues = []  # Track data quality issues
@@ -52,7 +48,7 @@ def peter_lynch_agent(state: AgentState, agent_id: str = "peter_lynch_agent"):
     for ticker in tickers:
         progress.update_status(agent_id, ticker, "Gathering financial line items")
         # Relevant line items for Peter Lynch's approach
-        financial_line_items = search_line_items(
+        financial_line_items = data_context.search_line_items(
             ticker,
             [
                 "revenue",
@@ -75,13 +71,13 @@ def peter_lynch_agent(state: AgentState, agent_id: str = "peter_lynch_agent"):
         )
 
         progress.update_status(agent_id, ticker, "Getting market cap")
-        market_cap = get_market_cap(ticker, end_date, api_key=api_key)
+        market_cap = data_context.get_market_cap(ticker, end_date, api_key=api_key)
 
         progress.update_status(agent_id, ticker, "Fetching insider trades")
-        insider_trades = get_insider_trades(ticker, end_date, limit=50, api_key=api_key)
+        insider_trades = data_context.get_insider_trades(ticker, end_date, limit=50, api_key=api_key)
 
         progress.update_status(agent_id, ticker, "Fetching company news")
-        company_news = get_company_news(ticker, end_date, limit=50, api_key=api_key)
+        company_news = data_context.get_company_news(ticker, end_date, limit=50, api_key=api_key)
 
         # Perform sub-analyses:
         progress.update_status(agent_id, ticker, "Analyzing growth")
@@ -131,14 +127,18 @@ def peter_lynch_agent(state: AgentState, agent_id: str = "peter_lynch_agent"):
             "insider_activity": insider_activity,
         }
 
-        progress.update_status(agent_id, ticker, "Generating Peter Lynch analysis")
-        lynch_output = generate_lynch_output(
+    outputs = call_llm_per_ticker(
+        tickers,
+        lambda ticker: generate_lynch_output(
             ticker=ticker,
             analysis_data=analysis_data[ticker],
             state=state,
             agent_id=agent_id,
-        )
-
+        ),
+        agent_name=agent_id,
+        status="Generating Peter Lynch analysis",
+    )
+    for ticker, lynch_output in outputs.items():
         lynch_analysis[ticker] = {
             "signal": lynch_output.signal,
             "confidence": lynch_output.confidence,
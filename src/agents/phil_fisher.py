@@ -1,17 +1,12 @@
 from src.graph.state import AgentState, show_agent_reasoning
-from src.tools.api import (
-    get_market_cap,
-    search_line_items,
-    get_insider_trades,
-    get_company_news,
-)
+from src.data.run_context import get_data_context
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.messages import HumanMessage
 from pydantic import BaseModel
 import json
 from typing_extensions import Literal
 from src.utils.progress import progress
-from src.utils.llm import call_llm
+from src.utils.llm import call_llm, call_llm_per_ticker
 import statistics
 from src.utils.api_key import get_api_key_from_state
 
@@ -37,6 +32,7 @@ def phil_fisher_agent(state: AgentState, agent_id: str = "phil_fisher_agent"):
     end_date = data["end_date"]
     tickers = data["tickers"]
     api_key = get_api_key_from_state(state, "FINANCIAL_DATASETS_API_KEY")
+    data_context = get_data_context(state)
     analysis_data = {}
     fisher_analysis = {}
 
@@ -47,7 +43,7 @@ def phil_fisher_agent(state: AgentState, agent_id: str = "phil_fisher_agent"):
         #   - Margins & Stability: operating_income, operating_margin, gross_margin
         #   - Management Efficiency & Leverage: total_debt, shareholders_equity, free_cash_flow
         #   - Valuation: net_income, free_cash_flow (for P/E, P/FCF), ebit, ebitda
-        financial_line_items = search_line_items(
+        financial_line_items = data_context.search_line_items(
             ticker,
             [
                 "revenue",
@@ -71,13 +67,13 @@ def phil_fisher_agent(state: AgentState, agent_id: str = "phil_fisher_agent"):
         )
 
         progress.update_status(agent_id, ticker, "Getting market cap")
-        market_cap = get_market_cap(ticker, end_date, api_key=api_key)
+        market_cap = data_context.get_market_cap(ticker, end_date, api_key=api_key)
 
         progress.update_status(agent_id, ticker, "Fetching insider trades")
-        insider_trades = get_insider_trades(ticker, end_date, limit=50, api_key=api_key)
+        insider_trades = data_context.get_insider_trades(ticker, end_date, limit=50, api_key=api_key)
 
         progress.update_status(agent_id, ticker, "Fetching company news")
-        company_news = get_company_news(ticker, end_date, limit=50, api_key=api_key)
+        company_news = data_context.get_company_news(ticker, end_date, limit=50, api_key=api_key)
 
         progress.update_status(agent_id, ticker, "Analyzing growth & quality")
         growth_quality = analyze_fisher_growth_quality(financial_line_items)
@@ -135,14 +131,18 @@ def phil_fisher_agent(state: AgentState, agent_id: str = "phil_fisher_agent"):
             "sentiment_analysis": sentiment_analysis,
         }
 
-        progress.update_status(agent_id, ticker, "Generating Phil Fisher-style analysis")
-        fisher_output = generate_fisher_output(
+    outputs = call_llm_per_ticker(
+        tickers,
+        lambda ticker: generate_fisher_output(
             ticker=ticker,
             analysis_data=analysis_data,
             state=state,
             agent_id=agent_id,
-        )
-
+        ),
+        agent_name=agent_id,
+        status="Generating Phil Fisher-style analysis",
+    )
+    for ticker, fisher_output in outputs.items():
         fisher_analysis[ticker] = {
             "signal": fisher_output.signal,
             "confidence": fisher_output.confidence,
@@ -1,7 +1,8 @@
 from langchain_core.messages import HumanMessage
 from src.graph.state import AgentState, show_agent_reasoning
 from src.utils.progress import progress
-from src.tools.api import get_prices, prices_to_df
+from src.tools.api import prefetch_prices, prices_to_df
+from src.data.run_context import get_data_context
 import json
 import numpy as np
 import pandas as pd
@@ -14,6 +15,7 @@ def risk_management_agent(state: AgentState, agent_id: str = "risk_management_ag
     data = state["data"]
     tickers = data["tickers"]
     api_key = get_api_key_from_state(state, "FINANCIAL_DATASETS_API_KEY")
+    data_context = get_data_context(state)
     
     # Check if we're in paper trading mode (more aggressive position sizing)
     paper_trading = portfolio.get("paper_trading", False)
@@ -28,11 +30,12 @@ def risk_management_agent(state: AgentState, agent_id: str = "risk_management_ag
 
     # First, fetch prices and calculate volatility for all relevant tickers
     all_tickers = set(tickers) | set(portfolio.get("positions", {}).keys())
+    prefetch_prices(sorted(all_tickers), data["start_date"], data["end_date"])
     
     for ticker in all_tickers:
         progress.update_status(agent_id, ticker, "Fetching price data and calculating volatility")
         
-        prices = get_prices(
+        prices = data_context.get_prices(
             ticker=ticker,
             start_date=data["start_date"],
             end_date=data["end_date"],
@@ -5,7 +5,7 @@ import pandas as pd
 import numpy as np
 import json
 from src.utils.api_key import get_api_key_from_state
-from src.tools.api import get_insider_trades, get_company_news
+from src.data.run_context import get_data_context
 
 
 ##### Sentiment Agent #####
@@ -15,6 +15,7 @@ def sentiment_analyst_agent(state: AgentState, agent_id: str = "sentiment_analys
     end_date = data.get("end_date")
     tickers = data.get("tickers")
     api_key = get_api_key_from_state(state, "FINANCIAL_DATASETS_API_KEY")
+    data_context = get_data_context(state)
     # Initialize sentiment analysis for each ticker
     sentiment_analysis = {}
 
@@ -22,7 +23,7 @@ def sentiment_analyst_agent(state: AgentState, agent_id: str = "sentiment_analys
         progress.update_status(agent_id, ticker, "Fetching insider trades")
 
         # Get the insider trades
-        insider_trades = get_insider_trades(
+        insider_trades = data_context.get_insider_trades(
             ticker=ticker,
             end_date=end_date,
             limit=1000,
@@ -38,7 +39,7 @@ def sentiment_analyst_agent(state: AgentState, agent_id: str = "sentiment_analys
         progress.update_status(agent_id, ticker, "Fetching company news")
 
         # Get the company news
-        company_news = get_company_news(ticker, end_date, limit=100, api_key=api_key)
+        company_news = data_context.get_company_news(ticker, end_date, limit=100, api_key=api_key)
 
         # Get the sentiment from the company news
         sentiment = pd.Series([n.sentiment for n in company_news]).dropna()
@@ -67,7 +67,8 @@ import json
 import pandas as pd
 import numpy as np
 
-from src.tools.api import get_prices, prices_to_df
+from src.tools.api import prices_to_df
+from src.data.run_context import get_data_context
 from src.utils.progress import progress
 
 
@@ -130,6 +131,7 @@ def technical_analyst_agent(state: AgentState, agent_id: str = "technical_analys
     end_date = data["end_date"]
     tickers = data["tickers"]
     api_key = get_api_key_from_state(state, "FINANCIAL_DATASETS_API_KEY")
+    data_context = get_data_context(state)
     # Initialize analysis for each ticker
     technical_analysis = {}
 
@@ -137,7 +139,7 @@ def technical_analyst_agent(state: AgentState, agent_id: str = "technical_analys
         progress.update_status(agent_id, ticker, "Analyzing price data")
 
         # Get the historical price data
-        prices = get_prices(
+        prices = data_context.get_prices(
             ticker=ticker,
             start_date=start_date,
             end_date=end_date,
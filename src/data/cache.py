@@ -1,8 +1,10 @@
 """
 Redis-backed cache for API responses.
 
-Provides persistent caching across container restarts using Redis.
-Falls back to in-memory cache if Redis is unavailable.
+Provides persistent caching across container restarts using Redis, with a
+bounded in-process L1 tier (LRU + per-entry TTL, see memory_cache.py) in
+front of it. Lookups hit L1 first and Redis second; if Redis is
+unavailable the L1 tier serves on its own.
 
 TTL Configuration:
 - Use environment variables to customize cache durations
@@ -12,15 +14,54 @@ TTL Configuration:
 Environment Variables:
 - CACHE_TTL_QUOTES: Real-time quote snapshots (default: 60s)
 - CACHE_TTL_PRICES: Historical price bars (default: 300s for intraday, 3600s for daily)
+- CACHE_MAX_STALE_QUOTES / CACHE_MAX_STALE_PRICES_INTRADAY: Staleness bound for
+  quotes and intraday bars (default: 300s / 900s, see below)
+- CACHE_REFRESH_WORKERS: Background refresh threads (default: 4)
+- CACHE_TTL_LLM: Cached structured LLM responses (default: 86400s / 24h)
 - CACHE_TTL_NEWS: News articles (default: 600s)
 - CACHE_TTL_METRICS: Financial metrics (default: 86400s / 24h)
 - CACHE_TTL_INSIDER: Insider trades (default: 86400s / 24h)
+- CACHE_TTL_LINE_ITEMS_FILED: Line item fields for report periods past their
+  filing window (default: 2592000s / 30d); newer periods use CACHE_TTL_LINE_ITEMS
+- CACHE_L1_MAX_ENTRIES / CACHE_L1_MAX_BYTES: In-process tier bounds (default: 10000 / 256MB)
+
+Values are stored in Redis as binary payloads (see src/data/cache_codec.py,
+configured with CACHE_CODEC / CACHE_COMPRESSION). Entries written as JSON
+text by earlier versions still decode.
+
+Record lists (prices, metrics, line items, insider trades, news) are stored
+append-only: one hash field per row keyed by its date field, plus a sorted
+set index scored by timestamp. Writes only send the rows being added and
+dedup server-side (HSETNX / ZADD NX); reads are ZRANGEBYSCORE range queries.
+
+Line items are also cached per field: one hash per (ticker, period,
+report_period) holding a value per line item name, so a request for a
+different subset of fields only has to fetch the fields not seen yet.
+
+Quotes and intraday bars are served stale-while-revalidate (see
+get_or_refresh): entries carry their fetch time and their age is counted in
+open-market seconds (src/utils/market_clock.py), so they stay fresh from the
+close until the next open, across weekends and holidays. An entry fetched
+before the latest close is refreshed once after it, to pick up the closing
+print. During the session an entry older than its TTL is returned right
+away while a background fetch replaces it; one older than the staleness
+bound is never served.
 """
 
-import os
+import hashlib
 import json
+import math
+import os
 import logging
-from typing import Optional, List, Dict, Any
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from threading import Lock
+from typing import Optional, List, Dict, Any, Callable, Tuple
+
+from src.data.cache_codec import codec_from_env
+from src.data.memory_cache import MemoryCache
+from src.utils.market_clock import last_market_close, market_seconds_between, seconds_until_market_elapsed
 
 logger = logging.getLogger(__name__)
 
@@ -33,6 +74,50 @@ except ImportError:
     logger.warning("Redis not installed, using in-memory cache only")
 
 
+# Read an append-only record list in score order, plus the index's remaining TTL.
+# KEYS: index zset, rows hash. ARGV: min score, max score, "1" for newest first.
+_RANGE_SCRIPT = """
+local ids
+if ARGV[3] == '1' then
+    ids = redis.call('ZREVRANGEBYSCORE', KEYS[1], ARGV[2], ARGV[1])
+else
+    ids = redis.call('ZRANGEBYSCORE', KEYS[1], ARGV[1], ARGV[2])
+end
+local out = {redis.call('PTTL', KEYS[1])}
+for i = 1, #ids, 1000 do
+    local rows = redis.call('HMGET', KEYS[2], unpack(ids, i, math.min(i + 999, #ids)))
+    for _, row in ipairs(rows) do
+        if row then
+            table.insert(out, row)
+        end
+    end
+end
+return out
+"""
+
+
+def _row_score(value: Any) -> float:
+    """Sort score (epoch seconds, naive times taken as UTC) for a row's date field."""
+    if hasattr(value, "timestamp"):
+        moment = value
+    else:
+        try:
+            moment = datetime.fromisoformat(str(value))
+        except ValueError:
+            return 0.0
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return moment.timestamp()
+
+
+def _row_id(row: Dict[str, Any], key_field: str, per_period: bool) -> str:
+    """Dedup id of a record-list row: its date for per-period lists, else a content hash."""
+    value = row.get(key_field)
+    if per_period and value:
+        return value.isoformat() if hasattr(value, "isoformat") else str(value)
+    return hashlib.sha1(json.dumps(row, sort_keys=True, default=str).encode()).hexdigest()
+
+
 def _get_ttl_from_env(key: str, default: int) -> int:
     """Get TTL value from environment variable or use default."""
     try:
@@ -56,10 +141,41 @@ class RedisCache:
     TTL_INSIDER = _get_ttl_from_env("CACHE_TTL_INSIDER", 86400)  # 24 hours
     TTL_LINE_ITEMS = _get_ttl_from_env("CACHE_TTL_LINE_ITEMS", 86400)  # 24 hours
     TTL_PROFILE = _get_ttl_from_env("CACHE_TTL_PROFILE", 86400)  # 24 hours - company profiles
+    TTL_LLM = _get_ttl_from_env("CACHE_TTL_LLM", 86400)  # 24 hours - LLM responses (opt-in)
+    TTL_LINE_ITEMS_FILED = _get_ttl_from_env("CACHE_TTL_LINE_ITEMS_FILED", 30 * 86400)  # 30 days - settled filings
+    
+    # Stale-while-revalidate bounds, in open-market seconds: past the TTL an
+    # entry is served while it refreshes, past the bound it is refetched
+    MAX_STALE_QUOTES = _get_ttl_from_env("CACHE_MAX_STALE_QUOTES", 300)  # 5 minutes
+    MAX_STALE_PRICES_INTRADAY = _get_ttl_from_env("CACHE_MAX_STALE_PRICES_INTRADAY", 900)  # 15 minutes
+    
+    # 10-K deadlines run up to 90 days after period end; amendments follow
+    LINE_ITEMS_FILING_WINDOW = timedelta(days=120)
+    
+    # Append-only record lists: key prefix -> (date field, newest first)
+    RECORD_LISTS = {
+        "prices": ("time", False),
+        "metrics": ("report_period", True),
+        "line_items": ("report_period", True),
+        "insider": ("filing_date", True),
+        "news": ("date", True),
+    }
+    # Lists with one row per period, deduplicated on the date field. Other
+    # lists (news, insider trades) can hold many rows per date and dedup on
+    # the row's content.
+    ONE_ROW_PER_PERIOD = {"prices", "metrics", "line_items"}
     
     def __init__(self):
         self._redis_client: Optional[redis.Redis] = None
-        self._in_memory_fallback: Dict[str, Any] = {}
+        self._range_script = None
+        self._l1 = MemoryCache(
+            max_entries=_get_ttl_from_env("CACHE_L1_MAX_ENTRIES", 10000),
+            max_bytes=_get_ttl_from_env("CACHE_L1_MAX_BYTES", 256 * 1024 * 1024),
+        )
+        self._codec = codec_from_env()
+        self._refreshing: set = set()
+        self._swr_lock = Lock()
+        self._swr_stats = {"fresh": 0, "stale": 0, "miss": 0, "refreshes": 0, "refresh_errors": 0}
         self._connect_redis()
     
     def _connect_redis(self):
@@ -72,40 +188,229 @@ class RedisCache:
         try:
             self._redis_client = redis.from_url(
                 redis_url,
-                decode_responses=True,
+                # Payloads are binary (see CacheCodec)
+                decode_responses=False,
                 socket_connect_timeout=5,
                 socket_timeout=5,
             )
             # Test connection
             self._redis_client.ping()
+            self._range_script = self._redis_client.register_script(_RANGE_SCRIPT)
             logger.info(f"Connected to Redis cache at {redis_url}")
         except Exception as e:
             logger.warning(f"Could not connect to Redis: {e}. Using in-memory fallback.")
             self._redis_client = None
     
     def _get(self, key: str) -> Optional[Any]:
-        """Get a value from cache."""
-        if self._redis_client:
+        """Get a value from cache (in-process L1 first, then Redis)."""
+        return self._get_many([key]).get(key)
+    
+    def _get_many(self, keys: List[str]) -> Dict[str, Any]:
+        """
+        Get several values: L1 first, then one pipelined MGET for the rest.
+        
+        Returns:
+            Dict of key -> value for the keys found
+        """
+        found, missing = {}, []
+        for key in dict.fromkeys(keys):
+            value = self._l1.get(key)
+            if value is None:
+                missing.append(key)
+            else:
+                found[key] = value
+        
+        if missing and self._redis_client:
             try:
-                data = self._redis_client.get(key)
-                if data:
-                    return json.loads(data)
+                pipe = self._redis_client.pipeline(transaction=False)
+                pipe.mget(missing)
+                for key in missing:
+                    pipe.pttl(key)
+                payloads, *ttls_ms = pipe.execute()
             except Exception as e:
-                logger.debug(f"Redis get error for {key}: {e}")
+                logger.debug(f"Redis get error for {len(missing)} keys: {e}")
+                return found
+            
+            for key, data, ttl_ms in zip(missing, payloads, ttls_ms):
+                if not data:
+                    continue
+                value = self._decode_or_drop(key, data)
+                if value is None:
+                    continue
+                found[key] = value
+                # Keep it in L1 only for as long as Redis would
+                if ttl_ms and ttl_ms > 0:
+                    self._l1.set(key, value, ttl_ms / 1000)
         
-        # Fallback to in-memory
-        return self._in_memory_fallback.get(key)
+        return found
+    
+    def _decode_or_drop(self, key: str, data: bytes) -> Optional[Any]:
+        """Decode one cached payload; an undecodable one is deleted so it is refetched."""
+        try:
+            return self._codec.decode(data)
+        except Exception as e:
+            logger.debug(f"Dropping undecodable cache entry {key}: {e}")
+            try:
+                self._redis_client.delete(key)
+            except Exception:
+                pass
+            return None
     
     def _set(self, key: str, value: Any, ttl: int = 3600):
         """Set a value in cache with TTL."""
-        # Always update in-memory fallback
-        self._in_memory_fallback[key] = value
+        self._set_many({key: value}, ttl)
+    
+    def _set_many(self, items: Dict[str, Any], ttl: int = 3600):
+        """Set several values with the same TTL in one pipelined round trip."""
+        # Always update the in-process tier
+        for key, value in items.items():
+            self._l1.set(key, value, ttl)
         
-        if self._redis_client:
+        if self._redis_client and items:
+            try:
+                pipe = self._redis_client.pipeline(transaction=False)
+                for key, value in items.items():
+                    pipe.setex(key, ttl, self._codec.encode(value))
+                pipe.execute()
+            except Exception as e:
+                logger.debug(f"Redis set error for {len(items)} keys: {e}")
+    
+    # === Append-only record lists ===
+    def _get_records(
+        self,
+        prefix: str,
+        cache_key: str,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Get a record list, optionally only rows whose date field is in [start, end].
+        
+        Rows come back sorted by date (newest first for everything but prices).
+        """
+        return self._get_records_many(prefix, [cache_key], start, end).get(cache_key)
+    
+    def _get_records_many(
+        self,
+        prefix: str,
+        cache_keys: List[str],
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Get several record lists: L1 first, then one pipeline of range reads.
+        
+        Returns:
+            Dict of cache key -> rows for the lists found (non-empty)
+        """
+        key_field, newest_first = self.RECORD_LISTS[prefix]
+        min_score = _row_score(start) if start else float("-inf")
+        max_score = _row_score(end) if end else float("inf")
+        if end and len(end) == 10:
+            # Date-only end bound covers the whole day
+            max_score += 86400 - 0.001
+        full_range = start is None and end is None
+        
+        def in_range(rows):
+            if full_range:
+                return rows
+            return [r for r in rows if min_score <= _row_score(r.get(key_field)) <= max_score]
+        
+        found, missing = {}, []
+        for cache_key in dict.fromkeys(cache_keys):
+            rows = self._l1.get(f"{prefix}:{cache_key}")
+            if rows is None:
+                missing.append(cache_key)
+            elif rows := in_range(rows):
+                found[cache_key] = rows
+        
+        if missing and self._redis_client:
+            try:
+                pipe = self._redis_client.pipeline(transaction=False)
+                for cache_key in missing:
+                    key = f"{prefix}:{cache_key}"
+                    self._range_script(
+                        keys=[f"{key}:idx", f"{key}:rows"],
+                        args=[min_score, max_score, "1" if newest_first else "0"],
+                        client=pipe,
+                    )
+                # Blobs written before the append-only layout, read in the same round trip
+                pipe.mget([f"{prefix}:{cache_key}" for cache_key in missing])
+                *results, legacy = pipe.execute()
+            except Exception as e:
+                logger.debug(f"Redis range read error for {len(missing)} {prefix} keys: {e}")
+                return found
+            
+            for cache_key, result, legacy_data in zip(missing, results, legacy):
+                key = f"{prefix}:{cache_key}"
+                ttl_ms, rows = result[0], self._decode_rows(key, result[1:])
+                if rows:
+                    found[cache_key] = rows
+                    # A list with an undecodable row is not complete enough for L1
+                    if full_range and ttl_ms > 0 and len(rows) == len(result) - 1:
+                        self._l1.set(key, rows, ttl_ms / 1000)
+                elif legacy_data:
+                    legacy_rows = self._decode_or_drop(key, legacy_data)
+                    if legacy_rows and (rows := in_range(legacy_rows)):
+                        found[cache_key] = rows
+        
+        return found
+    
+    def _decode_rows(self, key: str, payloads: List[bytes]) -> List[Dict[str, Any]]:
+        """Decode stored rows, skipping any that can't be decoded."""
+        rows = []
+        for payload in payloads:
+            try:
+                rows.append(self._codec.decode(payload))
+            except Exception as e:
+                logger.debug(f"Skipping undecodable row in {key}: {e}")
+        return rows
+    
+    def _append_records(self, prefix: str, cache_key: str, data: List[Dict[str, Any]], ttl: int):
+        """Add rows not stored yet (by date field); existing rows are kept as-is."""
+        self._append_records_many(prefix, {cache_key: data}, ttl)
+    
+    def _append_records_many(self, prefix: str, items: Dict[str, List[Dict[str, Any]]], ttl: int):
+        """Append rows to several record lists in one MULTI pipeline."""
+        key_field, newest_first = self.RECORD_LISTS[prefix]
+        per_period = prefix in self.ONE_ROW_PER_PERIOD
+        
+        for cache_key, data in items.items():
+            key = f"{prefix}:{cache_key}"
+            # L1 holds the full list; merge in-process if it's there, otherwise
+            # drop it so the next read isn't served a partial list
+            existing = self._l1.get(key)
+            if existing is not None or not self._redis_client:
+                if per_period:
+                    merged = self._merge_data(existing, data, key_field=key_field)
+                else:
+                    seen = {_row_id(r, key_field, False) for r in existing or []}
+                    merged = list(existing or []) + [r for r in data if _row_id(r, key_field, False) not in seen]
+                merged = sorted(merged, key=lambda r: _row_score(r.get(key_field)), reverse=newest_first)
+                self._l1.set(key, merged, ttl)
+            else:
+                self._l1.delete(key)
+        
+        if self._redis_client and any(items.values()):
             try:
-                self._redis_client.setex(key, ttl, json.dumps(value))
+                pipe = self._redis_client.pipeline(transaction=True)
+                for cache_key, data in items.items():
+                    if not data:
+                        continue
+                    key = f"{prefix}:{cache_key}"
+                    scores = {}
+                    for row in data:
+                        value = row.get(key_field)
+                        encoded = self._codec.encode(row)
+                        row_id = _row_id(row, key_field, per_period)
+                        scores.setdefault(row_id, _row_score(value) if value else 0.0)
+                        pipe.hsetnx(f"{key}:rows", row_id, encoded)
+                    pipe.zadd(f"{key}:idx", scores, nx=True)
+                    pipe.expire(f"{key}:rows", ttl)
+                    pipe.expire(f"{key}:idx", ttl)
+                pipe.execute()
             except Exception as e:
-                logger.debug(f"Redis set error for {key}: {e}")
+                logger.debug(f"Redis append error for {len(items)} {prefix} keys: {e}")
     
     def _merge_data(self, existing: Optional[List[Dict]], new_data: List[Dict], key_field: str) -> List[Dict]:
         """Merge existing and new data, avoiding duplicates based on a key field."""
@@ -120,77 +425,335 @@ class RedisCache:
         merged.extend([item for item in new_data if item.get(key_field) not in existing_keys])
         return merged
     
+    # === Stale-while-revalidate entries ===
+    def _get_stamped_many(self, keys: List[str]) -> Dict[str, Tuple[Any, Optional[float]]]:
+        """Get values with their fetch time (None for entries written without one)."""
+        found = {}
+        for key, value in self._get_many(keys).items():
+            if isinstance(value, dict) and value.keys() == {"value", "fetched_at"}:
+                found[key] = (value["value"], value["fetched_at"])
+            else:
+                found[key] = (value, None)
+        return found
+    
+    def _set_stamped_many(self, items: Dict[str, Any], max_staleness: int, fetched_at: Optional[float] = None):
+        """Store values with their fetch time, kept until they pass max_staleness market seconds."""
+        fetched_at = fetched_at or time.time()
+        ttl = max(1, math.ceil(seconds_until_market_elapsed(max_staleness)))
+        self._set_many({key: {"value": value, "fetched_at": fetched_at} for key, value in items.items()}, ttl)
+    
+    def get_or_refresh(
+        self,
+        key: str,
+        fetch: Callable[[], Any],
+        refresh_after: int,
+        max_staleness: int,
+    ) -> Any:
+        """
+        Get a value stale-while-revalidate.
+        
+        Ages are open-market seconds since the fetch. Up to refresh_after the
+        cached value is returned; up to max_staleness it is returned and a
+        background fetch replaces it; beyond that (or on a miss) fetch() runs
+        in the caller. An entry fetched before the latest session close is
+        never fresh, so the first read after the close refreshes it. Empty
+        results are returned but not cached.
+        
+        Returns:
+            The value, never older than max_staleness market seconds
+        """
+        refresh_after = min(refresh_after, max_staleness)
+        entry = self._get_stamped_many([key]).get(key)
+        if entry is not None:
+            value, fetched_at = entry
+            age, before_close = 0.0, False
+            if fetched_at is not None:
+                fetched = datetime.fromtimestamp(fetched_at, timezone.utc)
+                age = market_seconds_between(fetched)
+                before_close = fetched < last_market_close()
+            if age <= refresh_after and not before_close:
+                self._count_swr("fresh")
+                return value
+            if age <= max_staleness:
+                self._count_swr("stale")
+                self._refresh_in_background(key, fetch, max_staleness)
+                return value
+        
+        self._count_swr("miss")
+        value = fetch()
+        if value:
+            self._set_stamped_many({key: value}, max_staleness)
+        return value
+    
+    def _count_swr(self, outcome: str):
+        with self._swr_lock:
+            self._swr_stats[outcome] += 1
+    
+    def _refresh_in_background(self, key: str, fetch: Callable[[], Any], max_staleness: int):
+        """Refetch a stale entry off the caller's thread (one refresh per key at a time)."""
+        with self._swr_lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+        
+        def refresh():
+            try:
+                value = fetch()
+                if value:
+                    self._set_stamped_many({key: value}, max_staleness)
+                self._count_swr("refreshes")
+            except Exception as e:
+                self._count_swr("refresh_errors")
+                logger.debug(f"Background refresh of {key} failed: {e}")
+            finally:
+                with self._swr_lock:
+                    self._refreshing.discard(key)
+        
+        try:
+            _get_refresh_executor().submit(refresh)
+        except RuntimeError:
+            # Interpreter shutting down
+            with self._swr_lock:
+                self._refreshing.discard(key)
+    
     # === Real-time Quotes ===
     def get_quote(self, ticker: str) -> Optional[Dict[str, Any]]:
         """Get cached real-time quote snapshot."""
-        return self._get(f"quote:{ticker}")
+        entry = self._get_stamped_many([f"quote:{ticker}"]).get(f"quote:{ticker}")
+        return entry[0] if entry else None
     
     def set_quote(self, ticker: str, data: Dict[str, Any]):
-        """Cache real-time quote with short TTL."""
-        self._set(f"quote:{ticker}", data, self.TTL_QUOTES)
+        """Cache real-time quote until it passes the staleness bound."""
+        self._set_stamped_many({f"quote:{ticker}": data}, self.MAX_STALE_QUOTES)
+    
+    def get_quotes_many(self, tickers: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Get cached quotes for several tickers (one MGET). Returns ticker -> quote for hits."""
+        found = self._get_stamped_many([f"quote:{t}" for t in tickers])
+        return {t: found[f"quote:{t}"][0] for t in tickers if f"quote:{t}" in found}
+    
+    def set_quotes_many(self, quotes: Dict[str, Dict[str, Any]]):
+        """Cache quotes for several tickers (pipelined SETEX)."""
+        self._set_stamped_many({f"quote:{t}": q for t, q in quotes.items()}, self.MAX_STALE_QUOTES)
+    
+    def get_quote_or_fetch(
+        self,
+        ticker: str,
+        fetch: Callable[[], Optional[Dict[str, Any]]],
+        max_staleness: Optional[int] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """Get a quote stale-while-revalidate; max_staleness tightens the bound for this call."""
+        return self.get_or_refresh(
+            f"quote:{ticker}",
+            fetch,
+            self.TTL_QUOTES,
+            self.MAX_STALE_QUOTES if max_staleness is None else max_staleness,
+        )
+    
+    def get_intraday_or_fetch(
+        self,
+        cache_key: str,
+        fetch: Callable[[], List[Dict[str, Any]]],
+        max_staleness: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """Get intraday bars (ending today) stale-while-revalidate."""
+        return self.get_or_refresh(
+            f"intraday:{cache_key}",
+            fetch,
+            self.TTL_PRICES_INTRADAY,
+            self.MAX_STALE_PRICES_INTRADAY if max_staleness is None else max_staleness,
+        )
     
     # === Prices ===
-    def get_prices(self, cache_key: str) -> Optional[List[Dict[str, Any]]]:
-        """Get cached price data if available."""
-        return self._get(f"prices:{cache_key}")
+    def get_prices(
+        self,
+        cache_key: str,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+    ) -> Optional[List[Dict[str, Any]]]:
+        """Get cached price data if available, optionally only bars in [start, end]."""
+        return self._get_records("prices", cache_key, start, end)
     
     def set_prices(self, cache_key: str, data: List[Dict[str, Any]], intraday: bool = False):
         """Cache price data. Use shorter TTL for intraday data."""
-        existing = self.get_prices(cache_key)
-        merged = self._merge_data(existing, data, key_field="time")
         ttl = self.TTL_PRICES_INTRADAY if intraday else self.TTL_PRICES
-        self._set(f"prices:{cache_key}", merged, ttl)
+        self._append_records("prices", cache_key, data, ttl)
+    
+    def get_prices_many(self, cache_keys: List[str]) -> Dict[str, List[Dict[str, Any]]]:
+        """Get cached price data for several keys in one round trip. Returns key -> bars for hits."""
+        return self._get_records_many("prices", cache_keys)
+    
+    def set_prices_many(self, items: Dict[str, List[Dict[str, Any]]], intraday: bool = False):
+        """Cache price data for several keys in one round trip."""
+        ttl = self.TTL_PRICES_INTRADAY if intraday else self.TTL_PRICES
+        self._append_records_many("prices", items, ttl)
     
     # === Financial Metrics ===
     def get_financial_metrics(self, cache_key: str) -> Optional[List[Dict[str, Any]]]:
         """Get cached financial metrics if available."""
-        return self._get(f"metrics:{cache_key}")
+        return self._get_records("metrics", cache_key)
     
     def set_financial_metrics(self, cache_key: str, data: List[Dict[str, Any]]):
         """Cache financial metrics."""
-        existing = self.get_financial_metrics(cache_key)
-        merged = self._merge_data(existing, data, key_field="report_period")
-        self._set(f"metrics:{cache_key}", merged, self.TTL_METRICS)
+        self._append_records("metrics", cache_key, data, self.TTL_METRICS)
+    
+    def get_financial_metrics_many(self, cache_keys: List[str]) -> Dict[str, List[Dict[str, Any]]]:
+        """Get cached financial metrics for several keys in one round trip."""
+        return self._get_records_many("metrics", cache_keys)
+    
+    def set_financial_metrics_many(self, items: Dict[str, List[Dict[str, Any]]]):
+        """Cache financial metrics for several keys in one round trip."""
+        self._append_records_many("metrics", items, self.TTL_METRICS)
     
     # === Line Items ===
     def get_line_items(self, cache_key: str) -> Optional[List[Dict[str, Any]]]:
         """Get cached line items if available."""
-        return self._get(f"line_items:{cache_key}")
+        return self._get_records("line_items", cache_key)
     
     def set_line_items(self, cache_key: str, data: List[Dict[str, Any]]):
         """Cache line items."""
-        existing = self.get_line_items(cache_key)
-        merged = self._merge_data(existing, data, key_field="report_period")
-        self._set(f"line_items:{cache_key}", merged, self.TTL_LINE_ITEMS)
+        self._append_records("line_items", cache_key, data, self.TTL_LINE_ITEMS)
+    
+    # === FMP TTM Metrics ===
+    def get_fmp_ttm(self, ticker: str) -> Optional[Dict[str, Any]]:
+        """Get cached FMP TTM key metrics and ratios ({"metrics": ..., "ratios": ...})."""
+        return self._get(f"fmp_ttm:{ticker}")
+    
+    def set_fmp_ttm(self, ticker: str, data: Dict[str, Any]):
+        """Cache FMP TTM key metrics and ratios."""
+        self._set(f"fmp_ttm:{ticker}", data, self.TTL_METRICS)
+    
+    def get_fmp_ttm_many(self, tickers: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Get cached FMP TTM data for several tickers (ticker -> data)."""
+        found = self._get_many([f"fmp_ttm:{t}" for t in tickers])
+        return {t: found[f"fmp_ttm:{t}"] for t in tickers if f"fmp_ttm:{t}" in found}
+    
+    # === Line Item Fields ===
+    def line_item_ttl(self, as_of: str) -> int:
+        """TTL for line item data as of a date: long once its filing window has passed."""
+        try:
+            moment = datetime.fromisoformat(str(as_of)[:10])
+        except ValueError:
+            return self.TTL_LINE_ITEMS
+        if datetime.now() - moment > self.LINE_ITEMS_FILING_WINDOW:
+            return self.TTL_LINE_ITEMS_FILED
+        return self.TTL_LINE_ITEMS
+    
+    def get_line_item_periods(self, cache_key: str) -> Optional[List[Dict[str, Any]]]:
+        """Get the report periods (and their base fields) a line item search returned."""
+        return self._get(f"line_item_periods:{cache_key}")
+    
+    def set_line_item_periods(self, cache_key: str, periods: List[Dict[str, Any]], end_date: str):
+        """Cache the report periods a line item search returned as of end_date."""
+        self._set(f"line_item_periods:{cache_key}", periods, self.line_item_ttl(end_date))
+    
+    def get_line_item_fields(
+        self,
+        ticker: str,
+        period: str,
+        report_periods: List[str],
+        fields: List[str],
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Get cached line item values, one hash per report period.
+        
+        Returns:
+            Dict of report_period -> {field: value} holding only the cached fields
+            (a cached None means the API had no value for that field)
+        """
+        found, missing = {}, []
+        for report_period in report_periods:
+            values = self._l1.get(f"line_item_fields:{ticker}:{period}:{report_period}") or {}
+            found[report_period] = {f: values[f] for f in fields if f in values}
+            if len(found[report_period]) < len(fields):
+                missing.append(report_period)
+        
+        if missing and self._redis_client:
+            try:
+                pipe = self._redis_client.pipeline(transaction=False)
+                for report_period in missing:
+                    key = f"line_item_fields:{ticker}:{period}:{report_period}"
+                    pipe.hmget(key, fields)
+                    pipe.pttl(key)
+                results = pipe.execute()
+                for i, report_period in enumerate(missing):
+                    payloads, ttl_ms = results[2 * i], results[2 * i + 1]
+                    values = {f: self._codec.decode(p) for f, p in zip(fields, payloads) if p is not None}
+                    if not values:
+                        continue
+                    found[report_period].update(values)
+                    if ttl_ms and ttl_ms > 0:
+                        self._merge_l1_fields(f"line_item_fields:{ticker}:{period}:{report_period}", values, ttl_ms / 1000)
+            except Exception as e:
+                logger.debug(f"Redis line item read error for {ticker}: {e}")
+        
+        return found
+    
+    def set_line_item_fields(self, ticker: str, period: str, values: Dict[str, Dict[str, Any]]):
+        """Cache line item values (report_period -> {field: value}) field by field."""
+        for report_period, fields in values.items():
+            key = f"line_item_fields:{ticker}:{period}:{report_period}"
+            self._merge_l1_fields(key, fields, self.line_item_ttl(report_period))
+        
+        if self._redis_client and values:
+            try:
+                pipe = self._redis_client.pipeline(transaction=False)
+                for report_period, fields in values.items():
+                    if not fields:
+                        continue
+                    key = f"line_item_fields:{ticker}:{period}:{report_period}"
+                    pipe.hset(key, mapping={f: self._codec.encode(v) for f, v in fields.items()})
+                    pipe.expire(key, self.line_item_ttl(report_period))
+                pipe.execute()
+            except Exception as e:
+                logger.debug(f"Redis line item write error for {ticker}: {e}")
+    
+    def _merge_l1_fields(self, key: str, fields: Dict[str, Any], ttl: float):
+        # L1 may hold a subset of the hash; anything not in it is looked up in Redis
+        self._l1.set(key, {**(self._l1.get(key) or {}), **fields}, ttl)
     
     # === Insider Trades ===
     def get_insider_trades(self, cache_key: str) -> Optional[List[Dict[str, Any]]]:
         """Get cached insider trades if available."""
-        return self._get(f"insider:{cache_key}")
+        return self._get_records("insider", cache_key)
     
     def set_insider_trades(self, cache_key: str, data: List[Dict[str, Any]]):
         """Cache insider trades."""
-        existing = self.get_insider_trades(cache_key)
-        merged = self._merge_data(existing, data, key_field="filing_date")
-        self._set(f"insider:{cache_key}", merged, self.TTL_INSIDER)
+        self._append_records("insider", cache_key, data, self.TTL_INSIDER)
     
     # === Company News ===
     def get_company_news(self, cache_key: str) -> Optional[List[Dict[str, Any]]]:
         """Get cached company news if available."""
-        return self._get(f"news:{cache_key}")
+        return self._get_records("news", cache_key)
     
     def set_company_news(self, cache_key: str, data: List[Dict[str, Any]]):
         """Cache company news."""
-        existing = self.get_company_news(cache_key)
-        merged = self._merge_data(existing, data, key_field="date")
-        self._set(f"news:{cache_key}", merged, self.TTL_NEWS)
+        self._append_records("news", cache_key, data, self.TTL_NEWS)
+    
+    def get_company_news_many(self, cache_keys: List[str]) -> Dict[str, List[Dict[str, Any]]]:
+        """Get cached company news for several keys in one round trip."""
+        return self._get_records_many("news", cache_keys)
+    
+    def set_company_news_many(self, items: Dict[str, List[Dict[str, Any]]]):
+        """Cache company news for several keys in one round trip."""
+        self._append_records_many("news", items, self.TTL_NEWS)
+    
+    # === LLM Responses ===
+    def get_llm_response(self, key: str) -> Optional[str]:
+        """Get a cached LLM response (pydantic JSON) by content hash."""
+        return self._get(f"llm:{key}")
+    
+    def set_llm_response(self, key: str, data: str):
+        """Cache an LLM response (pydantic JSON) by content hash."""
+        self._set(f"llm:{key}", data, self.TTL_LLM)
     
     # === Cache Stats ===
     def get_stats(self) -> Dict[str, Any]:
         """Get cache statistics including TTL configuration."""
         stats = {
             "backend": "redis" if self._redis_client else "in_memory",
-            "in_memory_keys": len(self._in_memory_fallback),
+            "in_memory_keys": len(self._l1),
+            "l1": self._l1.get_stats(),
+            "codec": self._codec.get_stats(),
             "ttl_config": {
                 "quotes": self.TTL_QUOTES,
                 "prices_intraday": self.TTL_PRICES_INTRADAY,
@@ -200,8 +763,14 @@ class RedisCache:
                 "insider": self.TTL_INSIDER,
                 "line_items": self.TTL_LINE_ITEMS,
                 "profile": self.TTL_PROFILE,
+                "llm": self.TTL_LLM,
+                "line_items_filed": self.TTL_LINE_ITEMS_FILED,
+                "max_stale_quotes": self.MAX_STALE_QUOTES,
+                "max_stale_prices_intraday": self.MAX_STALE_PRICES_INTRADAY,
             },
         }
+        with self._swr_lock:
+            stats["stale_while_revalidate"] = dict(self._swr_stats, refreshing=len(self._refreshing))
         
         if self._redis_client:
             try:
@@ -215,11 +784,14 @@ class RedisCache:
     
     def clear(self):
         """Clear all cached data."""
-        self._in_memory_fallback.clear()
+        self._l1.clear()
         if self._redis_client:
             try:
                 # Only clear our prefixed keys, not all of Redis
-                for prefix in ["quote:", "prices:", "metrics:", "line_items:", "insider:", "news:"]:
+                for prefix in [
+                    "quote:", "intraday:", "prices:", "metrics:", "fmp_ttm:", "line_items:",
+                    "line_item_periods:", "line_item_fields:", "insider:", "news:", "llm:",
+                ]:
                     for key in self._redis_client.scan_iter(f"{prefix}*"):
                         self._redis_client.delete(key)
             except Exception as e:
@@ -229,6 +801,21 @@ class RedisCache:
 # Backward compatibility alias
 Cache = RedisCache
 
+# Shared pool for stale-while-revalidate background refreshes
+_refresh_executor: Optional[ThreadPoolExecutor] = None
+_refresh_executor_lock = Lock()
+
+
+def _get_refresh_executor() -> ThreadPoolExecutor:
+    global _refresh_executor
+    with _refresh_executor_lock:
+        if _refresh_executor is None:
+            _refresh_executor = ThreadPoolExecutor(
+                max_workers=_get_ttl_from_env("CACHE_REFRESH_WORKERS", 4),
+                thread_name_prefix="cache-refresh",
+            )
+        return _refresh_executor
+
 # Global cache instance
 _cache: Optional[RedisCache] = None
 
@@ -0,0 +1,211 @@
+"""
+Binary serialization for Redis cache payloads.
+
+RedisCache used to store every value as json.dumps text and json-decode it
+on every hit. Payloads are now written by a CacheCodec: a serializer
+(orjson, msgpack or stdlib json) plus optional compression (zstd, lz4 or
+zlib) behind a small versioned header.
+
+Header (7 bytes):
+    b"\\xffMZ" | version | serializer id | compression id | layout id
+
+The layout id is always plain. Price bars are stored one row per hash field
+(see RedisCache record lists), so there is no whole bar list to pack into a
+columnar float64 block; decode treats any other layout as unsupported.
+
+Entries without the header are legacy JSON text and still decode, so an
+existing Redis keeps serving while entries are rewritten in the new format.
+Entries written with a library that isn't installed on the reading side
+(e.g. msgpack) fail to decode and are treated as cache misses.
+
+Environment Variables:
+- CACHE_CODEC: json, orjson, msgpack or auto (default: auto, the fastest installed)
+- CACHE_COMPRESSION: none, zlib, zstd, lz4 or auto (default: auto, zstd/lz4 if installed)
+- CACHE_COMPRESS_MIN_BYTES: Payloads smaller than this aren't compressed (default: 512)
+"""
+
+import json
+import logging
+import os
+import struct
+import zlib
+from typing import Any
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Optional serializers / compressors
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+try:
+    import lz4.frame
+    LZ4_AVAILABLE = True
+except ImportError:
+    LZ4_AVAILABLE = False
+
+
+MAGIC = b"\xffMZ"
+FORMAT_VERSION = 1
+HEADER = struct.Struct(">3sBBBB")
+
+SERIALIZERS = {"json": 1, "orjson": 2, "msgpack": 3}
+COMPRESSIONS = {"none": 0, "zlib": 1, "zstd": 2, "lz4": 3}
+
+LAYOUT_PLAIN = 0
+
+
+# ==================== Serializers ====================
+
+def _default(value: Any) -> Any:
+    # Datetimes (incl. pandas Timestamps in DataFrame records) become ISO strings
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f"Cannot serialize {type(value).__name__}")
+
+
+def _dumps(serializer: str, value: Any) -> bytes:
+    if serializer == "orjson":
+        return orjson.dumps(value, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS, default=_default)
+    if serializer == "msgpack":
+        return msgpack.packb(value, use_bin_type=True, default=_default)
+    return json.dumps(value, default=_default).encode()
+
+
+def _loads(serializer: str, data: bytes) -> Any:
+    if serializer == "msgpack":
+        return msgpack.unpackb(data, raw=False)
+    # orjson output is plain JSON, so either library reads both
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# ==================== Compression ====================
+
+def _compress(compression: str, data: bytes) -> bytes:
+    if compression == "zstd":
+        return zstandard.ZstdCompressor(level=3).compress(data)
+    if compression == "lz4":
+        return lz4.frame.compress(data)
+    if compression == "zlib":
+        return zlib.compress(data, 6)
+    return data
+
+
+def _decompress(compression: str, data: bytes) -> bytes:
+    if compression == "zstd":
+        return zstandard.ZstdDecompressor().decompress(data)
+    if compression == "lz4":
+        return lz4.frame.decompress(data)
+    if compression == "zlib":
+        return zlib.decompress(data)
+    return data
+
+
+# ==================== Codec ====================
+
+class CacheCodec:
+    """
+    Encodes cache values to headered bytes and decodes them back.
+
+    Usage:
+        codec = CacheCodec(serializer="orjson", compression="zstd")
+        data = codec.encode(bars)
+        bars = codec.decode(data)
+    """
+
+    def __init__(self, serializer: str = "json", compression: str = "none", compress_min_bytes: int = 512):
+        if serializer not in SERIALIZERS:
+            raise ValueError(f"Unknown cache serializer: {serializer}")
+        if compression not in COMPRESSIONS:
+            raise ValueError(f"Unknown cache compression: {compression}")
+        self.serializer = serializer
+        self.compression = compression
+        self.compress_min_bytes = compress_min_bytes
+        self._serializer_names = {v: k for k, v in SERIALIZERS.items()}
+        self._compression_names = {v: k for k, v in COMPRESSIONS.items()}
+
+    def encode(self, value: Any) -> bytes:
+        """Encode a JSON-compatible value."""
+        body = _dumps(self.serializer, value)
+
+        compression = self.compression if len(body) >= self.compress_min_bytes else "none"
+        header = HEADER.pack(MAGIC, FORMAT_VERSION, SERIALIZERS[self.serializer], COMPRESSIONS[compression], LAYOUT_PLAIN)
+        return header + _compress(compression, body)
+
+    def decode(self, data: bytes | str) -> Any:
+        """Decode a payload written by any codec configuration, or legacy JSON text."""
+        if isinstance(data, str):
+            return json.loads(data)
+        if not data.startswith(MAGIC):
+            return json.loads(data)
+
+        _, version, serializer_id, compression_id, layout = HEADER.unpack_from(data)
+        if version != FORMAT_VERSION or layout != LAYOUT_PLAIN:
+            raise ValueError(f"Unsupported cache payload version/layout: {version}/{layout}")
+        serializer = self._serializer_names[serializer_id]
+        body = _decompress(self._compression_names[compression_id], data[HEADER.size:])
+        return _loads(serializer, body)
+
+    def get_stats(self) -> dict:
+        return {
+            "serializer": self.serializer,
+            "compression": self.compression,
+            "compress_min_bytes": self.compress_min_bytes,
+        }
+
+
+def _resolve_serializer(name: str) -> str:
+    if name == "auto":
+        if ORJSON_AVAILABLE:
+            return "orjson"
+        if MSGPACK_AVAILABLE:
+            return "msgpack"
+        return "json"
+    available = {"json": True, "orjson": ORJSON_AVAILABLE, "msgpack": MSGPACK_AVAILABLE}
+    if not available.get(name, False):
+        logger.warning(f"Cache serializer {name!r} not available, using json")
+        return "json"
+    return name
+
+
+def _resolve_compression(name: str) -> str:
+    if name == "auto":
+        if ZSTD_AVAILABLE:
+            return "zstd"
+        if LZ4_AVAILABLE:
+            return "lz4"
+        return "none"
+    available = {"none": True, "zlib": True, "zstd": ZSTD_AVAILABLE, "lz4": LZ4_AVAILABLE}
+    if not available.get(name, False):
+        logger.warning(f"Cache compression {name!r} not available, storing uncompressed")
+        return "none"
+    return name
+
+
+def codec_from_env() -> CacheCodec:
+    """Build a codec from CACHE_CODEC / CACHE_COMPRESSION / CACHE_COMPRESS_MIN_BYTES."""
+    return CacheCodec(
+        serializer=_resolve_serializer(os.environ.get("CACHE_CODEC", "auto").lower()),
+        compression=_resolve_compression(os.environ.get("CACHE_COMPRESSION", "auto").lower()),
+        compress_min_bytes=int(os.environ.get("CACHE_COMPRESS_MIN_BYTES", "512")),
+    )
@@ -0,0 +1,121 @@
+"""
+Bounded in-process L1 cache tier.
+
+RedisCache used to keep a plain dict of every value ever set as its
+in-memory fallback: it never expired anything and grew without bound in
+the long-running scheduler. MemoryCache replaces it with an LRU map that
+is bounded by entry count and (estimated) bytes, honours a per-entry TTL,
+and counts hits, misses, evictions and expirations.
+
+Environment Variables:
+- CACHE_L1_MAX_ENTRIES: Max entries kept in process (default: 10000)
+- CACHE_L1_MAX_BYTES: Max estimated bytes kept in process (default: 268435456 / 256MB)
+"""
+
+import sys
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Dict, Optional, Tuple
+
+
+def estimate_size(value: Any) -> int:
+    """Rough deep size in bytes of a JSON-like value."""
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(estimate_size(k) + estimate_size(v) for k, v in value.items())
+    elif isinstance(value, (list, tuple)):
+        size += sum(estimate_size(v) for v in value)
+    return size
+
+
+class MemoryCache:
+    """
+    Thread-safe LRU cache with per-entry TTL and entry/byte bounds.
+
+    Usage:
+        l1 = MemoryCache(max_entries=10000, max_bytes=256 * 1024 * 1024)
+        l1.set("quote:AAPL", quote, ttl=60)
+        quote = l1.get("quote:AAPL")  # None once expired or evicted
+    """
+
+    def __init__(self, max_entries: int = 10000, max_bytes: int = 256 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        # key -> (expires_at, size, value), least recently used first
+        self._entries: "OrderedDict[str, Tuple[float, int, Any]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    def get(self, key: str) -> Optional[Any]:
+        """Get a live value, refreshing its LRU position."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            if entry[0] <= time.monotonic():
+                self._remove(key)
+                self._expirations += 1
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[2]
+
+    def set(self, key: str, value: Any, ttl: float, size: Optional[int] = None):
+        """Store a value for ttl seconds, evicting least recently used entries if over bounds."""
+        if ttl <= 0:
+            self.delete(key)
+            return
+        if size is None:
+            size = estimate_size(value)
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            # A value bigger than the whole tier would only flush everything else
+            if size > self.max_bytes:
+                return
+            self._entries[key] = (time.monotonic() + ttl, size, value)
+            self._bytes += size
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self._evictions += 1
+
+    def delete(self, key: str):
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+    def _remove(self, key: str):
+        _, size, _ = self._entries.pop(key)
+        self._bytes -= size
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get size, bounds and hit/miss/eviction counters."""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": self._hits / lookups if lookups else 0.0,
+                "evictions": self._evictions,
+                "expirations": self._expirations,
+            }
@@ -0,0 +1,190 @@
+"""
+Columnar price container.
+
+get_prices used to build one pydantic Price object per bar with
+df.iterrows(), and prices_to_df turned those objects straight back into a
+DataFrame. A PriceFrame instead keeps the bars as NumPy arrays (time index
+plus OHLCV) built with vectorized operations, and only materializes Price
+objects if a caller actually iterates or indexes it.
+
+It is a read-only Sequence of Price, so existing callers that do
+`prices[-20:]`, `prices[0].close`, `len(prices)` or `for p in prices`
+keep working, while array-aware callers use `.close`, `.volume` or
+`to_df()` without per-row object churn.
+
+Usage:
+    frame = PriceFrame.from_df(df, ticker="AAPL")
+    closes = frame.close              # np.ndarray, no Price objects built
+    last = frame[-1]                  # single Price
+    prices = frame.prices             # lazy list[Price], built once
+"""
+
+from collections.abc import Sequence
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from src.data.models import Price
+
+OHLCV_FIELDS = ("open", "high", "low", "close", "volume")
+
+
+def _readonly(array: np.ndarray) -> np.ndarray:
+    if array.flags.writeable:
+        array.flags.writeable = False
+    return array
+
+
+class PriceFrame(Sequence):
+    """
+    Read-only columnar sequence of daily price bars, sorted by time.
+
+    Times are stored as UTC; utc=True marks bars whose provider timestamps
+    carried an offset, so rebuilt Price.time strings keep one ("+00:00").
+    """
+
+    __slots__ = ("ticker", "time", "open", "high", "low", "close", "volume", "utc", "_prices")
+
+    def __init__(
+        self,
+        ticker: Optional[str],
+        time: np.ndarray,
+        open: np.ndarray,
+        high: np.ndarray,
+        low: np.ndarray,
+        close: np.ndarray,
+        volume: np.ndarray,
+        utc: bool = False,
+    ):
+        self.ticker = ticker
+        self.utc = utc
+        self.time = _readonly(np.asarray(time, dtype="datetime64[s]"))
+        self.open = _readonly(np.asarray(open, dtype=np.float64))
+        self.high = _readonly(np.asarray(high, dtype=np.float64))
+        self.low = _readonly(np.asarray(low, dtype=np.float64))
+        self.close = _readonly(np.asarray(close, dtype=np.float64))
+        self.volume = _readonly(np.asarray(volume, dtype=np.int64))
+        self._prices: Optional[List[Price]] = None
+
+    # ==================== Constructors ====================
+
+    @classmethod
+    def empty(cls, ticker: Optional[str] = None) -> "PriceFrame":
+        return cls(ticker, *(np.empty(0) for _ in range(6)))
+
+    @classmethod
+    def from_df(cls, df: pd.DataFrame, ticker: Optional[str] = None) -> "PriceFrame":
+        """Build from a DataFrame with time/open/high/low/close/volume columns."""
+        if df is None or df.empty:
+            return cls.empty(ticker)
+
+        utc = pd.to_datetime(df["time"].iloc[:1]).dt.tz is not None
+        times = pd.to_datetime(df["time"], utc=True).dt.tz_convert(None).to_numpy().astype("datetime64[s]")
+        order = np.argsort(times, kind="stable")
+        columns = [pd.to_numeric(df[field], errors="coerce").to_numpy(dtype=np.float64)[order] for field in OHLCV_FIELDS]
+        # Reject bad bars (as Price validation did) so callers fall back to another source
+        missing = [field for field, column in zip(OHLCV_FIELDS, columns) if np.isnan(column).any()]
+        if missing:
+            raise ValueError(f"Price data has missing or non-numeric values in: {', '.join(missing)}")
+        if ticker is None and "ticker" in df.columns and len(df):
+            ticker = df["ticker"].iloc[0]
+        return cls(ticker, times[order], *columns, utc=utc)
+
+    @classmethod
+    def from_records(cls, records: Iterable[Dict[str, Any]], ticker: Optional[str] = None) -> "PriceFrame":
+        """Build from Price-shaped dicts (e.g. cached model_dump() output)."""
+        return cls.from_df(pd.DataFrame.from_records(list(records)), ticker=ticker)
+
+    @classmethod
+    def from_prices(cls, prices: Iterable[Price], ticker: Optional[str] = None) -> "PriceFrame":
+        """Build from existing Price objects."""
+        if isinstance(prices, PriceFrame):
+            return prices
+        return cls.from_records((p.model_dump() for p in prices), ticker=ticker)
+
+    # ==================== Sequence protocol ====================
+
+    def __len__(self) -> int:
+        return len(self.time)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            # NumPy slices are views, so this doesn't copy the bars
+            return PriceFrame(
+                self.ticker,
+                self.time[index], self.open[index], self.high[index],
+                self.low[index], self.close[index], self.volume[index],
+                utc=self.utc,
+            )
+        if self._prices is not None:
+            return self._prices[index]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("PriceFrame index out of range")
+        return self._make_price(index, self.time_strings(index, index + 1)[0])
+
+    def __iter__(self):
+        return iter(self.prices)
+
+    def __bool__(self) -> bool:
+        return len(self) > 0
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, PriceFrame):
+            return self.to_records() == other.to_records()
+        if isinstance(other, list):
+            return self.prices == other
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        span = f"{self.time[0]}..{self.time[-1]}" if len(self) else "empty"
+        return f"PriceFrame(ticker={self.ticker!r}, bars={len(self)}, {span})"
+
+    # ==================== Views ====================
+
+    def time_strings(self, start: int = 0, stop: Optional[int] = None) -> List[str]:
+        """Bar times as "YYYY-MM-DDTHH:MM:SS" strings (the Price.time format), "+00:00" when utc."""
+        strings = np.datetime_as_string(self.time[start:stop], unit="s").tolist()
+        return [t + "+00:00" for t in strings] if self.utc else strings
+
+    def _make_price(self, i: int, time: str) -> Price:
+        # Skips validation: from_df already rejected missing/non-numeric OHLCV
+        return Price.model_construct(
+            ticker=self.ticker,
+            time=time,
+            open=float(self.open[i]),
+            high=float(self.high[i]),
+            low=float(self.low[i]),
+            close=float(self.close[i]),
+            volume=int(self.volume[i]),
+        )
+
+    @property
+    def prices(self) -> List[Price]:
+        """list[Price] view, built on first access."""
+        if self._prices is None:
+            self._prices = [self._make_price(i, t) for i, t in enumerate(self.time_strings())]
+        return self._prices
+
+    def to_records(self) -> List[Dict[str, Any]]:
+        """Price-shaped dicts (same keys as Price.model_dump())."""
+        return pd.DataFrame(self._columns()).to_dict("records")
+
+    def _columns(self) -> Dict[str, Any]:
+        return {
+            "open": self.open,
+            "close": self.close,
+            "high": self.high,
+            "low": self.low,
+            "volume": self.volume,
+            "time": self.time_strings(),
+            "ticker": self.ticker,
+        }
+
+    def to_df(self) -> pd.DataFrame:
+        """DataFrame indexed by Date, matching prices_to_df's layout."""
+        index = pd.DatetimeIndex(self.time, name="Date")
+        df = pd.DataFrame(self._columns(), index=index.tz_localize("UTC") if self.utc else index)
+        return df.astype({"open": "float64", "close": "float64", "high": "float64", "low": "float64", "volume": "int64"})
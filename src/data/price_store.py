@@ -0,0 +1,250 @@
+"""
+Local columnar store for daily price bars.
+
+Keeps one NumPy structured array per ticker on disk (memory-mapped on read)
+plus a coverage index of the date ranges that have already been fetched.
+Any requested window that is fully covered is served from disk; otherwise
+only the uncovered gaps need to go back to the network, and the fetched bars
+are appended to the store.
+
+Layout:
+    {PRICE_STORE_DIR}/{TICKER}/bars.npy       - sorted, one row per trading day
+    {PRICE_STORE_DIR}/{TICKER}/coverage.json  - [[start, end], ...] inclusive dates
+
+Environment Variables:
+- PRICE_STORE_DIR: Directory for the store. Unset disables the store.
+"""
+
+import json
+import logging
+import os
+import tempfile
+from datetime import date, datetime, timedelta
+from threading import Lock
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from src.data.price_frame import PriceFrame
+
+logger = logging.getLogger(__name__)
+
+BAR_DTYPE = np.dtype([
+    ("time", "datetime64[s]"),
+    ("open", "f8"),
+    ("high", "f8"),
+    ("low", "f8"),
+    ("close", "f8"),
+    ("volume", "i8"),
+])
+
+DateRange = Tuple[str, str]
+
+
+def _to_date(value: str) -> date:
+    return datetime.strptime(value[:10], "%Y-%m-%d").date()
+
+
+def _merge_ranges(ranges: List[Tuple[date, date]]) -> List[Tuple[date, date]]:
+    """Merge overlapping or adjacent inclusive date ranges."""
+    merged: List[Tuple[date, date]] = []
+    for start, end in sorted(ranges):
+        if merged and start <= merged[-1][1] + timedelta(days=1):
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+class PriceStore:
+    """
+    Range-aware on-disk store for daily OHLCV bars.
+
+    Usage:
+        store = get_price_store()
+        for gap_start, gap_end in store.missing_ranges("AAPL", start, end):
+            bars = fetch(gap_start, gap_end)
+            store.write("AAPL", gap_start, gap_end, bars)
+        bars = store.read("AAPL", start, end)
+    """
+
+    def __init__(self, root: str):
+        self.root = root
+        self._lock = Lock()
+        os.makedirs(self.root, exist_ok=True)
+
+    # ==================== Paths ====================
+
+    def _ticker_dir(self, ticker: str) -> str:
+        return os.path.join(self.root, ticker.upper())
+
+    def _bars_path(self, ticker: str) -> str:
+        return os.path.join(self._ticker_dir(ticker), "bars.npy")
+
+    def _coverage_path(self, ticker: str) -> str:
+        return os.path.join(self._ticker_dir(ticker), "coverage.json")
+
+    # ==================== Coverage ====================
+
+    def _load_coverage(self, ticker: str) -> List[Tuple[date, date]]:
+        try:
+            with open(self._coverage_path(ticker), "r") as f:
+                return [(_to_date(s), _to_date(e)) for s, e in json.load(f)]
+        except FileNotFoundError:
+            return []
+        except Exception as e:
+            logger.warning(f"Corrupt price store coverage for {ticker}, ignoring: {e}")
+            return []
+
+    def missing_ranges(self, ticker: str, start_date: str, end_date: str) -> List[DateRange]:
+        """Return the sub-ranges of [start_date, end_date] not yet in the store."""
+        start, end = _to_date(start_date), _to_date(end_date)
+        gaps: List[DateRange] = []
+        cursor = start
+        for cov_start, cov_end in self._load_coverage(ticker):
+            if cov_end < cursor:
+                continue
+            if cov_start > end:
+                break
+            if cov_start > cursor:
+                gaps.append((cursor.isoformat(), (cov_start - timedelta(days=1)).isoformat()))
+            cursor = max(cursor, cov_end + timedelta(days=1))
+            if cursor > end:
+                break
+        if cursor <= end:
+            gaps.append((cursor.isoformat(), end.isoformat()))
+        return gaps
+
+    # ==================== Bars ====================
+
+    def _load_bars(self, ticker: str, mmap: bool = True) -> np.ndarray:
+        try:
+            return np.load(self._bars_path(ticker), mmap_mode="r" if mmap else None)
+        except FileNotFoundError:
+            return np.empty(0, dtype=BAR_DTYPE)
+        except Exception as e:
+            logger.warning(f"Corrupt price store bars for {ticker}, ignoring: {e}")
+            return np.empty(0, dtype=BAR_DTYPE)
+
+    def _window(self, ticker: str, start_date: str, end_date: str) -> np.ndarray:
+        """Bars in [start_date, end_date] (a view into the mapped file)."""
+        bars = self._load_bars(ticker)
+        if len(bars) == 0:
+            return bars
+
+        times = bars["time"]
+        lo = np.searchsorted(times, np.datetime64(start_date[:10], "s"), side="left")
+        hi = np.searchsorted(times, (np.datetime64(end_date[:10], "D") + 1).astype("datetime64[s]"), side="left")
+        return bars[lo:hi]
+
+    def read(self, ticker: str, start_date: str, end_date: str) -> List[Dict[str, Any]]:
+        """Read bars in [start_date, end_date] as Price-compatible dicts."""
+        window = self._window(ticker, start_date, end_date)
+        if len(window) == 0:
+            return []
+
+        return [
+            {
+                "ticker": ticker,
+                "time": t,
+                "open": o,
+                "high": h,
+                "low": l,
+                "close": c,
+                "volume": v,
+            }
+            for t, o, h, l, c, v in zip(
+                np.datetime_as_string(window["time"], unit="s").tolist(),
+                window["open"].tolist(),
+                window["high"].tolist(),
+                window["low"].tolist(),
+                window["close"].tolist(),
+                window["volume"].tolist(),
+            )
+        ]
+
+    def read_frame(self, ticker: str, start_date: str, end_date: str) -> PriceFrame:
+        """Read bars in [start_date, end_date] as a PriceFrame over the mapped arrays."""
+        window = self._window(ticker, start_date, end_date)
+        return PriceFrame(
+            ticker, window["time"], window["open"], window["high"],
+            window["low"], window["close"], window["volume"],
+        )
+
+    def write(self, ticker: str, start_date: str, end_date: str, bars: List[Dict[str, Any]]):
+        """
+        Append bars for a fetched range and mark the range as covered.
+
+        Bars for a day already in the store are replaced. Coverage never
+        extends past yesterday, since today's bar is still forming.
+        """
+        with self._lock:
+            os.makedirs(self._ticker_dir(ticker), exist_ok=True)
+
+            existing = self._load_bars(ticker, mmap=False)
+            if bars:
+                new = self._to_array(bars)
+                new_days = new["time"].astype("datetime64[D]")
+                keep = ~np.isin(existing["time"].astype("datetime64[D]"), new_days)
+                combined = np.concatenate([existing[keep], new])
+                combined.sort(order="time")
+                self._atomic_write(self._bars_path(ticker), lambda f: np.save(f, combined))
+
+            last_final_day = date.today() - timedelta(days=1)
+            start, end = _to_date(start_date), min(_to_date(end_date), last_final_day)
+            if start <= end:
+                coverage = _merge_ranges(self._load_coverage(ticker) + [(start, end)])
+                payload = json.dumps([[s.isoformat(), e.isoformat()] for s, e in coverage])
+                self._atomic_write(self._coverage_path(ticker), lambda f: f.write(payload.encode()))
+
+    def _to_array(self, bars: List[Dict[str, Any]]) -> np.ndarray:
+        times = pd.to_datetime([b["time"] for b in bars], utc=True).tz_convert(None)
+        out = np.empty(len(bars), dtype=BAR_DTYPE)
+        out["time"] = times.values.astype("datetime64[s]")
+        for field in ("open", "high", "low", "close", "volume"):
+            out[field] = [b[field] for b in bars]
+        # One bar per day; the last one in the batch wins
+        _, last_idx = np.unique(out["time"].astype("datetime64[D]")[::-1], return_index=True)
+        return out[len(out) - 1 - last_idx]
+
+    def _atomic_write(self, path: str, writer):
+        """Write via a temp file + rename so concurrent readers never see partial files."""
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                writer(f)
+            os.replace(tmp_path, path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def clear(self, ticker: str = None):
+        """Remove stored bars for one ticker, or for all tickers."""
+        import shutil
+        with self._lock:
+            target = self._ticker_dir(ticker) if ticker else self.root
+            shutil.rmtree(target, ignore_errors=True)
+            os.makedirs(self.root, exist_ok=True)
+
+
+# Global store instance
+_price_store: Optional[PriceStore] = None
+
+
+def get_price_store() -> Optional[PriceStore]:
+    """Get the global price store, or None when PRICE_STORE_DIR is not set."""
+    global _price_store
+    root = os.environ.get("PRICE_STORE_DIR")
+    if not root:
+        return None
+    if _price_store is None or _price_store.root != root:
+        _price_store = PriceStore(root)
+    return _price_store
+
+
+def reset_price_store():
+    """Reset the global price store instance (for testing)."""
+    global _price_store
+    _price_store = None
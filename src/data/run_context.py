@@ -0,0 +1,254 @@
+"""
+Run-scoped data context shared by all agents in one workflow run.
+
+Every analyst node used to call src.tools.api directly, so the same ticker's
+metrics, line items, market cap and prices were requested once per agent.
+A RunDataContext is created per workflow id (carried in
+state["metadata"]["workflow_id"]) and sits in front of those calls:
+
+- Results are memoized for the run, and a stored result also serves any
+  smaller `limit` for the same ticker/period/date window.
+- search_line_items fetches the union of every field requested so far in
+  the run for that period, so once the first ticker has been analyzed, one
+  call per ticker covers every agent's field list.
+
+Usage (inside an agent):
+    data_context = get_data_context(state)
+    metrics = data_context.get_financial_metrics(ticker, end_date, period="ttm", limit=10)
+"""
+
+import logging
+from threading import Lock
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from src.tools import api
+
+logger = logging.getLogger(__name__)
+
+# Attributes every LineItem carries regardless of requested fields
+_LINE_ITEM_BASE_FIELDS = ("ticker", "report_period", "period", "currency")
+
+
+def _project_line_item(item, fields: List[str]):
+    """Copy a LineItem keeping only its base attributes and the requested fields."""
+    values = item.model_dump()
+    kept = {name: values[name] for name in _LINE_ITEM_BASE_FIELDS}
+    kept.update({name: values[name] for name in fields if name in values})
+    return type(item)(**kept)
+
+
+class RunDataContext:
+    """Memoizing data access layer for one workflow run."""
+
+    def __init__(self, workflow_id: str = None):
+        self.workflow_id = workflow_id
+        self._lock = Lock()
+        self._key_locks: Dict[Tuple, Lock] = {}
+        # key -> (limit fetched with, result)
+        self._limited: Dict[Tuple, Tuple[int, list]] = {}
+        # key -> result
+        self._exact: Dict[Tuple, Any] = {}
+        # (ticker, end_date, period) -> (fields fetched, limit fetched with, items)
+        self._line_items: Dict[Tuple, Tuple[Set[str], int, list]] = {}
+        # period -> line item fields requested so far in this run
+        self._known_line_items: Dict[str, Set[str]] = {}
+        self._hits = 0
+        self._misses = 0
+
+    # ==================== Internals ====================
+
+    def _key_lock(self, key: Tuple) -> Lock:
+        with self._lock:
+            return self._key_locks.setdefault(key, Lock())
+
+    def _record(self, hit: bool):
+        with self._lock:
+            if hit:
+                self._hits += 1
+            else:
+                self._misses += 1
+
+    def _get_limited(self, key: Tuple, limit: int, fetch: Callable[[], list]) -> list:
+        """Serve from a stored result fetched with a limit >= the requested one."""
+        with self._key_lock(key):
+            stored = self._limited.get(key)
+            # A result shorter than its limit is the complete set, so it covers any limit
+            if stored and (stored[0] >= limit or len(stored[1]) < stored[0]):
+                self._record(hit=True)
+                return stored[1][:limit]
+
+            self._record(hit=False)
+            result = fetch() or []
+            # Don't pin failures for the whole run
+            if result:
+                self._limited[key] = (limit, result)
+            return result[:limit]
+
+    def _get_exact(self, key: Tuple, fetch: Callable[[], Any]) -> Any:
+        with self._key_lock(key):
+            if key in self._exact:
+                self._record(hit=True)
+                return self._exact[key]
+
+            self._record(hit=False)
+            result = fetch()
+            # Don't pin failures for the whole run
+            if result:
+                self._exact[key] = result
+            return result
+
+    # ==================== Agent data calls ====================
+
+    def get_financial_metrics(
+        self,
+        ticker: str,
+        end_date: str,
+        period: str = "ttm",
+        limit: int = 10,
+        api_key: str = None,
+    ) -> list:
+        key = ("metrics", ticker, end_date, period)
+        return self._get_limited(
+            key, limit,
+            lambda: api.get_financial_metrics(ticker, end_date, period=period, limit=limit, api_key=api_key),
+        )
+
+    def search_line_items(
+        self,
+        ticker: str,
+        line_items: List[str],
+        end_date: str,
+        period: str = "ttm",
+        limit: int = 10,
+        api_key: str = None,
+    ) -> list:
+        requested = set(line_items)
+        with self._lock:
+            known = self._known_line_items.setdefault(period, set())
+            known.update(requested)
+            union = set(known)
+
+        key = (ticker, end_date, period)
+        with self._key_lock(("line_items",) + key):
+            stored = self._line_items.get(key)
+            if stored:
+                fields, fetched_limit, items = stored
+                covers_limit = fetched_limit >= limit or len(items) < fetched_limit
+                if requested <= fields and covers_limit:
+                    self._record(hit=True)
+                    return [_project_line_item(item, line_items) for item in items[:limit]]
+                union |= fields
+                limit_to_fetch = max(limit, fetched_limit)
+            else:
+                limit_to_fetch = limit
+
+            self._record(hit=False)
+            items = api.search_line_items(
+                ticker, sorted(union), end_date, period=period, limit=limit_to_fetch, api_key=api_key
+            )
+            fields = union
+            if not items and union != requested:
+                # A field another agent asked for may be rejecting the whole request
+                logger.debug(f"Union line item fetch empty for {ticker}, retrying requested fields only")
+                items = api.search_line_items(
+                    ticker, line_items, end_date, period=period, limit=limit, api_key=api_key
+                )
+                fields, limit_to_fetch = requested, limit
+
+            if items:
+                self._line_items[key] = (fields, limit_to_fetch, items)
+            return [_project_line_item(item, line_items) for item in (items or [])[:limit]]
+
+    def get_market_cap(self, ticker: str, end_date: str, api_key: str = None) -> Optional[float]:
+        return self._get_exact(
+            ("market_cap", ticker, end_date),
+            lambda: api.get_market_cap(ticker, end_date, api_key=api_key),
+        )
+
+    def get_prices(self, ticker: str, start_date: str, end_date: str, api_key: str = None) -> list:
+        prices = self._get_exact(
+            ("prices", ticker, start_date, end_date),
+            lambda: api.get_prices(ticker, start_date, end_date, api_key=api_key),
+        )
+        # PriceFrames are read-only and can be shared; copy plain lists
+        return list(prices) if isinstance(prices, list) else (prices or [])
+
+    def get_company_news(
+        self,
+        ticker: str,
+        end_date: str,
+        start_date: str | None = None,
+        limit: int = 1000,
+        api_key: str = None,
+    ) -> list:
+        return self._get_limited(
+            ("news", ticker, end_date, start_date), limit,
+            lambda: api.get_company_news(ticker, end_date, start_date=start_date, limit=limit, api_key=api_key),
+        )
+
+    def get_insider_trades(
+        self,
+        ticker: str,
+        end_date: str,
+        start_date: str | None = None,
+        limit: int = 1000,
+        api_key: str = None,
+    ) -> list:
+        return self._get_limited(
+            ("insider_trades", ticker, end_date, start_date), limit,
+            lambda: api.get_insider_trades(ticker, end_date, start_date=start_date, limit=limit, api_key=api_key),
+        )
+
+    def get_stats(self) -> dict:
+        """Get hit/miss counts for this run."""
+        with self._lock:
+            total = self._hits + self._misses
+            return {
+                "workflow_id": self.workflow_id,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": self._hits / total if total else 0.0,
+            }
+
+
+# Contexts for in-progress runs, keyed by workflow id
+_contexts: Dict[str, RunDataContext] = {}
+_contexts_lock = Lock()
+
+
+def get_data_context(state) -> RunDataContext:
+    """
+    Get the data context for the run a state belongs to.
+
+    States without a workflow id get a throwaway context, which still
+    memoizes within the calling agent but isn't shared.
+    """
+    workflow_id = state.get("metadata", {}).get("workflow_id")
+    if workflow_id is None:
+        return RunDataContext()
+
+    workflow_id = str(workflow_id)
+    with _contexts_lock:
+        context = _contexts.get(workflow_id)
+        if context is None:
+            context = _contexts[workflow_id] = RunDataContext(workflow_id)
+        return context
+
+
+def release_data_context(workflow_id) -> Optional[dict]:
+    """Drop a finished run's context and return its stats."""
+    if workflow_id is None:
+        return None
+    with _contexts_lock:
+        context = _contexts.pop(str(workflow_id), None)
+    if context is None:
+        return None
+    stats = context.get_stats()
+    logger.info(f"Run data context {workflow_id}: {stats['hits']} hits, {stats['misses']} misses")
+    return stats
+
+
+def reset_data_contexts():
+    """Drop all contexts (for testing)."""
+    with _contexts_lock:
+        _contexts.clear()
@@ -1,5 +1,9 @@
 import os
 import json
+import asyncio
+import hashlib
+import threading
+from collections import OrderedDict
 from langchain_anthropic import ChatAnthropic
 from langchain_deepseek import ChatDeepSeek
 from langchain_google_genai import ChatGoogleGenerativeAI
@@ -136,6 +140,136 @@ def get_models_list():
 
 
 def get_model(model_name: str, model_provider: ModelProvider, api_keys: dict = None) -> ChatOpenAI | ChatGroq | ChatOllama | GigaChat | None:
+    """
+    Get a chat client for a model, reusing a pooled one when possible.
+    
+    Clients are pooled per provider, model, credentials fingerprint and event
+    loop, so repeated calls share one client and its HTTP connection pool
+    instead of paying construction and TLS handshakes every time.
+    """
+    if not client_pool_enabled():
+        return _create_model(model_name, model_provider, api_keys)
+    return _get_pool_entry(model_name, model_provider, api_keys)["client"]
+
+
+def get_structured_model(
+    model_name: str,
+    model_provider: ModelProvider,
+    api_keys: dict,
+    pydantic_model: type[BaseModel],
+    method: str = "json_mode",
+):
+    """Get a pooled client wrapped with with_structured_output for an output schema."""
+    if not client_pool_enabled():
+        return _create_model(model_name, model_provider, api_keys).with_structured_output(pydantic_model, method=method)
+    
+    entry = _get_pool_entry(model_name, model_provider, api_keys)
+    key = (pydantic_model, method)
+    structured = entry["structured"].get(key)
+    if structured is None:
+        structured = entry["client"].with_structured_output(pydantic_model, method=method)
+        entry["structured"][key] = structured
+    return structured
+
+
+# ---------------------------------------------------------------------------
+# Client pool
+# ---------------------------------------------------------------------------
+
+# Settings that determine which credentials/endpoint a provider's client uses.
+# A change in any of them (e.g. a rotated key) replaces the pooled client.
+_CREDENTIAL_SETTINGS = {
+    ModelProvider.GROQ: ("GROQ_API_KEY",),
+    ModelProvider.OPENAI: ("OPENAI_API_KEY", "OPENAI_API_BASE"),
+    ModelProvider.ANTHROPIC: ("ANTHROPIC_API_KEY",),
+    ModelProvider.DEEPSEEK: ("DEEPSEEK_API_KEY",),
+    ModelProvider.GOOGLE: ("GOOGLE_API_KEY",),
+    ModelProvider.OLLAMA: ("OLLAMA_HOST", "OLLAMA_BASE_URL"),
+    ModelProvider.OPENROUTER: ("OPENROUTER_API_KEY", "YOUR_SITE_URL", "YOUR_SITE_NAME"),
+    ModelProvider.XAI: ("XAI_API_KEY",),
+    ModelProvider.GIGACHAT: ("GIGACHAT_USER", "GIGACHAT_PASSWORD", "GIGACHAT_API_KEY", "GIGACHAT_CREDENTIALS"),
+    ModelProvider.AZURE_OPENAI: ("AZURE_OPENAI_API_KEY", "AZURE_OPENAI_ENDPOINT", "AZURE_OPENAI_DEPLOYMENT_NAME"),
+}
+
+_pool: "OrderedDict[tuple, dict]" = OrderedDict()
+_pool_lock = threading.Lock()
+_pool_stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+
+def client_pool_enabled() -> bool:
+    return os.getenv("LLM_CLIENT_POOL", "true").lower() == "true"
+
+
+def _credentials_fingerprint(model_provider, api_keys: dict = None) -> str:
+    """Hash of the settings a provider's client is built from (never stored in clear)."""
+    names = _CREDENTIAL_SETTINGS.get(model_provider) or next(
+        (
+            settings for provider, settings in _CREDENTIAL_SETTINGS.items()
+            if str(model_provider).lower() in (provider.value.lower(), provider.name.lower())
+        ),
+        (),
+    )
+    values = [(name, (api_keys or {}).get(name) or os.getenv(name) or "") for name in names]
+    return hashlib.sha256(json.dumps(values).encode()).hexdigest()[:16]
+
+
+def _current_loop_id() -> int | None:
+    """Async HTTP connections belong to one event loop, so clients are pooled per loop."""
+    try:
+        return id(asyncio.get_running_loop())
+    except RuntimeError:
+        return None
+
+
+def _get_pool_entry(model_name: str, model_provider, api_keys: dict = None) -> dict:
+    max_size = int(os.getenv("LLM_CLIENT_POOL_SIZE", "32"))
+    slot = (str(model_provider), model_name, _current_loop_id())
+    fingerprint = _credentials_fingerprint(model_provider, api_keys)
+    key = slot + (fingerprint,)
+    
+    with _pool_lock:
+        entry = _pool.get(key)
+        if entry is not None:
+            _pool.move_to_end(key)
+            _pool_stats["hits"] += 1
+            return entry
+    
+    # Build outside the lock; a concurrent miss for the same key just builds twice
+    client = _create_model(model_name, model_provider, api_keys)
+    entry = {"client": client, "structured": {}}
+    if client is None:
+        return entry
+    
+    with _pool_lock:
+        _pool_stats["misses"] += 1
+        # Keys rotated: drop clients built from the previous credentials.
+        # Per-request keys differ between users, so those age out by LRU instead.
+        if not (api_keys or {}):
+            for stale in [k for k in _pool if k[:3] == slot and k[3] != fingerprint]:
+                del _pool[stale]
+                _pool_stats["evictions"] += 1
+        entry = _pool.setdefault(key, entry)
+        while len(_pool) > max_size:
+            _pool.popitem(last=False)
+            _pool_stats["evictions"] += 1
+    return entry
+
+
+def get_model_pool_stats() -> dict:
+    """Get client pool hits, misses, evictions and size."""
+    with _pool_lock:
+        return {**_pool_stats, "size": len(_pool)}
+
+
+def reset_model_pool():
+    """Drop all pooled clients (useful for testing)."""
+    with _pool_lock:
+        _pool.clear()
+        for name in _pool_stats:
+            _pool_stats[name] = 0
+
+
+def _create_model(model_name: str, model_provider: ModelProvider, api_keys: dict = None) -> ChatOpenAI | ChatGroq | ChatOllama | GigaChat | None:
     if model_provider == ModelProvider.GROQ:
         api_key = (api_keys or {}).get("GROQ_API_KEY") or os.getenv("GROQ_API_KEY")
         if not api_key:
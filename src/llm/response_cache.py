@@ -0,0 +1,100 @@
+"""
+Content-addressed cache for structured LLM responses.
+
+call_llm answers the same prompt again whenever a UI user re-runs a flow,
+/automated/dry-run repeats a cycle or a backtest resumes. With the cache on,
+a validated response is stored under a hash of everything that determines
+it: provider, model, the rendered messages and the output schema. An
+identical request is then answered from Redis (or the in-process tier) for
+the TTL without calling the provider.
+
+Only validated pydantic results are cached, never error/default responses.
+
+Environment Variables:
+- LLM_RESPONSE_CACHE: Enable the cache (default: false)
+- CACHE_TTL_LLM: Seconds to keep responses (default: 86400)
+- LLM_CACHE_BYPASS_AGENTS: Comma-separated agent names (or name fragments)
+  that always call the provider, e.g. "portfolio_manager,risk_manager"
+"""
+
+import hashlib
+import json
+import logging
+import os
+from typing import Any, List, Optional, Tuple
+
+from pydantic import BaseModel
+
+logger = logging.getLogger(__name__)
+
+
+def llm_cache_enabled() -> bool:
+    return os.environ.get("LLM_RESPONSE_CACHE", "false").lower() == "true"
+
+
+def cache_bypassed(agent_name: Optional[str]) -> bool:
+    """Check if an agent is configured to skip the response cache."""
+    if not agent_name:
+        return False
+    bypass = [a.strip().lower() for a in os.environ.get("LLM_CACHE_BYPASS_AGENTS", "").split(",") if a.strip()]
+    name = agent_name.lower().replace(" ", "_")
+    return any(agent in name for agent in bypass)
+
+
+def _render_messages(prompt: Any) -> List[Tuple[str, Any]]:
+    """Render a prompt (string, prompt value or message list) to (role, content) pairs."""
+    if hasattr(prompt, "to_messages"):
+        prompt = prompt.to_messages()
+    if isinstance(prompt, str):
+        return [("human", prompt)]
+    if isinstance(prompt, (list, tuple)):
+        rendered = []
+        for message in prompt:
+            if isinstance(message, (list, tuple)) and len(message) == 2:
+                rendered.append((str(message[0]), message[1]))
+            else:
+                rendered.append((getattr(message, "type", "human"), getattr(message, "content", str(message))))
+        return rendered
+    return [("human", str(prompt))]
+
+
+def response_cache_key(
+    provider: str,
+    model: str,
+    prompt: Any,
+    pydantic_model: type[BaseModel],
+) -> str:
+    """Hash of (provider, model, rendered messages, output schema)."""
+    payload = json.dumps(
+        {
+            "provider": str(provider).lower(),
+            "model": model,
+            "messages": _render_messages(prompt),
+            "schema": pydantic_model.model_json_schema(),
+        },
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def get_cached_response(key: str, pydantic_model: type[BaseModel]) -> Optional[BaseModel]:
+    """Get a cached response, or None on a miss or if it no longer validates."""
+    try:
+        from src.data.cache import get_cache
+        cached = get_cache().get_llm_response(key)
+        if cached is None:
+            return None
+        return pydantic_model.model_validate_json(cached)
+    except Exception as e:
+        logger.debug(f"LLM response cache read failed: {e}")
+        return None
+
+
+def set_cached_response(key: str, response: BaseModel):
+    """Store a validated response."""
+    try:
+        from src.data.cache import get_cache
+        get_cache().set_llm_response(key, response.model_dump_json())
+    except Exception as e:
+        logger.debug(f"LLM response cache write failed: {e}")
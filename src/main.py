@@ -7,6 +7,7 @@ from colorama import Fore, Style, init
 import questionary
 from src.agents.portfolio_manager import portfolio_management_agent
 from src.agents.risk_manager import risk_management_agent
+from src.data.run_context import release_data_context
 from src.graph.state import AgentState
 from src.utils.display import print_trading_output
 from src.utils.analysts import ANALYST_ORDER, get_analyst_nodes
@@ -17,6 +18,7 @@ from src.cli.input import (
 )
 
 import argparse
+import uuid
 from datetime import datetime
 from dateutil.relativedelta import relativedelta
 import json
@@ -58,6 +60,10 @@ def run_hedge_fund(
     # Start progress tracking
     progress.start()
 
+    # Agents share one data context per run, keyed by workflow id
+    if workflow_id is None:
+        workflow_id = str(uuid.uuid4())
+
     try:
         # Build workflow (default to all analysts when none provided)
         workflow = create_workflow(selected_analysts if selected_analysts else None)
@@ -94,6 +100,7 @@ def run_hedge_fund(
     finally:
         # Stop progress tracking
         progress.stop()
+        release_data_context(workflow_id)
 
 
 def start(state: AgentState):
@@ -12,6 +12,7 @@ import logging
 from datetime import datetime, timezone
 from typing import Optional, List, Dict, Any
 from contextlib import contextmanager
+from threading import Lock
 
 logger = logging.getLogger(__name__)
 
@@ -38,6 +39,9 @@ class EventLogger:
     def __init__(self):
         self._engine = None
         self._initialized = False
+        # LLM response cache outcomes per agent: agent -> {"hits", "misses"}
+        self._llm_cache_stats: Dict[str, Dict[str, int]] = {}
+        self._llm_cache_lock = Lock()
     
     def _get_engine(self):
         """Lazily get the database engine."""
@@ -518,8 +522,20 @@ class EventLogger:
         retry_count: int = 0,
         estimated_cost_usd: float = 0.0,
         error: str = None,
+        error_type: str = None,
+        error_message: str = None,
+        cache_hit: Optional[bool] = None,
     ):
-        """Log an LLM API call for monitoring and cost tracking."""
+        """
+        Log an LLM API call for monitoring and cost tracking.
+        
+        cache_hit is True when the response came from the LLM response cache,
+        False when the cache was consulted and missed, and None when it
+        wasn't used; hits and misses feed get_llm_cache_stats().
+        """
+        error = error or error_message
+        if cache_hit is not None:
+            self._record_llm_cache_outcome(agent_id or "unknown", cache_hit)
         try:
             # Log to workflow events if we have a workflow_id and are initialized
             if workflow_id and self._initialized:
@@ -540,6 +556,8 @@ class EventLogger:
                         "retry_count": retry_count,
                         "estimated_cost_usd": estimated_cost_usd,
                         "error": error,
+                        "error_type": error_type,
+                        "cache_hit": cache_hit,
                     },
                 )
             
@@ -551,3 +569,24 @@ class EventLogger:
         except Exception as e:
             # Silent fail - don't let logging errors break the pipeline
             pass
+    
+    def _record_llm_cache_outcome(self, agent_id: str, hit: bool):
+        with self._llm_cache_lock:
+            counts = self._llm_cache_stats.setdefault(agent_id, {"hits": 0, "misses": 0})
+            counts["hits" if hit else "misses"] += 1
+    
+    def get_llm_cache_stats(self) -> Dict[str, Any]:
+        """Get LLM response cache hits, misses and hit rate (overall and per agent)."""
+        with self._llm_cache_lock:
+            by_agent = {
+                agent: dict(counts, hit_rate=round(counts["hits"] / max(1, counts["hits"] + counts["misses"]), 3))
+                for agent, counts in self._llm_cache_stats.items()
+            }
+        hits = sum(c["hits"] for c in by_agent.values())
+        misses = sum(c["misses"] for c in by_agent.values())
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": round(hits / max(1, hits + misses), 3),
+            "by_agent": by_agent,
+        }
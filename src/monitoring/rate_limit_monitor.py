@@ -53,6 +53,9 @@ class APIQuotaStatus:
     last_call_at: Optional[datetime] = None
     last_error_at: Optional[datetime] = None
     consecutive_errors: int = 0
+    # Adaptive concurrency window, when an AIMD limiter manages this API
+    concurrency_limit: Optional[int] = None
+    in_flight: Optional[int] = None
     
     @property
     def utilization_pct(self) -> float:
@@ -247,6 +250,16 @@ class RateLimitMonitor:
                 service=api_name,
             )
     
+    def record_concurrency_window(self, api_name: str, limit: int, in_flight: int):
+        """Record the current adaptive concurrency window for an API."""
+        with self._lock:
+            if api_name not in self._quotas:
+                self._quotas[api_name] = APIQuotaStatus(api_name=api_name)
+            
+            quota = self._quotas[api_name]
+            quota.concurrency_limit = limit
+            quota.in_flight = in_flight
+    
     def can_call(self, api_name: str, threshold_pct: float = 95) -> bool:
         """
         Check if it's safe to make an API call.
@@ -300,6 +313,8 @@ class RateLimitMonitor:
                     "utilization_pct": quota.utilization_pct,
                     "last_call_at": quota.last_call_at.isoformat() if quota.last_call_at else None,
                     "consecutive_errors": quota.consecutive_errors,
+                    "concurrency_limit": quota.concurrency_limit,
+                    "in_flight": quota.in_flight,
                 }
             
             return result
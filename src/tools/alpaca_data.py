@@ -24,11 +24,18 @@ from dataclasses import dataclass
 from dotenv import load_dotenv
 
 from src.data.cache import get_cache
+from src.tools.provider_errors import report_provider_error
+from src.utils.adaptive_limiter import get_adaptive_limiter
+from src.utils.distributed_rate_limiter import get_provider_limiter
+from src.utils.http_session import get_http_session
 
 load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+# Max symbols per multi-symbol stocks/bars request (keeps URLs well under length limits)
+MULTI_BARS_BATCH_SIZE = 100
+
 # Lazy import for monitoring to avoid circular imports
 _rate_limit_monitor = None
 
@@ -142,6 +149,41 @@ class AlpacaDataClient:
         endpoint: str,
         params: Dict = None,
         version: str = "v2",
+    ) -> Dict:
+        """
+        Make API request, within the adaptive concurrency window when
+        ADAPTIVE_CONCURRENCY is on (see src/utils/adaptive_limiter.py) and the
+        shared rate limit for this provider when DISTRIBUTED_RATE_LIMIT is on
+        (see src/utils/distributed_rate_limiter.py).
+        """
+        adaptive = get_adaptive_limiter("alpaca_data")
+        if adaptive and not adaptive.acquire(timeout=60):
+            report_provider_error("alpaca: concurrency limiter timeout")
+            raise Exception("Alpaca Data API concurrency limiter timeout")
+        try:
+            limiter = get_provider_limiter("alpaca_data")
+            if limiter is None:
+                return self._send(method, endpoint, params, version)
+            if not limiter.acquire(timeout=60):
+                raise Exception("Alpaca Data API rate limiter timeout")
+            try:
+                return self._send(method, endpoint, params, version)
+            finally:
+                limiter.release()
+        except Exception as e:
+            # The public getters swallow this and return empty; let source health see it
+            report_provider_error(f"alpaca: {e}")
+            raise
+        finally:
+            if adaptive:
+                adaptive.release()
+    
+    def _send(
+        self,
+        method: str,
+        endpoint: str,
+        params: Dict = None,
+        version: str = "v2",
     ) -> Dict:
         """
         Make API request with monitoring.
@@ -160,7 +202,7 @@ class AlpacaDataClient:
         
         start_time = time.time()
         try:
-            response = requests.request(
+            response = get_http_session("alpaca_data").request(
                 method=method,
                 url=url,
                 headers=self._headers(),
@@ -177,6 +219,10 @@ class AlpacaDataClient:
                         "alpaca_data",
                         retry_after=int(retry_after) if retry_after else None
                     )
+                if limiter := get_provider_limiter("alpaca_data"):
+                    limiter.record_429()
+                if adaptive := get_adaptive_limiter("alpaca_data"):
+                    adaptive.record_429()
                 raise Exception("Alpaca Data API rate limited (429)")
             
             if response.status_code == 403:
@@ -203,14 +249,18 @@ class AlpacaDataClient:
                     )
                 raise Exception(f"Alpaca Data API error ({response.status_code}): {error_msg}")
             
+            remaining = response.headers.get("X-RateLimit-Remaining")
+            remaining = int(remaining) if remaining else None
+            if adaptive := get_adaptive_limiter("alpaca_data"):
+                adaptive.record_response(latency_ms / 1000, remaining)
+            
             # Log successful call
             if rate_monitor:
-                remaining = response.headers.get("X-RateLimit-Remaining")
                 rate_monitor.record_call(
                     "alpaca_data",
                     call_type=call_type,
                     success=True,
-                    rate_limit_remaining=int(remaining) if remaining else None,
+                    rate_limit_remaining=remaining,
                     latency_ms=latency_ms,
                 )
             
@@ -284,58 +334,184 @@ class AlpacaDataClient:
             logger.warning("Alpaca not configured, returning empty DataFrame")
             return pd.DataFrame()
         
-        # Check cache first
         cache_key = f"alpaca_{symbol}_{start_date}_{end_date}_{timeframe}"
+        
+        # Intraday bars up to today keep changing: serve stale-while-revalidate
+        if timeframe != "1Day" and end_date >= datetime.now().strftime("%Y-%m-%d"):
+            try:
+                records = self._cache.get_intraday_or_fetch(
+                    cache_key,
+                    lambda: self._fetch_bars(symbol, start_date, end_date, timeframe, limit).to_dict("records"),
+                )
+                return pd.DataFrame(records) if records else pd.DataFrame()
+            except Exception as e:
+                logger.error(f"Failed to get Alpaca bars for {symbol}: {e}")
+                return pd.DataFrame()
+        
+        # Check cache first
         if cached := self._cache.get_prices(cache_key):
             logger.debug(f"Cache hit for Alpaca bars: {symbol}")
             return pd.DataFrame(cached)
         
         try:
-            params = {
-                "symbols": symbol.upper(),
-                "timeframe": timeframe,
-                "start": f"{start_date}T00:00:00Z",
-                "end": f"{end_date}T23:59:59Z",
-                "limit": limit,
-                "adjustment": "all",  # Include splits and dividends
-                "feed": "iex",  # Use IEX (available on free tier)
-            }
-            
-            data = self._request("GET", "stocks/bars", params=params)
-            
-            bars = data.get("bars", {}).get(symbol.upper(), [])
-            
-            if not bars:
-                logger.info(f"No Alpaca bars returned for {symbol}")
-                return pd.DataFrame()
-            
-            # Convert to DataFrame
-            records = []
-            for bar in bars:
-                records.append({
-                    "time": pd.to_datetime(bar["t"]),
-                    "open": float(bar["o"]),
-                    "high": float(bar["h"]),
-                    "low": float(bar["l"]),
-                    "close": float(bar["c"]),
-                    "volume": int(bar["v"]),
-                    "vwap": float(bar.get("vw", 0)),
-                    "trade_count": int(bar.get("n", 0)),
-                })
-            
-            df = pd.DataFrame(records)
-            df = df.sort_values("time").reset_index(drop=True)
+            df = self._fetch_bars(symbol, start_date, end_date, timeframe, limit)
+            if df.empty:
+                return df
             
             # Cache the results
             self._cache.set_prices(cache_key, df.to_dict("records"))
-            
-            logger.info(f"Got {len(df)} Alpaca bars for {symbol}")
             return df
             
         except Exception as e:
             logger.error(f"Failed to get Alpaca bars for {symbol}: {e}")
             return pd.DataFrame()
     
+    def _fetch_bars(
+        self,
+        symbol: str,
+        start_date: str,
+        end_date: str,
+        timeframe: str,
+        limit: int,
+    ) -> pd.DataFrame:
+        """Fetch bars for one symbol from the API (no caching)."""
+        params = {
+            "symbols": symbol.upper(),
+            "timeframe": timeframe,
+            "start": f"{start_date}T00:00:00Z",
+            "end": f"{end_date}T23:59:59Z",
+            "limit": limit,
+            "adjustment": "all",  # Include splits and dividends
+            "feed": "iex",  # Use IEX (available on free tier)
+        }
+        
+        data = self._request("GET", "stocks/bars", params=params)
+        
+        bars = data.get("bars", {}).get(symbol.upper(), [])
+        
+        if not bars:
+            logger.info(f"No Alpaca bars returned for {symbol}")
+            return pd.DataFrame()
+        
+        df = self._bars_to_df(bars)
+        logger.info(f"Got {len(df)} Alpaca bars for {symbol}")
+        return df
+    
+    def get_bars_multi(
+        self,
+        symbols: List[str],
+        start_date: str,
+        end_date: str,
+        timeframe: str = "1Day",
+        long_format: bool = False,
+    ) -> Dict[str, pd.DataFrame] | pd.DataFrame:
+        """
+        Get historical price bars for many symbols in batched requests.
+        
+        The stocks/bars endpoint accepts a comma-separated symbol list and
+        pages through results with next_page_token, so a whole universe loads
+        in a few round trips. Symbols already cached are served from cache,
+        and each fetched symbol is cached under the same key get_bars uses.
+        
+        Args:
+            symbols: Stock symbols
+            start_date: Start date (YYYY-MM-DD)
+            end_date: End date (YYYY-MM-DD)
+            timeframe: Bar timeframe (1Min, 5Min, 15Min, 1Hour, 1Day)
+            long_format: Return one DataFrame with a symbol column instead of a dict
+            
+        Returns:
+            Dict mapping symbol to a DataFrame like get_bars returns (empty when
+            no bars), or a single long-format DataFrame
+        """
+        symbols = list(dict.fromkeys(s.upper() for s in symbols))
+        results: Dict[str, pd.DataFrame] = {}
+        
+        if self.is_configured() and symbols:
+            cache_keys = {symbol: f"alpaca_{symbol}_{start_date}_{end_date}_{timeframe}" for symbol in symbols}
+            cached = self._cache.get_prices_many(list(cache_keys.values()))
+            missing = []
+            for symbol, cache_key in cache_keys.items():
+                if cache_key in cached:
+                    results[symbol] = pd.DataFrame(cached[cache_key])
+                else:
+                    missing.append(symbol)
+            
+            for i in range(0, len(missing), MULTI_BARS_BATCH_SIZE):
+                batch = missing[i:i + MULTI_BARS_BATCH_SIZE]
+                try:
+                    bars_by_symbol = self._fetch_bars_pages(batch, start_date, end_date, timeframe)
+                except Exception as e:
+                    logger.error(f"Failed to get Alpaca bars for {len(batch)} symbols: {e}")
+                    continue
+                
+                fetched = {}
+                for symbol in batch:
+                    bars = bars_by_symbol.get(symbol)
+                    if not bars:
+                        continue
+                    df = self._bars_to_df(bars)
+                    fetched[cache_keys[symbol]] = df.to_dict("records")
+                    results[symbol] = df
+                self._cache.set_prices_many(fetched)
+            
+            logger.info(f"Got Alpaca bars for {len(results)}/{len(symbols)} symbols ({len(missing)} fetched)")
+        elif not self.is_configured():
+            logger.warning("Alpaca not configured, returning empty bars")
+        
+        if long_format:
+            frames = [df.assign(symbol=symbol) for symbol, df in results.items() if not df.empty]
+            return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+        return {symbol: results.get(symbol, pd.DataFrame()) for symbol in symbols}
+    
+    def _fetch_bars_pages(
+        self,
+        symbols: List[str],
+        start_date: str,
+        end_date: str,
+        timeframe: str,
+    ) -> Dict[str, List[Dict]]:
+        """Fetch all pages of stocks/bars for a batch of symbols."""
+        params = {
+            "symbols": ",".join(symbols),
+            "timeframe": timeframe,
+            "start": f"{start_date}T00:00:00Z",
+            "end": f"{end_date}T23:59:59Z",
+            "limit": 10000,  # Per page, across all symbols
+            "adjustment": "all",  # Include splits and dividends
+            "feed": "iex",  # Use IEX (available on free tier)
+        }
+        
+        bars_by_symbol: Dict[str, List[Dict]] = {}
+        while True:
+            data = self._request("GET", "stocks/bars", params=params)
+            for symbol, bars in (data.get("bars") or {}).items():
+                bars_by_symbol.setdefault(symbol, []).extend(bars)
+            
+            page_token = data.get("next_page_token")
+            if not page_token:
+                return bars_by_symbol
+            params = {**params, "page_token": page_token}
+    
+    @staticmethod
+    def _bars_to_df(bars: List[Dict]) -> pd.DataFrame:
+        """Convert raw Alpaca bars to a time-sorted DataFrame."""
+        records = []
+        for bar in bars:
+            records.append({
+                "time": pd.to_datetime(bar["t"]),
+                "open": float(bar["o"]),
+                "high": float(bar["h"]),
+                "low": float(bar["l"]),
+                "close": float(bar["c"]),
+                "volume": int(bar["v"]),
+                "vwap": float(bar.get("vw", 0)),
+                "trade_count": int(bar.get("n", 0)),
+            })
+        
+        df = pd.DataFrame(records)
+        return df.sort_values("time").reset_index(drop=True)
+    
     def get_snapshot(self, symbol: str) -> Optional[AlpacaSnapshot]:
         """
         Get latest market snapshot for a symbol.
@@ -580,6 +756,12 @@ def get_alpaca_prices(ticker: str, start_date: str, end_date: str) -> pd.DataFra
     return client.get_bars(ticker, start_date, end_date)
 
 
+def get_alpaca_prices_multi(tickers: List[str], start_date: str, end_date: str) -> Dict[str, pd.DataFrame]:
+    """Get prices for many tickers from Alpaca in batched requests (convenience function)."""
+    client = get_alpaca_data_client()
+    return client.get_bars_multi(tickers, start_date, end_date)
+
+
 def get_alpaca_news(ticker: str, limit: int = 20) -> List[Dict]:
     """Get news from Alpaca (convenience function)."""
     client = get_alpaca_data_client()
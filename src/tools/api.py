@@ -1,12 +1,24 @@
 import datetime
+import functools
+import inspect
 import os
+import numpy as np
 import pandas as pd
 import requests
 import time
 import logging
-from threading import Semaphore, Lock
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from threading import Event, Semaphore, Lock
 
 from src.data.cache import get_cache
+from src.data.memory_cache import MemoryCache
+from src.data.price_frame import PriceFrame
+from src.data.price_store import get_price_store
+from src.tools.provider_errors import report_provider_error
+from src.utils.adaptive_limiter import get_adaptive_limiter
+from src.utils.distributed_rate_limiter import get_distributed_limiter
+from src.utils.http_session import get_http_session
+from src.utils.market_clock import is_trading_day
 
 # Lazy import for monitoring to avoid circular imports
 _rate_limit_monitor = None
@@ -54,6 +66,9 @@ logger = logging.getLogger(__name__)
 # Global cache instance
 _cache = get_cache()
 
+# FinancialMetrics built from FMP TTM data, by ticker/period/end date
+_fmp_metrics_memo = MemoryCache(max_entries=4096)
+
 
 class FallbackTracker:
     """
@@ -184,6 +199,351 @@ def get_fallback_stats() -> dict:
     return _fallback_tracker.get_stats()
 
 
+class ProviderMissCache:
+    """
+    Short-lived memory of (provider, data type, ticker) combinations that came
+    back empty, so routing can skip a provider that is known not to have a
+    ticker (delisted, ETF, plan restriction) instead of retrying it and
+    re-logging the same failure on every call.
+    
+    Date-windowed fetches (prices, news) record misses per window (the
+    router passes "TICKER[start..end]" as the ticker), since an empty
+    weekend or holiday window says nothing about the next one.
+    
+    Each miss carries a reason code:
+    - "no_data": the provider answered with nothing
+    - "error": the provider call raised
+    
+    Entries expire after PROVIDER_MISS_TTL seconds. While a miss is live, the
+    provider is re-probed in the background at most every probe_interval
+    seconds; a successful probe clears the miss.
+    """
+    
+    NO_DATA = "no_data"
+    ERROR = "error"
+    
+    def __init__(self, ttl: float = 900.0, probe_interval: float = 300.0, max_entries: int = 10000):
+        self.ttl = ttl
+        self.probe_interval = probe_interval
+        self._misses = MemoryCache(max_entries=max_entries)
+        self._lock = Lock()
+        self._skipped = 0
+        self._probes = 0
+        self._recovered = 0
+    
+    @staticmethod
+    def enabled() -> bool:
+        return os.environ.get("PROVIDER_MISS_CACHE", "true").lower() == "true"
+    
+    @staticmethod
+    def _key(source: str, data_type: str, ticker: str) -> str:
+        return f"{source}:{data_type}:{ticker}"
+    
+    def record_miss(self, source: str, data_type: str, ticker: str, reason: str):
+        """Remember that a provider had nothing for this ticker."""
+        now = time.time()
+        with self._lock:
+            self._misses.set(
+                self._key(source, data_type, ticker),
+                {"reason": reason, "since": now, "next_probe": now + self.probe_interval},
+                self.ttl,
+            )
+    
+    def forget(self, source: str, data_type: str, ticker: str):
+        with self._lock:
+            self._misses.delete(self._key(source, data_type, ticker))
+    
+    def clear(self):
+        with self._lock:
+            self._misses.clear()
+    
+    def get(self, source: str, data_type: str, ticker: str) -> dict | None:
+        """Get the live miss for a provider/data type/ticker, if any."""
+        if not self.enabled():
+            return None
+        return self._misses.get(self._key(source, data_type, ticker))
+    
+    def should_skip(self, source: str, data_type: str, ticker: str) -> tuple[bool, bool]:
+        """
+        Check whether to route around a provider.
+        
+        Returns:
+            (skip, probe): skip the provider for this request; probe it in
+            the background (claimed by this caller, at most once per interval)
+        """
+        miss = self.get(source, data_type, ticker)
+        if miss is None:
+            return False, False
+        with self._lock:
+            self._skipped += 1
+            probe = time.time() >= miss["next_probe"]
+            if probe:
+                miss["next_probe"] = time.time() + self.probe_interval
+                self._probes += 1
+        return True, probe
+    
+    def record_probe_success(self, source: str, data_type: str, ticker: str):
+        self.forget(source, data_type, ticker)
+        with self._lock:
+            self._recovered += 1
+    
+    def get_stats(self) -> dict:
+        with self._lock:
+            return {
+                "enabled": self.enabled(),
+                "misses": len(self._misses),
+                "skipped": self._skipped,
+                "probes": self._probes,
+                "recovered": self._recovered,
+                "ttl": self.ttl,
+            }
+
+
+class ProviderRouter:
+    """
+    Routes a fetch across a primary and a secondary provider.
+    
+    Sequential mode (default) waits for the primary to finish before trying
+    the secondary. Hedged mode (HEDGED_REQUESTS=true) starts the primary,
+    and if it hasn't answered within the primary's observed latency
+    percentile (HEDGE_LATENCY_PERCENTILE), fires the secondary in parallel
+    and takes whichever returns data first. The loser's result is discarded;
+    a request already on the wire can't be aborted, so it finishes in the
+    background (and still warms that provider's cache).
+    
+    Both modes record outcomes in the FallbackTracker and per-provider
+    latencies used to compute the hedge delay. Providers that came back
+    empty for a ticker are remembered in a ProviderMissCache and routed
+    around until the miss expires or a background probe succeeds.
+    """
+    
+    def __init__(
+        self,
+        tracker: FallbackTracker,
+        misses: ProviderMissCache | None = None,
+        percentile: float = 95.0,
+        default_delay: float = 2.0,
+        min_delay: float = 0.25,
+        min_samples: int = 20,
+        window_size: int = 200,
+        max_workers: int = 16,
+    ):
+        self.tracker = tracker
+        self.misses = misses or ProviderMissCache()
+        self.percentile = percentile
+        self.default_delay = default_delay
+        self.min_delay = min_delay
+        self.min_samples = min_samples
+        self.window_size = window_size
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="hedge")
+        self._lock = Lock()
+        self._latencies: dict[tuple[str, str], list[float]] = {}
+        self._hedges_fired = 0
+        self._hedges_won = 0
+    
+    @staticmethod
+    def hedging_enabled() -> bool:
+        return os.environ.get("HEDGED_REQUESTS", "false").lower() == "true"
+    
+    def _record_latency(self, data_type: str, source: str, seconds: float):
+        with self._lock:
+            samples = self._latencies.setdefault((data_type, source), [])
+            samples.append(seconds)
+            if len(samples) > self.window_size:
+                samples.pop(0)
+    
+    def hedge_delay(self, data_type: str, source: str) -> float:
+        """Seconds to wait on the primary before hedging to the secondary."""
+        with self._lock:
+            samples = list(self._latencies.get((data_type, source), []))
+        if len(samples) < self.min_samples:
+            return self.default_delay
+        return max(self.min_delay, float(np.percentile(samples, self.percentile)))
+    
+    def _timed(self, data_type: str, source: str, fn):
+        start = time.time()
+        try:
+            return fn()
+        finally:
+            self._record_latency(data_type, source, time.time() - start)
+    
+    def fetch(
+        self,
+        data_type: str,
+        ticker: str,
+        primary: tuple,
+        secondary: tuple,
+        window: tuple | None = None,
+    ):
+        """
+        Fetch from primary/secondary providers.
+        
+        Providers with a live miss for this data type and ticker (see
+        ProviderMissCache) are skipped, and re-probed in the background.
+        
+        Args:
+            data_type: Data type label for tracking (e.g. "prices")
+            ticker: Ticker, for logging
+            primary: (source name, fn) where fn returns data or None
+            secondary: (source name, fn)
+            window: (start_date, end_date) the fetch covers; misses are only
+                remembered for that same window
+        
+        Returns:
+            The winning provider's data, or None if both returned nothing
+        """
+        if window:
+            ticker = f"{ticker}[{window[0]}..{window[1]}]"
+        available = []
+        for provider in (primary, secondary):
+            skip, probe = self.misses.should_skip(provider[0], data_type, ticker)
+            if probe:
+                self._executor.submit(self._probe, data_type, ticker, provider)
+            if skip:
+                logger.debug(f"Skipping {provider[0]} {data_type} for {ticker}: known miss")
+            else:
+                available.append(provider)
+        
+        if len(available) == 1:
+            return self._fetch_single(data_type, ticker, available[0])
+        if not available:
+            return None
+        if self.hedging_enabled():
+            return self._fetch_hedged(data_type, ticker, primary, secondary)
+        return self._fetch_sequential(data_type, ticker, primary, secondary)
+    
+    def _attempt(self, data_type: str, source: str, fn) -> tuple:
+        """Run a provider fetch. Returns (data, None) or (None, miss reason)."""
+        try:
+            result = self._timed(data_type, source, fn)
+        except Exception as e:
+            logger.warning(f"{source} {data_type} fetch raised: {e}")
+            return None, ProviderMissCache.ERROR
+        if not result:
+            return None, ProviderMissCache.NO_DATA
+        return result, None
+    
+    def _fetch_single(self, data_type: str, ticker: str, provider: tuple):
+        # The other provider is a known miss for this ticker: this one is
+        # effectively the primary, so no fallback is recorded
+        name, fn = provider
+        result, reason = self._attempt(data_type, name, fn)
+        if result:
+            self.tracker.record_success(data_type, name, was_fallback=False)
+            return result
+        self.misses.record_miss(name, data_type, ticker, reason)
+        logger.info(f"{name} {data_type} failed for {ticker}, trying Financial Datasets...")
+        return None
+    
+    def _probe(self, data_type: str, ticker: str, provider: tuple):
+        name, fn = provider
+        result, reason = self._attempt(data_type, name, fn)
+        if result:
+            logger.info(f"{name} {data_type} for {ticker} recovered, clearing known miss")
+            self.misses.record_probe_success(name, data_type, ticker)
+        else:
+            self.misses.record_miss(name, data_type, ticker, reason)
+    
+    def _fetch_sequential(self, data_type: str, ticker: str, primary: tuple, secondary: tuple):
+        primary_name, primary_fn = primary
+        secondary_name, secondary_fn = secondary
+        
+        result, reason = self._attempt(data_type, primary_name, primary_fn)
+        if result:
+            self.tracker.record_success(data_type, primary_name, was_fallback=False)
+            return result
+        self.misses.record_miss(primary_name, data_type, ticker, reason)
+        self.tracker.record_primary_failure(data_type, primary_name, "No data returned")
+        logger.info(f"{primary_name} {data_type} failed for {ticker}, trying {secondary_name} fallback...")
+        
+        result, reason = self._attempt(data_type, secondary_name, secondary_fn)
+        if result:
+            self.tracker.record_success(data_type, secondary_name, was_fallback=True)
+            return result
+        self.misses.record_miss(secondary_name, data_type, ticker, reason)
+        logger.info(f"{secondary_name} {data_type} fallback failed for {ticker}, trying Financial Datasets...")
+        return None
+    
+    def _fetch_hedged(self, data_type: str, ticker: str, primary: tuple, secondary: tuple):
+        primary_name, primary_fn = primary
+        secondary_name, secondary_fn = secondary
+        delay = self.hedge_delay(data_type, primary_name)
+        
+        primary_future = self._executor.submit(self._attempt, data_type, primary_name, primary_fn)
+        done, _ = wait([primary_future], timeout=delay)
+        if done:
+            result, reason = primary_future.result()
+            if result:
+                self.tracker.record_success(data_type, primary_name, was_fallback=False)
+                return result
+            self.misses.record_miss(primary_name, data_type, ticker, reason)
+            self.tracker.record_primary_failure(data_type, primary_name, "No data returned")
+        else:
+            with self._lock:
+                self._hedges_fired += 1
+            logger.info(f"{primary_name} {data_type} for {ticker} slower than {delay:.2f}s, hedging to {secondary_name}")
+        
+        secondary_future = self._executor.submit(self._attempt, data_type, secondary_name, secondary_fn)
+        names = {primary_future: primary_name, secondary_future: secondary_name}
+        pending = {secondary_future} | ({primary_future} if not done else set())
+        while pending:
+            finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in finished:
+                result, reason = future.result()
+                if not result:
+                    self.misses.record_miss(names[future], data_type, ticker, reason)
+                    continue
+                for loser in pending:
+                    loser.cancel()
+                if future is primary_future:
+                    self.tracker.record_success(data_type, primary_name, was_fallback=False)
+                else:
+                    if not done:
+                        self.tracker.record_primary_failure(
+                            data_type, primary_name, f"Slower than hedge delay ({delay:.2f}s)"
+                        )
+                        with self._lock:
+                            self._hedges_won += 1
+                    self.tracker.record_success(data_type, secondary_name, was_fallback=True)
+                return result
+        
+        logger.info(f"{primary_name} and {secondary_name} {data_type} failed for {ticker}, trying Financial Datasets...")
+        return None
+    
+    def get_stats(self) -> dict:
+        """Get hedging statistics and current hedge delays."""
+        with self._lock:
+            keys = list(self._latencies.keys())
+            stats = {
+                "hedging_enabled": self.hedging_enabled(),
+                "hedges_fired": self._hedges_fired,
+                "hedges_won": self._hedges_won,
+            }
+        stats["hedge_delays"] = {
+            f"{data_type}:{source}": round(self.hedge_delay(data_type, source), 3)
+            for data_type, source in keys
+        }
+        stats["provider_misses"] = self.misses.get_stats()
+        return stats
+
+
+# Global provider router instance
+_provider_router = ProviderRouter(
+    _fallback_tracker,
+    ProviderMissCache(
+        ttl=float(os.getenv("PROVIDER_MISS_TTL", "900")),
+        probe_interval=float(os.getenv("PROVIDER_MISS_PROBE_INTERVAL", "300")),
+    ),
+    percentile=float(os.getenv("HEDGE_LATENCY_PERCENTILE", "95")),
+    default_delay=float(os.getenv("HEDGE_DEFAULT_DELAY", "2.0")),
+)
+
+
+def get_hedging_stats() -> dict:
+    """Get current hedged-request statistics."""
+    return _provider_router.get_stats()
+
+
 class DataAPIRateLimiter:
     """
     Rate limiter for Financial Datasets API calls.
@@ -264,13 +624,49 @@ class DataAPIRateLimiter:
         self.semaphore.release()
 
 
-# Global rate limiter for data API
-_data_rate_limiter = DataAPIRateLimiter(
-    max_concurrent=int(os.getenv("DATA_API_MAX_CONCURRENT", "2")),
-    min_delay_seconds=float(os.getenv("DATA_API_MIN_DELAY", "0.5")),
+# Adaptive concurrency window for data API calls when ADAPTIVE_CONCURRENCY=true
+# (see src/utils/adaptive_limiter.py); it replaces the fixed concurrency and
+# minimum delay below, which then only act as an upper bound
+_data_adaptive_limiter = get_adaptive_limiter("financial_datasets")
+
+# Global rate limiter for data API (shared across processes via Redis when
+# DISTRIBUTED_RATE_LIMIT=true, see src/utils/distributed_rate_limiter.py)
+_data_rate_limiter = get_distributed_limiter(
+    "financial_datasets",
+    requests_per_minute=float(os.getenv(
+        "DATA_API_REQUESTS_PER_MINUTE", str(60 / max(float(os.getenv("DATA_API_MIN_DELAY", "0.5")), 0.01))
+    )),
+    max_concurrent=(
+        _data_adaptive_limiter.max_limit if _data_adaptive_limiter
+        else int(os.getenv("DATA_API_MAX_CONCURRENT", "2"))
+    ),
+    fallback=DataAPIRateLimiter(
+        max_concurrent=(
+            _data_adaptive_limiter.max_limit if _data_adaptive_limiter
+            else int(os.getenv("DATA_API_MAX_CONCURRENT", "2"))
+        ),
+        min_delay_seconds=0.0 if _data_adaptive_limiter else float(os.getenv("DATA_API_MIN_DELAY", "0.5")),
+    ),
 )
 
 
+def _acquire_data_slot(timeout: float = 300) -> bool:
+    """Acquire a slot in the adaptive window (if enabled), then data rate limiter permission."""
+    if _data_adaptive_limiter and not _data_adaptive_limiter.acquire(timeout=timeout):
+        return False
+    if not _data_rate_limiter.acquire(timeout=timeout):
+        if _data_adaptive_limiter:
+            _data_adaptive_limiter.release()
+        return False
+    return True
+
+
+def _release_data_slot():
+    _data_rate_limiter.release()
+    if _data_adaptive_limiter:
+        _data_adaptive_limiter.release()
+
+
 def _make_api_request(url: str, headers: dict, method: str = "GET", json_data: dict = None, max_retries: int = 3, call_type: str = "general") -> requests.Response:
     """
     Make an API request with rate limiting handling and exponential backoff.
@@ -293,8 +689,9 @@ def _make_api_request(url: str, headers: dict, method: str = "GET", json_data: d
     
     for attempt in range(max_retries + 1):  # +1 for initial attempt
         # Acquire rate limiter permission
-        if not _data_rate_limiter.acquire(timeout=300):
+        if not _acquire_data_slot(timeout=300):
             logger.warning("Data API rate limiter timeout")
+            report_provider_error("financial_datasets: rate limiter timeout")
             # Return a fake 429 response to trigger retry logic
             response = requests.Response()
             response.status_code = 429
@@ -303,14 +700,16 @@ def _make_api_request(url: str, headers: dict, method: str = "GET", json_data: d
         start_time = time.time()
         try:
             if method.upper() == "POST":
-                response = requests.post(url, headers=headers, json=json_data, timeout=30)
+                response = get_http_session("financial_datasets").post(url, headers=headers, json=json_data, timeout=30)
             else:
-                response = requests.get(url, headers=headers, timeout=30)
+                response = get_http_session("financial_datasets").get(url, headers=headers, timeout=30)
             
             latency_ms = int((time.time() - start_time) * 1000)
             
             if response.status_code == 429:
                 _data_rate_limiter.record_429()
+                if _data_adaptive_limiter:
+                    _data_adaptive_limiter.record_429()
                 
                 # Log rate limit hit to monitoring system
                 if rate_monitor:
@@ -329,18 +728,25 @@ def _make_api_request(url: str, headers: dict, method: str = "GET", json_data: d
             else:
                 _data_rate_limiter.record_success()
                 
+                # Parse rate limit headers if present
+                remaining = response.headers.get("X-RateLimit-Remaining")
+                remaining = int(remaining) if remaining else None
+                if _data_adaptive_limiter:
+                    _data_adaptive_limiter.record_response(latency_ms / 1000, remaining)
+                
                 # Log successful call to monitoring system
                 if rate_monitor:
-                    # Parse rate limit headers if present
-                    remaining = response.headers.get("X-RateLimit-Remaining")
                     rate_monitor.record_call(
                         "financial_datasets",
                         call_type=call_type,
                         success=(response.status_code < 400),
-                        rate_limit_remaining=int(remaining) if remaining else None,
+                        rate_limit_remaining=remaining,
                         latency_ms=latency_ms,
                     )
             
+            if response.status_code == 429 or response.status_code >= 500:
+                # Callers treat any non-200 as "no data"; let source health see it
+                report_provider_error(f"financial_datasets: HTTP {response.status_code}")
             return response
             
         except requests.exceptions.Timeout as e:
@@ -364,98 +770,201 @@ def _make_api_request(url: str, headers: dict, method: str = "GET", json_data: d
                 )
             raise
         finally:
-            _data_rate_limiter.release()
+            _release_data_slot()
 
 
-def get_prices(ticker: str, start_date: str, end_date: str, api_key: str = None) -> list[Price]:
-    """Fetch price data from cache or API.
+class _InFlightCall:
+    """A fetch in progress that concurrent identical callers wait on."""
+    
+    def __init__(self):
+        self.done = Event()
+        self.result = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent identical data requests into one in-flight fetch.
+    
+    When LangGraph fans out the analyst nodes, many agents ask for the same
+    ticker's data at the same moment. The first caller for a key performs the
+    fetch; everyone else arriving while it is in flight waits and receives
+    the same result (or the same exception). Nothing is retained once the
+    fetch completes - caching stays the job of the cache layer.
+    """
+    
+    def __init__(self):
+        self._lock = Lock()
+        self._calls: dict[tuple, _InFlightCall] = {}
+        self._leaders = 0
+        self._coalesced = 0
+    
+    def do(self, key: tuple, fn):
+        """Run fn() for key, or wait for the identical call already in flight."""
+        with self._lock:
+            call = self._calls.get(key)
+            is_leader = call is None
+            if is_leader:
+                call = _InFlightCall()
+                self._calls[key] = call
+                self._leaders += 1
+            else:
+                self._coalesced += 1
+        
+        if not is_leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            # Hand out a fresh list so one caller's mutations don't leak to another
+            return list(call.result) if isinstance(call.result, list) else call.result
+        
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.done.set()
+    
+    def get_stats(self) -> dict:
+        """Get coalescing statistics."""
+        with self._lock:
+            total = self._leaders + self._coalesced
+            return {
+                "fetches": self._leaders,
+                "coalesced": self._coalesced,
+                "in_flight": len(self._calls),
+                "coalesced_rate": self._coalesced / total if total else 0.0,
+            }
+
+
+# Global single-flight group for data fetches
+_single_flight = SingleFlight()
+
+
+def get_single_flight_stats() -> dict:
+    """Get current request coalescing statistics."""
+    return _single_flight.get_stats()
+
+
+def _normalize_request_value(value):
+    """Make a request argument hashable and order-insensitive where order doesn't matter."""
+    if isinstance(value, (list, tuple, set)):
+        items = tuple(value)
+        if all(isinstance(item, str) for item in items):
+            return tuple(sorted(set(items)))
+        return items
+    return value
+
+
+def _coalesced(fn):
+    """Decorator: route concurrent identical calls to fn through the single-flight group."""
+    signature = inspect.signature(fn)
+    
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        key = (fn.__name__,) + tuple(
+            (name, _normalize_request_value(value)) for name, value in bound.arguments.items()
+        )
+        return _single_flight.do(key, lambda: fn(*args, **kwargs))
+    
+    return wrapper
+
+
+@_coalesced
+def get_prices(ticker: str, start_date: str, end_date: str, api_key: str = None) -> PriceFrame:
+    """Fetch price data from the local price store, cache or API.
+    
+    Returns a PriceFrame: a columnar, read-only sequence of Price that
+    exposes OHLCV as NumPy arrays and only builds Price objects on access.
+    
+    When PRICE_STORE_DIR is set, bars are served from the on-disk price store
+    and only the date gaps it does not yet cover are fetched from providers.
     
     Routes through data sources based on PRIMARY_DATA_SOURCE:
     - fmp: FMP → Alpaca → Financial Datasets
     - alpaca: Alpaca → FMP → Financial Datasets
     - financial_datasets: Financial Datasets API only
     """
+    store = get_price_store()
+    if store is None:
+        return _fetch_prices(ticker, start_date, end_date, api_key)
+    
+    gaps = store.missing_ranges(ticker, start_date, end_date)
+    if gaps:
+        for gap_start, gap_end in gaps:
+            prices = _fetch_prices(ticker, gap_start, gap_end, api_key)
+            # _fetch_prices returns empty on provider errors too, so an empty gap is
+            # only trusted as covered when it has no trading days (weekend, holiday)
+            if prices or not _has_trading_day(gap_start, gap_end):
+                store.write(ticker, gap_start, gap_end, PriceFrame.from_prices(prices, ticker).to_records())
+            else:
+                logger.info(f"No prices fetched for {ticker} {gap_start}..{gap_end}, will refetch next time")
+    
+    return store.read_frame(ticker, start_date, end_date)
+
+
+def _has_trading_day(start_date: str, end_date: str) -> bool:
+    """Check whether a date range includes a regular trading session."""
+    day = datetime.datetime.strptime(start_date, "%Y-%m-%d").date()
+    end = datetime.datetime.strptime(end_date, "%Y-%m-%d").date()
+    while day <= end:
+        if is_trading_day(day):
+            return True
+        day += datetime.timedelta(days=1)
+    return False
+
+
+def _fetch_prices(ticker: str, start_date: str, end_date: str, api_key: str = None) -> PriceFrame:
+    """Fetch price data for a date range from providers (bypasses the price store)."""
     primary_source = os.environ.get("PRIMARY_DATA_SOURCE", "fmp")
     
     # Helper to fetch from FMP
-    def try_fmp() -> list[Price] | None:
+    def try_fmp() -> PriceFrame | None:
         try:
             from src.tools.fmp_data import get_fmp_data_client
             client = get_fmp_data_client()
             if client.is_configured():
                 df = client.get_historical_prices(ticker, start_date, end_date)
                 if df is not None and not df.empty:
-                    prices = []
-                    for _, row in df.iterrows():
-                        prices.append(Price(
-                            ticker=ticker,
-                            time=row["time"].isoformat() if hasattr(row["time"], "isoformat") else str(row["time"]),
-                            open=float(row["open"]),
-                            high=float(row["high"]),
-                            low=float(row["low"]),
-                            close=float(row["close"]),
-                            volume=int(row["volume"]),
-                        ))
-                    if prices:
-                        logger.info(f"Got {len(prices)} prices for {ticker} from FMP")
-                        return prices
+                    prices = PriceFrame.from_df(df, ticker=ticker)
+                    logger.info(f"Got {len(prices)} prices for {ticker} from FMP")
+                    return prices
         except Exception as e:
             logger.warning(f"FMP prices failed for {ticker}: {e}")
         return None
     
     # Helper to fetch from Alpaca
-    def try_alpaca() -> list[Price] | None:
+    def try_alpaca() -> PriceFrame | None:
         try:
             from src.tools.alpaca_data import get_alpaca_data_client
             client = get_alpaca_data_client()
             if client.is_configured():
                 df = client.get_bars(ticker, start_date, end_date)
                 if df is not None and not df.empty:
-                    prices = []
-                    for _, row in df.iterrows():
-                        prices.append(Price(
-                            ticker=ticker,
-                            time=row["time"].isoformat() if hasattr(row["time"], "isoformat") else str(row["time"]),
-                            open=float(row["open"]),
-                            high=float(row["high"]),
-                            low=float(row["low"]),
-                            close=float(row["close"]),
-                            volume=int(row["volume"]),
-                        ))
-                    if prices:
-                        logger.info(f"Got {len(prices)} prices for {ticker} from Alpaca")
-                        return prices
+                    prices = PriceFrame.from_df(df, ticker=ticker)
+                    logger.info(f"Got {len(prices)} prices for {ticker} from Alpaca")
+                    return prices
         except Exception as e:
             logger.warning(f"Alpaca prices failed for {ticker}: {e}")
         return None
     
     # Route based on primary data source
-    if primary_source == "fmp":
-        # FMP → Alpaca → Financial Datasets
-        result = try_fmp()
-        if result:
-            _fallback_tracker.record_success("prices", "FMP", was_fallback=False)
-            return result
-        _fallback_tracker.record_primary_failure("prices", "FMP", "No data returned")
-        logger.info(f"FMP failed for {ticker}, trying Alpaca fallback...")
-        result = try_alpaca()
-        if result:
-            _fallback_tracker.record_success("prices", "Alpaca", was_fallback=True)
-            return result
-        logger.info(f"Alpaca fallback failed for {ticker}, trying Financial Datasets...")
-    elif primary_source == "alpaca":
-        # Alpaca → FMP → Financial Datasets
-        result = try_alpaca()
-        if result:
-            _fallback_tracker.record_success("prices", "Alpaca", was_fallback=False)
-            return result
-        _fallback_tracker.record_primary_failure("prices", "Alpaca", "No data returned")
-        logger.info(f"Alpaca failed for {ticker}, trying FMP fallback...")
-        result = try_fmp()
+    providers = {"fmp": ("FMP", try_fmp), "alpaca": ("Alpaca", try_alpaca)}
+    if primary_source in providers:
+        # FMP ↔ Alpaca (sequential or hedged) → Financial Datasets
+        secondary_source = "alpaca" if primary_source == "fmp" else "fmp"
+        result = _provider_router.fetch(
+            "prices", ticker, providers[primary_source], providers[secondary_source],
+            window=(start_date, end_date),
+        )
         if result:
-            _fallback_tracker.record_success("prices", "FMP", was_fallback=True)
             return result
-        logger.info(f"FMP fallback failed for {ticker}, trying Financial Datasets...")
 
     # Fall back to Financial Datasets API
     # Create a cache key that includes all parameters to ensure exact matches
@@ -463,7 +972,7 @@ def get_prices(ticker: str, start_date: str, end_date: str, api_key: str = None)
     
     # Check cache first - simple exact match
     if cached_data := _cache.get_prices(cache_key):
-        return [Price(**price) for price in cached_data]
+        return PriceFrame.from_records(cached_data, ticker=ticker)
 
     # If not in cache, fetch from API
     headers = {}
@@ -474,23 +983,184 @@ def get_prices(ticker: str, start_date: str, end_date: str, api_key: str = None)
     url = f"https://api.financialdatasets.ai/prices/?ticker={ticker}&interval=day&interval_multiplier=1&start_date={start_date}&end_date={end_date}"
     response = _make_api_request(url, headers, call_type="prices")
     if response.status_code != 200:
-        return []
+        return PriceFrame.empty(ticker)
 
     # Parse response with Pydantic model
     try:
         price_response = PriceResponse(**response.json())
         prices = price_response.prices
     except:
-        return []
+        return PriceFrame.empty(ticker)
 
     if not prices:
-        return []
+        return PriceFrame.empty(ticker)
 
     # Cache the results using the comprehensive cache key
     _cache.set_prices(cache_key, [p.model_dump() for p in prices])
-    return prices
+    return PriceFrame.from_prices(prices, ticker=ticker)
 
 
+def _price_cache_keys(ticker: str, start_date: str, end_date: str) -> list[str]:
+    """Cache keys get_prices may be served from, in routing order."""
+    keys = {
+        "fmp": f"fmp_{ticker}_{start_date}_{end_date}",
+        "alpaca": f"alpaca_{ticker.upper()}_{start_date}_{end_date}_1Day",
+    }
+    primary_source = os.environ.get("PRIMARY_DATA_SOURCE", "fmp")
+    ordered = [keys[primary_source], keys["alpaca" if primary_source == "fmp" else "fmp"]] if primary_source in keys else []
+    return ordered + [f"{ticker}_{start_date}_{end_date}"]
+
+
+def get_prices_many(tickers: list[str], start_date: str, end_date: str, api_key: str = None) -> dict[str, PriceFrame]:
+    """
+    Fetch prices for many tickers over the same window.
+    
+    Universe-level callers (strategy scan, liquidity filter, watchlist
+    triggers) use this instead of calling get_prices in a loop. Every cache
+    key the tickers could be served from is read in one pipelined round
+    trip (which also loads the hits into the in-process cache tier), misses
+    go through the batched Alpaca prefetch, and only then does get_prices
+    run per ticker.
+    
+    Returns:
+        Dict of ticker -> PriceFrame (empty when no data); tickers whose
+        fetch raised are left out
+    """
+    tickers = list(dict.fromkeys(tickers))
+    if get_price_store() is None and tickers:
+        keys = {ticker: _price_cache_keys(ticker, start_date, end_date) for ticker in tickers}
+        cached = _cache.get_prices_many([key for ticker_keys in keys.values() for key in ticker_keys])
+        missing = [ticker for ticker, ticker_keys in keys.items() if not any(key in cached for key in ticker_keys)]
+        logger.debug(f"Price cache served {len(tickers) - len(missing)}/{len(tickers)} tickers")
+        prefetch_prices(missing, start_date, end_date)
+    
+    results = {}
+    for ticker in tickers:
+        try:
+            results[ticker] = get_prices(ticker, start_date, end_date, api_key=api_key)
+        except Exception as e:
+            logger.warning(f"Price fetch failed for {ticker}: {e}")
+    return results
+
+
+def prefetch_prices(tickers: list[str], start_date: str, end_date: str) -> int:
+    """
+    Warm the price cache for many tickers with batched multi-symbol requests.
+    
+    Only applies when Alpaca is the primary price source, since get_prices
+    then reads the same per-symbol Alpaca cache entries. Callers that are
+    about to call get_prices for a whole universe can call this first to
+    turn N round trips into a few.
+    
+    Returns:
+        Number of tickers with bars loaded
+    """
+    if os.environ.get("PRIMARY_DATA_SOURCE", "fmp") != "alpaca" or len(tickers) < 2:
+        return 0
+    try:
+        from src.tools.alpaca_data import get_alpaca_data_client
+        client = get_alpaca_data_client()
+        if not client.is_configured():
+            return 0
+        frames = client.get_bars_multi(tickers, start_date, end_date)
+        return sum(1 for df in frames.values() if not df.empty)
+    except Exception as e:
+        logger.warning(f"Batched price prefetch failed, falling back to per-ticker fetches: {e}")
+        return 0
+
+
+def warm_cache(
+    tickers: list[str],
+    end_date: str,
+    start_date: str | None = None,
+    metrics_period: str = "ttm",
+    metrics_limit: int = 10,
+    news_limit: int = 1000,
+) -> int:
+    """
+    Load cached metrics and news for many tickers in one round trip each.
+
+    Reads every ticker's cache entry with a single pipelined request per data
+    type, which leaves the hits in the in-process cache tier, so the
+    per-ticker get_financial_metrics / get_company_news calls that follow
+    don't each make their own Redis round trip.
+
+    Returns:
+        Number of cache entries found
+    """
+    metrics = _cache.get_financial_metrics_many(
+        [f"{ticker}_{metrics_period}_{end_date}_{metrics_limit}" for ticker in tickers]
+    )
+    fmp_ttm = _cache.get_fmp_ttm_many(tickers)
+    news = _cache.get_company_news_many(
+        [f"{ticker}_{start_date or 'none'}_{end_date}_{news_limit}" for ticker in tickers]
+    )
+    return len(metrics) + len(fmp_ttm) + len(news)
+
+
+def _fmp_financial_metrics(ticker: str, end_date: str, period: str, m: dict, r: dict) -> FinancialMetrics:
+    """Build FinancialMetrics from FMP TTM key metrics (m) and ratios (r)."""
+    # Map FMP fields to FinancialMetrics model fields
+    # FMP uses camelCase with TTM suffix, we use snake_case
+    return FinancialMetrics(
+        ticker=ticker,
+        report_period=end_date,
+        period=period,
+        currency="USD",  # FMP primarily covers US markets
+
+        # Valuation metrics
+        market_cap=m.get("marketCap"),
+        enterprise_value=m.get("enterpriseValueTTM") or r.get("enterpriseValueTTM"),
+        price_to_earnings_ratio=r.get("priceToEarningsRatioTTM"),
+        price_to_book_ratio=r.get("priceToBookRatioTTM"),
+        price_to_sales_ratio=r.get("priceToSalesRatioTTM"),
+        enterprise_value_to_ebitda_ratio=m.get("evToEBITDATTM") or r.get("enterpriseValueMultipleTTM"),
+        enterprise_value_to_revenue_ratio=m.get("evToSalesTTM"),
+        free_cash_flow_yield=m.get("freeCashFlowYieldTTM"),
+        peg_ratio=r.get("priceToEarningsGrowthRatioTTM"),
+
+        # Profitability margins
+        gross_margin=r.get("grossProfitMarginTTM"),
+        operating_margin=r.get("operatingProfitMarginTTM"),
+        net_margin=r.get("netProfitMarginTTM"),
+
+        # Returns
+        return_on_equity=m.get("returnOnEquityTTM") or r.get("returnOnEquityTTM"),
+        return_on_assets=m.get("returnOnAssetsTTM") or r.get("returnOnAssetsTTM"),
+        return_on_invested_capital=m.get("returnOnInvestedCapitalTTM"),
+
+        # Efficiency/Turnover
+        asset_turnover=r.get("assetTurnoverTTM"),
+        inventory_turnover=r.get("inventoryTurnoverTTM"),
+        receivables_turnover=r.get("receivablesTurnoverTTM"),
+        days_sales_outstanding=m.get("daysOfSalesOutstandingTTM"),
+        operating_cycle=m.get("operatingCycleTTM"),
+        working_capital_turnover=r.get("workingCapitalTurnoverRatioTTM"),
+
+        # Liquidity
+        current_ratio=m.get("currentRatioTTM") or r.get("currentRatioTTM"),
+        quick_ratio=r.get("quickRatioTTM"),
+        cash_ratio=r.get("cashRatioTTM"),
+        operating_cash_flow_ratio=r.get("operatingCashFlowRatioTTM"),
+
+        # Leverage/Solvency
+        debt_to_equity=r.get("debtToEquityRatioTTM"),
+        debt_to_assets=r.get("debtToAssetsRatioTTM"),
+        interest_coverage=r.get("interestCoverageRatioTTM"),
+
+        # Per-share metrics
+        payout_ratio=r.get("dividendPayoutRatioTTM"),
+        earnings_per_share=r.get("netIncomePerShareTTM"),
+        book_value_per_share=r.get("bookValuePerShareTTM"),
+        free_cash_flow_per_share=r.get("freeCashFlowPerShareTTM"),
+
+        # Note: FMP TTM endpoints don't provide growth metrics directly
+        # Growth metrics would require comparing multiple periods
+        # These are left as None for now
+    )
+
+
+@_coalesced
 def get_financial_metrics(
     ticker: str,
     end_date: str,
@@ -508,77 +1178,27 @@ def get_financial_metrics(
 
     # Try FMP first when selected as primary
     if primary_source == "fmp":
+        memo_key = f"{ticker}:{period}:{end_date}"
+        if (memoized := _fmp_metrics_memo.get(memo_key)) is not None:
+            return [memoized]
         try:
-            from src.tools.fmp_data import get_fmp_data_client
-            client = get_fmp_data_client()
-            if client.is_configured():
-                metrics_ttm = client.get_key_metrics_ttm(ticker)
-                ratios_ttm = client.get_ratios_ttm(ticker)
-
-                if metrics_ttm or ratios_ttm:
-                    m = metrics_ttm or {}
-                    r = ratios_ttm or {}
-
-                    # Map FMP fields to FinancialMetrics model fields
-                    # FMP uses camelCase with TTM suffix, we use snake_case
-                    fmp_metrics = FinancialMetrics(
-                        ticker=ticker,
-                        report_period=end_date,
-                        period=period,
-                        currency="USD",  # FMP primarily covers US markets
-                        
-                        # Valuation metrics
-                        market_cap=m.get("marketCap"),
-                        enterprise_value=m.get("enterpriseValueTTM") or r.get("enterpriseValueTTM"),
-                        price_to_earnings_ratio=r.get("priceToEarningsRatioTTM"),
-                        price_to_book_ratio=r.get("priceToBookRatioTTM"),
-                        price_to_sales_ratio=r.get("priceToSalesRatioTTM"),
-                        enterprise_value_to_ebitda_ratio=m.get("evToEBITDATTM") or r.get("enterpriseValueMultipleTTM"),
-                        enterprise_value_to_revenue_ratio=m.get("evToSalesTTM"),
-                        free_cash_flow_yield=m.get("freeCashFlowYieldTTM"),
-                        peg_ratio=r.get("priceToEarningsGrowthRatioTTM"),
-                        
-                        # Profitability margins
-                        gross_margin=r.get("grossProfitMarginTTM"),
-                        operating_margin=r.get("operatingProfitMarginTTM"),
-                        net_margin=r.get("netProfitMarginTTM"),
-                        
-                        # Returns
-                        return_on_equity=m.get("returnOnEquityTTM") or r.get("returnOnEquityTTM"),
-                        return_on_assets=m.get("returnOnAssetsTTM") or r.get("returnOnAssetsTTM"),
-                        return_on_invested_capital=m.get("returnOnInvestedCapitalTTM"),
-                        
-                        # Efficiency/Turnover
-                        asset_turnover=r.get("assetTurnoverTTM"),
-                        inventory_turnover=r.get("inventoryTurnoverTTM"),
-                        receivables_turnover=r.get("receivablesTurnoverTTM"),
-                        days_sales_outstanding=m.get("daysOfSalesOutstandingTTM"),
-                        operating_cycle=m.get("operatingCycleTTM"),
-                        working_capital_turnover=r.get("workingCapitalTurnoverRatioTTM"),
-                        
-                        # Liquidity
-                        current_ratio=m.get("currentRatioTTM") or r.get("currentRatioTTM"),
-                        quick_ratio=r.get("quickRatioTTM"),
-                        cash_ratio=r.get("cashRatioTTM"),
-                        operating_cash_flow_ratio=r.get("operatingCashFlowRatioTTM"),
-                        
-                        # Leverage/Solvency
-                        debt_to_equity=r.get("debtToEquityRatioTTM"),
-                        debt_to_assets=r.get("debtToAssetsRatioTTM"),
-                        interest_coverage=r.get("interestCoverageRatioTTM"),
-                        
-                        # Per-share metrics
-                        payout_ratio=r.get("dividendPayoutRatioTTM"),
-                        earnings_per_share=r.get("netIncomePerShareTTM"),
-                        book_value_per_share=r.get("bookValuePerShareTTM"),
-                        free_cash_flow_per_share=r.get("freeCashFlowPerShareTTM"),
-                        
-                        # Note: FMP TTM endpoints don't provide growth metrics directly
-                        # Growth metrics would require comparing multiple periods
-                        # These are left as None for now
-                    )
-                    logger.info(f"Got financial metrics for {ticker} from FMP")
-                    return [fmp_metrics]
+            ttm = _cache.get_fmp_ttm(ticker)
+            if ttm is None:
+                from src.tools.fmp_data import get_fmp_data_client
+                client = get_fmp_data_client()
+                if client.is_configured():
+                    ttm = {
+                        "metrics": client.get_key_metrics_ttm(ticker) or {},
+                        "ratios": client.get_ratios_ttm(ticker) or {},
+                    }
+                    if ttm["metrics"] or ttm["ratios"]:
+                        _cache.set_fmp_ttm(ticker, ttm)
+
+            if ttm and (ttm["metrics"] or ttm["ratios"]):
+                fmp_metrics = _fmp_financial_metrics(ticker, end_date, period, ttm["metrics"], ttm["ratios"])
+                _fmp_metrics_memo.set(memo_key, fmp_metrics, _cache.TTL_METRICS)
+                logger.info(f"Got financial metrics for {ticker} from FMP")
+                return [fmp_metrics]
         except Exception as e:
             logger.warning(f"FMP metrics failed for {ticker}, falling back: {e}")
     
@@ -616,6 +1236,7 @@ def get_financial_metrics(
     return financial_metrics
 
 
+@_coalesced
 def search_line_items(
     ticker: str,
     line_items: list[str],
@@ -624,8 +1245,60 @@ def search_line_items(
     limit: int = 10,
     api_key: str = None,
 ) -> list[LineItem]:
-    """Fetch line items from API."""
-    # If not in cache or insufficient data, fetch from API
+    """Fetch line items from cache or API.
+    
+    Values are cached per (ticker, period, report_period, field), so a request
+    for a different subset of line items only fetches the fields not cached yet.
+    """
+    cache_key = f"{ticker}_{period}_{end_date}_{limit}"
+    
+    periods = _cache.get_line_item_periods(cache_key)
+    if periods:
+        report_periods = [p["report_period"] for p in periods]
+        cached = _cache.get_line_item_fields(ticker, period, report_periods, line_items)
+        missing = [f for f in line_items if any(f not in cached[rp] for rp in report_periods)]
+        if missing:
+            fetched = _fetch_line_items(ticker, missing, end_date, period, limit, api_key)
+            if fetched is not None:
+                # Periods the subset search didn't return are cached as None too,
+                # but only for fields not already held for that period
+                returned = {item.report_period: item for item in fetched}
+                values = {}
+                for rp in dict.fromkeys([*report_periods, *returned]):
+                    item = returned.get(rp)
+                    held = cached.get(rp, {})
+                    values[rp] = {f: getattr(item, f, None) for f in missing if item is not None or f not in held}
+                _cache.set_line_item_fields(ticker, period, values)
+                for rp, fields in values.items():
+                    cached.setdefault(rp, {}).update(fields)
+        # On a failed fetch, serve the fields already cached; the rest read as None
+        # (not cached, so they are fetched again next time)
+        empty = dict.fromkeys(line_items)
+        return [LineItem(**{**p, **empty, **cached[p["report_period"]]}) for p in periods]
+    
+    search_results = _fetch_line_items(ticker, line_items, end_date, period, limit, api_key)
+    if not search_results:
+        return []
+    
+    # Cache the report periods found and each field's value separately
+    _cache.set_line_item_periods(
+        cache_key,
+        [item.model_dump(exclude=set(line_items)) for item in search_results],
+        end_date,
+    )
+    _cache_line_item_fields(ticker, period, search_results, line_items)
+    return search_results
+
+
+def _fetch_line_items(
+    ticker: str,
+    line_items: list[str],
+    end_date: str,
+    period: str,
+    limit: int,
+    api_key: str = None,
+) -> list[LineItem] | None:
+    """POST a line item search; None when the request or parsing failed."""
     headers = {}
     financial_api_key = api_key or os.environ.get("FINANCIAL_DATASETS_API_KEY")
     if financial_api_key:
@@ -642,21 +1315,26 @@ def search_line_items(
     }
     response = _make_api_request(url, headers, method="POST", json_data=body, call_type="financials")
     if response.status_code != 200:
-        return []
+        return None
     
     try:
         data = response.json()
         response_model = LineItemResponse(**data)
-        search_results = response_model.search_results
+        return response_model.search_results[:limit]
     except:
-        return []
-    if not search_results:
-        return []
+        return None
+
 
-    # Cache the results
-    return search_results[:limit]
+def _cache_line_item_fields(ticker: str, period: str, items: list[LineItem], fields: list[str]):
+    """Cache each requested field per report period; fields the API left out are cached as None."""
+    _cache.set_line_item_fields(
+        ticker,
+        period,
+        {item.report_period: {f: getattr(item, f, None) for f in fields} for item in items},
+    )
 
 
+@_coalesced
 def get_insider_trades(
     ticker: str,
     end_date: str,
@@ -757,6 +1435,7 @@ def get_insider_trades(
     return all_trades
 
 
+@_coalesced
 def get_company_news(
     ticker: str,
     end_date: str,
@@ -773,6 +1452,13 @@ def get_company_news(
     """
     primary_source = os.environ.get("PRIMARY_DATA_SOURCE", "fmp")
 
+    # Create a cache key that includes all parameters to ensure exact matches
+    cache_key = f"{ticker}_{start_date or 'none'}_{end_date}_{limit}"
+    
+    # Check cache first - simple exact match
+    if cached_data := _cache.get_company_news(cache_key):
+        return [CompanyNews(**news) for news in cached_data]
+
     # Helper to fetch from FMP
     def try_fmp() -> list[CompanyNews] | None:
         try:
@@ -829,41 +1515,19 @@ def get_company_news(
         return None
 
     # Route based on primary data source
-    if primary_source == "fmp":
-        # FMP → Alpaca → Financial Datasets
-        result = try_fmp()
-        if result:
-            _fallback_tracker.record_success("news", "FMP", was_fallback=False)
-            return result
-        _fallback_tracker.record_primary_failure("news", "FMP", "No data returned")
-        logger.info(f"FMP news failed for {ticker}, trying Alpaca fallback...")
-        result = try_alpaca()
-        if result:
-            _fallback_tracker.record_success("news", "Alpaca", was_fallback=True)
-            return result
-        logger.info(f"Alpaca news fallback failed for {ticker}, trying Financial Datasets...")
-    elif primary_source == "alpaca":
-        # Alpaca → FMP → Financial Datasets
-        result = try_alpaca()
-        if result:
-            _fallback_tracker.record_success("news", "Alpaca", was_fallback=False)
-            return result
-        _fallback_tracker.record_primary_failure("news", "Alpaca", "No data returned")
-        logger.info(f"Alpaca news failed for {ticker}, trying FMP fallback...")
-        result = try_fmp()
+    providers = {"fmp": ("FMP", try_fmp), "alpaca": ("Alpaca", try_alpaca)}
+    if primary_source in providers:
+        # FMP ↔ Alpaca (sequential or hedged) → Financial Datasets
+        secondary_source = "alpaca" if primary_source == "fmp" else "fmp"
+        result = _provider_router.fetch(
+            "news", ticker, providers[primary_source], providers[secondary_source],
+            window=(start_date, end_date),
+        )
         if result:
-            _fallback_tracker.record_success("news", "FMP", was_fallback=True)
+            _cache.set_company_news(cache_key, [news.model_dump() for news in result])
             return result
-        logger.info(f"FMP news fallback failed for {ticker}, trying Financial Datasets...")
 
     # Fall back to Financial Datasets API
-    # Create a cache key that includes all parameters to ensure exact matches
-    cache_key = f"{ticker}_{start_date or 'none'}_{end_date}_{limit}"
-    
-    # Check cache first - simple exact match
-    if cached_data := _cache.get_company_news(cache_key):
-        return [CompanyNews(**news) for news in cached_data]
-
     # If not in cache, fetch from API
     headers = {}
     financial_api_key = api_key or os.environ.get("FINANCIAL_DATASETS_API_KEY")
@@ -914,6 +1578,7 @@ def get_company_news(
     return all_news
 
 
+@_coalesced
 def get_market_cap(
     ticker: str,
     end_date: str,
@@ -952,6 +1617,8 @@ def get_market_cap(
 
 def prices_to_df(prices: list[Price]) -> pd.DataFrame:
     """Convert prices to a DataFrame."""
+    if isinstance(prices, PriceFrame):
+        return prices.to_df()
     df = pd.DataFrame([p.model_dump() for p in prices])
     df["Date"] = pd.to_datetime(df["time"])
     df.set_index("Date", inplace=True)
@@ -25,17 +25,23 @@ Configuration:
     Set PRIMARY_DATA_SOURCE=fmp for FMP Ultimate (recommended)
     Set PRIMARY_DATA_SOURCE=alpaca for Alpaca Market Data
     Set PRIMARY_DATA_SOURCE=financial_datasets for Financial Datasets API
+    Set DATA_SOURCE_LATENCY_ROUTING=false to keep the fixed order above
+    (by default measured sources are re-ranked by expected latency)
 """
 
 import os
 import logging
 import time
+from collections import deque
 from datetime import datetime, timedelta
-from typing import Optional, List, Dict, Any, Tuple
+from threading import Lock
+from typing import Optional, List, Dict, Any, Tuple, Deque
 from dataclasses import dataclass
 from enum import Enum
 import pandas as pd
 
+from src.tools.provider_errors import collect_provider_errors, report_provider_error
+
 logger = logging.getLogger(__name__)
 
 
@@ -131,6 +137,130 @@ DATA_SOURCES = {
 }
 
 
+class CircuitState(Enum):
+    """Circuit breaker state for a data source"""
+    CLOSED = "closed"  # Requests flow normally
+    OPEN = "open"  # Failing; requests are skipped until the open timeout passes
+    HALF_OPEN = "half_open"  # One probe request decides whether to close again
+
+
+class SourceHealth:
+    """
+    Rolling latency/error statistics and circuit breaker for one source and
+    data type.
+    
+    The breaker opens after failure_threshold consecutive failures, or when
+    the error rate over the rolling window reaches error_rate_threshold (with
+    at least min_requests samples). After open_timeout seconds it goes
+    half-open and lets a single probe request through: success closes it,
+    failure re-opens it.
+    """
+    
+    def __init__(
+        self,
+        window_size: int = 50,
+        failure_threshold: int = 3,
+        error_rate_threshold: float = 0.5,
+        min_requests: int = 10,
+        open_timeout: float = 300.0,
+    ):
+        self.window_size = window_size
+        self.failure_threshold = failure_threshold
+        self.error_rate_threshold = error_rate_threshold
+        self.min_requests = min_requests
+        self.open_timeout = open_timeout
+        
+        self._lock = Lock()
+        self._samples: Deque[Tuple[float, bool]] = deque(maxlen=window_size)  # (latency, success)
+        self._latency_ewma: Optional[float] = None
+        self._consecutive_failures = 0
+        self._state = CircuitState.CLOSED
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._times_opened = 0
+    
+    @property
+    def state(self) -> CircuitState:
+        with self._lock:
+            return self._current_state()
+    
+    def _current_state(self) -> CircuitState:
+        if self._state == CircuitState.OPEN and time.time() - self._opened_at >= self.open_timeout:
+            self._state = CircuitState.HALF_OPEN
+            self._probe_in_flight = False
+        return self._state
+    
+    def allow_request(self) -> bool:
+        """Check whether a request may go out now (claims the probe when half-open)."""
+        with self._lock:
+            state = self._current_state()
+            if state == CircuitState.CLOSED:
+                return True
+            if state == CircuitState.HALF_OPEN and not self._probe_in_flight:
+                self._probe_in_flight = True
+                return True
+            return False
+    
+    def record(self, latency: float, success: bool):
+        """Record a completed request."""
+        with self._lock:
+            self._samples.append((latency, success))
+            if success:
+                self._latency_ewma = latency if self._latency_ewma is None else 0.8 * self._latency_ewma + 0.2 * latency
+                self._consecutive_failures = 0
+                if self._state == CircuitState.HALF_OPEN:
+                    self._state = CircuitState.CLOSED
+                    self._probe_in_flight = False
+                return
+            
+            self._consecutive_failures += 1
+            if self._state == CircuitState.HALF_OPEN or self._should_open():
+                self._open()
+    
+    def _should_open(self) -> bool:
+        if self._consecutive_failures >= self.failure_threshold:
+            return True
+        return len(self._samples) >= self.min_requests and self._error_rate() >= self.error_rate_threshold
+    
+    def _open(self):
+        self._state = CircuitState.OPEN
+        self._opened_at = time.time()
+        self._probe_in_flight = False
+        self._times_opened += 1
+    
+    def _error_rate(self) -> float:
+        if not self._samples:
+            return 0.0
+        return sum(1 for _, ok in self._samples if not ok) / len(self._samples)
+    
+    def expected_latency(self, prior: float, min_samples: int = 3) -> float:
+        """
+        Expected seconds to a successful response: average latency scaled by
+        the success rate. Sources with too few samples get the prior.
+        """
+        with self._lock:
+            successes = sum(1 for _, ok in self._samples if ok)
+            if successes < min_samples or self._latency_ewma is None:
+                return prior
+            return self._latency_ewma / max(1.0 - self._error_rate(), 0.1)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            latencies = sorted(latency for latency, ok in self._samples if ok)
+            return {
+                "state": self._current_state().value,
+                "requests": len(self._samples),
+                "error_rate": round(self._error_rate(), 3),
+                "consecutive_failures": self._consecutive_failures,
+                "latency_ewma_ms": round(self._latency_ewma * 1000, 1) if self._latency_ewma is not None else None,
+                "latency_p95_ms": (
+                    round(latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))] * 1000, 1)
+                    if latencies else None
+                ),
+                "times_opened": self._times_opened,
+            }
+
+
 class MultiSourceDataProvider:
     """
     Unified interface to multiple market data sources with automatic fallback.
@@ -140,12 +270,21 @@ class MultiSourceDataProvider:
     - Rate limit tracking per source
     - Caching to minimize API calls
     - Logging of data source usage
+    - Per source and data type latency/error statistics with a circuit
+      breaker (see SourceHealth)
+    - Latency-aware routing: healthy sources are tried in order of expected
+      latency (DATA_SOURCE_LATENCY_ROUTING, default on); sources without
+      enough samples yet are ranked with a prior, the primary source first
     """
     
+    # Expected latency (seconds) assumed for sources without enough samples
+    DEFAULT_LATENCY_PRIOR = 1.0
+    
     def __init__(self):
         self._rate_limit_tracker: Dict[DataSource, Dict] = {}
-        self._failed_sources: Dict[str, datetime] = {}  # Track failed sources
-        self._failure_cooldown = timedelta(minutes=5)  # Wait before retrying failed source
+        self._health: Dict[Tuple[DataSource, str], SourceHealth] = {}
+        self._health_lock = Lock()
+        self._failure_cooldown = timedelta(minutes=5)  # Breaker open time before a probe
         
         # Check which sources are available
         self._available_sources = self._check_available_sources()
@@ -169,26 +308,66 @@ class MultiSourceDataProvider:
         available.sort(key=lambda s: DATA_SOURCES[s].priority)
         return available
     
-    def _is_source_available(self, source: DataSource) -> bool:
-        """Check if a source is currently available (not rate limited or failed)."""
+    def _health_for(self, source: DataSource, data_type: str) -> SourceHealth:
+        with self._health_lock:
+            key = (source, data_type)
+            if key not in self._health:
+                self._health[key] = SourceHealth(open_timeout=self._failure_cooldown.total_seconds())
+            return self._health[key]
+    
+    def _is_source_available(self, source: DataSource, data_type: str) -> bool:
+        """Check if a source is configured and its circuit for this data type isn't open."""
         if source not in self._available_sources:
             return False
+        return self._health_for(source, data_type).state != CircuitState.OPEN
+    
+    def _call_source(self, source: DataSource, data_type: str, fetch):
+        """
+        Call a source if its circuit allows it, recording latency and errors.
         
-        # Check if source recently failed
-        fail_key = source.value
-        if fail_key in self._failed_sources:
-            if datetime.now() - self._failed_sources[fail_key] < self._failure_cooldown:
-                return False
-            else:
-                # Cooldown expired, try again
-                del self._failed_sources[fail_key]
+        The provider clients swallow HTTP errors (429/401/5xx) and return an
+        empty result; they report them through provider_errors, so a call
+        that reported an error counts as a failure. A genuinely empty answer
+        (no news, an ETF without fundamentals) counts as a success, since
+        health is tracked per source and data type, not per ticker.
         
-        return True
+        Returns:
+            (called, result); exceptions from fetch are recorded and re-raised
+        """
+        health = self._health_for(source, data_type)
+        if not health.allow_request():
+            return False, None
+        
+        start = time.time()
+        with collect_provider_errors() as errors:
+            try:
+                result = fetch()
+            except Exception:
+                health.record(time.time() - start, success=False)
+                if health.state == CircuitState.OPEN:
+                    logger.warning(f"Circuit open for {source.value} {data_type}, will probe after cooldown")
+                raise
+        health.record(time.time() - start, success=not errors)
+        if errors and health.state == CircuitState.OPEN:
+            logger.warning(f"Circuit open for {source.value} {data_type} after {errors[-1]}, will probe after cooldown")
+        return True, result
     
-    def _mark_source_failed(self, source: DataSource):
-        """Mark a source as temporarily failed."""
-        self._failed_sources[source.value] = datetime.now()
-        logger.warning(f"Marked {source.value} as failed, will retry after cooldown")
+    def get_source_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Get rolling latency/error statistics and breaker state per source and data type."""
+        with self._health_lock:
+            items = list(self._health.items())
+        stats: Dict[str, Dict[str, Any]] = {}
+        for (source, data_type), health in items:
+            stats.setdefault(source.value, {})[data_type] = health.get_stats()
+        return stats
+    
+    def get_routing_order(self, data_type: str) -> List[DataSource]:
+        """
+        Get the sources a data type is currently routed to, in the order they are tried.
+        
+        Reflects PRIMARY_DATA_SOURCE, latency-aware ordering and open circuits.
+        """
+        return list(self._get_sources_for_data_type(data_type))
     
     def _get_sources_for_data_type(self, data_type: str) -> List[DataSource]:
         """Get ordered list of sources that support a given data type."""
@@ -238,7 +417,7 @@ class MultiSourceDataProvider:
         }
         
         available_for_type = source_capabilities.get(data_type, [])
-        available = [s for s in available_for_type if self._is_source_available(s)]
+        available = [s for s in available_for_type if self._is_source_available(s, data_type)]
         
         # Route based on PRIMARY_DATA_SOURCE setting
         if primary_source == "fmp":
@@ -256,6 +435,23 @@ class MultiSourceDataProvider:
                 available.remove(DataSource.FINANCIAL_DATASETS)
                 available.insert(0, DataSource.FINANCIAL_DATASETS)
         
+        if os.environ.get("DATA_SOURCE_LATENCY_ROUTING", "true").lower() == "true":
+            # Best expected latency first; unmeasured sources get the prior
+            # (the routed-first source the most optimistic one) and ties keep
+            # the order above
+            available = [
+                source for _, _, source in sorted(
+                    (
+                        self._health_for(source, data_type).expected_latency(
+                            0.0 if rank == 0 else self.DEFAULT_LATENCY_PRIOR
+                        ),
+                        rank,
+                        source,
+                    )
+                    for rank, source in enumerate(available)
+                )
+            ]
+        
         return available
 
     # ========================================================================
@@ -276,32 +472,29 @@ class MultiSourceDataProvider:
         """
         sources = self._get_sources_for_data_type("prices")
         
+        fetchers = {
+            DataSource.ALPACA_DATA: self._get_prices_alpaca,
+            DataSource.YFINANCE: self._get_prices_yfinance,
+            DataSource.FINANCIAL_DATASETS: self._get_prices_financial_datasets,
+            DataSource.POLYGON: self._get_prices_polygon,
+            DataSource.FMP: self._get_prices_fmp,
+            DataSource.ALPHA_VANTAGE: self._get_prices_alpha_vantage,
+        }
+        
         for source in sources:
+            fetch = fetchers.get(source)
+            if fetch is None:
+                continue
             try:
                 logger.debug(f"Trying {source.value} for {ticker} prices")
+                called, df = self._call_source(source, "prices", lambda: fetch(ticker, start_date, end_date))
                 
-                if source == DataSource.ALPACA_DATA:
-                    df = self._get_prices_alpaca(ticker, start_date, end_date)
-                elif source == DataSource.YFINANCE:
-                    df = self._get_prices_yfinance(ticker, start_date, end_date)
-                elif source == DataSource.FINANCIAL_DATASETS:
-                    df = self._get_prices_financial_datasets(ticker, start_date, end_date)
-                elif source == DataSource.POLYGON:
-                    df = self._get_prices_polygon(ticker, start_date, end_date)
-                elif source == DataSource.FMP:
-                    df = self._get_prices_fmp(ticker, start_date, end_date)
-                elif source == DataSource.ALPHA_VANTAGE:
-                    df = self._get_prices_alpha_vantage(ticker, start_date, end_date)
-                else:
-                    continue
-                
-                if df is not None and not df.empty:
+                if called and df is not None and not df.empty:
                     logger.info(f"Got {len(df)} price records for {ticker} from {source.value}")
                     return df, source
                     
             except Exception as e:
                 logger.warning(f"Failed to get prices from {source.value}: {e}")
-                self._mark_source_failed(source)
         
         logger.error(f"All sources failed for {ticker} prices")
         return pd.DataFrame(), DataSource.YFINANCE
@@ -384,6 +577,7 @@ class MultiSourceDataProvider:
         
         response = requests.get(url, params=params, timeout=30)
         if response.status_code != 200:
+            report_provider_error(f"HTTP {response.status_code}")
             return pd.DataFrame()
         
         data = response.json()
@@ -422,6 +616,7 @@ class MultiSourceDataProvider:
         
         response = requests.get(url, params=params, timeout=30)
         if response.status_code != 200:
+            report_provider_error(f"HTTP {response.status_code}")
             return pd.DataFrame()
         
         data = response.json()
@@ -459,26 +654,26 @@ class MultiSourceDataProvider:
         """
         sources = self._get_sources_for_data_type("financials")
         
+        fetchers = {
+            DataSource.YFINANCE: self._get_fundamentals_yfinance,
+            DataSource.FINANCIAL_DATASETS: self._get_fundamentals_financial_datasets,
+            DataSource.FMP: self._get_fundamentals_fmp,
+        }
+        
         for source in sources:
+            fetch = fetchers.get(source)
+            if fetch is None:
+                continue
             try:
                 logger.debug(f"Trying {source.value} for {ticker} fundamentals")
+                called, data = self._call_source(source, "financials", lambda: fetch(ticker))
                 
-                if source == DataSource.YFINANCE:
-                    data = self._get_fundamentals_yfinance(ticker)
-                elif source == DataSource.FINANCIAL_DATASETS:
-                    data = self._get_fundamentals_financial_datasets(ticker)
-                elif source == DataSource.FMP:
-                    data = self._get_fundamentals_fmp(ticker)
-                else:
-                    continue
-                
-                if data:
+                if called and data:
                     logger.info(f"Got fundamentals for {ticker} from {source.value}")
                     return data, source
                     
             except Exception as e:
                 logger.warning(f"Failed to get fundamentals from {source.value}: {e}")
-                self._mark_source_failed(source)
         
         logger.error(f"All sources failed for {ticker} fundamentals")
         return {}, DataSource.YFINANCE
@@ -580,26 +775,26 @@ class MultiSourceDataProvider:
         """Get news articles for a ticker with automatic fallback."""
         sources = self._get_sources_for_data_type("news")
         
+        fetchers = {
+            DataSource.ALPACA_DATA: self._get_news_alpaca,
+            DataSource.FINNHUB: self._get_news_finnhub,
+            DataSource.FINANCIAL_DATASETS: self._get_news_financial_datasets,
+            DataSource.FMP: self._get_news_fmp,
+        }
+        
         for source in sources:
+            fetch = fetchers.get(source)
+            if fetch is None:
+                continue
             try:
-                if source == DataSource.ALPACA_DATA:
-                    news = self._get_news_alpaca(ticker, limit)
-                elif source == DataSource.FINNHUB:
-                    news = self._get_news_finnhub(ticker, limit)
-                elif source == DataSource.FINANCIAL_DATASETS:
-                    news = self._get_news_financial_datasets(ticker, limit)
-                elif source == DataSource.FMP:
-                    news = self._get_news_fmp(ticker, limit)
-                else:
-                    continue
+                called, news = self._call_source(source, "news", lambda: fetch(ticker, limit))
                 
-                if news:
+                if called and news:
                     logger.info(f"Got {len(news)} news articles for {ticker} from {source.value}")
                     return news, source
                     
             except Exception as e:
                 logger.warning(f"Failed to get news from {source.value}: {e}")
-                self._mark_source_failed(source)
         
         return [], DataSource.FINNHUB
     
@@ -638,6 +833,7 @@ class MultiSourceDataProvider:
         
         response = requests.get(url, params=params, timeout=30)
         if response.status_code != 200:
+            report_provider_error(f"HTTP {response.status_code}")
             return []
         
         articles = response.json()[:limit]
@@ -713,3 +909,8 @@ def get_available_data_sources() -> Dict[str, bool]:
         }
     
     return result
+
+
+def get_data_source_stats() -> Dict[str, Dict[str, Any]]:
+    """Get per source and data type latency/error statistics and circuit state."""
+    return get_data_provider().get_source_stats()
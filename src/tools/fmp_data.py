@@ -29,6 +29,10 @@ from dataclasses import dataclass
 from dotenv import load_dotenv
 
 from src.data.cache import get_cache
+from src.tools.provider_errors import report_provider_error
+from src.utils.adaptive_limiter import get_adaptive_limiter
+from src.utils.distributed_rate_limiter import get_provider_limiter
+from src.utils.http_session import get_http_session
 
 load_dotenv()
 
@@ -121,6 +125,40 @@ class FMPDataClient:
         endpoint: str,
         params: Dict = None,
         method: str = "GET",
+    ) -> Any:
+        """
+        Make API request, within the adaptive concurrency window when
+        ADAPTIVE_CONCURRENCY is on (see src/utils/adaptive_limiter.py) and the
+        shared rate limit for this provider when DISTRIBUTED_RATE_LIMIT is on
+        (see src/utils/distributed_rate_limiter.py).
+        """
+        adaptive = get_adaptive_limiter("fmp_data")
+        if adaptive and not adaptive.acquire(timeout=60):
+            report_provider_error("fmp: concurrency limiter timeout")
+            raise Exception("FMP API concurrency limiter timeout")
+        try:
+            limiter = get_provider_limiter("fmp")
+            if limiter is None:
+                return self._send(endpoint, params, method)
+            if not limiter.acquire(timeout=60):
+                raise Exception("FMP API rate limiter timeout")
+            try:
+                return self._send(endpoint, params, method)
+            finally:
+                limiter.release()
+        except Exception as e:
+            # The public getters swallow this and return empty; let source health see it
+            report_provider_error(f"fmp: {e}")
+            raise
+        finally:
+            if adaptive:
+                adaptive.release()
+    
+    def _send(
+        self,
+        endpoint: str,
+        params: Dict = None,
+        method: str = "GET",
     ) -> Any:
         """
         Make API request with monitoring.
@@ -147,7 +185,7 @@ class FMPDataClient:
         start_time = time.time()
         
         try:
-            response = requests.request(
+            response = get_http_session("fmp").request(
                 method=method,
                 url=url,
                 params=params,
@@ -162,6 +200,10 @@ class FMPDataClient:
                         "fmp_data",
                         retry_after=int(retry_after) if retry_after else None
                     )
+                if limiter := get_provider_limiter("fmp"):
+                    limiter.record_429()
+                if adaptive := get_adaptive_limiter("fmp_data"):
+                    adaptive.record_429()
                 raise Exception("FMP API rate limited (429)")
             
             if response.status_code == 401:
@@ -181,14 +223,18 @@ class FMPDataClient:
                     )
                 raise Exception(f"FMP API error ({response.status_code}): {error_msg}")
             
+            remaining = response.headers.get("X-RateLimit-Remaining")
+            remaining = int(remaining) if remaining else None
+            if adaptive := get_adaptive_limiter("fmp_data"):
+                adaptive.record_response(latency_ms / 1000, remaining)
+            
             # Log successful call
             if rate_monitor:
-                remaining = response.headers.get("X-RateLimit-Remaining")
                 rate_monitor.record_call(
                     "fmp_data",
                     call_type=call_type,
                     success=True,
-                    rate_limit_remaining=int(remaining) if remaining else None,
+                    rate_limit_remaining=remaining,
                     latency_ms=latency_ms,
                 )
             
@@ -342,34 +388,47 @@ class FMPDataClient:
             return pd.DataFrame()
         
         try:
-            params = {"symbol": symbol}
-            if from_date:
-                params["from"] = from_date
-            if to_date:
-                params["to"] = to_date
-            
-            data = self._request(f"historical-chart/{interval}", params)
+            # Bars up to today keep changing: serve stale-while-revalidate
+            if not to_date or to_date[:10] >= datetime.now().strftime("%Y-%m-%d"):
+                records = self._cache.get_intraday_or_fetch(
+                    f"fmp_{symbol}_{interval}_{from_date}_{to_date}",
+                    lambda: self._fetch_intraday(symbol, interval, from_date, to_date),
+                )
+            else:
+                records = self._fetch_intraday(symbol, interval, from_date, to_date)
             
-            if not data:
+            if not records:
                 return pd.DataFrame()
             
-            records = []
-            for bar in data:
-                records.append({
-                    "time": pd.to_datetime(bar.get("date")),
-                    "open": float(bar.get("open", 0)),
-                    "high": float(bar.get("high", 0)),
-                    "low": float(bar.get("low", 0)),
-                    "close": float(bar.get("close", 0)),
-                    "volume": int(bar.get("volume", 0)),
-                })
-            
             df = pd.DataFrame(records)
+            df["time"] = pd.to_datetime(df["time"])
             return df.sort_values("time").reset_index(drop=True)
             
         except Exception as e:
             logger.error(f"Failed to get FMP intraday for {symbol}: {e}")
             return pd.DataFrame()
+    
+    def _fetch_intraday(self, symbol: str, interval: str, from_date: str, to_date: str) -> List[Dict]:
+        """Fetch intraday bars from the API as records (no caching)."""
+        params = {"symbol": symbol}
+        if from_date:
+            params["from"] = from_date
+        if to_date:
+            params["to"] = to_date
+        
+        data = self._request(f"historical-chart/{interval}", params)
+        
+        return [
+            {
+                "time": bar.get("date"),
+                "open": float(bar.get("open", 0)),
+                "high": float(bar.get("high", 0)),
+                "low": float(bar.get("low", 0)),
+                "close": float(bar.get("close", 0)),
+                "volume": int(bar.get("volume", 0)),
+            }
+            for bar in data or []
+        ]
 
     # ==================== Fundamentals ====================
     
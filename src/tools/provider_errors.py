@@ -0,0 +1,39 @@
+"""
+Errors swallowed by the data provider clients.
+
+The FMP, Alpaca and Financial Datasets helpers catch HTTP errors (429, 401,
+5xx, timeouts) and return an empty result, so a caller can't tell a failed
+request from a ticker that simply has no data. Clients report those errors
+here before swallowing them, and MultiSourceDataProvider collects the errors
+reported during one source call so its circuit breaker counts them as
+failures while genuinely empty answers count as successes.
+
+Usage:
+    with collect_provider_errors() as errors:
+        result = client.get_news_for_ticker("AAPL")
+    failed = bool(errors)
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, List, Optional
+
+_errors: ContextVar[Optional[List[str]]] = ContextVar("provider_errors", default=None)
+
+
+def report_provider_error(error) -> None:
+    """Record a swallowed provider error for the enclosing collect_provider_errors(), if any."""
+    errors = _errors.get()
+    if errors is not None:
+        errors.append(str(error))
+
+
+@contextmanager
+def collect_provider_errors() -> Iterator[List[str]]:
+    """Collect errors reported by provider clients in this thread/task."""
+    errors: List[str] = []
+    token = _errors.set(errors)
+    try:
+        yield errors
+    finally:
+        _errors.reset(token)
@@ -19,6 +19,8 @@ from datetime import datetime
 from enum import Enum
 from dotenv import load_dotenv
 
+from src.utils.http_session import get_http_session
+
 load_dotenv()
 
 
@@ -340,7 +342,7 @@ class AlpacaService:
         
         start_time = time.time()
         try:
-            response = requests.request(
+            response = get_http_session("alpaca").request(
                 method=method,
                 url=url,
                 headers=self._headers(),
@@ -554,26 +556,39 @@ class AlpacaService:
 
     # ==================== Market Data (Quotes) ====================
 
-    def get_quote(self, symbol: str) -> Optional[Dict[str, Any]]:
+    def get_quote(self, symbol: str, max_staleness: Optional[int] = None) -> Optional[Dict[str, Any]]:
         """
         Get latest quote for a symbol.
         
-        Uses Alpaca's data API for real-time quotes.
+        Uses Alpaca's data API for real-time quotes, cached stale-while-revalidate
+        (see RedisCache.get_or_refresh): outside market hours the last quote is
+        reused until the next open, once refreshed after the close.
         
         Args:
             symbol: Stock symbol
+            max_staleness: Tighter bound (open-market seconds) on the age of a
+                cached quote for this call; 0 always fetches during the session
             
         Returns:
             Dict with bid, ask, last, timestamp, or None on error
         """
         symbol = symbol.upper()
         
+        try:
+            from src.data.cache import get_cache
+            return get_cache().get_quote_or_fetch(symbol, lambda: self._fetch_quote(symbol), max_staleness)
+        except Exception as e:
+            print(f"[Alpaca] ⚠️ Quote cache error for {symbol}: {e}")
+            return self._fetch_quote(symbol)
+    
+    def _fetch_quote(self, symbol: str) -> Optional[Dict[str, Any]]:
+        """Fetch the latest quote from the data API (no caching)."""
         try:
             # Use the market data API endpoint
             # Paper trading uses the same data API as live
             data_url = "https://data.alpaca.markets/v2"
             
-            response = requests.get(
+            response = get_http_session("alpaca_data").get(
                 f"{data_url}/stocks/{symbol}/quotes/latest",
                 headers=self._headers(),
                 timeout=10
@@ -615,7 +630,7 @@ class AlpacaService:
         try:
             data_url = "https://data.alpaca.markets/v2"
             
-            response = requests.get(
+            response = get_http_session("alpaca_data").get(
                 f"{data_url}/stocks/{symbol}/trades/latest",
                 headers=self._headers(),
                 timeout=10
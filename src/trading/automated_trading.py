@@ -1194,18 +1194,19 @@ class AutomatedTradingService:
             return tickers
         
         try:
-            from src.tools.api import get_prices
+            from src.tools.api import get_prices_many
             from datetime import datetime, timedelta
             
             end_date = datetime.now().strftime("%Y-%m-%d")
             start_date = (datetime.now() - timedelta(days=5)).strftime("%Y-%m-%d")
+            prices_by_ticker = get_prices_many(tickers[:50], start_date, end_date)  # Limit API calls
             
             liquid_tickers = []
             illiquid_tickers = []
             
-            for ticker in tickers[:50]:  # Limit API calls
+            for ticker in tickers[:50]:
                 try:
-                    prices = get_prices(ticker, start_date, end_date)
+                    prices = prices_by_ticker[ticker]
                     
                     if not prices:
                         illiquid_tickers.append((ticker, "no price data"))
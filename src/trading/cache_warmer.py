@@ -0,0 +1,246 @@
+"""
+Pre-Market Cache Warmer
+
+The first trading cycle of the day otherwise pays cold-cache costs for every
+ticker in the screening universe. The warmer works out the universe the cycle
+will screen (open positions, the watchlist and the dynamic screening
+universe) and loads the data the cycle and the analyst agents request into
+the cache ahead of time:
+
+- Slow-moving data (TTM/annual metrics, line items, company profiles) is
+  cached for a day, so it is warmed early (6:30 AM ET)
+- Fast-moving data (price bars, news, Danelfin scores) has TTLs of minutes
+  to an hour, so it is warmed just before the open (9:25 AM ET)
+
+Both passes use the same end date (today) as the trading cycle, so the
+cache keys line up. Fetches fan out on a small thread pool under the
+per-provider limits used by the data aggregator; every call still goes
+through the providers' rate limiters.
+
+Environment Variables:
+- CACHE_WARM_ENABLED: Register the warm-up jobs (default: true)
+- CACHE_WARM_MAX_WORKERS: Concurrent fetches (default: 4)
+"""
+
+import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from dateutil.relativedelta import relativedelta
+
+logger = logging.getLogger(__name__)
+
+
+# Data type groups per pass
+SLOW_DATA_TYPES = ("financial_metrics", "line_items", "profiles")
+FAST_DATA_TYPES = ("prices", "news", "danelfin")
+ALL_DATA_TYPES = SLOW_DATA_TYPES + FAST_DATA_TYPES
+
+# Periods the analyst agents request metrics and line items for
+WARM_PERIODS = ("ttm", "annual")
+
+# News limits the analyst agents request (without a start date)
+WARM_NEWS_LIMITS = (50, 100)
+
+
+def cache_warm_enabled() -> bool:
+    return os.environ.get("CACHE_WARM_ENABLED", "true").lower() == "true"
+
+
+def get_warm_universe() -> List[str]:
+    """
+    Work out the tickers the next trading cycle will screen.
+
+    Open positions and the watchlist are always included, even if the
+    screening universe trims them.
+    """
+    from src.trading.automated_trading import get_automated_trading_service
+
+    service = get_automated_trading_service()
+    tickers: List[str] = []
+
+    def add(symbols):
+        for symbol in symbols:
+            if symbol and symbol not in tickers:
+                tickers.append(symbol)
+
+    try:
+        add(pos.symbol for pos in service.alpaca.get_positions() or [])
+    except Exception as e:
+        logger.warning(f"Cache warm: could not fetch positions: {e}")
+
+    try:
+        from src.trading.watchlist_service import get_watchlist_service
+        add(item.ticker for item in get_watchlist_service().get_watchlist(status="watching"))
+    except Exception as e:
+        logger.debug(f"Cache warm: watchlist not available: {e}")
+
+    try:
+        add(service._get_screening_universe())
+    except Exception as e:
+        logger.warning(f"Cache warm: could not build screening universe: {e}")
+
+    return tickers
+
+
+def _price_windows(end: datetime) -> List[str]:
+    """Start dates of the price windows the strategies and agents request."""
+    from src.trading.strategy_engine import get_strategy_engine
+
+    engine = get_strategy_engine()
+    days = {d for strategy in engine.strategies.values() for d in strategy.price_lookbacks()}
+    starts = {(end.date() - timedelta(days=d)).isoformat() for d in days}
+    # UnifiedWorkflow runs the agents over the last month
+    starts.add((end - relativedelta(months=1)).strftime("%Y-%m-%d"))
+    return sorted(starts)
+
+
+def _warm_prices(tickers: List[str], end: datetime) -> Dict[str, bool]:
+    """Load every price window for the universe with the bulk loader."""
+    from src.tools.api import get_prices_many
+
+    end_date = end.strftime("%Y-%m-%d")
+    covered = {ticker: True for ticker in tickers}
+    for start_date in _price_windows(end):
+        try:
+            prices = get_prices_many(tickers, start_date, end_date)
+        except Exception as e:
+            logger.warning(f"Cache warm: prices {start_date}..{end_date} failed: {e}")
+            prices = {}
+        for ticker in tickers:
+            covered[ticker] = covered[ticker] and bool(prices.get(ticker))
+    return covered
+
+
+def _warm_danelfin(tickers: List[str]) -> Dict[str, bool]:
+    """Fetch Danelfin scores (sequential, rate limited by the client)."""
+    from src.tools.danelfin_api import is_danelfin_enabled, get_scores_batch
+
+    if not is_danelfin_enabled():
+        return {}
+    scores = get_scores_batch(tickers)
+    return {ticker: bool(score and score.success) for ticker, score in scores.items()}
+
+
+def _per_ticker_tasks(end_date: str, start_date: str) -> Dict[str, Callable[[str], Any]]:
+    """Per-ticker fetches, mirroring the calls the agents make."""
+    from src.tools import api
+    from src.utils.data_aggregator import COMMON_LINE_ITEMS
+
+    def metrics(ticker: str):
+        return all(api.get_financial_metrics(ticker, end_date, period=p, limit=10) for p in WARM_PERIODS)
+
+    def line_items(ticker: str):
+        return all(
+            api.search_line_items(ticker, COMMON_LINE_ITEMS, end_date, period=p, limit=10)
+            for p in WARM_PERIODS
+        )
+
+    def news(ticker: str):
+        found = [api.get_company_news(ticker, end_date, start_date=start_date, limit=250)]
+        found += [api.get_company_news(ticker, end_date, limit=limit) for limit in WARM_NEWS_LIMITS]
+        return all(found)
+
+    return {
+        "financial_metrics": metrics,
+        "line_items": line_items,
+        "profiles": api.get_company_profile,
+        "news": news,
+    }
+
+
+def warm_cache_for_universe(
+    tickers: Sequence[str],
+    data_types: Sequence[str] = ALL_DATA_TYPES,
+    end_date: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Pre-load the cache for a universe of tickers.
+
+    Args:
+        tickers: Tickers to warm
+        data_types: Any of ALL_DATA_TYPES
+        end_date: Trading day to warm for (default: today)
+
+    Returns:
+        Report with per data type coverage (fraction of tickers loaded)
+    """
+    from src.utils.data_aggregator import get_provider_for, get_provider_limits
+
+    start_time = time.time()
+    tickers = list(dict.fromkeys(tickers))
+    end = datetime.strptime(end_date, "%Y-%m-%d") if end_date else datetime.now()
+    end_date = end.strftime("%Y-%m-%d")
+    start_date = (end - relativedelta(months=1)).strftime("%Y-%m-%d")
+
+    covered: Dict[str, Dict[str, bool]] = {}
+    errors: List[str] = []
+
+    if "prices" in data_types and tickers:
+        covered["prices"] = _warm_prices(tickers, end)
+    if "danelfin" in data_types and tickers:
+        try:
+            if (scores := _warm_danelfin(tickers)):
+                covered["danelfin"] = scores
+        except Exception as e:
+            errors.append(f"danelfin: {e}")
+
+    tasks = {name: fn for name, fn in _per_ticker_tasks(end_date, start_date).items() if name in data_types}
+    limits = get_provider_limits()
+
+    def run(ticker: str, name: str):
+        with limits[get_provider_for(name)]:
+            return tasks[name](ticker)
+
+    if tasks and tickers:
+        max_workers = min(int(os.getenv("CACHE_WARM_MAX_WORKERS", "4")), len(tickers) * len(tasks))
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="cache-warm") as executor:
+            futures = {
+                executor.submit(run, ticker, name): (ticker, name)
+                for name in tasks
+                for ticker in tickers
+            }
+            for future in as_completed(futures):
+                ticker, name = futures[future]
+                try:
+                    ok = bool(future.result())
+                except Exception as e:
+                    errors.append(f"{ticker} {name}: {e}")
+                    ok = False
+                covered.setdefault(name, {})[ticker] = ok
+
+    coverage = {
+        name: round(sum(hits.values()) / len(hits), 3)
+        for name, hits in covered.items() if hits
+    }
+    report = {
+        "end_date": end_date,
+        "tickers": len(tickers),
+        "coverage": coverage,
+        "overall_coverage": round(sum(coverage.values()) / len(coverage), 3) if coverage else 0.0,
+        "missing": {
+            name: sorted(t for t, ok in hits.items() if not ok)
+            for name, hits in covered.items() if not all(hits.values())
+        },
+        "errors": errors[:20],
+        "duration_seconds": round(time.time() - start_time, 1),
+    }
+
+    logger.info(
+        f"Cache warm for {len(tickers)} tickers ({', '.join(data_types)}): "
+        f"{report['overall_coverage']:.0%} coverage in {report['duration_seconds']}s "
+        f"{coverage}"
+    )
+    return report
+
+
+def run_cache_warm(data_types: Sequence[str] = ALL_DATA_TYPES) -> Dict[str, Any]:
+    """Warm the cache for the next trading cycle's universe."""
+    tickers = get_warm_universe()
+    if not tickers:
+        logger.warning("Cache warm: empty universe, nothing to warm")
+        return {"tickers": 0, "coverage": {}, "overall_coverage": 0.0}
+    return warm_cache_for_universe(tickers, data_types)
@@ -499,24 +499,10 @@ class TradingScheduler:
             self.task_history = self.task_history[-100:]
     
     def _is_market_hours(self) -> bool:
-        """Check if current time is during market hours."""
-        from datetime import timezone
-        import pytz
-        
+        """Check if current time is during market hours (regular session, holidays excluded)."""
         try:
-            et = pytz.timezone('America/New_York')
-            now = datetime.now(et)
-            
-            # Check if weekday
-            if now.weekday() >= 5:  # Saturday or Sunday
-                return False
-                
-            # Check time
-            market_open = now.replace(hour=9, minute=30, second=0, microsecond=0)
-            market_close = now.replace(hour=16, minute=0, second=0, microsecond=0)
-            
-            return market_open <= now <= market_close
-            
+            from src.utils.market_clock import is_market_hours
+            return is_market_hours()
         except Exception:
             # Default to True if can't determine
             return True
@@ -1000,6 +986,28 @@ async def _add_monitoring_schedule(scheduler: TradingScheduler):
         replace_existing=True,
     )
     logger.info("Added watchlist auto-enrich at 6:00 AM ET")
+    
+    # Cache warm-up for the 9:35 cycle: day-long data after the watchlist is
+    # enriched, minute-TTL data (bars, news, Danelfin) just before the open
+    from src.trading.cache_warmer import cache_warm_enabled
+    if cache_warm_enabled():
+        scheduler.scheduler.add_job(
+            _run_pre_market_cache_warm,
+            trigger=CronTrigger(day_of_week='mon-fri', hour=6, minute=30, timezone='America/New_York'),
+            kwargs={"fast": False},
+            id="pre_market_cache_warm",
+            name="Pre-Market Cache Warm (fundamentals)",
+            replace_existing=True,
+        )
+        scheduler.scheduler.add_job(
+            _run_pre_market_cache_warm,
+            trigger=CronTrigger(day_of_week='mon-fri', hour=9, minute=25, timezone='America/New_York'),
+            kwargs={"fast": True},
+            id="pre_open_cache_warm",
+            name="Pre-Open Cache Warm (prices, news, scores)",
+            replace_existing=True,
+        )
+        logger.info("Added cache warm-up at 6:30 AM and 9:25 AM ET")
 
 
 async def _run_watchlist_auto_enrich():
@@ -1085,6 +1093,33 @@ async def _run_pre_market_health_check():
         return {"status": "error", "error": str(e)}
 
 
+async def _run_pre_market_cache_warm(fast: bool = False):
+    """Warm the cache for the first trading cycle of the day."""
+    import asyncio
+    
+    try:
+        from src.trading.cache_warmer import run_cache_warm, FAST_DATA_TYPES, SLOW_DATA_TYPES
+        
+        data_types = FAST_DATA_TYPES if fast else SLOW_DATA_TYPES
+        logger.info(f"Warming cache ({', '.join(data_types)})...")
+        # Blocking fetches; keep the event loop (heartbeats) responsive
+        report = await asyncio.to_thread(run_cache_warm, data_types)
+        
+        coverage = report.get("overall_coverage", 0.0)
+        if coverage >= 0.9:
+            logger.info(f"✅ Cache warm: {coverage:.0%} coverage for {report.get('tickers', 0)} tickers")
+        else:
+            logger.warning(f"⚠️ Cache warm: {coverage:.0%} coverage for {report.get('tickers', 0)} tickers")
+            if report.get("missing"):
+                logger.warning(f"   Missing: {report['missing']}")
+        
+        return report
+        
+    except Exception as e:
+        logger.error(f"Cache warm failed: {e}")
+        return {"status": "error", "error": str(e)}
+
+
 async def _run_daily_analytics():
     """Run daily analytics and report generation."""
     try:
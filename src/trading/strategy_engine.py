@@ -16,7 +16,7 @@ from enum import Enum
 import statistics
 
 from datetime import date
-from src.tools.api import get_prices, get_financial_metrics
+from src.tools.api import get_prices, get_prices_many, get_financial_metrics
 from src.trading.alpaca_service import AlpacaService
 
 logger = logging.getLogger(__name__)
@@ -92,6 +92,16 @@ class BaseStrategy:
         """Analyze a ticker and return a signal. Override in subclass."""
         raise NotImplementedError
     
+    def price_lookbacks(self) -> List[int]:
+        """
+        Calendar-day windows (ending today) that analyze() fetches prices for.
+        
+        StrategyEngine.scan_universe loads these for the whole universe in
+        bulk before analyzing, so per-ticker fetches are served from cache.
+        Override in subclass.
+        """
+        return []
+    
     def scan(self, tickers: List[str]) -> List[TradingSignal]:
         """Scan multiple tickers and return signals."""
         signals = []
@@ -263,6 +273,10 @@ class MomentumStrategy(BaseStrategy):
         self.volume_threshold = params.get("volume_threshold", 1.5) if params else 1.5
         self.momentum_threshold = params.get("momentum_threshold", 2.0) if params else 2.0
     
+    def price_lookbacks(self) -> List[int]:
+        # analyze() window, then _calculate_atr's default window
+        return [self.lookback_period + 15, 14 + 15]
+    
     def analyze(self, ticker: str) -> Optional[TradingSignal]:
         """Analyze ticker for momentum signals."""
         end = date.today()
@@ -386,6 +400,9 @@ class MeanReversionStrategy(BaseStrategy):
         self.bb_period = params.get("bb_period", 20) if params else 20
         self.bb_std = params.get("bb_std", 2.0) if params else 2.0
     
+    def price_lookbacks(self) -> List[int]:
+        return [self.bb_period + 15]
+    
     def analyze(self, ticker: str) -> Optional[TradingSignal]:
         """Analyze ticker for mean reversion signals."""
         end = date.today()
@@ -501,6 +518,10 @@ class TrendFollowingStrategy(BaseStrategy):
         self.short_ma_period = params.get("short_ma_period", 10) if params else 10
         self.long_ma_period = params.get("long_ma_period", 50) if params else 50
     
+    def price_lookbacks(self) -> List[int]:
+        # analyze() window, then _calculate_atr's default window
+        return [self.long_ma_period + 30, 14 + 15]
+    
     def analyze(self, ticker: str) -> Optional[TradingSignal]:
         """Analyze ticker for trend following signals."""
         end = date.today()
@@ -646,6 +667,10 @@ class VWAPScalperStrategy(BaseStrategy):
     def __init__(self, params: Optional[Dict] = None):
         super().__init__(params)
     
+    def price_lookbacks(self) -> List[int]:
+        # _get_price_data(days=5) adds a 10-day buffer
+        return [5 + 10]
+    
     def analyze(self, ticker: str) -> Optional[TradingSignal]:
         """Analyze ticker for VWAP scalp opportunities."""
         prices = self._get_price_data(ticker, days=5)
@@ -750,6 +775,10 @@ class BreakoutMicroStrategy(BaseStrategy):
         super().__init__(params)
         self.lookback_period = params.get("lookback_period", 5) if params else 5
     
+    def price_lookbacks(self) -> List[int]:
+        # _get_price_data(days=lookback + 5) adds a 10-day buffer
+        return [self.lookback_period + 5 + 10]
+    
     def analyze(self, ticker: str) -> Optional[TradingSignal]:
         """Analyze ticker for micro breakout opportunities."""
         prices = self._get_price_data(ticker, days=self.lookback_period + 5)
@@ -1017,6 +1046,7 @@ class StrategyEngine:
             Dict of ticker -> signals
         """
         results = {}
+        self._load_scan_prices(tickers, strategies)
         
         for ticker in tickers:
             signals = self.analyze_ticker(ticker, strategies, alpaca_service=alpaca_service)
@@ -1029,6 +1059,18 @@ class StrategyEngine:
         
         return results
     
+    def _load_scan_prices(self, tickers: List[str], strategies: Optional[List[str]] = None):
+        """Bulk-load every price window the strategies will request for the universe."""
+        strats = [self.strategies[name] for name in (strategies or self.strategies) if name in self.strategies]
+        windows = sorted({days for strategy in strats for days in strategy.price_lookbacks()})
+        end = date.today()
+        for days in windows:
+            start = end - timedelta(days=days)
+            try:
+                get_prices_many(tickers, start.strftime("%Y-%m-%d"), end.strftime("%Y-%m-%d"))
+            except Exception as e:
+                logger.debug(f"Bulk price load for {days}-day window failed: {e}")
+    
     def get_best_signals(
         self,
         tickers: List[str],
@@ -10,7 +10,7 @@ from datetime import datetime, timedelta, date, timezone
 from typing import List, Optional, Dict, Any
 from dataclasses import dataclass
 
-from src.tools.api import get_prices
+from src.tools.api import get_prices, get_prices_many
 from src.trading.alpaca_service import AlpacaService
 from src.trading.strategy_engine import get_strategy_engine, TradingSignal
 
@@ -366,6 +366,21 @@ class WatchlistService:
                 Watchlist.status == "watching"
             ).all()
             
+            # Load prices for every watched ticker up front (one cache round trip per window)
+            end = date.today()
+            start = end - timedelta(days=5)
+            start_20 = end - timedelta(days=30)
+            now = datetime.now(timezone.utc)
+            active_items = [item for item in watching_items if not (item.expires_at and now > item.expires_at)]
+            recent_prices = get_prices_many(
+                [item.ticker for item in active_items],
+                start.strftime("%Y-%m-%d"), end.strftime("%Y-%m-%d"),
+            )
+            breakout_tickers = [item.ticker for item in active_items if item.entry_condition == "breakout"]
+            breakout_prices = get_prices_many(
+                breakout_tickers, start_20.strftime("%Y-%m-%d"), end.strftime("%Y-%m-%d")
+            ) if breakout_tickers else {}
+            
             for db_item in watching_items:
                 # Check expiration
                 if db_item.expires_at and datetime.now(timezone.utc) > db_item.expires_at:
@@ -374,9 +389,7 @@ class WatchlistService:
                 
                 try:
                     # Get current price
-                    end = date.today()
-                    start = end - timedelta(days=5)
-                    prices = get_prices(db_item.ticker, start.strftime("%Y-%m-%d"), end.strftime("%Y-%m-%d"))
+                    prices = recent_prices[db_item.ticker]
                     if not prices:
                         continue
                     
@@ -395,8 +408,7 @@ class WatchlistService:
                             
                     elif db_item.entry_condition == "breakout":
                         # Check for 20-day high breakout
-                        start_20 = end - timedelta(days=30)
-                        prices_20 = get_prices(db_item.ticker, start_20.strftime("%Y-%m-%d"), end.strftime("%Y-%m-%d"))
+                        prices_20 = breakout_prices[db_item.ticker]
                         if prices_20:
                             prices_20 = prices_20[-20:]  # Get last 20
                             high_20 = max(p.high for p in prices_20[:-1])
@@ -0,0 +1,218 @@
+"""
+Adaptive (AIMD) Concurrency Limiter for Data API Calls
+
+A fixed concurrency limit has to be sized for the worst case (the market
+open), so it leaves throughput unused off-peak and still hits 429s when the
+provider is under load. This limiter sizes the window from what the provider
+reports back, the way TCP congestion control does:
+
+- Additive increase: while the remaining quota (X-RateLimit-Remaining) is
+  healthy and latency is stable, the window grows by about one slot per
+  window's worth of successful calls, but only while it is actually in use
+- Multiplicative decrease: a 429 or a latency spike (a call slower than
+  latency_spike_ratio x the baseline latency) cuts the window by
+  decrease_factor, at most once per cooldown so one burst counts once
+
+The current window is reported to RateLimitMonitor whenever it changes.
+
+Environment Variables:
+- ADAPTIVE_CONCURRENCY: Use adaptive windows for data providers (default: false)
+- ADAPTIVE_MIN_CONCURRENCY / ADAPTIVE_MAX_CONCURRENCY: Window bounds (default: 1 / 16)
+"""
+
+import logging
+import os
+import time
+from threading import Condition, Lock
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    Concurrency window adjusted by additive increase / multiplicative decrease.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        initial_limit: int = 2,
+        min_limit: int = 1,
+        max_limit: int = 16,
+        quota_limit: Optional[int] = None,
+        healthy_remaining_pct: float = 20.0,
+        decrease_factor: float = 0.5,
+        latency_spike_ratio: float = 2.0,
+        min_latency_samples: int = 10,
+        decrease_cooldown: float = 1.0,
+    ):
+        """
+        Args:
+            name: API name as tracked by RateLimitMonitor (e.g. "fmp_data")
+            initial_limit: Starting window
+            min_limit / max_limit: Window bounds
+            quota_limit: Requests per window the provider allows; with it the
+                remaining quota is judged as a percentage
+            healthy_remaining_pct: Don't grow the window below this much remaining quota
+            decrease_factor: Window multiplier on a 429 or latency spike
+            latency_spike_ratio: Latency over this multiple of the baseline is a spike
+            min_latency_samples: Samples before latency spikes are acted on
+            decrease_cooldown: Minimum seconds between decreases
+        """
+        self.name = name
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.quota_limit = quota_limit
+        self.healthy_remaining_pct = healthy_remaining_pct
+        self.decrease_factor = decrease_factor
+        self.latency_spike_ratio = latency_spike_ratio
+        self.min_latency_samples = min_latency_samples
+        self.decrease_cooldown = decrease_cooldown
+
+        self._limit = float(max(min_limit, min(initial_limit, max_limit)))
+        self._in_flight = 0
+        self._cond = Condition()
+        self._baseline_latency: Optional[float] = None
+        self._latency_samples = 0
+        self._last_decrease = 0.0
+        self._increases = 0
+        self._decreases = 0
+        self._reported: Optional[int] = None
+
+    @property
+    def limit(self) -> int:
+        """Current window (whole requests)."""
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def acquire(self, blocking: bool = True, timeout: Optional[float] = None) -> bool:
+        """Wait for a slot in the current window."""
+        with self._cond:
+            if not blocking:
+                if self._in_flight >= self.limit:
+                    return False
+            elif not self._cond.wait_for(lambda: self._in_flight < self.limit, timeout=timeout):
+                return False
+            self._in_flight += 1
+        return True
+
+    def release(self):
+        with self._cond:
+            self._in_flight = max(0, self._in_flight - 1)
+            self._cond.notify()
+
+    def record_response(self, latency_seconds: float, remaining: Optional[int] = None):
+        """Feed back a completed call's latency and X-RateLimit-Remaining."""
+        with self._cond:
+            baseline = self._baseline_latency
+            self._latency_samples += 1
+            # Slow-moving baseline; spikes barely move it
+            self._baseline_latency = latency_seconds if baseline is None else 0.95 * baseline + 0.05 * latency_seconds
+
+            spiked = (
+                baseline is not None
+                and self._latency_samples > self.min_latency_samples
+                and latency_seconds > self.latency_spike_ratio * baseline
+            )
+            if spiked:
+                self._decrease(f"latency {latency_seconds:.2f}s vs {baseline:.2f}s baseline")
+            elif self._quota_healthy(remaining) and self._in_flight >= self.limit - 1:
+                # ~+1 slot per window of successful calls, only while the window is in use
+                old = self.limit
+                self._limit = min(self.max_limit, self._limit + 1.0 / self._limit)
+                self._increases += 1
+                if self.limit > old:
+                    # Wake callers waiting in acquire() for the new slot(s)
+                    self._cond.notify_all()
+        self._report()
+
+    def record_429(self):
+        """Cut the window after a rate limit error."""
+        with self._cond:
+            self._decrease("429")
+        self._report()
+
+    def _quota_healthy(self, remaining: Optional[int]) -> bool:
+        if remaining is None:
+            return True
+        if self.quota_limit:
+            return remaining * 100.0 / self.quota_limit >= self.healthy_remaining_pct
+        return remaining > 0
+
+    def _decrease(self, reason: str):
+        now = time.monotonic()
+        if now - self._last_decrease < self.decrease_cooldown:
+            return
+        self._last_decrease = now
+        old = self.limit
+        self._limit = max(float(self.min_limit), self._limit * self.decrease_factor)
+        self._decreases += 1
+        if self.limit != old:
+            logger.info(f"{self.name} concurrency {old} -> {self.limit} ({reason})")
+
+    def _report(self):
+        limit = self.limit
+        if limit == self._reported:
+            return
+        self._reported = limit
+        try:
+            from src.monitoring import get_rate_limit_monitor
+            get_rate_limit_monitor().record_concurrency_window(self.name, limit, self._in_flight)
+        except Exception as e:
+            logger.debug(f"Could not report concurrency window for {self.name}: {e}")
+
+    def get_status(self) -> Dict[str, Any]:
+        with self._cond:
+            return {
+                "name": self.name,
+                "limit": self.limit,
+                "in_flight": self._in_flight,
+                "min_limit": self.min_limit,
+                "max_limit": self.max_limit,
+                "baseline_latency_ms": round(self._baseline_latency * 1000, 1) if self._baseline_latency else None,
+                "increases": self._increases,
+                "decreases": self._decreases,
+            }
+
+
+def adaptive_concurrency_enabled() -> bool:
+    return os.environ.get("ADAPTIVE_CONCURRENCY", "false").lower() == "true"
+
+
+# Provider defaults: RateLimitMonitor name -> (initial window, quota per minute)
+ADAPTIVE_PROVIDERS = {
+    "financial_datasets": (2, 60),
+    "fmp_data": (4, 300),
+    "alpaca_data": (4, 200),
+}
+
+_limiters: Dict[str, AdaptiveConcurrencyLimiter] = {}
+_limiters_lock = Lock()
+
+
+def get_adaptive_limiter(name: str) -> Optional[AdaptiveConcurrencyLimiter]:
+    """Get the adaptive limiter for a provider in ADAPTIVE_PROVIDERS, or None when disabled."""
+    if not adaptive_concurrency_enabled():
+        return None
+
+    with _limiters_lock:
+        if name not in _limiters:
+            initial, quota = ADAPTIVE_PROVIDERS[name]
+            _limiters[name] = AdaptiveConcurrencyLimiter(
+                name,
+                initial_limit=initial,
+                min_limit=int(os.getenv("ADAPTIVE_MIN_CONCURRENCY", "1")),
+                max_limit=int(os.getenv("ADAPTIVE_MAX_CONCURRENCY", "16")),
+                quota_limit=quota,
+            )
+        return _limiters[name]
+
+
+def reset_adaptive_limiters():
+    """Drop all adaptive limiters (useful for testing)."""
+    with _limiters_lock:
+        _limiters.clear()
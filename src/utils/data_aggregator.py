@@ -10,7 +10,12 @@ Supports multiple data sources with automatic fallback:
 3. Polygon.io, FMP, Finnhub (if keys are configured)
 """
 
+import copy
 import logging
+import os
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from threading import BoundedSemaphore
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
 from dataclasses import dataclass
@@ -23,6 +28,8 @@ from src.tools.api import (
     get_prices as get_prices_legacy,
     get_company_news,
     get_insider_trades,
+    warm_cache,
+    _data_rate_limiter,
 )
 from src.utils.api_key import get_api_key_from_state
 from src.graph.state import AgentState
@@ -31,7 +38,12 @@ logger = logging.getLogger(__name__)
 
 # Try to import multi-source data provider
 try:
-    from src.tools.data_providers import get_data_provider, get_available_data_sources
+    from src.tools.data_providers import (
+        DATA_SOURCES,
+        DataSource,
+        get_data_provider,
+        get_available_data_sources,
+    )
     MULTI_SOURCE_AVAILABLE = True
 except ImportError:
     MULTI_SOURCE_AVAILABLE = False
@@ -71,6 +83,105 @@ class AggregatedData:
             self.insider_trades = {}
 
 
+# Common line items needed by most agents
+COMMON_LINE_ITEMS = [
+    "revenue",
+    "net_income",
+    "earnings_per_share",
+    "free_cash_flow",
+    "total_assets",
+    "total_liabilities",
+    "shareholders_equity",
+    "current_assets",
+    "current_liabilities",
+    "total_debt",
+    "cash_and_equivalents",
+    "outstanding_shares",
+    "capital_expenditure",
+    "depreciation_and_amortization",
+    "operating_income",
+    "ebit",
+    "gross_profit",
+    "operating_margin",
+    "gross_margin",
+    "dividends_and_other_cash_distributions",
+    "issuance_or_purchase_of_equity_shares",
+    "research_and_development",
+    "operating_expense",
+]
+
+
+# Value stored for a data type when its fetch fails (copied per ticker)
+_FAILED_DEFAULTS = {
+    "financial_metrics": [],
+    "line_items": {},
+    "market_caps": None,
+    "prices": [],
+    "news": [],
+    "insider_trades": [],
+}
+
+
+def get_provider_for(field: str) -> str:
+    """
+    Name the provider a data type is routed to, mirroring the routing in src/tools/api.py.
+    
+    Args:
+        field: An AggregatedData field name (e.g. "prices", "news", "line_items")
+    """
+    primary_source = os.environ.get("PRIMARY_DATA_SOURCE", "fmp")
+    if field == "prices" and MULTI_SOURCE_AVAILABLE:
+        sources = get_data_provider().get_routing_order("prices")
+        if sources:
+            return sources[0].value
+    if primary_source == "fmp" and field != "line_items":
+        return "fmp"
+    if primary_source == "alpaca" and field in ("prices", "news"):
+        return "alpaca"
+    return "financial_datasets"
+
+
+def get_provider_limits() -> Dict[str, BoundedSemaphore]:
+    """
+    Per-provider concurrency limits for the pre-fetch fan-out.
+    
+    Financial Datasets uses the concurrency of the shared data API rate
+    limiter. Other providers get one slot per request/second of their
+    configured per-minute limit (rate x ~1s latency), with at least one.
+    """
+    default = int(os.getenv("AGGREGATE_MAX_WORKERS", "16"))
+    limits = defaultdict(lambda: BoundedSemaphore(default))
+    limits["financial_datasets"] = BoundedSemaphore(_data_rate_limiter.max_concurrent)
+    
+    if MULTI_SOURCE_AVAILABLE:
+        for source, config in DATA_SOURCES.items():
+            if source == DataSource.FINANCIAL_DATASETS:
+                continue
+            per_minute = config.rate_limit_per_minute
+            limits[source.value] = BoundedSemaphore(max(1, per_minute // 60) if per_minute else default)
+    return limits
+
+
+def _fetch_ticker_prices(ticker: str, start_date: str, end_date: str) -> List:
+    """Fetch prices via the multi-source provider, falling back to the legacy API."""
+    try:
+        if MULTI_SOURCE_AVAILABLE:
+            data_provider = get_data_provider()
+            price_df, source = data_provider.get_prices(ticker, start_date, end_date)
+            if not price_df.empty:
+                # Convert DataFrame to list of dicts for compatibility
+                print(f"  [{ticker}] ✓ Got {len(price_df)} prices from {source.value}")
+                return price_df.to_dict('records')
+        return get_prices_legacy(ticker, start_date, end_date)
+    except Exception as e:
+        print(f"  [{ticker}] Price error: {e}")
+        # Try legacy API as last resort
+        try:
+            return get_prices_legacy(ticker, start_date, end_date)
+        except Exception:
+            return []
+
+
 def aggregate_financial_data(
     state: AgentState,
     tickers: List[str],
@@ -81,10 +192,14 @@ def aggregate_financial_data(
     Pre-fetch all financial data needed by agents.
     
     This function:
-    1. Fetches all common financial data once
+    1. Fetches all common financial data once, fanning out every data type
+       for every ticker concurrently on a bounded thread pool
     2. Stores it in a shared structure
     3. Returns it for agents to use
     
+    Concurrency per provider is capped by get_provider_limits(), and the
+    pool size by AGGREGATE_MAX_WORKERS (default: 16).
+    
     Args:
         state: AgentState containing API keys
         tickers: List of ticker symbols
@@ -109,111 +224,51 @@ def aggregate_financial_data(
     print(f"Date Range: {start_date} to {end_date}")
     print(f"{'='*60}\n")
     
-    # Common line items needed by most agents
-    common_line_items = [
-        "revenue",
-        "net_income",
-        "earnings_per_share",
-        "free_cash_flow",
-        "total_assets",
-        "total_liabilities",
-        "shareholders_equity",
-        "current_assets",
-        "current_liabilities",
-        "total_debt",
-        "cash_and_equivalents",
-        "outstanding_shares",
-        "capital_expenditure",
-        "depreciation_and_amortization",
-        "operating_income",
-        "ebit",
-        "gross_profit",
-        "operating_margin",
-        "gross_margin",
-        "dividends_and_other_cash_distributions",
-        "issuance_or_purchase_of_equity_shares",
-        "research_and_development",
-        "operating_expense",
-    ]
-    
-    for ticker in tickers:
-        print(f"[{ticker}] Fetching data...")
-        
-        # Financial metrics (TTM and Annual)
-        try:
-            print(f"  - Financial metrics (TTM)...")
-            aggregated.financial_metrics[ticker] = get_financial_metrics(
-                ticker, end_date, period="ttm", limit=10, api_key=api_key
-            )
-        except Exception as e:
-            print(f"    Error: {e}")
-            aggregated.financial_metrics[ticker] = []
-        
-        # Line items (TTM)
-        try:
-            print(f"  - Line items (TTM)...")
-            ttm_line_items = search_line_items(
-                ticker, common_line_items, end_date,
-                period="ttm", limit=10, api_key=api_key
-            )
-            aggregated.line_items[ticker] = ttm_line_items
-        except Exception as e:
-            print(f"    Error: {e}")
-            aggregated.line_items[ticker] = {}
-        
-        # Market cap
-        try:
-            print(f"  - Market cap...")
-            aggregated.market_caps[ticker] = get_market_cap(ticker, end_date, api_key=api_key)
-        except Exception as e:
-            print(f"    Error: {e}")
-            aggregated.market_caps[ticker] = None
-        
-        # Prices - Use multi-source provider with fallback
-        try:
-            print(f"  - Price history...")
-            if MULTI_SOURCE_AVAILABLE:
-                data_provider = get_data_provider()
-                price_df, source = data_provider.get_prices(ticker, start_date, end_date)
-                if not price_df.empty:
-                    # Convert DataFrame to list of dicts for compatibility
-                    aggregated.prices[ticker] = price_df.to_dict('records')
-                    print(f"    ✓ Got {len(price_df)} prices from {source.value}")
-                else:
-                    # Fall back to legacy API
-                    aggregated.prices[ticker] = get_prices_legacy(ticker, start_date, end_date)
-            else:
-                aggregated.prices[ticker] = get_prices_legacy(ticker, start_date, end_date)
-        except Exception as e:
-            print(f"    Error: {e}")
-            # Try legacy API as last resort
+    
+    # Load cached entries for the whole universe in a few round trips
+    try:
+        warm_cache(tickers, end_date, start_date=start_date, news_limit=250)
+    except Exception as e:
+        logger.debug(f"Cache warm-up failed: {e}")
+    
+    # One task per (ticker, data type); each runs under its provider's limit
+    tasks = {
+        "financial_metrics": lambda t: get_financial_metrics(t, end_date, period="ttm", limit=10, api_key=api_key),
+        "line_items": lambda t: search_line_items(t, COMMON_LINE_ITEMS, end_date, period="ttm", limit=10, api_key=api_key),
+        "market_caps": lambda t: get_market_cap(t, end_date, api_key=api_key),
+        "prices": lambda t: _fetch_ticker_prices(t, start_date, end_date),
+        "news": lambda t: get_company_news(t, end_date=end_date, start_date=start_date, limit=250),
+        "insider_trades": lambda t: get_insider_trades(t, end_date=end_date, start_date=start_date),
+    }
+    limits = get_provider_limits()
+    max_workers = min(int(os.getenv("AGGREGATE_MAX_WORKERS", "16")), len(tickers) * len(tasks)) or 1
+    remaining = {ticker: len(tasks) for ticker in tickers}
+    
+    def run(ticker: str, field: str):
+        with limits[get_provider_for(field)]:
+            return tasks[field](ticker)
+    
+    print(f"Fetching {len(tickers) * len(tasks)} data sets with {max_workers} workers...")
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="aggregate") as executor:
+        futures = {
+            executor.submit(run, ticker, field): (ticker, field)
+            for ticker in tickers
+            for field in tasks
+        }
+        for future in as_completed(futures):
+            ticker, field = futures[future]
             try:
-                aggregated.prices[ticker] = get_prices_legacy(ticker, start_date, end_date)
-            except:
-                aggregated.prices[ticker] = []
-        
-        # News (last year)
-        try:
-            print(f"  - Company news...")
-            aggregated.news[ticker] = get_company_news(
-                ticker, end_date=end_date, start_date=start_date, limit=250
-            )
-        except Exception as e:
-            print(f"    Error: {e}")
-            aggregated.news[ticker] = []
-        
-        # Insider trades (last year)
-        try:
-            print(f"  - Insider trades...")
-            aggregated.insider_trades[ticker] = get_insider_trades(
-                ticker, end_date=end_date, start_date=start_date
-            )
-        except Exception as e:
-            print(f"    Error: {e}")
-            aggregated.insider_trades[ticker] = []
-        
-        print(f"[{ticker}] ✓ Data aggregated\n")
+                result = future.result()
+            except Exception as e:
+                print(f"  [{ticker}] {field} error: {e}")
+                result = copy.copy(_FAILED_DEFAULTS[field])
+            getattr(aggregated, field)[ticker] = result
+            
+            remaining[ticker] -= 1
+            if remaining[ticker] == 0:
+                print(f"[{ticker}] ✓ Data aggregated")
     
+    print()
     print(f"{'='*60}")
     print("DATA AGGREGATION COMPLETE")
     print(f"{'='*60}\n")
@@ -0,0 +1,346 @@
+"""
+Cross-Process Rate Limiter Backed by Redis
+
+The FastAPI backend and the run_daemon scheduler run as separate containers
+that share the same FMP, Alpaca, Financial Datasets and LLM quotas. The
+per-process limiters (DataAPIRateLimiter, RateLimiter) can't see each
+other's traffic, so their combined rate can exceed the provider limit.
+
+DistributedRateLimiter keeps a token bucket per provider in Redis and
+refills/takes tokens in one atomic Lua script using the Redis server clock,
+so every worker draws from the same bucket. A 429 seen by any worker empties
+the bucket and pauses it for an exponential backoff, which all workers honor.
+Concurrency is still bounded per process with a semaphore.
+
+It has the same acquire/release/record_429/record_success API as the
+per-process limiters. When DISTRIBUTED_RATE_LIMIT is off or Redis is
+unreachable, the factories return the per-process limiter instead; Redis
+errors after startup fail open (the local semaphore still applies).
+
+Environment Variables:
+- DISTRIBUTED_RATE_LIMIT: Use the Redis-backed limiters (default: false)
+- FMP_REQUESTS_PER_MINUTE: Shared FMP budget (default: 300)
+- ALPACA_DATA_REQUESTS_PER_MINUTE: Shared Alpaca data budget (default: 200)
+- FMP_MAX_CONCURRENT / ALPACA_DATA_MAX_CONCURRENT: Per-process concurrency (default: 8)
+"""
+
+import asyncio
+import logging
+import os
+import time
+from threading import Lock, Semaphore
+from typing import Any, Dict, Optional
+
+from src.utils.rate_limiter import acquire_semaphore_async
+
+logger = logging.getLogger(__name__)
+
+# Try to import redis, fall back gracefully if not available
+try:
+    import redis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+
+# Refill the bucket and take one token. Returns 0 if granted, otherwise the
+# milliseconds until a token (or the end of a 429 pause).
+# KEYS: bucket hash. ARGV: tokens per second, capacity, key TTL (ms).
+ACQUIRE_SCRIPT = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) * 1000 + math.floor(tonumber(t[2]) / 1000)
+local rate = tonumber(ARGV[1])
+local capacity = tonumber(ARGV[2])
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts', 'paused_until')
+local paused_until = tonumber(state[3]) or 0
+if now < paused_until then
+    return paused_until - now
+end
+local tokens = tonumber(state[1]) or capacity
+local ts = tonumber(state[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate / 1000)
+local wait = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+else
+    wait = math.ceil((1 - tokens) * 1000 / rate)
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', now)
+redis.call('PEXPIRE', KEYS[1], ARGV[3])
+return wait
+"""
+
+# Record a 429: empty the bucket and pause it for base^strikes seconds.
+# 429s arriving during a pause (other in-flight requests) don't add strikes.
+# Returns the pause in milliseconds.
+# KEYS: bucket hash. ARGV: backoff base, max backoff (s), strike window (s), key TTL (ms).
+PENALTY_SCRIPT = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) * 1000 + math.floor(tonumber(t[2]) / 1000)
+local state = redis.call('HMGET', KEYS[1], 'strikes', 'last_429', 'paused_until')
+local paused_until = tonumber(state[3]) or 0
+if now < paused_until then
+    return paused_until - now
+end
+local strikes = tonumber(state[1]) or 0
+if now - (tonumber(state[2]) or 0) > tonumber(ARGV[3]) * 1000 then
+    strikes = 0
+end
+strikes = strikes + 1
+local backoff = math.floor(math.min(tonumber(ARGV[1]) ^ strikes, tonumber(ARGV[2])) * 1000)
+redis.call('HSET', KEYS[1], 'tokens', '0', 'ts', now + backoff, 'paused_until', now + backoff,
+    'strikes', strikes, 'last_429', now)
+redis.call('PEXPIRE', KEYS[1], ARGV[4])
+return backoff
+"""
+
+
+class DistributedRateLimiter:
+    """
+    Token bucket shared across processes through Redis.
+
+    Limits requests by:
+    1. Limiting concurrent requests in this process (semaphore)
+    2. A token bucket shared by every process using the same name
+    3. A shared pause after 429 errors (exponential backoff)
+    """
+
+    def __init__(
+        self,
+        name: str,
+        redis_client: Any,
+        requests_per_minute: float,
+        max_concurrent: int = 4,
+        burst: Optional[int] = None,
+        backoff_base: float = 2.0,
+        max_backoff: float = 120.0,
+        strike_window: float = 60.0,
+    ):
+        self.name = name
+        self.key = f"ratelimit:{name}"
+        self.requests_per_minute = requests_per_minute
+        self.max_concurrent = max_concurrent
+        self.burst = burst or max_concurrent
+        self.backoff_base = backoff_base
+        self.max_backoff = max_backoff
+        self.strike_window = strike_window
+
+        self.semaphore = Semaphore(max_concurrent)
+        self._redis = redis_client
+        self._acquire_script = redis_client.register_script(ACQUIRE_SCRIPT)
+        self._penalty_script = redis_client.register_script(PENALTY_SCRIPT)
+        # Idle buckets refill to capacity anyway, so let Redis drop them
+        self._key_ttl_ms = int(max(self.burst * 60_000 / requests_per_minute, max_backoff * 1000) * 2)
+
+        self.consecutive_429s = 0
+        self._stats_lock = Lock()
+        self._redis_errors = 0
+        self._waited_seconds = 0.0
+
+    def _take(self) -> float:
+        """Try to take a token. Returns seconds to wait (0 when granted)."""
+        try:
+            wait_ms = self._acquire_script(
+                keys=[self.key],
+                args=[self.requests_per_minute / 60.0, self.burst, self._key_ttl_ms],
+            )
+            return int(wait_ms) / 1000
+        except Exception as e:
+            # Fail open: the per-process semaphore still bounds concurrency
+            with self._stats_lock:
+                self._redis_errors += 1
+            logger.debug(f"Distributed rate limiter {self.name} unavailable: {e}")
+            return 0.0
+
+    def acquire(self, blocking: bool = True, timeout: Optional[float] = None) -> bool:
+        """
+        Acquire permission to make a call.
+
+        Args:
+            blocking: If True, wait until available. If False, return immediately.
+            timeout: Maximum time to wait (None = wait forever)
+
+        Returns:
+            True if acquired, False if not available within the timeout
+        """
+        start_time = time.time()
+        if not self.semaphore.acquire(blocking=blocking, timeout=timeout):
+            return False
+
+        try:
+            while True:
+                wait = self._take()
+                if wait <= 0:
+                    waited = time.time() - start_time
+                    if waited > 0.01:
+                        with self._stats_lock:
+                            self._waited_seconds += waited
+                    return True
+                if not blocking or (timeout is not None and time.time() - start_time + wait > timeout):
+                    self.semaphore.release()
+                    return False
+                time.sleep(min(wait, 2.0))
+        except BaseException:
+            self.semaphore.release()
+            raise
+
+    async def acquire_async(self, timeout: Optional[float] = None) -> bool:
+        """Acquire permission to make a call without blocking the event loop."""
+        start_time = time.time()
+        if not await acquire_semaphore_async(self.semaphore, timeout):
+            return False
+
+        try:
+            while True:
+                wait = self._take()
+                if wait <= 0:
+                    waited = time.time() - start_time
+                    if waited > 0.01:
+                        with self._stats_lock:
+                            self._waited_seconds += waited
+                    return True
+                if timeout is not None and time.time() - start_time + wait > timeout:
+                    self.semaphore.release()
+                    return False
+                await asyncio.sleep(min(wait, 2.0))
+        except BaseException:
+            self.semaphore.release()
+            raise
+
+    def release(self):
+        """Release the per-process concurrency slot."""
+        self.semaphore.release()
+
+    def record_429(self):
+        """Record a 429: pause the shared bucket for every process."""
+        self.consecutive_429s += 1
+        try:
+            pause_ms = int(self._penalty_script(
+                keys=[self.key],
+                args=[self.backoff_base, self.max_backoff, self.strike_window, self._key_ttl_ms],
+            ))
+            logger.warning(f"{self.name} rate limited, pausing shared bucket for {pause_ms / 1000:.1f}s")
+        except Exception as e:
+            logger.debug(f"Could not record 429 for {self.name} in Redis: {e}")
+
+    # Name used by the LLM RateLimiter
+    record_429_error = record_429
+
+    def record_success(self):
+        """Record a successful request."""
+        self.consecutive_429s = 0
+
+    def get_status(self) -> Dict[str, Any]:
+        """Get limiter configuration and the shared bucket state."""
+        status = {
+            "initialized": True,
+            "distributed": True,
+            "name": self.name,
+            "max_concurrent": self.max_concurrent,
+            "requests_per_minute": self.requests_per_minute,
+            "burst": self.burst,
+            "consecutive_429s": self.consecutive_429s,
+        }
+        with self._stats_lock:
+            status["redis_errors"] = self._redis_errors
+            status["waited_seconds"] = round(self._waited_seconds, 2)
+        try:
+            tokens, paused_until = self._redis.hmget(self.key, ["tokens", "paused_until"])
+            status["current_tokens"] = float(tokens) if tokens is not None else float(self.burst)
+            status["paused_until_ms"] = int(paused_until) if paused_until is not None else None
+        except Exception:
+            pass
+        return status
+
+
+def distributed_rate_limit_enabled() -> bool:
+    return os.environ.get("DISTRIBUTED_RATE_LIMIT", "false").lower() == "true"
+
+
+# Shared Redis connection and limiters by name
+_redis_client = None
+_redis_lock = Lock()
+_limiters: Dict[str, DistributedRateLimiter] = {}
+
+# Provider defaults: name -> (requests per minute, per-process concurrency)
+PROVIDER_LIMITS = {
+    "fmp": (300, 8),
+    "alpaca_data": (200, 8),
+}
+
+
+def _get_redis():
+    """Connect to Redis once; None if unavailable."""
+    global _redis_client
+    if not REDIS_AVAILABLE:
+        return None
+
+    with _redis_lock:
+        if _redis_client is None:
+            redis_url = os.environ.get("REDIS_URL", "redis://localhost:6379/0")
+            try:
+                client = redis.from_url(redis_url, socket_connect_timeout=5, socket_timeout=5)
+                client.ping()
+                _redis_client = client
+            except Exception as e:
+                logger.warning(f"Could not connect to Redis for rate limiting: {e}. Using per-process limits.")
+                _redis_client = False
+        return _redis_client or None
+
+
+def get_distributed_limiter(
+    name: str,
+    requests_per_minute: float,
+    max_concurrent: int,
+    fallback: Any = None,
+    **kwargs,
+) -> Any:
+    """
+    Get or create the shared limiter for a provider.
+
+    Args:
+        name: Bucket name shared by all processes (e.g. "fmp", "llm")
+        requests_per_minute: Combined budget across processes
+        max_concurrent: Concurrency limit within this process
+        fallback: Limiter to return when distributed limiting is off or
+            Redis is unavailable
+
+    Returns:
+        A DistributedRateLimiter, or the fallback
+    """
+    if not distributed_rate_limit_enabled():
+        return fallback
+
+    if name not in _limiters:
+        client = _get_redis()
+        if client is None:
+            return fallback
+        _limiters[name] = DistributedRateLimiter(
+            name, client, requests_per_minute, max_concurrent=max_concurrent, **kwargs
+        )
+        logger.info(
+            f"Distributed rate limiter {name}: {requests_per_minute}/min shared, "
+            f"max_concurrent={max_concurrent} per process"
+        )
+    return _limiters[name]
+
+
+def get_provider_limiter(name: str) -> Optional[DistributedRateLimiter]:
+    """Get the shared limiter for a data provider in PROVIDER_LIMITS, or None when disabled."""
+    if not distributed_rate_limit_enabled():
+        return None
+
+    default_rpm, default_concurrent = PROVIDER_LIMITS[name]
+    prefix = name.upper()
+    return get_distributed_limiter(
+        name,
+        requests_per_minute=float(os.getenv(f"{prefix}_REQUESTS_PER_MINUTE", str(default_rpm))),
+        max_concurrent=int(os.getenv(f"{prefix}_MAX_CONCURRENT", str(default_concurrent))),
+    )
+
+
+def reset_distributed_limiters():
+    """Drop the shared limiters and Redis connection (useful for testing)."""
+    global _redis_client
+    _limiters.clear()
+    _redis_client = None
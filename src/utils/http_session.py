@@ -0,0 +1,135 @@
+"""
+Shared HTTP Sessions for Provider Clients
+
+Module-level requests.get/post/request open a fresh TCP+TLS connection per
+call. The provider clients (FMP, Alpaca Data, Alpaca Trading, Financial
+Datasets) instead share pooled, keep-alive sessions from here, so the many
+small calls in a trading cycle reuse warm connections.
+
+Each named session mounts an HTTPAdapter with its own per-host connection
+pools and a transport-level retry policy. Transport retries only cover
+connection failures (the request never reached the server); HTTP status
+handling such as 429 backoff stays in the clients.
+
+Environment Variables:
+- HTTP_POOL_CONNECTIONS: Number of per-host pools kept per session (default: 10)
+- HTTP_POOL_MAXSIZE: Max keep-alive connections per host (default: 20)
+- HTTP_CONNECT_RETRIES: Transport-level retries on connection errors (default: 2)
+- HTTP_RETRY_BACKOFF: Backoff factor between transport retries (default: 0.3)
+"""
+
+import logging
+import os
+from threading import Lock
+from typing import Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
+
+
+class HTTPSessionManager:
+    """
+    Hands out one pooled requests.Session per provider name.
+
+    Usage:
+        session = get_http_session("fmp")
+        response = session.request("GET", url, params=params, timeout=30)
+    """
+
+    def __init__(
+        self,
+        pool_connections: int = 10,
+        pool_maxsize: int = 20,
+        connect_retries: int = 2,
+        retry_backoff: float = 0.3,
+    ):
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.connect_retries = connect_retries
+        self.retry_backoff = retry_backoff
+        self._sessions: Dict[str, requests.Session] = {}
+        self._lock = Lock()
+
+    def _build_session(self) -> requests.Session:
+        retry = Retry(
+            total=self.connect_retries,
+            connect=self.connect_retries,
+            read=0,
+            status=0,
+            other=0,
+            backoff_factor=self.retry_backoff,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            max_retries=retry,
+        )
+        session = requests.Session()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    def get_session(self, name: str) -> requests.Session:
+        """Get (or create) the shared session for a provider."""
+        session = self._sessions.get(name)
+        if session is not None:
+            return session
+        with self._lock:
+            if name not in self._sessions:
+                self._sessions[name] = self._build_session()
+                logger.debug(f"Created pooled HTTP session for {name}")
+            return self._sessions[name]
+
+    def close(self):
+        """Close all sessions and their pooled connections."""
+        with self._lock:
+            for session in self._sessions.values():
+                session.close()
+            self._sessions.clear()
+
+    def get_stats(self) -> dict:
+        """Get pool configuration and open sessions."""
+        return {
+            "sessions": sorted(self._sessions.keys()),
+            "pool_connections": self.pool_connections,
+            "pool_maxsize": self.pool_maxsize,
+            "connect_retries": self.connect_retries,
+        }
+
+
+# Global session manager instance
+_session_manager: Optional[HTTPSessionManager] = None
+_session_manager_lock = Lock()
+
+
+def get_session_manager() -> HTTPSessionManager:
+    """Get the global HTTP session manager, configured from environment."""
+    global _session_manager
+    if _session_manager is None:
+        with _session_manager_lock:
+            if _session_manager is None:
+                _session_manager = HTTPSessionManager(
+                    pool_connections=int(os.getenv("HTTP_POOL_CONNECTIONS", "10")),
+                    pool_maxsize=int(os.getenv("HTTP_POOL_MAXSIZE", "20")),
+                    connect_retries=int(os.getenv("HTTP_CONNECT_RETRIES", "2")),
+                    retry_backoff=float(os.getenv("HTTP_RETRY_BACKOFF", "0.3")),
+                )
+    return _session_manager
+
+
+def get_http_session(name: str) -> requests.Session:
+    """Get the shared pooled session for a provider (e.g. "fmp", "alpaca")."""
+    return get_session_manager().get_session(name)
+
+
+def reset_session_manager():
+    """Close all sessions and reset the global manager (for testing)."""
+    global _session_manager
+    with _session_manager_lock:
+        if _session_manager is not None:
+            _session_manager.close()
+        _session_manager = None
@@ -2,14 +2,27 @@
 Helper functions for LLM with improved error handling and detailed error reporting.
 """
 
+import asyncio
 import json
 import logging
 import os
+import threading
 import time
 import traceback
 import uuid
-from pydantic import BaseModel
-from src.llm.models import get_model, get_model_info
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar
+from functools import lru_cache
+from typing import Callable
+from pydantic import BaseModel, create_model
+from src.llm.models import get_model, get_model_info, get_structured_model
+from src.llm.response_cache import (
+    cache_bypassed,
+    get_cached_response,
+    llm_cache_enabled,
+    response_cache_key,
+    set_cached_response,
+)
 from src.utils.progress import progress
 from src.graph.state import AgentState
 from src.utils.rate_limiter import get_rate_limiter
@@ -112,6 +125,11 @@ _rate_limiter = get_rate_limiter(
 )
 
 
+# Set while call_llm_per_ticker collects prompts for a batched call:
+# call_llm records its request here instead of calling the provider
+_captured_requests: ContextVar[list | None] = ContextVar("llm_captured_requests", default=None)
+
+
 class LLMError:
     """Tracks LLM call errors for debugging."""
     def __init__(self, agent_name: str, error: Exception, attempt: int, max_retries: int):
@@ -149,9 +167,61 @@ def call_llm(
     state: AgentState | None = None,
     max_retries: int = 3,
     default_factory=None,
+    use_cache: bool | None = None,
+) -> BaseModel:
+    """
+    Makes an LLM call with retry logic (blocking wrapper around acall_llm).
+    
+    The call runs on a shared background event loop, so calls made from
+    many threads (e.g. per-ticker fan-out) share one loop and its provider
+    connections. Async code should await acall_llm directly. See acall_llm
+    for the arguments.
+    """
+    return _run_on_llm_loop(acall_llm(
+        prompt,
+        pydantic_model,
+        agent_name=agent_name,
+        state=state,
+        max_retries=max_retries,
+        default_factory=default_factory,
+        use_cache=use_cache,
+    ))
+
+
+# Event loop running the LLM calls of synchronous callers
+_llm_loop: asyncio.AbstractEventLoop | None = None
+_llm_loop_lock = threading.Lock()
+
+
+def _get_llm_loop() -> asyncio.AbstractEventLoop:
+    """Get the background event loop for sync callers, starting it on first use."""
+    global _llm_loop
+    with _llm_loop_lock:
+        if _llm_loop is None:
+            _llm_loop = asyncio.new_event_loop()
+            threading.Thread(target=_llm_loop.run_forever, name="llm-loop", daemon=True).start()
+        return _llm_loop
+
+
+def _run_on_llm_loop(coro):
+    """Run a coroutine on the LLM event loop and wait for its result."""
+    return asyncio.run_coroutine_threadsafe(coro, _get_llm_loop()).result()
+
+
+async def acall_llm(
+    prompt: any,
+    pydantic_model: type[BaseModel],
+    agent_name: str | None = None,
+    state: AgentState | None = None,
+    max_retries: int = 3,
+    default_factory=None,
+    use_cache: bool | None = None,
 ) -> BaseModel:
     """
-    Makes an LLM call with retry logic, handling both JSON supported and non-JSON supported models.
+    Makes an async LLM call with retry logic, handling both JSON supported and non-JSON supported models.
+    
+    Uses the model's ainvoke, waits for the global rate limiter and backs
+    off with asyncio.sleep, so one event loop can have many calls in flight.
     
     Includes improved error handling that:
     - Logs detailed error information for debugging
@@ -159,6 +229,10 @@ def call_llm(
     - Tracks error types for monitoring
     - Logs to monitoring system for latency/cost tracking
     
+    With LLM_RESPONSE_CACHE=true, validated responses are cached by a hash of
+    (provider, model, messages, output schema) and identical calls skip the
+    provider (see src/llm/response_cache.py).
+    
     Args:
         prompt: The prompt to send to the LLM
         pydantic_model: The Pydantic model class to structure the output
@@ -166,11 +240,23 @@ def call_llm(
         state: Optional state object to extract agent-specific model configuration
         max_retries: Maximum number of retries (default: 3)
         default_factory: Optional factory function to create default response on failure
+        use_cache: Set False to skip the response cache for this call
+            (None follows LLM_RESPONSE_CACHE and LLM_CACHE_BYPASS_AGENTS)
 
     Returns:
         An instance of the specified Pydantic model
     """
     
+    captured = _captured_requests.get()
+    if captured is not None:
+        captured.append({
+            "prompt": prompt,
+            "pydantic_model": pydantic_model,
+            "agent_name": agent_name,
+            "state": state,
+        })
+        return _create_error_response(pydantic_model, "Deferred to batched call", default_factory)
+    
     # Extract model configuration if state is provided and agent_name is available
     if state and agent_name:
         model_name, model_provider = get_agent_model_config(state, agent_name)
@@ -198,6 +284,27 @@ def call_llm(
     # Estimate prompt tokens for monitoring
     prompt_tokens = _estimate_tokens(str(prompt))
     
+    # Serve identical requests from the response cache
+    cache_key = None
+    if use_cache is not False and llm_cache_enabled() and not cache_bypassed(agent_name):
+        lookup_start_time = time.time()
+        cache_key = response_cache_key(model_provider, model_name, prompt, pydantic_model)
+        cached = get_cached_response(cache_key, pydantic_model)
+        if cached is not None:
+            if event_logger:
+                event_logger.log_llm_call(
+                    provider=model_provider,
+                    model=model_name,
+                    success=True,
+                    workflow_id=workflow_id,
+                    agent_id=agent_name,
+                    call_purpose="analysis",
+                    prompt_tokens=prompt_tokens,
+                    latency_ms=int((time.time() - lookup_start_time) * 1000),
+                    cache_hit=True,
+                )
+            return cached
+    
     try:
         llm = get_model(model_name, model_provider, api_keys)
     except Exception as e:
@@ -222,10 +329,7 @@ def call_llm(
     # For non-JSON support models, we can use structured output
     if not (model_info and not model_info.has_json_mode()):
         try:
-            llm = llm.with_structured_output(
-                pydantic_model,
-                method="json_mode",
-            )
+            llm = get_structured_model(model_name, model_provider, api_keys, pydantic_model, method="json_mode")
         except Exception as e:
             logger.warning(f"Could not set structured output for {model_name}: {e}")
             # Continue without structured output
@@ -245,7 +349,7 @@ def call_llm(
                 progress.update_status(agent_name, None, f"Waiting for LLM slot (attempt {attempt + 1}/{max_retries})")
             
             # Acquire rate limiter permission - wait up to 5 minutes
-            if not _rate_limiter.acquire(blocking=True, timeout=300):
+            if not await _rate_limiter.acquire_async(timeout=300):
                 logger.warning(f"Rate limiter timeout for {agent_name} - could not acquire slot")
                 if agent_name:
                     progress.update_status(agent_name, None, "Rate limiter timeout")
@@ -258,7 +362,7 @@ def call_llm(
                 progress.update_status(agent_name, None, f"Calling LLM (attempt {attempt + 1}/{max_retries})")
             
             # Call the LLM
-            result = llm.invoke(prompt)
+            result = await llm.ainvoke(prompt)
             
             # Calculate timing
             attempt_latency_ms = int((time.time() - attempt_start_time) * 1000)
@@ -296,6 +400,7 @@ def call_llm(
                     total_time_ms=total_time_ms,
                     retry_count=total_retries,
                     estimated_cost_usd=_estimate_cost(model_provider, model_name, prompt_tokens, completion_tokens),
+                    cache_hit=False if cache_key else None,
                 )
             
             # Track rate limit usage
@@ -308,34 +413,10 @@ def call_llm(
                     latency_ms=attempt_latency_ms,
                 )
 
-            # For non-JSON support models, we need to extract and parse the JSON manually
-            if model_info and not model_info.has_json_mode():
-                parsed_result = extract_json_from_response(result.content)
-                if parsed_result:
-                    try:
-                        return pydantic_model(**parsed_result)
-                    except Exception as validation_error:
-                        logger.warning(f"Pydantic validation failed for {agent_name}: {validation_error}")
-                        # Try to fix common issues
-                        parsed_result = _fix_common_json_issues(parsed_result, pydantic_model)
-                        if parsed_result:
-                            return pydantic_model(**parsed_result)
-                        raise validation_error
-                else:
-                    raise ValueError("Could not extract JSON from model response")
-            else:
-                # Validate the result is the correct type
-                if isinstance(result, pydantic_model):
-                    return result
-                elif isinstance(result, dict):
-                    return pydantic_model(**result)
-                else:
-                    # If result has content attribute (BaseMessage), try to parse it
-                    if hasattr(result, 'content'):
-                        parsed = extract_json_from_response(result.content)
-                        if parsed:
-                            return pydantic_model(**parsed)
-                    return result
+            parsed_result = _to_pydantic(result, pydantic_model, model_info, agent_name)
+            if cache_key and isinstance(parsed_result, pydantic_model):
+                set_cached_response(cache_key, parsed_result)
+            return parsed_result
 
         except Exception as e:
             # Release rate limiter on error
@@ -410,12 +491,217 @@ def call_llm(
             
             # Wait a bit before retrying (exponential backoff)
             backoff_time = min(2 ** attempt, 30)  # Max 30 seconds
-            time.sleep(backoff_time)
+            await asyncio.sleep(backoff_time)
 
     # This should never be reached due to the retry logic above
     return _create_error_response(pydantic_model, "Unknown LLM error", default_factory)
 
 
+def call_llm_per_ticker(
+    tickers: list[str],
+    generate: Callable[[str], BaseModel],
+    agent_name: str | None = None,
+    status: str | None = None,
+) -> dict[str, BaseModel]:
+    """
+    Run an agent's per-ticker LLM calls concurrently.
+    
+    generate(ticker) builds the prompt from the already computed analysis and
+    calls call_llm, so the global LLM rate limiter still bounds how many
+    requests are in flight (raise LLM_MAX_CONCURRENT to benefit). Results are
+    returned in ticker order, and a multi-ticker run takes about as long as
+    its slowest ticker instead of the sum.
+    
+    With LLM_BATCH_SIZE > 1 the per-ticker prompts are merged so one call
+    answers up to that many tickers with a {ticker: signal} map (see
+    _call_llm_batched).
+    
+    Environment Variables:
+    - LLM_TICKER_FANOUT: Max concurrent tickers per agent (default: 8, 1 = serial)
+    - LLM_BATCH_SIZE: Tickers per batched prompt (default: 1 = one call per ticker)
+    - LLM_BATCH_MAX_TOKENS: Estimated prompt tokens per batch (default: 6000)
+    """
+    max_workers = min(int(os.getenv("LLM_TICKER_FANOUT", "8")), len(tickers))
+    if agent_name and status:
+        for ticker in tickers:
+            progress.update_status(agent_name, ticker, status)
+    
+    batch_size = int(os.getenv("LLM_BATCH_SIZE", "1"))
+    if batch_size > 1 and len(tickers) > 1:
+        return _call_llm_batched(tickers, generate, batch_size, max_workers)
+    
+    return dict(zip(tickers, _map_concurrently(generate, tickers, max_workers)))
+
+
+def _map_concurrently(fn: Callable, items: list, max_workers: int) -> list:
+    """Apply fn to items on a thread pool, keeping the input order."""
+    if max_workers <= 1 or len(items) <= 1:
+        return [fn(item) for item in items]
+    
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items)), thread_name_prefix="llm-fanout") as executor:
+        futures = [executor.submit(fn, item) for item in items]
+        return [future.result() for future in futures]
+
+
+def _call_llm_batched(
+    tickers: list[str],
+    generate: Callable[[str], BaseModel],
+    batch_size: int,
+    max_workers: int,
+) -> dict[str, BaseModel]:
+    """
+    Answer several tickers per LLM call.
+    
+    Each generate(ticker) is run with call_llm capturing its request rather
+    than calling the provider. The captured prompts are packed into batches
+    of up to batch_size tickers (fewer if the batch would exceed
+    LLM_BATCH_MAX_TOKENS) and each batch is sent as one prompt whose
+    structured output maps ticker -> signal. Tickers a batch fails to answer
+    with a valid signal are retried with their own per-ticker call.
+    """
+    requests = {}
+    for ticker in tickers:
+        token = _captured_requests.set([])
+        try:
+            generate(ticker)
+            captured = _captured_requests.get()
+        finally:
+            _captured_requests.reset(token)
+        # Agents that make more (or no) LLM calls per ticker are not batched
+        if len(captured) == 1:
+            requests[ticker] = captured[0]
+    
+    batches = _plan_batches(
+        [ticker for ticker in tickers if ticker in requests],
+        requests,
+        batch_size,
+        int(os.getenv("LLM_BATCH_MAX_TOKENS", "6000")),
+    )
+    results = {}
+    for answered in _map_concurrently(lambda batch: _call_llm_batch(batch, requests), batches, max_workers):
+        results.update(answered)
+    
+    missing = [ticker for ticker in tickers if ticker not in results]
+    if missing:
+        if len(missing) < len(tickers):
+            logger.info(f"Batched LLM call left {len(missing)} ticker(s) unanswered, calling per ticker: {missing}")
+        results.update(zip(missing, _map_concurrently(generate, missing, max_workers)))
+    
+    return {ticker: results[ticker] for ticker in tickers}
+
+
+def _prompt_messages(prompt) -> list[tuple[str, str]]:
+    """(role, content) pairs of a prompt value, message list or string."""
+    if hasattr(prompt, "to_messages"):
+        return [(message.type, message.content) for message in prompt.to_messages()]
+    if isinstance(prompt, (list, tuple)):
+        return [
+            tuple(message) if isinstance(message, (list, tuple)) else (message.type, message.content)
+            for message in prompt
+        ]
+    return [("human", str(prompt))]
+
+
+def _plan_batches(tickers: list[str], requests: dict, batch_size: int, max_tokens: int) -> list[list[str]]:
+    """Pack tickers into batches bounded by size, token budget and output model."""
+    batches = []
+    batch, batch_tokens = [], 0
+    for ticker in tickers:
+        tokens = _estimate_tokens(str(_prompt_messages(requests[ticker]["prompt"])))
+        if batch and (
+            len(batch) >= batch_size
+            or batch_tokens + tokens > max_tokens
+            or requests[ticker]["pydantic_model"] is not requests[batch[0]]["pydantic_model"]
+        ):
+            batches.append(batch)
+            batch, batch_tokens = [], 0
+        batch.append(ticker)
+        batch_tokens += tokens
+    if batch:
+        batches.append(batch)
+    return batches
+
+
+@lru_cache(maxsize=64)
+def _batch_model(signal_model: type[BaseModel]) -> type[BaseModel]:
+    """Structured output for a batch: {"signals": {ticker: signal}}."""
+    return create_model(f"{signal_model.__name__}Batch", signals=(dict[str, signal_model], ...))
+
+
+def _call_llm_batch(batch: list[str], requests: dict) -> dict[str, BaseModel]:
+    """Send one batch; returns the tickers that came back with a valid signal."""
+    if len(batch) < 2:
+        return {}
+    
+    first = requests[batch[0]]
+    system, sections = [], []
+    for ticker in batch:
+        messages = _prompt_messages(requests[ticker]["prompt"])
+        if not system:
+            system = [content for role, content in messages if role == "system"]
+        sections.append(
+            f"=== {ticker} ===\n" + "\n".join(content for role, content in messages if role != "system")
+        )
+    
+    prompt = [
+        ("system", "\n".join(system + ["Analyze each ticker below independently."])),
+        (
+            "human",
+            "\n\n".join(sections)
+            + "\n\nReturn JSON only: "
+            + '{"signals": {"<TICKER>": <object in the format requested above>, ...}} '
+            + f"with exactly one entry for each of: {', '.join(batch)}",
+        ),
+    ]
+    
+    response = call_llm(
+        prompt=prompt,
+        pydantic_model=_batch_model(first["pydantic_model"]),
+        agent_name=first["agent_name"],
+        state=first["state"],
+        max_retries=1,
+    )
+    signals = {str(ticker).upper(): signal for ticker, signal in (getattr(response, "signals", None) or {}).items()}
+    
+    return {
+        ticker: signals[ticker.upper()]
+        for ticker in batch
+        if isinstance(signals.get(ticker.upper()), first["pydantic_model"])
+    }
+
+
+def _to_pydantic(result, pydantic_model: type[BaseModel], model_info, agent_name: str | None):
+    """Convert a raw LLM result to the output model (raises if it can't be parsed)."""
+    # For non-JSON support models, we need to extract and parse the JSON manually
+    if model_info and not model_info.has_json_mode():
+        parsed_result = extract_json_from_response(result.content)
+        if parsed_result:
+            try:
+                return pydantic_model(**parsed_result)
+            except Exception as validation_error:
+                logger.warning(f"Pydantic validation failed for {agent_name}: {validation_error}")
+                # Try to fix common issues
+                parsed_result = _fix_common_json_issues(parsed_result, pydantic_model)
+                if parsed_result:
+                    return pydantic_model(**parsed_result)
+                raise validation_error
+        else:
+            raise ValueError("Could not extract JSON from model response")
+    else:
+        # Validate the result is the correct type
+        if isinstance(result, pydantic_model):
+            return result
+        elif isinstance(result, dict):
+            return pydantic_model(**result)
+        else:
+            # If result has content attribute (BaseMessage), try to parse it
+            if hasattr(result, 'content'):
+                parsed = extract_json_from_response(result.content)
+                if parsed:
+                    return pydantic_model(**parsed)
+            return result
+
+
 def _create_error_response(
     model_class: type[BaseModel], 
     error_message: str, 
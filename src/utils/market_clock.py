@@ -0,0 +1,168 @@
+"""
+US Equity Market Clock
+
+Regular-session calendar for NYSE/Nasdaq (9:30-16:00 ET, weekdays, full-day
+holidays) used by the scheduler and by cache TTLs for market data.
+
+Besides "is the market open", it answers how much open-market time passed
+between two instants. Quotes and intraday bars only change while the
+market is open, so their staleness is measured in market seconds: a quote
+fetched at 15:59 is 60s stale at the close and still 60s stale on Saturday.
+
+Early closes (1 PM ET half days) are treated as full sessions, so data is
+refreshed a little more often than needed on those afternoons.
+"""
+
+from datetime import date, datetime, time, timedelta
+from functools import lru_cache
+from typing import Optional, Set
+
+import pytz
+from dateutil.easter import easter
+
+ET = pytz.timezone("America/New_York")
+MARKET_OPEN = time(9, 30)
+MARKET_CLOSE = time(16, 0)
+
+# How far ahead/behind to walk the calendar before giving up
+_MAX_DAYS = 14
+
+
+def _observed(day: date) -> date:
+    """Weekend holidays are observed on the nearest weekday."""
+    if day.weekday() == 5:
+        return day - timedelta(days=1)
+    if day.weekday() == 6:
+        return day + timedelta(days=1)
+    return day
+
+
+def _nth_weekday(year: int, month: int, weekday: int, n: int) -> date:
+    """n-th (1-based, -1 for last) weekday of a month."""
+    if n > 0:
+        first = date(year, month, 1)
+        return first + timedelta(days=(weekday - first.weekday()) % 7 + 7 * (n - 1))
+    last = date(year + month // 12, month % 12 + 1, 1) - timedelta(days=1)
+    return last - timedelta(days=(last.weekday() - weekday) % 7)
+
+
+@lru_cache(maxsize=16)
+def market_holidays(year: int) -> Set[date]:
+    """Full-day NYSE holidays for a year."""
+    holidays = {
+        _nth_weekday(year, 1, 0, 3),  # Martin Luther King Jr. Day
+        _nth_weekday(year, 2, 0, 3),  # Washington's Birthday
+        easter(year) - timedelta(days=2),  # Good Friday
+        _nth_weekday(year, 5, 0, -1),  # Memorial Day
+        _observed(date(year, 7, 4)),  # Independence Day
+        _nth_weekday(year, 9, 0, 1),  # Labor Day
+        _nth_weekday(year, 11, 3, 4),  # Thanksgiving
+        _observed(date(year, 12, 25)),  # Christmas
+    }
+    # New Year's Day on a Saturday is not observed on the Friday before
+    new_year = date(year, 1, 1)
+    if new_year.weekday() != 5:
+        holidays.add(_observed(new_year))
+    if year >= 2022:
+        holidays.add(_observed(date(year, 6, 19)))  # Juneteenth
+    return holidays
+
+
+def is_trading_day(day: date) -> bool:
+    return day.weekday() < 5 and day not in market_holidays(day.year)
+
+
+def _to_et(moment: Optional[datetime]) -> datetime:
+    if moment is None:
+        return datetime.now(ET)
+    if moment.tzinfo is None:
+        return ET.localize(moment)
+    return moment.astimezone(ET)
+
+
+def _session(day: date):
+    """(open, close) of a trading day in ET."""
+    return (
+        ET.localize(datetime.combine(day, MARKET_OPEN)),
+        ET.localize(datetime.combine(day, MARKET_CLOSE)),
+    )
+
+
+def is_market_hours(now: Optional[datetime] = None) -> bool:
+    """Check if the regular session is open (naive times are taken as ET)."""
+    now = _to_et(now)
+    if not is_trading_day(now.date()):
+        return False
+    market_open, market_close = _session(now.date())
+    return market_open <= now <= market_close
+
+
+def next_market_open(now: Optional[datetime] = None) -> datetime:
+    """Start of the next session (now, if the market is open)."""
+    now = _to_et(now)
+    for offset in range(_MAX_DAYS + 1):
+        day = now.date() + timedelta(days=offset)
+        if not is_trading_day(day):
+            continue
+        market_open, market_close = _session(day)
+        if now <= market_close:
+            return max(now, market_open)
+    return now + timedelta(days=_MAX_DAYS)
+
+
+def last_market_close(now: Optional[datetime] = None) -> datetime:
+    """End of the most recent session that has closed (by now)."""
+    now = _to_et(now)
+    for offset in range(_MAX_DAYS + 1):
+        day = now.date() - timedelta(days=offset)
+        if not is_trading_day(day):
+            continue
+        _, market_close = _session(day)
+        if market_close <= now:
+            return market_close
+    return now - timedelta(days=_MAX_DAYS)
+
+
+def market_seconds_between(start: datetime, end: Optional[datetime] = None) -> float:
+    """
+    Seconds the market was open between two instants.
+
+    Spans longer than two weeks are reported as their wall-clock length.
+    """
+    start, end = _to_et(start), _to_et(end)
+    if end <= start:
+        return 0.0
+    if (end - start).days > _MAX_DAYS:
+        return (end - start).total_seconds()
+
+    total = 0.0
+    day = start.date()
+    while day <= end.date():
+        if is_trading_day(day):
+            market_open, market_close = _session(day)
+            overlap = (min(end, market_close) - max(start, market_open)).total_seconds()
+            total += max(0.0, overlap)
+        day += timedelta(days=1)
+    return total
+
+
+def seconds_until_market_elapsed(market_seconds: float, now: Optional[datetime] = None) -> float:
+    """
+    Wall-clock seconds until the market has been open for market_seconds
+    more (e.g. how long a cached quote stays within its staleness bound).
+    """
+    now = _to_et(now)
+    remaining = market_seconds
+    for offset in range(_MAX_DAYS + 1):
+        day = now.date() + timedelta(days=offset)
+        if not is_trading_day(day):
+            continue
+        market_open, market_close = _session(day)
+        if now >= market_close:
+            continue
+        start = max(now, market_open)
+        available = (market_close - start).total_seconds()
+        if remaining <= available:
+            return (start - now).total_seconds() + remaining
+        remaining -= available
+    return _MAX_DAYS * 86400.0
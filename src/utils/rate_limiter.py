@@ -10,12 +10,33 @@ import logging
 import os
 import random
 import time
-from typing import Optional
+from typing import Optional, TYPE_CHECKING
 from threading import Lock, Semaphore
 
+if TYPE_CHECKING:
+    from src.utils.distributed_rate_limiter import DistributedRateLimiter
+
 logger = logging.getLogger(__name__)
 
 
+async def acquire_semaphore_async(semaphore: Semaphore, timeout: Optional[float] = None) -> bool:
+    """
+    Acquire a threading semaphore from async code by polling it.
+    
+    The limiters are shared between threads and event loops, so their slots
+    are threading semaphores; this waits for one with asyncio.sleep instead
+    of blocking the loop.
+    """
+    start_time = time.time()
+    poll = 0.01
+    while not semaphore.acquire(blocking=False):
+        if timeout is not None and time.time() - start_time >= timeout:
+            return False
+        await asyncio.sleep(poll)
+        poll = min(poll * 2, 0.25)
+    return True
+
+
 class RateLimiter:
     """
     Token bucket rate limiter for LLM API calls.
@@ -225,6 +246,60 @@ class RateLimiter:
             self.semaphore.release()
             raise
     
+    async def acquire_async(self, timeout: Optional[float] = None) -> bool:
+        """
+        Acquire permission to make an LLM call without blocking the event loop.
+        
+        Same steps as acquire(), sharing its slots and token bucket with
+        synchronous callers, but every wait is an asyncio.sleep.
+        
+        Args:
+            timeout: Maximum time to wait (None = wait forever)
+        
+        Returns:
+            True if acquired, False if not available within the timeout
+        """
+        start_time = time.time()
+        
+        if not await acquire_semaphore_async(self.semaphore, timeout):
+            logger.debug("Rate limiter: failed to acquire semaphore")
+            return False
+        
+        try:
+            # Minimum interval, then 429 backoff
+            for delay in (self._wait_for_minimum_interval(), self._calculate_backoff()):
+                if delay <= 0:
+                    continue
+                if timeout and (time.time() - start_time + delay) > timeout:
+                    self.semaphore.release()
+                    return False
+                await asyncio.sleep(delay)
+            
+            # Wait for token (rate limit bucket)
+            token_wait_start = time.time()
+            max_token_wait = 30.0  # Max 30 seconds waiting for token
+            
+            while not self._acquire_token():
+                if timeout and (time.time() - start_time) >= timeout:
+                    self.semaphore.release()
+                    return False
+                
+                if (time.time() - token_wait_start) > max_token_wait:
+                    logger.warning("Rate limiter: token wait timeout, proceeding anyway")
+                    break
+                
+                wait_time = (1.0 - self.tokens) / max(self.refill_rate, 0.001)
+                if wait_time > 0:
+                    await asyncio.sleep(min(wait_time, 2.0))
+                self._refill_tokens()
+            
+            return True
+            
+        except BaseException:
+            # Release semaphore on error or cancellation
+            self.semaphore.release()
+            raise
+    
     def release(self):
         """Release the semaphore after LLM call completes"""
         self.semaphore.release()
@@ -238,7 +313,7 @@ def get_rate_limiter(
     max_concurrent: int = 1,  # Default to 1 for safety
     requests_per_minute: int = 15,  # Conservative default
     min_request_interval: float = 2.0,  # 2 seconds between requests
-) -> RateLimiter:
+) -> "RateLimiter | DistributedRateLimiter":
     """Get or create the global rate limiter"""
     global _global_rate_limiter
     
@@ -248,11 +323,20 @@ def get_rate_limiter(
         requests_per_minute = int(os.getenv("LLM_REQUESTS_PER_MINUTE", str(requests_per_minute)))
         min_request_interval = float(os.getenv("LLM_MIN_REQUEST_INTERVAL", str(min_request_interval)))
         
-        _global_rate_limiter = RateLimiter(
+        local_limiter = RateLimiter(
             max_concurrent=max_concurrent,
             requests_per_minute=requests_per_minute,
             min_request_interval=min_request_interval,
         )
+        
+        # Share the LLM quota with other processes when DISTRIBUTED_RATE_LIMIT is on
+        from src.utils.distributed_rate_limiter import get_distributed_limiter
+        _global_rate_limiter = get_distributed_limiter(
+            "llm",
+            requests_per_minute=requests_per_minute,
+            max_concurrent=max_concurrent,
+            fallback=local_limiter,
+        )
     
     return _global_rate_limiter
 
@@ -271,6 +355,8 @@ def get_rate_limiter_status() -> dict:
         return {"initialized": False}
     
     rl = _global_rate_limiter
+    if hasattr(rl, "get_status"):
+        return rl.get_status()
     return {
         "initialized": True,
         "max_concurrent": rl.max_concurrent,
@@ -0,0 +1,182 @@
+"""
+Tests for per-ticker LLM fan-out in persona agents
+
+Covers call_llm_per_ticker:
+- Results returned in ticker order regardless of completion order
+- Calls for all tickers in flight together
+- Serial fallback with LLM_TICKER_FANOUT=1
+- warren_buffett_agent signals built from the fanned-out outputs
+- Batched prompts: one call per batch, split by size and token budget,
+  per-ticker fallback for tickers missing from the batch response
+"""
+
+import os
+import threading
+import time
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from langchain_core.prompts import ChatPromptTemplate
+
+from src.agents.warren_buffett import WarrenBuffettSignal
+from src.utils import llm as llm_utils
+from src.utils.llm import call_llm_per_ticker
+
+
+class TestCallLLMPerTicker:
+    """Tests for the fan-out helper."""
+
+    def test_results_in_ticker_order(self):
+        delays = {"AAPL": 0.05, "MSFT": 0.0, "NVDA": 0.02}
+
+        def generate(ticker):
+            time.sleep(delays[ticker])
+            return ticker.lower()
+
+        result = call_llm_per_ticker(["AAPL", "MSFT", "NVDA"], generate)
+
+        assert list(result.items()) == [("AAPL", "aapl"), ("MSFT", "msft"), ("NVDA", "nvda")]
+
+    def test_calls_run_concurrently(self):
+        barrier = threading.Barrier(3, timeout=2)
+
+        def generate(ticker):
+            barrier.wait()  # Only passes if all three tickers are in flight
+            return ticker
+
+        assert len(call_llm_per_ticker(["AAPL", "MSFT", "NVDA"], generate)) == 3
+
+    def test_serial_when_fanout_disabled(self):
+        seen = []
+
+        def generate(ticker):
+            seen.append(threading.current_thread().name)
+            return ticker
+
+        with patch.dict(os.environ, {"LLM_TICKER_FANOUT": "1"}):
+            call_llm_per_ticker(["AAPL", "MSFT"], generate)
+
+        assert seen == [threading.current_thread().name] * 2
+
+    def test_errors_propagate(self):
+        def generate(ticker):
+            raise RuntimeError(ticker)
+
+        with pytest.raises(RuntimeError):
+            call_llm_per_ticker(["AAPL", "MSFT"], generate)
+
+
+class TestPersonaAgentFanout:
+    """Tests for an agent using the helper."""
+
+    def test_buffett_signals_keep_ticker_order(self):
+        from src.agents import warren_buffett
+
+        data_context = MagicMock()
+        data_context.get_financial_metrics.return_value = []
+        data_context.search_line_items.return_value = []
+        data_context.get_market_cap.return_value = None
+        state = {
+            "data": {"end_date": "2024-03-01", "tickers": ["NVDA", "AAPL"], "analyst_signals": {}},
+            "metadata": {"show_reasoning": False},
+        }
+
+        def generate(ticker, analysis_data, state, agent_id):
+            time.sleep(0.02 if ticker == "NVDA" else 0)
+            return WarrenBuffettSignal(signal="neutral", confidence=50, reasoning=ticker)
+
+        with patch.object(warren_buffett, "get_data_context", return_value=data_context), \
+             patch.object(warren_buffett, "generate_buffett_output", side_effect=generate):
+            warren_buffett.warren_buffett_agent(state)
+
+        signals = state["data"]["analyst_signals"]["warren_buffett_agent"]
+        assert list(signals) == ["NVDA", "AAPL"]
+        assert signals["AAPL"]["reasoning"] == "AAPL"
+
+
+def _generate(ticker):
+    template = ChatPromptTemplate.from_messages([
+        ("system", "You are Warren Buffett."),
+        ("human", "Ticker: {ticker}\nFacts: {facts}"),
+    ])
+    prompt = template.invoke({"ticker": ticker, "facts": "x" * 400})
+    return llm_utils.call_llm(prompt, WarrenBuffettSignal, agent_name="warren_buffett_agent", max_retries=1)
+
+
+def _signal(reasoning):
+    return {"signal": "bullish", "confidence": 70, "reasoning": reasoning}
+
+
+class TestBatchedCalls:
+    """Tests for LLM_BATCH_SIZE > 1."""
+
+    @pytest.fixture
+    def llm(self):
+        llm = MagicMock()
+        llm.with_structured_output.return_value = llm
+        llm.ainvoke = AsyncMock()
+        with patch.object(llm_utils, "get_model", return_value=llm), \
+             patch.object(llm_utils, "get_structured_model", return_value=llm), \
+             patch.object(llm_utils, "get_model_info", return_value=None), \
+             patch.object(llm_utils, "_rate_limiter", MagicMock(acquire_async=AsyncMock(return_value=True))), \
+             patch.object(llm_utils, "_get_event_logger", return_value=None), \
+             patch.object(llm_utils, "_get_rate_limit_monitor", return_value=None):
+            yield llm
+
+    def _batch_response(self, prompt, drop=()):
+        human = prompt[1][1]
+        tickers = [t for t in ("AAPL", "MSFT", "NVDA", "TSLA") if f"=== {t} ===" in human]
+        return {"signals": {t.lower(): _signal(f"batch {t}") for t in tickers if t not in drop}}
+
+    def test_one_call_per_batch(self, llm):
+        llm.ainvoke.side_effect = self._batch_response
+
+        with patch.dict(os.environ, {"LLM_BATCH_SIZE": "2"}):
+            result = call_llm_per_ticker(["AAPL", "MSFT", "NVDA", "TSLA"], _generate)
+
+        assert llm.ainvoke.call_count == 2
+        assert list(result) == ["AAPL", "MSFT", "NVDA", "TSLA"]
+        assert result["NVDA"].reasoning == "batch NVDA"
+
+    def test_token_budget_splits_batches(self, llm):
+        llm.ainvoke.side_effect = self._batch_response
+
+        with patch.dict(os.environ, {"LLM_BATCH_SIZE": "4", "LLM_BATCH_MAX_TOKENS": "250"}):
+            batches = llm_utils._plan_batches(
+                ["AAPL", "MSFT", "NVDA", "TSLA"],
+                {t: {"prompt": "x" * 400, "pydantic_model": WarrenBuffettSignal} for t in ("AAPL", "MSFT", "NVDA", "TSLA")},
+                4,
+                250,
+            )
+            call_llm_per_ticker(["AAPL", "MSFT", "NVDA", "TSLA"], _generate)
+
+        assert batches == [["AAPL", "MSFT"], ["NVDA", "TSLA"]]
+        assert llm.ainvoke.call_count == 2
+
+    def test_missing_ticker_falls_back_to_single_call(self, llm):
+        def invoke(prompt):
+            if isinstance(prompt, list):
+                return self._batch_response(prompt, drop=("MSFT",))
+            return _signal("single")
+
+        llm.ainvoke.side_effect = invoke
+
+        with patch.dict(os.environ, {"LLM_BATCH_SIZE": "4"}):
+            result = call_llm_per_ticker(["AAPL", "MSFT", "NVDA"], _generate)
+
+        assert llm.ainvoke.call_count == 2
+        assert result["MSFT"].reasoning == "single"
+        assert result["AAPL"].reasoning == "batch AAPL"
+
+    def test_invalid_batch_falls_back_for_every_ticker(self, llm):
+        def invoke(prompt):
+            if isinstance(prompt, list):
+                return {"signals": {"AAPL": {"signal": "maybe"}}}
+            return _signal("single")
+
+        llm.ainvoke.side_effect = invoke
+
+        with patch.dict(os.environ, {"LLM_BATCH_SIZE": "4"}):
+            result = call_llm_per_ticker(["AAPL", "MSFT"], _generate)
+
+        assert [r.reasoning for r in result.values()] == ["single", "single"]
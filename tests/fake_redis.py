@@ -0,0 +1,193 @@
+"""
+Minimal in-process Redis stand-in for cache tests.
+
+Implements the handful of commands the cache layer uses, with bytes values
+like a decode_responses=False client. Lua scripts registered by the code
+under test are emulated by Python handlers keyed by script source.
+"""
+
+import math
+import time
+from typing import Callable, Dict
+from unittest.mock import patch
+
+from src.data import cache
+from src.utils import distributed_rate_limiter
+
+
+class FakeRedis:
+    def __init__(self):
+        self.store: Dict[str, object] = {}
+        self.expiry: Dict[str, float] = {}
+        self.lua_handlers: Dict[str, Callable] = {}
+        # Server clock for scripts calling TIME; tests may replace it
+        self.clock = time.time
+
+    # ==================== Keys ====================
+
+    def _live(self, key):
+        if key in self.expiry and self.expiry[key] <= time.monotonic():
+            self.store.pop(key, None)
+            self.expiry.pop(key, None)
+        return self.store.get(key)
+
+    def get(self, key):
+        return self._live(key)
+
+    def mget(self, keys):
+        return [self._live(key) for key in keys]
+
+    def setex(self, key, ttl, value):
+        self.store[key] = value
+        self.expiry[key] = time.monotonic() + ttl
+
+    def expire(self, key, ttl):
+        if key in self.store:
+            self.expiry[key] = time.monotonic() + ttl
+
+    def pttl(self, key):
+        if self._live(key) is None:
+            return -2
+        if key not in self.expiry:
+            return -1
+        return int((self.expiry[key] - time.monotonic()) * 1000)
+
+    def delete(self, *keys):
+        return sum(self.store.pop(key, None) is not None for key in keys)
+
+    # ==================== Hashes / sorted sets ====================
+
+    def hset(self, key, mapping):
+        self.store.setdefault(key, {}).update(mapping)
+        return len(mapping)
+
+    def hsetnx(self, key, field, value):
+        hash_ = self.store.setdefault(key, {})
+        if field in hash_:
+            return 0
+        hash_[field] = value
+        return 1
+
+    def hmget(self, key, fields):
+        hash_ = self._live(key) or {}
+        return [hash_.get(field) for field in fields]
+
+    def zadd(self, key, mapping, nx=False):
+        zset = self.store.setdefault(key, {})
+        added = 0
+        for member, score in mapping.items():
+            if nx and member in zset:
+                continue
+            added += member not in zset
+            zset[member] = score
+        return added
+
+    def zrangebyscore(self, key, min_score, max_score):
+        zset = self._live(key) or {}
+        members = sorted(zset.items(), key=lambda item: (item[1], item[0]))
+        return [m for m, s in members if float(min_score) <= s <= float(max_score)]
+
+    def zrevrangebyscore(self, key, max_score, min_score):
+        return list(reversed(self.zrangebyscore(key, min_score, max_score)))
+
+    # ==================== Pipelines / scripts ====================
+
+    def pipeline(self, transaction=True):
+        return _FakePipeline(self)
+
+    def register_script(self, source):
+        handler = self.lua_handlers.get(source) or _LUA_HANDLERS[source]
+
+        def run(keys=(), args=(), client=None):
+            if isinstance(client, _FakePipeline):
+                client._calls.append((lambda: handler(self, list(keys), list(args)), (), {}))
+                return client
+            return handler(self, list(keys), list(args))
+
+        return run
+
+
+def fake_cache() -> "cache.RedisCache":
+    """A RedisCache backed by a fresh FakeRedis, so tests never touch the REDIS_URL server."""
+    with patch.object(cache.RedisCache, "_connect_redis"):
+        redis_cache = cache.RedisCache()
+    redis_cache._redis_client = FakeRedis()
+    redis_cache._range_script = redis_cache._redis_client.register_script(cache._RANGE_SCRIPT)
+    return redis_cache
+
+
+class _FakePipeline:
+    def __init__(self, redis):
+        self._redis = redis
+        self._calls = []
+
+    def __getattr__(self, name):
+        command = getattr(self._redis, name)
+
+        def queue(*args, **kwargs):
+            self._calls.append((command, args, kwargs))
+            return self
+
+        return queue
+
+    def execute(self):
+        calls, self._calls = self._calls, []
+        return [command(*args, **kwargs) for command, args, kwargs in calls]
+
+
+def _range_script(redis, keys, args):
+    index_key, rows_key = keys
+    min_score, max_score, newest_first = args
+    if newest_first == "1":
+        ids = redis.zrevrangebyscore(index_key, max_score, min_score)
+    else:
+        ids = redis.zrangebyscore(index_key, min_score, max_score)
+    rows = redis.hmget(rows_key, ids)
+    return [redis.pttl(index_key)] + [row for row in rows if row is not None]
+
+
+def _now_ms(redis):
+    return int(redis.clock() * 1000)
+
+
+def _acquire_script(redis, keys, args):
+    rate, capacity = float(args[0]), float(args[1])
+    tokens, ts, paused_until = redis.hmget(keys[0], ["tokens", "ts", "paused_until"])
+    now = _now_ms(redis)
+    if now < float(paused_until or 0):
+        return int(float(paused_until) - now)
+    tokens = float(tokens) if tokens is not None else capacity
+    ts = float(ts) if ts is not None else now
+    tokens = min(capacity, tokens + max(0, now - ts) * rate / 1000)
+    wait = 0
+    if tokens >= 1:
+        tokens -= 1
+    else:
+        wait = math.ceil((1 - tokens) * 1000 / rate)
+    redis.hset(keys[0], mapping={"tokens": tokens, "ts": now})
+    return wait
+
+
+def _penalty_script(redis, keys, args):
+    base, max_backoff, window = float(args[0]), float(args[1]), float(args[2])
+    strikes, last_429, paused_until = redis.hmget(keys[0], ["strikes", "last_429", "paused_until"])
+    now = _now_ms(redis)
+    if now < float(paused_until or 0):
+        return int(float(paused_until) - now)
+    strikes = int(strikes or 0)
+    if now - float(last_429 or 0) > window * 1000:
+        strikes = 0
+    strikes += 1
+    backoff = int(min(base ** strikes, max_backoff) * 1000)
+    redis.hset(keys[0], mapping={
+        "tokens": 0, "ts": now + backoff, "paused_until": now + backoff,
+        "strikes": strikes, "last_429": now,
+    })
+    return backoff
+
+
+_LUA_HANDLERS = {
+    cache._RANGE_SCRIPT: _range_script,
+    distributed_rate_limiter.ACQUIRE_SCRIPT: _acquire_script,
+    distributed_rate_limiter.PENALTY_SCRIPT: _penalty_script,
+}
@@ -0,0 +1,150 @@
+"""
+Tests for the AIMD adaptive concurrency limiter.
+
+Tests:
+- Additive increase while quota is healthy and the window is in use
+- Multiplicative decrease on 429s and latency spikes, once per cooldown
+- Window bounds and blocking acquire, waiters woken when the window grows
+- Window reported to RateLimitMonitor
+"""
+
+import threading
+import pytest
+from unittest.mock import MagicMock, patch
+
+from src.utils.adaptive_limiter import AdaptiveConcurrencyLimiter, get_adaptive_limiter, reset_adaptive_limiters
+
+
+def _fill(limiter):
+    while limiter.acquire(blocking=False):
+        pass
+
+
+@pytest.fixture
+def limiter():
+    return AdaptiveConcurrencyLimiter("fmp_data", initial_limit=4, max_limit=8, quota_limit=300, decrease_cooldown=0)
+
+
+class TestAdditiveIncrease:
+    """Test window growth."""
+
+    def test_grows_about_one_slot_per_window(self, limiter):
+        _fill(limiter)
+        for _ in range(5):
+            limiter.record_response(0.1, remaining=250)
+
+        assert limiter.limit == 5
+
+    def test_idle_window_does_not_grow(self, limiter):
+        for _ in range(20):
+            limiter.record_response(0.1, remaining=250)
+
+        assert limiter.limit == 4
+
+    def test_low_remaining_quota_holds_window(self, limiter):
+        _fill(limiter)
+        for _ in range(20):
+            limiter.record_response(0.1, remaining=30)
+
+        assert limiter.limit == 4
+
+    def test_capped_at_max(self, limiter):
+        for _ in range(200):
+            _fill(limiter)
+            limiter.record_response(0.1)
+
+        assert limiter.limit == 8
+
+
+class TestMultiplicativeDecrease:
+    """Test window cuts."""
+
+    def test_429_halves_window(self, limiter):
+        limiter.record_429()
+        assert limiter.limit == 2
+        limiter.record_429()
+        limiter.record_429()
+        assert limiter.limit == 1
+
+    def test_burst_of_429s_cut_once_per_cooldown(self):
+        limiter = AdaptiveConcurrencyLimiter("fmp_data", initial_limit=8, max_limit=8, decrease_cooldown=60)
+        for _ in range(4):
+            limiter.record_429()
+
+        assert limiter.limit == 4
+
+    def test_latency_spike_cuts_window(self, limiter):
+        for _ in range(20):
+            limiter.record_response(0.1)
+        limiter.record_response(0.5)
+
+        assert limiter.limit == 2
+
+
+class TestWindow:
+    """Test slot accounting and reporting."""
+
+    def test_acquire_bounded_by_window(self, limiter):
+        _fill(limiter)
+        assert limiter.in_flight == 4
+        assert not limiter.acquire(timeout=0.01)
+
+        limiter.release()
+        assert limiter.acquire(timeout=0.01)
+
+    def test_waiter_woken_by_window_increase(self, limiter):
+        _fill(limiter)
+        acquired = []
+        waiter = threading.Thread(target=lambda: acquired.append(limiter.acquire(timeout=2)))
+        waiter.start()
+
+        # No slot is released; only the window growing past 4 can admit the waiter
+        while limiter.limit == 4:
+            limiter.record_response(0.1)
+        waiter.join(timeout=1)
+
+        assert acquired == [True]
+        assert limiter.in_flight == 5
+
+    def test_window_changes_reported_to_monitor(self, limiter):
+        monitor = MagicMock()
+        with patch("src.monitoring.get_rate_limit_monitor", return_value=monitor):
+            limiter.record_429()
+            limiter.record_response(0.1)
+
+        monitor.record_concurrency_window.assert_called_once_with("fmp_data", 2, 0)
+
+    def test_monitor_exposes_window(self):
+        from src.monitoring.rate_limit_monitor import RateLimitMonitor
+
+        with patch("src.monitoring.rate_limit_monitor.get_event_logger"), \
+             patch("src.monitoring.rate_limit_monitor.get_alert_manager"):
+            monitor = RateLimitMonitor()
+        monitor.record_concurrency_window("fmp_data", 6, 3)
+
+        status = monitor.get_all_status()["fmp_data"]
+        assert (status["concurrency_limit"], status["in_flight"]) == (6, 3)
+
+    def test_one_limiter_per_provider_across_threads(self, monkeypatch):
+        monkeypatch.setenv("ADAPTIVE_CONCURRENCY", "true")
+        reset_adaptive_limiters()
+        barrier = threading.Barrier(8)
+        limiters = []
+
+        def get():
+            barrier.wait()
+            limiters.append(get_adaptive_limiter("fmp_data"))
+
+        threads = [threading.Thread(target=get) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        reset_adaptive_limiters()
+
+        assert len({id(limiter) for limiter in limiters}) == 1
+
+    def test_disabled_by_default(self, monkeypatch):
+        monkeypatch.delenv("ADAPTIVE_CONCURRENCY", raising=False)
+        reset_adaptive_limiters()
+        assert get_adaptive_limiter("fmp_data") is None
@@ -56,7 +56,7 @@ class TestAlpacaDataClient:
         assert isinstance(df, pd.DataFrame)
         assert df.empty
     
-    @patch('src.tools.alpaca_data.requests.request')
+    @patch('requests.Session.request')
     def test_get_bars_parses_response(self, mock_request, monkeypatch):
         """Test get_bars correctly parses Alpaca API response."""
         monkeypatch.setenv("ALPACA_API_KEY", "test-key")
@@ -92,7 +92,7 @@ class TestAlpacaDataClient:
         assert df.iloc[0]["close"] == 185.5
         assert df.iloc[0]["volume"] == 1000000
     
-    @patch('src.tools.alpaca_data.requests.request')
+    @patch('requests.Session.request')
     def test_get_news_returns_articles(self, mock_request, monkeypatch):
         """Test get_news correctly parses news articles."""
         monkeypatch.setenv("ALPACA_API_KEY", "test-key")
@@ -127,6 +127,90 @@ class TestAlpacaDataClient:
         assert "AAPL" in news[0].symbols
 
 
+class TestGetBarsMulti:
+    """Tests for batched multi-symbol bar fetching."""
+    
+    @staticmethod
+    def _response(payload):
+        response = MagicMock()
+        response.status_code = 200
+        response.text = "{...}"
+        response.json.return_value = payload
+        response.headers = {}
+        return response
+    
+    @staticmethod
+    def _bar(day, close):
+        return {"t": f"{day}T05:00:00Z", "o": close, "h": close, "l": close, "c": close, "v": 1000}
+    
+    @patch('requests.Session.request')
+    def test_follows_page_tokens_and_groups_by_symbol(self, mock_request, monkeypatch):
+        """Test pages are followed and bars are merged per symbol."""
+        monkeypatch.setenv("ALPACA_API_KEY", "test-key")
+        monkeypatch.setenv("ALPACA_SECRET_KEY", "test-secret")
+        
+        mock_request.side_effect = [
+            self._response({
+                "bars": {"AAPL": [self._bar("2023-03-01", 1.0)], "MSFT": [self._bar("2023-03-01", 2.0)]},
+                "next_page_token": "page-2",
+            }),
+            self._response({
+                "bars": {"MSFT": [self._bar("2023-03-02", 3.0)]},
+                "next_page_token": None,
+            }),
+        ]
+        
+        from src.tools.alpaca_data import AlpacaDataClient
+        
+        client = AlpacaDataClient()
+        frames = client.get_bars_multi(["aapl", "MSFT", "NVDA"], "2023-03-01", "2023-03-02")
+        
+        assert mock_request.call_count == 2
+        first_params = mock_request.call_args_list[0].kwargs["params"]
+        assert first_params["symbols"] == "AAPL,MSFT,NVDA"
+        assert mock_request.call_args_list[1].kwargs["params"]["page_token"] == "page-2"
+        assert list(frames["AAPL"]["close"]) == [1.0]
+        assert list(frames["MSFT"]["close"]) == [2.0, 3.0]
+        assert frames["NVDA"].empty
+    
+    @patch('requests.Session.request')
+    def test_fills_per_symbol_cache_used_by_get_bars(self, mock_request, monkeypatch):
+        """Test fetched symbols are cached under get_bars' key."""
+        monkeypatch.setenv("ALPACA_API_KEY", "test-key")
+        monkeypatch.setenv("ALPACA_SECRET_KEY", "test-secret")
+        
+        mock_request.return_value = self._response({
+            "bars": {"AAPL": [self._bar("2023-04-03", 1.0)], "MSFT": [self._bar("2023-04-03", 2.0)]},
+        })
+        
+        from src.tools.alpaca_data import AlpacaDataClient
+        
+        client = AlpacaDataClient()
+        client.get_bars_multi(["AAPL", "MSFT"], "2023-04-03", "2023-04-04")
+        df = client.get_bars("MSFT", "2023-04-03", "2023-04-04")
+        
+        assert mock_request.call_count == 1
+        assert df.iloc[0]["close"] == 2.0
+    
+    @patch('requests.Session.request')
+    def test_long_format_has_symbol_column(self, mock_request, monkeypatch):
+        """Test long-format output stacks symbols into one frame."""
+        monkeypatch.setenv("ALPACA_API_KEY", "test-key")
+        monkeypatch.setenv("ALPACA_SECRET_KEY", "test-secret")
+        
+        mock_request.return_value = self._response({
+            "bars": {"AAPL": [self._bar("2023-05-01", 1.0)], "MSFT": [self._bar("2023-05-01", 2.0)]},
+        })
+        
+        from src.tools.alpaca_data import AlpacaDataClient
+        
+        client = AlpacaDataClient()
+        df = client.get_bars_multi(["AAPL", "MSFT"], "2023-05-01", "2023-05-02", long_format=True)
+        
+        assert len(df) == 2
+        assert set(df["symbol"]) == {"AAPL", "MSFT"}
+
+
 # =============================================================================
 # Data Source Routing Tests
 # =============================================================================
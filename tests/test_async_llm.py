@@ -0,0 +1,113 @@
+"""
+Tests for the async LLM call path.
+
+Tests:
+- acall_llm awaits ainvoke and backs off with asyncio.sleep
+- Many calls in flight on one event loop
+- call_llm as a blocking wrapper, usable from threads
+- RateLimiter.acquire_async sharing slots with synchronous callers
+"""
+
+import asyncio
+import time
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from pydantic import BaseModel
+
+from src.utils import llm as llm_utils
+from src.utils.rate_limiter import RateLimiter
+
+
+class Signal(BaseModel):
+    signal: str
+    confidence: float
+    reasoning: str
+
+
+SIGNAL = {"signal": "bullish", "confidence": 70.0, "reasoning": "r"}
+
+
+@pytest.fixture
+def limiter():
+    return RateLimiter(max_concurrent=20, requests_per_minute=6000, min_request_interval=0)
+
+
+@pytest.fixture
+def llm(limiter):
+    llm = MagicMock()
+    llm.with_structured_output.return_value = llm
+    llm.ainvoke = AsyncMock(return_value=SIGNAL)
+    with patch.object(llm_utils, "get_model", return_value=llm), \
+         patch.object(llm_utils, "get_structured_model", return_value=llm), \
+         patch.object(llm_utils, "get_model_info", return_value=None), \
+         patch.object(llm_utils, "_rate_limiter", limiter), \
+         patch.object(llm_utils, "_get_event_logger", return_value=None), \
+         patch.object(llm_utils, "_get_rate_limit_monitor", return_value=None):
+        yield llm
+
+
+class TestAcallLLM:
+    """Test the native async path."""
+
+    def test_uses_ainvoke(self, llm):
+        result = asyncio.run(llm_utils.acall_llm("analyze AAPL", Signal))
+
+        assert result == Signal(**SIGNAL)
+        llm.ainvoke.assert_awaited_once()
+        llm.invoke.assert_not_called()
+
+    def test_calls_overlap_on_one_loop(self, llm):
+        async def slow(prompt):
+            await asyncio.sleep(0.2)
+            return SIGNAL
+
+        llm.ainvoke.side_effect = slow
+
+        async def run_all():
+            return await asyncio.gather(*(llm_utils.acall_llm(f"analyze {i}", Signal) for i in range(10)))
+
+        start = time.time()
+        results = asyncio.run(run_all())
+
+        assert len(results) == 10
+        assert time.time() - start < 1.0  # Serial would take 2s
+
+    def test_retry_backs_off_without_blocking(self, llm):
+        llm.ainvoke.side_effect = [RuntimeError("timeout"), SIGNAL]
+
+        with patch.object(llm_utils.asyncio, "sleep", new=AsyncMock()) as sleep, \
+             patch.object(llm_utils.time, "sleep") as blocking_sleep:
+            result = asyncio.run(llm_utils.acall_llm("analyze AAPL", Signal))
+
+        assert result.signal == "bullish"
+        sleep.assert_awaited_once_with(1)
+        blocking_sleep.assert_not_called()
+
+    def test_sync_wrapper_returns_result(self, llm):
+        assert llm_utils.call_llm("analyze AAPL", Signal) == Signal(**SIGNAL)
+        llm.ainvoke.assert_awaited_once()
+
+
+class TestAcquireAsync:
+    """Test the asyncio-aware rate limiter path."""
+
+    def test_shares_slots_with_sync_callers(self):
+        limiter = RateLimiter(max_concurrent=1, requests_per_minute=6000, min_request_interval=0)
+        assert limiter.acquire(timeout=1)
+
+        assert asyncio.run(limiter.acquire_async(timeout=0.1)) is False
+        limiter.release()
+        assert asyncio.run(limiter.acquire_async(timeout=0.1)) is True
+
+    def test_waiter_gets_released_slot(self):
+        limiter = RateLimiter(max_concurrent=1, requests_per_minute=6000, min_request_interval=0)
+
+        async def run():
+            assert await limiter.acquire_async()
+            waiter = asyncio.create_task(limiter.acquire_async(timeout=2))
+            await asyncio.sleep(0.05)
+            assert not waiter.done()
+            limiter.release()
+            return await waiter
+
+        assert asyncio.run(run()) is True
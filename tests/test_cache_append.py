@@ -0,0 +1,135 @@
+"""
+Tests for the append-only record list layout in RedisCache.
+
+Tests:
+- Writes only add rows and dedup on the date field server-side
+- News and insider trades keep every row that shares a date
+- Writes don't read back the stored history
+- Range reads and newest-first ordering
+- In-memory only operation without Redis
+"""
+
+import json
+import pytest
+from unittest.mock import patch
+
+from src.data import cache as cache_module
+from src.data.cache import RedisCache
+from tests.fake_redis import FakeRedis
+
+
+def _bar(day: int, close: float = 100.0) -> dict:
+    return {
+        "open": close,
+        "close": close,
+        "high": close,
+        "low": close,
+        "volume": 1000,
+        "time": f"2024-01-{day:02d}T00:00:00",
+        "ticker": "AAPL",
+    }
+
+
+def _new_cache(redis=None) -> RedisCache:
+    with patch.object(RedisCache, "_connect_redis"):
+        cache = RedisCache()
+    if redis is not None:
+        cache._redis_client = redis
+        cache._range_script = redis.register_script(cache_module._RANGE_SCRIPT)
+    return cache
+
+
+@pytest.fixture
+def redis():
+    return FakeRedis()
+
+
+@pytest.fixture
+def cache(redis):
+    return _new_cache(redis)
+
+
+class TestAppendOnlyWrites:
+    """Test incremental writes."""
+
+    def test_existing_rows_are_kept_and_new_rows_appended(self, cache, redis):
+        cache.set_prices("AAPL_k", [_bar(2, 100.0), _bar(3, 101.0)])
+        cache.set_prices("AAPL_k", [_bar(3, 999.0), _bar(4, 102.0)])
+
+        cache._l1.clear()
+        assert [b["close"] for b in cache.get_prices("AAPL_k")] == [100.0, 101.0, 102.0]
+        assert len(redis.store["prices:AAPL_k:rows"]) == 3
+
+    def test_rows_sharing_a_date_are_kept(self, cache, redis):
+        trades = [{"filing_date": "2024-01-05", "name": "A", "shares": s} for s in range(5)]
+        news = [{"date": "2024-01-05", "title": t, "url": t} for t in ("a", "b", "c")]
+        cache.set_insider_trades("AAPL_k", trades)
+        cache.set_insider_trades("AAPL_k", trades[:2])
+        cache.set_company_news("AAPL_k", news)
+
+        in_process = (cache.get_insider_trades("AAPL_k"), cache.get_company_news("AAPL_k"))
+        cache._l1.clear()
+
+        assert len(cache.get_insider_trades("AAPL_k")) == len(in_process[0]) == 5
+        assert len(cache.get_company_news("AAPL_k")) == len(in_process[1]) == 3
+
+    def test_write_does_not_read_history(self, cache, redis):
+        cache.set_prices("AAPL_k", [_bar(d) for d in range(1, 29)])
+        cache._l1.clear()
+
+        with patch.object(cache, "_range_script") as range_read, \
+             patch.object(redis, "get") as get:
+            cache.set_prices("AAPL_k", [_bar(29)])
+
+        range_read.assert_not_called()
+        get.assert_not_called()
+        assert len(redis.store["prices:AAPL_k:rows"]) == 29
+
+    def test_write_after_l1_miss_drops_stale_l1(self, cache):
+        cache.set_prices("AAPL_k", [_bar(2)])
+        cache._l1.clear()
+        cache.set_prices("AAPL_k", [_bar(3)])
+
+        assert [b["time"][:10] for b in cache.get_prices("AAPL_k")] == ["2024-01-02", "2024-01-03"]
+
+
+class TestRangeReads:
+    """Test ZRANGEBYSCORE-backed reads."""
+
+    def test_date_range_served_from_redis(self, cache):
+        cache.set_prices("AAPL_k", [_bar(d) for d in range(2, 12)])
+        cache._l1.clear()
+
+        bars = cache.get_prices("AAPL_k", start="2024-01-05", end="2024-01-07")
+        assert [b["time"][:10] for b in bars] == ["2024-01-05", "2024-01-06", "2024-01-07"]
+
+    def test_date_range_served_from_l1(self, cache):
+        cache.set_prices("AAPL_k", [_bar(d) for d in range(2, 12)])
+
+        bars = cache.get_prices("AAPL_k", start="2024-01-10")
+        assert [b["time"][:10] for b in bars] == ["2024-01-10", "2024-01-11"]
+
+    def test_news_read_newest_first(self, cache):
+        news = [{"date": f"2024-01-0{d}", "title": f"n{d}"} for d in (3, 1, 2)]
+        cache.set_company_news("AAPL_k", news)
+        cache._l1.clear()
+
+        assert [n["title"] for n in cache.get_company_news("AAPL_k")] == ["n3", "n2", "n1"]
+
+    def test_legacy_blob_still_served(self, cache, redis):
+        redis.setex("metrics:AAPL_old", 60, json.dumps([{"report_period": "2024-03-31"}]).encode())
+        assert cache.get_financial_metrics("AAPL_old") == [{"report_period": "2024-03-31"}]
+
+
+class TestWithoutRedis:
+    """Test the in-process tier alone."""
+
+    def test_merge_in_l1(self):
+        cache = _new_cache()
+        cache.set_financial_metrics("AAPL_k", [{"report_period": "2023-12-31", "pe": 1}])
+        cache.set_financial_metrics("AAPL_k", [{"report_period": "2024-03-31", "pe": 2}, {"report_period": "2023-12-31", "pe": 9}])
+
+        assert cache.get_financial_metrics("AAPL_k") == [
+            {"report_period": "2024-03-31", "pe": 2},
+            {"report_period": "2023-12-31", "pe": 1},
+        ]
@@ -0,0 +1,166 @@
+"""
+Tests for the bulk multi-key cache API and its universe-level callers.
+
+Tests:
+- get_many/set_many variants using one pipelined round trip
+- L1 hits skipping Redis
+- api.get_prices_many warming the cache and prefetching only misses
+- Strategy scan bulk-loading each strategy price window
+"""
+
+import os
+import pytest
+from unittest.mock import MagicMock, patch
+
+from src.data import cache as cache_module
+from src.data.cache import RedisCache
+from tests.fake_redis import FakeRedis
+
+
+def _bar(day: int, close: float = 100.0) -> dict:
+    return {
+        "open": close,
+        "close": close,
+        "high": close,
+        "low": close,
+        "volume": 1000,
+        "time": f"2023-05-{day:02d}T00:00:00",
+        "ticker": "AAPL",
+    }
+
+
+class _CountingRedis(FakeRedis):
+    """FakeRedis that counts pipeline round trips."""
+
+    def __init__(self):
+        super().__init__()
+        self.round_trips = 0
+
+    def pipeline(self, transaction=True):
+        pipe = super().pipeline(transaction)
+        execute = pipe.execute
+
+        def counted():
+            self.round_trips += 1
+            return execute()
+
+        pipe.execute = counted
+        return pipe
+
+
+@pytest.fixture
+def redis():
+    return _CountingRedis()
+
+
+@pytest.fixture
+def cache(redis):
+    with patch.object(RedisCache, "_connect_redis"):
+        cache = RedisCache()
+    cache._redis_client = redis
+    cache._range_script = redis.register_script(cache_module._RANGE_SCRIPT)
+    return cache
+
+
+class TestBulkCacheApi:
+    """Test the *_many cache methods."""
+
+    def test_quotes_round_trip_in_one_pipeline_each(self, cache, redis):
+        cache.set_quotes_many({"AAPL": {"price": 1.0}, "MSFT": {"price": 2.0}})
+        cache._l1.clear()
+        redis.round_trips = 0
+
+        quotes = cache.get_quotes_many(["AAPL", "MSFT", "NVDA"])
+
+        assert quotes == {"AAPL": {"price": 1.0}, "MSFT": {"price": 2.0}}
+        assert redis.round_trips == 1
+
+    def test_prices_many_in_one_pipeline(self, cache, redis):
+        cache.set_prices_many({"AAPL_a": [_bar(1)], "MSFT_a": [_bar(2)]})
+        assert redis.round_trips == 1
+
+        cache._l1.clear()
+        redis.round_trips = 0
+        found = cache.get_prices_many(["AAPL_a", "MSFT_a", "NVDA_a"])
+
+        assert set(found) == {"AAPL_a", "MSFT_a"}
+        assert redis.round_trips == 1
+
+    def test_l1_hits_skip_redis(self, cache, redis):
+        cache.set_financial_metrics_many({"AAPL_ttm": [{"report_period": "2024-03-31"}]})
+        cache.get_financial_metrics_many(["AAPL_ttm"])
+        redis.round_trips = 0
+
+        assert cache.get_financial_metrics_many(["AAPL_ttm"]) == {"AAPL_ttm": [{"report_period": "2024-03-31"}]}
+        assert redis.round_trips == 0
+
+    def test_bad_payload_only_drops_its_key(self, cache, redis):
+        cache.set_quotes_many({"AAPL": {"price": 1.0}, "MSFT": {"price": 2.0}, "NVDA": {"price": 3.0}})
+        cache._l1.clear()
+        redis.store["quote:MSFT"] = b"not a cache payload"
+
+        quotes = cache.get_quotes_many(["AAPL", "MSFT", "NVDA"])
+
+        assert quotes == {"AAPL": {"price": 1.0}, "NVDA": {"price": 3.0}}
+        assert "quote:MSFT" not in redis.store
+
+    def test_bad_row_only_drops_that_row(self, cache, redis):
+        cache.set_prices_many({"AAPL_a": [_bar(1), _bar(2)], "MSFT_a": [_bar(3)]})
+        cache._l1.clear()
+        rows = redis.store["prices:AAPL_a:rows"]
+        rows[next(iter(rows))] = b"not a cache payload"
+
+        found = cache.get_prices_many(["AAPL_a", "MSFT_a"])
+
+        assert len(found["AAPL_a"]) == 1
+        assert found["MSFT_a"] == [_bar(3)]
+
+    def test_news_many_without_redis(self):
+        with patch.object(RedisCache, "_connect_redis"):
+            cache = RedisCache()
+        cache.set_company_news_many({"AAPL_n": [{"date": "2024-01-02", "title": "a"}]})
+
+        assert cache.get_company_news_many(["AAPL_n", "MSFT_n"]) == {"AAPL_n": [{"date": "2024-01-02", "title": "a"}]}
+
+
+class TestGetPricesMany:
+    """Test the universe-level price loader."""
+
+    def test_cached_tickers_not_prefetched(self):
+        from src.tools import api
+
+        api._cache.set_prices("AAPL_2023-05-01_2023-05-05", [_bar(2, 150.0)])
+        with patch.dict(os.environ, {"PRIMARY_DATA_SOURCE": "financial_datasets", "PRICE_STORE_DIR": ""}), \
+             patch.object(api, "prefetch_prices") as prefetch, \
+             patch.object(api, "_make_api_request", return_value=MagicMock(status_code=404)):
+            prices = api.get_prices_many(["AAPL", "MSFT"], "2023-05-01", "2023-05-05")
+
+        prefetch.assert_called_once_with(["MSFT"], "2023-05-01", "2023-05-05")
+        assert prices["AAPL"].close.tolist() == [150.0]
+        assert not prices["MSFT"]
+
+    def test_failed_ticker_left_out(self):
+        from src.tools import api
+
+        with patch.dict(os.environ, {"PRICE_STORE_DIR": ""}), \
+             patch.object(api, "prefetch_prices"), \
+             patch.object(api, "get_prices", side_effect=RuntimeError("boom")):
+            assert api.get_prices_many(["AAPL"], "2023-05-01", "2023-05-05") == {}
+
+
+class TestStrategyScanBulkLoad:
+    """Test scan_universe loading strategy windows up front."""
+
+    def test_each_window_loaded_once_for_universe(self):
+        from src.trading import strategy_engine
+
+        engine = strategy_engine.StrategyEngine.__new__(strategy_engine.StrategyEngine)
+        momentum = MagicMock(price_lookbacks=MagicMock(return_value=[20, 29]))
+        trend = MagicMock(price_lookbacks=MagicMock(return_value=[80, 29]))
+        engine.strategies = {"momentum": momentum, "trend": trend}
+
+        with patch.object(strategy_engine, "get_prices_many") as get_many:
+            engine._load_scan_prices(["AAPL", "MSFT"])
+
+        assert get_many.call_count == 3
+        assert all(call.args[0] == ["AAPL", "MSFT"] for call in get_many.call_args_list)
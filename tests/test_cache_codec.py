@@ -0,0 +1,122 @@
+"""
+Tests for the binary cache codec.
+
+Tests:
+- Round trips across serializers and compressions
+- Legacy JSON entries still decoding
+- RedisCache reading/writing through the codec
+"""
+
+import json
+import pytest
+import pandas as pd
+from unittest.mock import patch
+
+from tests.fake_redis import FakeRedis
+
+from src.data.cache_codec import (
+    CacheCodec,
+    HEADER,
+    MAGIC,
+    ORJSON_AVAILABLE,
+    ZSTD_AVAILABLE,
+    codec_from_env,
+)
+
+
+def _bars(n: int = 250) -> list:
+    return [
+        {
+            "open": 100.0 + i,
+            "close": 101.5 + i,
+            "high": 102.0 + i,
+            "low": 99.0 + i,
+            "volume": 1_000_000 + i,
+            "time": (pd.Timestamp("2024-01-01") + pd.Timedelta(days=i)).strftime("%Y-%m-%dT%H:%M:%S"),
+            "ticker": "AAPL",
+        }
+        for i in range(n)
+    ]
+
+
+SERIALIZERS = ["json"] + (["orjson"] if ORJSON_AVAILABLE else [])
+COMPRESSIONS = ["none", "zlib"] + (["zstd"] if ZSTD_AVAILABLE else [])
+
+
+class TestCacheCodecRoundTrip:
+    """Test encode/decode across configurations."""
+
+    @pytest.mark.parametrize("serializer", SERIALIZERS)
+    @pytest.mark.parametrize("compression", COMPRESSIONS)
+    def test_round_trip(self, serializer, compression):
+        codec = CacheCodec(serializer, compression, compress_min_bytes=0)
+        value = {"ticker": "AAPL", "metrics": [{"pe": 25.1, "report_period": "2024-03-31"}]}
+
+        data = codec.encode(value)
+        assert data.startswith(MAGIC)
+        assert codec.decode(data) == value
+
+    @pytest.mark.parametrize("serializer", SERIALIZERS)
+    def test_any_configuration_reads_any_other(self, serializer):
+        writer = CacheCodec(serializer, "zlib", compress_min_bytes=0)
+        reader = CacheCodec("json", "none")
+        assert reader.decode(writer.encode(_bars())) == _bars()
+
+    def test_small_payloads_skip_compression(self):
+        codec = CacheCodec("json", "zlib", compress_min_bytes=512)
+        _, _, _, compression_id, _ = HEADER.unpack_from(codec.encode({"a": 1}))
+        assert compression_id == 0
+
+    def test_legacy_json_entries_decode(self):
+        codec = CacheCodec("json", "none")
+        assert codec.decode(json.dumps(_bars(3)).encode()) == _bars(3)
+        assert codec.decode(json.dumps(_bars(3))) == _bars(3)
+
+    def test_timestamps_serialize_as_iso_strings(self):
+        codec = CacheCodec("json", "none")
+        records = [{"time": pd.Timestamp("2024-01-02"), "close": 1.0, "volume": 5}]
+        assert codec.decode(codec.encode(records)) == [
+            {"time": "2024-01-02T00:00:00", "close": 1.0, "volume": 5}
+        ]
+
+
+class TestCodecFromEnv:
+    """Test environment configuration."""
+
+    def test_unavailable_library_falls_back(self):
+        with patch.dict("os.environ", {"CACHE_CODEC": "msgpack", "CACHE_COMPRESSION": "lz4"}), \
+             patch("src.data.cache_codec.MSGPACK_AVAILABLE", False), \
+             patch("src.data.cache_codec.LZ4_AVAILABLE", False):
+            codec = codec_from_env()
+        assert (codec.serializer, codec.compression) == ("json", "none")
+
+    def test_unknown_name_rejected(self):
+        with pytest.raises(ValueError):
+            CacheCodec("pickle", "none")
+
+
+class TestRedisCacheCodec:
+    """Test RedisCache storing binary payloads."""
+
+    @pytest.fixture
+    def cache(self):
+        from src.data import cache as cache_module
+        from src.data.cache import RedisCache
+
+        with patch.object(RedisCache, "_connect_redis"):
+            cache = RedisCache()
+        cache._redis_client = FakeRedis()
+        cache._range_script = cache._redis_client.register_script(cache_module._RANGE_SCRIPT)
+        return cache
+
+    def test_prices_written_as_binary_and_read_back(self, cache):
+        cache.set_prices("AAPL_2024-01-01_2024-12-31", _bars())
+        rows = cache._redis_client.store["prices:AAPL_2024-01-01_2024-12-31:rows"]
+
+        assert all(raw.startswith(MAGIC) for raw in rows.values())
+        cache._l1.clear()
+        assert cache.get_prices("AAPL_2024-01-01_2024-12-31") == _bars()
+
+    def test_legacy_json_entry_served(self, cache):
+        cache._redis_client.setex("metrics:AAPL_ttm", 60, json.dumps([{"pe": 25.1}]).encode())
+        assert cache.get_financial_metrics("AAPL_ttm") == [{"pe": 25.1}]
@@ -0,0 +1,128 @@
+"""
+Tests for concurrent financial data aggregation.
+
+Tests:
+- All data types for all tickers are fetched concurrently
+- Failed fetches fall back to per-type defaults
+- Per-provider concurrency limits come from the existing rate limits
+- Prices counted against the provider the data router tries first
+"""
+
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from src.utils import data_aggregator
+from src.utils.data_aggregator import aggregate_financial_data, get_provider_for, get_provider_limits
+
+
+STATE = {"metadata": {}, "data": {}, "messages": []}
+
+
+def _slow(value, delay=0.2):
+    def fetch(*args, **kwargs):
+        time.sleep(delay)
+        return value
+    return fetch
+
+
+@pytest.fixture
+def mocked_fetchers():
+    with patch.object(data_aggregator, "get_financial_metrics", side_effect=_slow(["metrics"])), \
+         patch.object(data_aggregator, "search_line_items", side_effect=_slow(["line_items"])), \
+         patch.object(data_aggregator, "get_market_cap", side_effect=_slow(1e12)), \
+         patch.object(data_aggregator, "_fetch_ticker_prices", side_effect=_slow(["prices"])), \
+         patch.object(data_aggregator, "get_company_news", side_effect=_slow(["news"])), \
+         patch.object(data_aggregator, "get_insider_trades", side_effect=_slow(["trades"])), \
+         patch.object(data_aggregator, "get_provider_for", return_value="test"), \
+         patch.object(data_aggregator, "get_provider_limits",
+                      return_value={"test": threading.BoundedSemaphore(100)}):
+        yield
+
+
+class TestAggregateFinancialData:
+    """Test the concurrent pre-fetch."""
+
+    def test_fetches_run_concurrently(self, mocked_fetchers, monkeypatch):
+        monkeypatch.setenv("AGGREGATE_MAX_WORKERS", "32")
+        tickers = ["AAPL", "MSFT", "NVDA"]
+
+        start = time.time()
+        aggregated = aggregate_financial_data(STATE, tickers, "2024-12-31")
+        elapsed = time.time() - start
+
+        # 18 fetches of 0.2s each would take 3.6s serially
+        assert elapsed < 1.5
+        for ticker in tickers:
+            assert aggregated.financial_metrics[ticker] == ["metrics"]
+            assert aggregated.line_items[ticker] == ["line_items"]
+            assert aggregated.market_caps[ticker] == 1e12
+            assert aggregated.prices[ticker] == ["prices"]
+            assert aggregated.news[ticker] == ["news"]
+            assert aggregated.insider_trades[ticker] == ["trades"]
+
+    def test_failed_fetch_uses_default(self, mocked_fetchers):
+        with patch.object(data_aggregator, "get_market_cap", side_effect=RuntimeError("boom")), \
+             patch.object(data_aggregator, "search_line_items", side_effect=RuntimeError("boom")):
+            aggregated = aggregate_financial_data(STATE, ["AAPL"], "2024-12-31")
+
+        assert aggregated.market_caps["AAPL"] is None
+        assert aggregated.line_items["AAPL"] == {}
+        assert aggregated.news["AAPL"] == ["news"]
+
+    def test_failed_defaults_not_shared(self, mocked_fetchers):
+        with patch.object(data_aggregator, "search_line_items", side_effect=RuntimeError("boom")):
+            aggregated = aggregate_financial_data(STATE, ["AAPL", "MSFT"], "2024-12-31")
+
+        aggregated.line_items["AAPL"]["revenue"] = 1.0
+
+        assert aggregated.line_items["MSFT"] == {}
+        assert data_aggregator._FAILED_DEFAULTS["line_items"] == {}
+
+    def test_provider_limit_caps_concurrency(self, mocked_fetchers):
+        active, peak = [0], [0]
+        lock = threading.Lock()
+
+        def tracked(*args, **kwargs):
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.05)
+            with lock:
+                active[0] -= 1
+            return []
+
+        with patch.object(data_aggregator, "get_company_news", side_effect=tracked), \
+             patch.object(data_aggregator, "get_provider_for", side_effect=lambda f: "slow" if f == "news" else "test"), \
+             patch.object(data_aggregator, "get_provider_limits", return_value={
+                 "test": threading.BoundedSemaphore(100),
+                 "slow": threading.BoundedSemaphore(2),
+             }):
+            aggregate_financial_data(STATE, ["A", "B", "C", "D", "E", "F"], "2024-12-31")
+
+        assert peak[0] <= 2
+
+
+class TestProviderLimits:
+    """Test per-provider limits derived from the rate limiters."""
+
+    def test_financial_datasets_uses_data_api_limiter(self):
+        limits = get_provider_limits()
+        expected = data_aggregator._data_rate_limiter.max_concurrent
+        assert limits["financial_datasets"]._value == expected
+
+    def test_per_minute_limit_sets_concurrency(self):
+        limits = get_provider_limits()
+        assert limits["fmp"]._value == 5        # 300/min
+        assert limits["polygon"]._value == 1    # 5/min, floor of one
+
+    def test_prices_follow_provider_routing_order(self, monkeypatch):
+        from src.tools.data_providers import DataSource
+
+        monkeypatch.setattr(data_aggregator, "MULTI_SOURCE_AVAILABLE", True)
+        provider = data_aggregator.get_data_provider()
+        with patch.object(provider, "get_routing_order", return_value=[DataSource.YFINANCE]) as routing:
+            assert get_provider_for("prices") == "yfinance"
+        routing.assert_called_once_with("prices")
@@ -0,0 +1,120 @@
+"""
+Tests for the Redis-backed cross-process rate limiter.
+
+Tests:
+- Two limiters on one Redis share a single token bucket
+- A 429 in one process pauses the bucket for all of them
+- Redis errors fail open
+- Factories fall back to per-process limiters when disabled
+"""
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+from src.utils import distributed_rate_limiter as drl
+from src.utils.distributed_rate_limiter import DistributedRateLimiter
+from tests.fake_redis import FakeRedis
+
+
+@pytest.fixture
+def redis():
+    redis = FakeRedis()
+    now = [1000.0]
+    redis.clock = lambda: now[0]
+    redis.now = now
+    return redis
+
+
+@pytest.fixture(autouse=True)
+def reset():
+    drl.reset_distributed_limiters()
+    yield
+    drl.reset_distributed_limiters()
+
+
+class TestSharedBucket:
+    """Test the token bucket shared through Redis."""
+
+    def test_processes_draw_from_one_bucket(self, redis):
+        # Two "processes" with a 60/min budget and burst of 2
+        backend = DistributedRateLimiter("fmp", redis, requests_per_minute=60, burst=2)
+        daemon = DistributedRateLimiter("fmp", redis, requests_per_minute=60, burst=2)
+
+        assert backend.acquire(blocking=False)
+        assert daemon.acquire(blocking=False)
+        assert not backend.acquire(blocking=False)
+
+        redis.now[0] += 1.0
+        assert daemon.acquire(blocking=False)
+
+    def test_blocking_acquire_waits_for_refill(self, redis):
+        limiter = DistributedRateLimiter("fmp", redis, requests_per_minute=60, burst=1)
+        limiter.acquire()
+        limiter.release()
+
+        def sleep(seconds):
+            redis.now[0] += seconds
+
+        with patch.object(drl.time, "sleep", side_effect=sleep) as mock_sleep:
+            assert limiter.acquire(timeout=5)
+        assert mock_sleep.call_args.args[0] == pytest.approx(1.0)
+
+    def test_timeout_releases_concurrency_slot(self, redis):
+        limiter = DistributedRateLimiter("fmp", redis, requests_per_minute=1, max_concurrent=1, burst=1)
+        limiter.acquire()
+        limiter.release()
+
+        assert not limiter.acquire(timeout=0.5)
+        assert limiter.semaphore.acquire(blocking=False)
+
+    def test_429_pauses_every_process(self, redis):
+        backend = DistributedRateLimiter("fmp", redis, requests_per_minute=600, burst=10)
+        daemon = DistributedRateLimiter("fmp", redis, requests_per_minute=600, burst=10)
+
+        backend.record_429()
+        assert not daemon.acquire(blocking=False)
+
+        redis.now[0] += 2.1
+        assert daemon.acquire(blocking=False)
+
+    def test_concurrent_429s_count_one_strike(self, redis):
+        limiter = DistributedRateLimiter("fmp", redis, requests_per_minute=600)
+        limiter.record_429()
+        limiter.record_429()
+
+        assert redis.hmget("ratelimit:fmp", ["strikes"]) == [1]
+
+    def test_redis_error_fails_open(self):
+        client = MagicMock()
+        client.register_script.return_value = MagicMock(side_effect=ConnectionError("down"))
+        limiter = DistributedRateLimiter("fmp", client, requests_per_minute=60)
+
+        assert limiter.acquire(blocking=False)
+        assert limiter.get_status()["redis_errors"] == 1
+
+
+class TestFactories:
+    """Test limiter selection."""
+
+    def test_disabled_returns_fallback(self, monkeypatch):
+        monkeypatch.delenv("DISTRIBUTED_RATE_LIMIT", raising=False)
+        fallback = object()
+
+        assert drl.get_distributed_limiter("llm", 15, 1, fallback=fallback) is fallback
+        assert drl.get_provider_limiter("fmp") is None
+
+    def test_redis_unavailable_returns_fallback(self, monkeypatch):
+        monkeypatch.setenv("DISTRIBUTED_RATE_LIMIT", "true")
+        fallback = object()
+
+        with patch.object(drl, "_get_redis", return_value=None):
+            assert drl.get_distributed_limiter("llm", 15, 1, fallback=fallback) is fallback
+
+    def test_provider_limiter_shared_by_name(self, monkeypatch, redis):
+        monkeypatch.setenv("DISTRIBUTED_RATE_LIMIT", "true")
+        monkeypatch.setenv("FMP_REQUESTS_PER_MINUTE", "120")
+
+        with patch.object(drl, "_get_redis", return_value=redis):
+            limiter = drl.get_provider_limiter("fmp")
+            assert drl.get_provider_limiter("fmp") is limiter
+        assert limiter.requests_per_minute == 120
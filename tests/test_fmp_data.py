@@ -58,7 +58,7 @@ class TestFMPDataClient:
 class TestFMPPriceData:
     """Test FMP price data fetching."""
     
-    @patch("requests.request")
+    @patch("requests.Session.request")
     def test_get_historical_prices_success(self, mock_request):
         """Test successful price data fetch."""
         from src.tools.fmp_data import FMPDataClient
@@ -99,7 +99,7 @@ class TestFMPPriceData:
         assert "close" in df.columns
         assert "volume" in df.columns
     
-    @patch("requests.request")
+    @patch("requests.Session.request")
     def test_get_historical_prices_empty(self, mock_request):
         """Test handling empty price response."""
         from src.tools.fmp_data import FMPDataClient
@@ -118,7 +118,7 @@ class TestFMPPriceData:
 class TestFMPFundamentals:
     """Test FMP fundamental data fetching."""
     
-    @patch("requests.request")
+    @patch("requests.Session.request")
     def test_get_key_metrics_ttm(self, mock_request):
         """Test key metrics TTM fetch."""
         from src.tools.fmp_data import FMPDataClient
@@ -142,7 +142,7 @@ class TestFMPFundamentals:
         assert metrics.get("peRatioTTM") == 25.5
         assert metrics.get("roeTTM") == 0.45
     
-    @patch("requests.request")
+    @patch("requests.Session.request")
     def test_get_ratios_ttm(self, mock_request):
         """Test financial ratios TTM fetch."""
         from src.tools.fmp_data import FMPDataClient
@@ -168,7 +168,7 @@ class TestFMPFundamentals:
 class TestFMPNews:
     """Test FMP news data fetching."""
     
-    @patch("requests.request")
+    @patch("requests.Session.request")
     def test_get_stock_news(self, mock_request):
         """Test stock news fetch."""
         from src.tools.fmp_data import FMPDataClient
@@ -429,6 +429,15 @@ class TestFMPIntegration:
 class TestFinancialMetricsMapping:
     """Test the FMP to FinancialMetrics field mapping."""
     
+    @pytest.fixture(autouse=True)
+    def _fresh_metrics_cache(self):
+        """FMP TTM data is cached per ticker; start each mapping test uncached."""
+        from src.tools import api
+        from tests.fake_redis import fake_cache
+        api._fmp_metrics_memo.clear()
+        with patch.object(api, "_cache", fake_cache()):
+            yield
+    
     def test_fmp_mapping_with_mock_data(self):
         """Test mapping layer with mocked FMP response."""
         from src.data.models import FinancialMetrics
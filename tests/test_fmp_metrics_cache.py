@@ -0,0 +1,71 @@
+"""
+Tests for caching FMP TTM data in get_financial_metrics.
+
+Tests:
+- TTM metrics/ratios fetched once per ticker and cached under TTL_METRICS
+- Built FinancialMetrics memoized in process
+- Empty FMP responses not cached
+"""
+
+import os
+import pytest
+from unittest.mock import MagicMock, patch
+
+from tests.fake_redis import fake_cache
+
+
+@pytest.fixture
+def api():
+    from src.tools import api
+
+    api._fmp_metrics_memo.clear()
+    with patch.dict(os.environ, {"PRIMARY_DATA_SOURCE": "fmp"}), \
+         patch.object(api, "_cache", fake_cache()):
+        yield api
+
+
+@pytest.fixture
+def client():
+    client = MagicMock()
+    client.is_configured.return_value = True
+    client.get_key_metrics_ttm.return_value = {"marketCap": 1000, "returnOnEquityTTM": 0.2}
+    client.get_ratios_ttm.return_value = {"priceToEarningsRatioTTM": 15.0}
+    with patch("src.tools.fmp_data.get_fmp_data_client", return_value=client):
+        yield client
+
+
+class TestFmpMetricsCache:
+    """Test the FMP path of get_financial_metrics."""
+
+    def test_repeat_calls_memoized(self, api, client):
+        first = api.get_financial_metrics("ZZFM", "2023-07-14")
+        second = api.get_financial_metrics("ZZFM", "2023-07-14")
+
+        assert client.get_key_metrics_ttm.call_count == 1
+        assert client.get_ratios_ttm.call_count == 1
+        assert second[0] is first[0]
+        assert first[0].price_to_earnings_ratio == 15.0
+
+    def test_ttm_data_shared_across_end_dates(self, api, client):
+        api.get_financial_metrics("ZZFM", "2023-07-14")
+        metrics = api.get_financial_metrics("ZZFM", "2023-07-21")
+
+        assert client.get_key_metrics_ttm.call_count == 1
+        assert metrics[0].report_period == "2023-07-21"
+
+    def test_cached_data_used_after_memo_cleared(self, api, client):
+        api.get_financial_metrics("ZZFM", "2023-07-14")
+        api._fmp_metrics_memo.clear()
+
+        assert api.get_financial_metrics("ZZFM", "2023-07-14")[0].market_cap == 1000
+        assert client.get_key_metrics_ttm.call_count == 1
+        assert api.warm_cache(["ZZFM"], "2023-07-14") == 1
+
+    def test_empty_response_not_cached(self, api, client):
+        client.get_key_metrics_ttm.return_value = None
+        client.get_ratios_ttm.return_value = None
+
+        with patch.object(api, "_make_api_request", return_value=MagicMock(status_code=404)):
+            assert api.get_financial_metrics("ZZFM", "2023-07-14") == []
+
+        assert api._cache.get_fmp_ttm("ZZFM") is None
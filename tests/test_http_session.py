@@ -0,0 +1,63 @@
+"""
+Tests for the shared pooled HTTP session manager.
+
+Tests:
+- One session per provider name, reused across calls
+- Adapters carry the configured pool sizes and connect-only retries
+- Provider clients route requests through the pooled session
+"""
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+from src.utils.http_session import HTTPSessionManager, get_http_session, reset_session_manager
+
+
+@pytest.fixture(autouse=True)
+def fresh_manager():
+    reset_session_manager()
+    yield
+    reset_session_manager()
+
+
+class TestHTTPSessionManager:
+    """Test session creation and pooling configuration."""
+
+    def test_same_name_returns_same_session(self):
+        assert get_http_session("fmp") is get_http_session("fmp")
+
+    def test_different_names_get_different_sessions(self):
+        assert get_http_session("fmp") is not get_http_session("alpaca")
+
+    def test_adapter_uses_configured_pool_and_retry(self):
+        manager = HTTPSessionManager(pool_connections=4, pool_maxsize=8, connect_retries=3)
+        adapter = manager.get_session("fmp").get_adapter("https://financialmodelingprep.com")
+
+        assert adapter._pool_connections == 4
+        assert adapter._pool_maxsize == 8
+        assert adapter.max_retries.connect == 3
+        assert adapter.max_retries.status == 0
+        assert adapter.max_retries.read == 0
+
+    def test_close_drops_sessions(self):
+        manager = HTTPSessionManager()
+        session = manager.get_session("fmp")
+        manager.close()
+        assert manager.get_session("fmp") is not session
+        assert manager.get_stats()["sessions"] == ["fmp"]
+
+
+class TestClientsUseSharedSession:
+    """Test provider clients send requests through the pooled session."""
+
+    def test_fmp_client_uses_fmp_session(self):
+        from src.tools.fmp_data import FMPDataClient
+
+        mock_response = MagicMock(status_code=200, headers={})
+        mock_response.json.return_value = [{"peRatioTTM": 25.5}]
+        session = get_http_session("fmp")
+
+        with patch.object(session, "request", return_value=mock_response) as mock_request:
+            FMPDataClient(api_key="test-key").get_key_metrics_ttm("AAPL")
+
+        mock_request.assert_called_once()
@@ -0,0 +1,127 @@
+"""
+Tests for the per-field line item cache.
+
+Tests:
+- Repeat searches served from cache without an API call
+- A different subset of fields only fetches the fields not cached yet
+- Fields the API left out are cached too, including for report periods a
+  subset search didn't return
+- Cached fields served when a subset search fails
+- Filing-date based TTLs
+"""
+
+import pytest
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock, patch
+
+from src.data import cache as cache_module
+from src.data.cache import RedisCache
+from tests.fake_redis import FakeRedis
+
+
+def _response(line_items, report_periods=("2023-06-30", "2023-03-31")):
+    values = {"revenue": 100.0, "net_income": 10.0, "free_cash_flow": 5.0}
+    results = [
+        {
+            "ticker": "ZZLI",
+            "report_period": rp,
+            "period": "ttm",
+            "currency": "USD",
+            **{f: values[f] for f in line_items if f in values},
+        }
+        for rp in report_periods
+    ]
+    return MagicMock(status_code=200, json=MagicMock(return_value={"search_results": results}))
+
+
+@pytest.fixture
+def api():
+    from src.tools import api
+
+    with patch.object(RedisCache, "_connect_redis"):
+        cache = RedisCache()
+    cache._redis_client = FakeRedis()
+    cache._range_script = cache._redis_client.register_script(cache_module._RANGE_SCRIPT)
+    with patch.object(api, "_cache", cache):
+        yield api
+
+
+def _requested(mock_request):
+    return [c.kwargs["json_data"]["line_items"] for c in mock_request.call_args_list]
+
+
+class TestLineItemFieldCache:
+    """Test search_line_items caching."""
+
+    def test_repeat_search_served_from_cache(self, api):
+        with patch.object(api, "_make_api_request", side_effect=lambda *a, **kw: _response(kw["json_data"]["line_items"])) as request:
+            first = api.search_line_items("ZZLI", ["revenue", "net_income"], "2023-09-30", limit=2)
+            api._cache._l1.clear()
+            second = api.search_line_items("ZZLI", ["net_income", "revenue"], "2023-09-30", limit=2)
+
+        assert request.call_count == 1
+        assert [i.model_dump() for i in first] == [i.model_dump() for i in second]
+
+    def test_only_missing_fields_fetched(self, api):
+        with patch.object(api, "_make_api_request", side_effect=lambda *a, **kw: _response(kw["json_data"]["line_items"])) as request:
+            api.search_line_items("ZZLI", ["revenue", "net_income"], "2023-09-30", limit=2)
+            items = api.search_line_items("ZZLI", ["revenue", "free_cash_flow"], "2023-09-30", limit=2)
+
+        assert _requested(request) == [["revenue", "net_income"], ["free_cash_flow"]]
+        assert [(i.report_period, i.revenue, i.free_cash_flow) for i in items] == [
+            ("2023-06-30", 100.0, 5.0),
+            ("2023-03-31", 100.0, 5.0),
+        ]
+
+    def test_fields_missing_from_response_cached(self, api):
+        with patch.object(api, "_make_api_request", side_effect=lambda *a, **kw: _response(kw["json_data"]["line_items"])) as request:
+            api.search_line_items("ZZLI", ["revenue", "goodwill"], "2023-09-30", limit=2)
+            items = api.search_line_items("ZZLI", ["goodwill"], "2023-09-30", limit=2)
+
+        assert request.call_count == 1
+        assert items[0].goodwill is None
+
+    def test_periods_missing_from_subset_response_cached(self, api):
+        responses = [
+            _response(["revenue"]),
+            _response(["goodwill"], report_periods=("2023-06-30",)),
+            MagicMock(status_code=200, json=MagicMock(return_value={"search_results": []})),
+        ]
+        with patch.object(api, "_make_api_request", side_effect=responses) as request:
+            api.search_line_items("ZZLI", ["revenue"], "2023-09-30", limit=2)
+            api.search_line_items("ZZLI", ["goodwill"], "2023-09-30", limit=2)
+            api.search_line_items("ZZLI", ["free_cash_flow"], "2023-09-30", limit=2)
+            items = api.search_line_items("ZZLI", ["revenue", "goodwill", "free_cash_flow"], "2023-09-30", limit=2)
+
+        assert request.call_count == 3
+        assert [(i.revenue, i.goodwill, i.free_cash_flow) for i in items] == [(100.0, None, None), (100.0, None, None)]
+
+    def test_failed_subset_search_serves_cached_fields(self, api):
+        responses = [_response(["revenue"]), MagicMock(status_code=500), _response(["net_income"])]
+        with patch.object(api, "_make_api_request", side_effect=responses):
+            api.search_line_items("ZZLI", ["revenue"], "2023-09-30", limit=2)
+            failed = api.search_line_items("ZZLI", ["revenue", "net_income"], "2023-09-30", limit=2)
+            retried = api.search_line_items("ZZLI", ["revenue", "net_income"], "2023-09-30", limit=2)
+
+        # Requested fields read as None, and aren't cached, so the next search refetches them
+        assert [(i.revenue, i.net_income) for i in failed] == [(100.0, None), (100.0, None)]
+        assert [(i.revenue, i.net_income) for i in retried] == [(100.0, 10.0), (100.0, 10.0)]
+
+    def test_failed_search_not_cached(self, api):
+        with patch.object(api, "_make_api_request", return_value=MagicMock(status_code=500)) as request:
+            assert api.search_line_items("ZZLI", ["revenue"], "2023-09-30") == []
+            assert api.search_line_items("ZZLI", ["revenue"], "2023-09-30") == []
+
+        assert request.call_count == 2
+
+
+class TestLineItemTtl:
+    """Test TTLs tied to filing dates."""
+
+    def test_settled_and_recent_periods(self):
+        with patch.object(RedisCache, "_connect_redis"):
+            cache = RedisCache()
+        recent = (datetime.now() - timedelta(days=30)).strftime("%Y-%m-%d")
+
+        assert cache.line_item_ttl("2020-12-31") == cache.TTL_LINE_ITEMS_FILED
+        assert cache.line_item_ttl(recent) == cache.TTL_LINE_ITEMS
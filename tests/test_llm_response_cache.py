@@ -0,0 +1,127 @@
+"""
+Tests for the content-addressed LLM response cache.
+
+Tests:
+- Cache key stability and sensitivity to provider, model, messages and schema
+- Hits served without calling the provider, misses stored
+- Per-agent and per-call bypass
+- Error/default responses never cached
+- Hit/miss stats from log_llm_call
+"""
+
+import os
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from pydantic import BaseModel
+
+from src.data.cache import RedisCache
+from src.llm import response_cache
+from src.monitoring.event_logger import EventLogger
+from src.utils import llm as llm_utils
+
+
+class Signal(BaseModel):
+    signal: str
+    confidence: float
+    reasoning: str
+
+
+class OtherSignal(BaseModel):
+    signal: str
+
+
+@pytest.fixture
+def cache():
+    with patch.object(RedisCache, "_connect_redis"):
+        cache = RedisCache()
+    with patch("src.data.cache.get_cache", return_value=cache):
+        yield cache
+
+
+@pytest.fixture
+def model():
+    """Provider stub whose structured output is a valid Signal."""
+    llm = MagicMock()
+    llm.with_structured_output.return_value = llm
+    llm.ainvoke = AsyncMock(return_value=Signal(signal="bullish", confidence=80.0, reasoning="r"))
+    event_logger = EventLogger()
+    with patch.dict(os.environ, {"LLM_RESPONSE_CACHE": "true", "LLM_CACHE_BYPASS_AGENTS": "risk_manager"}), \
+         patch.object(llm_utils, "get_model", return_value=llm), \
+         patch.object(llm_utils, "get_structured_model", return_value=llm), \
+         patch.object(llm_utils, "get_model_info", return_value=None), \
+         patch.object(llm_utils, "_rate_limiter", MagicMock(acquire_async=AsyncMock(return_value=True))), \
+         patch.object(llm_utils, "_get_event_logger", return_value=event_logger), \
+         patch.object(llm_utils, "_get_rate_limit_monitor", return_value=None):
+        llm.event_logger = event_logger
+        yield llm
+
+
+class TestResponseCacheKey:
+    """Test the content hash."""
+
+    def test_stable_for_equal_prompts(self):
+        a = response_cache.response_cache_key("OpenAI", "gpt-4o", [("system", "s"), ("human", "h")], Signal)
+        b = response_cache.response_cache_key("openai", "gpt-4o", [("system", "s"), ("human", "h")], Signal)
+        assert a == b
+
+    def test_sensitive_to_every_component(self):
+        base = ("openai", "gpt-4o", "prompt", Signal)
+        key = response_cache.response_cache_key(*base)
+        assert key != response_cache.response_cache_key("anthropic", *base[1:])
+        assert key != response_cache.response_cache_key("openai", "gpt-4o-mini", *base[2:])
+        assert key != response_cache.response_cache_key("openai", "gpt-4o", "prompt 2", Signal)
+        assert key != response_cache.response_cache_key("openai", "gpt-4o", "prompt", OtherSignal)
+
+    def test_bypass_matches_agent_fragments(self):
+        with patch.dict(os.environ, {"LLM_CACHE_BYPASS_AGENTS": "portfolio_manager, risk_manager"}):
+            assert response_cache.cache_bypassed("portfolio_manager_agent")
+            assert not response_cache.cache_bypassed("warren_buffett_agent")
+
+
+class TestCallLLMCaching:
+    """Test call_llm with the cache enabled."""
+
+    def test_hit_skips_provider(self, cache, model):
+        first = llm_utils.call_llm("analyze AAPL", Signal, agent_name="warren_buffett_agent")
+        second = llm_utils.call_llm("analyze AAPL", Signal, agent_name="warren_buffett_agent")
+
+        assert model.ainvoke.call_count == 1
+        assert second == first
+
+    def test_different_prompt_misses(self, cache, model):
+        llm_utils.call_llm("analyze AAPL", Signal, agent_name="warren_buffett_agent")
+        llm_utils.call_llm("analyze MSFT", Signal, agent_name="warren_buffett_agent")
+
+        assert model.ainvoke.call_count == 2
+
+    def test_bypassed_agent_and_call_always_invoke(self, cache, model):
+        for _ in range(2):
+            llm_utils.call_llm("size AAPL", Signal, agent_name="risk_manager_agent")
+            llm_utils.call_llm("analyze AAPL", Signal, agent_name="warren_buffett_agent", use_cache=False)
+
+        assert model.ainvoke.call_count == 4
+
+    def test_disabled_by_default(self, cache, model):
+        with patch.dict(os.environ, {"LLM_RESPONSE_CACHE": "false"}):
+            llm_utils.call_llm("analyze AAPL", Signal)
+            llm_utils.call_llm("analyze AAPL", Signal)
+
+        assert model.ainvoke.call_count == 2
+
+    def test_error_response_not_cached(self, cache, model):
+        model.ainvoke.side_effect = RuntimeError("invalid_api_key")
+        failed = llm_utils.call_llm("analyze AAPL", Signal, max_retries=1)
+        assert failed.reasoning.startswith("Analysis failed")
+
+        model.ainvoke.side_effect = None
+        assert llm_utils.call_llm("analyze AAPL", Signal).signal == "bullish"
+
+        assert model.ainvoke.call_count == 2
+
+    def test_hit_rate_reported_per_agent(self, cache, model):
+        for _ in range(3):
+            llm_utils.call_llm("analyze AAPL", Signal, agent_name="warren_buffett_agent")
+
+        stats = model.event_logger.get_llm_cache_stats()
+        assert (stats["hits"], stats["misses"]) == (2, 1)
+        assert stats["by_agent"]["warren_buffett_agent"]["hit_rate"] == 0.667
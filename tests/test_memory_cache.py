@@ -0,0 +1,112 @@
+"""
+Tests for the bounded in-process L1 cache tier.
+
+Tests:
+- TTL expiry and LRU eviction by entries and bytes
+- Hit/miss/eviction counters
+- RedisCache consulting L1 before Redis and bounding the fallback
+"""
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+from src.data.memory_cache import MemoryCache
+
+
+@pytest.fixture
+def clock():
+    now = [1000.0]
+    with patch("src.data.memory_cache.time.monotonic", side_effect=lambda: now[0]):
+        yield now
+
+
+class TestMemoryCache:
+    """Test the LRU + TTL map."""
+
+    def test_entries_expire_after_ttl(self, clock):
+        l1 = MemoryCache()
+        l1.set("quote:AAPL", {"price": 1.0}, ttl=60)
+
+        clock[0] += 59
+        assert l1.get("quote:AAPL") == {"price": 1.0}
+        clock[0] += 2
+        assert l1.get("quote:AAPL") is None
+        assert l1.get_stats()["expirations"] == 1
+        assert len(l1) == 0
+
+    def test_least_recently_used_evicted_by_count(self):
+        l1 = MemoryCache(max_entries=2)
+        l1.set("a", 1, ttl=60)
+        l1.set("b", 2, ttl=60)
+        l1.get("a")
+        l1.set("c", 3, ttl=60)
+
+        assert l1.get("b") is None
+        assert l1.get("a") == 1 and l1.get("c") == 3
+        assert l1.get_stats()["evictions"] == 1
+
+    def test_evicted_by_bytes(self):
+        l1 = MemoryCache(max_bytes=100)
+        l1.set("a", "x", ttl=60, size=60)
+        l1.set("b", "y", ttl=60, size=60)
+
+        assert l1.get("a") is None
+        assert l1.get_stats()["bytes"] == 60
+
+    def test_oversized_value_not_stored(self):
+        l1 = MemoryCache(max_bytes=100)
+        l1.set("a", "x", ttl=60, size=10)
+        l1.set("big", "y", ttl=60, size=500)
+
+        assert l1.get("big") is None
+        assert l1.get("a") == "x"
+
+    def test_hit_miss_counters(self):
+        l1 = MemoryCache()
+        l1.set("a", 1, ttl=60)
+        l1.get("a")
+        l1.get("missing")
+
+        stats = l1.get_stats()
+        assert (stats["hits"], stats["misses"], stats["hit_rate"]) == (1, 1, 0.5)
+
+
+class TestRedisCacheL1:
+    """Test RedisCache's use of the L1 tier."""
+
+    @pytest.fixture
+    def cache(self):
+        from src.data.cache import RedisCache
+
+        with patch.object(RedisCache, "_connect_redis"):
+            return RedisCache()
+
+    def test_l1_served_before_redis(self, cache):
+        cache.set_quote("AAPL", {"price": 1.0})
+        cache._redis_client = MagicMock()
+
+        assert cache.get_quote("AAPL") == {"price": 1.0}
+        cache._redis_client.pipeline.assert_not_called()
+
+    def test_fallback_honours_ttl(self, cache, clock):
+        # Market open: quotes are kept for their staleness bound
+        with patch("src.data.cache.seconds_until_market_elapsed", side_effect=lambda s: s):
+            cache.set_quote("AAPL", {"price": 1.0})
+        clock[0] += cache.MAX_STALE_QUOTES + 1
+        assert cache.get_quote("AAPL") is None
+
+    def test_redis_hit_fills_l1_with_remaining_ttl(self, cache, clock):
+        pipe = MagicMock()
+        pipe.execute.return_value = [[b'{"price": 2.0}'], 5000]
+        cache._redis_client = MagicMock()
+        cache._redis_client.pipeline.return_value = pipe
+
+        assert cache.get_quote("MSFT") == {"price": 2.0}
+        clock[0] += 4
+        assert cache._l1.get("quote:MSFT") == {"price": 2.0}
+        clock[0] += 2
+        assert cache._l1.get("quote:MSFT") is None
+
+    def test_stats_expose_l1_counters(self, cache):
+        stats = cache.get_stats()
+        assert {"hits", "misses", "evictions", "entries", "bytes"} <= set(stats["l1"])
@@ -0,0 +1,90 @@
+"""
+Tests for the pooled chat clients behind get_model.
+
+Tests:
+- Clients reused per provider, model and credentials
+- Rotated keys replace the pooled client
+- Structured-output wrappers reused per output schema
+- LRU bound and per-event-loop clients
+"""
+
+import asyncio
+import os
+import pytest
+from unittest.mock import MagicMock, patch
+from pydantic import BaseModel
+
+from src.llm import models
+from src.llm.models import ModelProvider, get_model, get_model_pool_stats, get_structured_model
+
+
+class Signal(BaseModel):
+    signal: str
+
+
+class OtherSignal(BaseModel):
+    signal: str
+
+
+@pytest.fixture
+def create():
+    models.reset_model_pool()
+    with patch.object(models, "_create_model", side_effect=lambda *a, **k: MagicMock()) as create, \
+         patch.dict(os.environ, {"OPENAI_API_KEY": "key-1", "LLM_CLIENT_POOL": "true"}):
+        yield create
+    models.reset_model_pool()
+
+
+class TestModelPool:
+    """Test client reuse and eviction."""
+
+    def test_client_reused(self, create):
+        first = get_model("gpt-4o", ModelProvider.OPENAI)
+
+        assert get_model("gpt-4o", ModelProvider.OPENAI) is first
+        assert get_model("gpt-4o-mini", ModelProvider.OPENAI) is not first
+        assert create.call_count == 2
+        assert get_model_pool_stats()["hits"] == 1
+
+    def test_rotated_env_key_replaces_client(self, create):
+        first = get_model("gpt-4o", ModelProvider.OPENAI)
+
+        with patch.dict(os.environ, {"OPENAI_API_KEY": "key-2"}):
+            second = get_model("gpt-4o", ModelProvider.OPENAI)
+
+        assert second is not first
+        assert get_model_pool_stats()["size"] == 1
+        assert get_model_pool_stats()["evictions"] == 1
+
+    def test_request_keys_pooled_separately(self, create):
+        mine = get_model("gpt-4o", ModelProvider.OPENAI, {"OPENAI_API_KEY": "user-a"})
+        theirs = get_model("gpt-4o", ModelProvider.OPENAI, {"OPENAI_API_KEY": "user-b"})
+
+        assert mine is not theirs
+        assert get_model("gpt-4o", ModelProvider.OPENAI, {"OPENAI_API_KEY": "user-a"}) is mine
+
+    def test_structured_wrapper_per_schema(self, create):
+        signal = get_structured_model("gpt-4o", ModelProvider.OPENAI, None, Signal)
+
+        assert get_structured_model("gpt-4o", ModelProvider.OPENAI, None, Signal) is signal
+        get_structured_model("gpt-4o", ModelProvider.OPENAI, None, OtherSignal)
+        client = get_model("gpt-4o", ModelProvider.OPENAI)
+        assert client.with_structured_output.call_count == 2
+
+    def test_lru_bound(self, create):
+        with patch.dict(os.environ, {"LLM_CLIENT_POOL_SIZE": "2"}):
+            first = get_model("a", ModelProvider.OPENAI)
+            get_model("b", ModelProvider.OPENAI)
+            get_model("c", ModelProvider.OPENAI)
+
+            assert get_model("a", ModelProvider.OPENAI) is not first
+
+    def test_client_per_event_loop(self, create):
+        async def in_loop():
+            return get_model("gpt-4o", ModelProvider.OPENAI)
+
+        assert asyncio.run(in_loop()) is not get_model("gpt-4o", ModelProvider.OPENAI)
+
+    def test_disabled(self, create):
+        with patch.dict(os.environ, {"LLM_CLIENT_POOL": "false"}):
+            assert get_model("gpt-4o", ModelProvider.OPENAI) is not get_model("gpt-4o", ModelProvider.OPENAI)
@@ -0,0 +1,177 @@
+"""
+Tests for the columnar PriceFrame container.
+
+Tests:
+- Vectorized construction from provider DataFrames and cached records
+- Bad OHLCV values rejected, UTC offsets kept in Price.time
+- Sequence compatibility with list[Price] callers
+- prices_to_df fast path and parity with the Price list path
+- get_prices returning PriceFrames from providers and the price store
+"""
+
+import os
+import pytest
+import numpy as np
+import pandas as pd
+from unittest.mock import MagicMock, patch
+
+from src.data.models import Price
+from src.data.price_frame import PriceFrame
+from src.data.price_store import reset_price_store
+
+
+def _provider_df() -> pd.DataFrame:
+    # Unsorted and tz-aware, like an Alpaca bars frame
+    return pd.DataFrame({
+        "time": pd.to_datetime(["2024-01-03T05:00:00Z", "2024-01-02T05:00:00Z", "2024-01-04T05:00:00Z"]),
+        "open": [101.0, 100.0, 102.0],
+        "high": [103.0, 102.0, 104.0],
+        "low": [99.0, 98.0, 100.0],
+        "close": [102.0, 101.0, 103.0],
+        "volume": [2000, 1000, 3000],
+    })
+
+
+class TestPriceFrameConstruction:
+    """Test building frames without per-row objects."""
+
+    def test_from_df_sorts_and_exposes_arrays(self):
+        frame = PriceFrame.from_df(_provider_df(), ticker="AAPL")
+
+        assert len(frame) == 3
+        assert frame.close.tolist() == [101.0, 102.0, 103.0]
+        assert frame.volume.dtype == np.int64
+        assert frame.time_strings() == [
+            "2024-01-02T05:00:00+00:00", "2024-01-03T05:00:00+00:00", "2024-01-04T05:00:00+00:00",
+        ]
+
+    def test_naive_times_stay_naive(self):
+        df = _provider_df()
+        df["time"] = df["time"].dt.tz_convert(None)
+        frame = PriceFrame.from_df(df, ticker="AAPL")
+
+        assert frame.time_strings(0, 1) == ["2024-01-02T05:00:00"]
+        assert frame.to_df().index.tz is None
+
+    def test_utc_offset_kept_in_prices_and_df(self):
+        frame = PriceFrame.from_df(_provider_df(), ticker="AAPL")
+
+        assert frame[0].time == "2024-01-02T05:00:00+00:00"
+        assert frame[1:][0].time == "2024-01-03T05:00:00+00:00"
+        assert str(frame.to_df().index.tz) == "UTC"
+
+    @pytest.mark.parametrize("field, value", [("volume", None), ("close", float("nan")), ("open", "n/a")])
+    def test_missing_ohlcv_rejected(self, field, value):
+        df = _provider_df().astype({field: object})
+        df.loc[1, field] = value
+
+        with pytest.raises(ValueError, match=field):
+            PriceFrame.from_df(df, ticker="AAPL")
+
+    def test_arrays_are_read_only(self):
+        frame = PriceFrame.from_df(_provider_df(), ticker="AAPL")
+        with pytest.raises(ValueError):
+            frame.close[0] = 0.0
+
+    def test_records_round_trip(self):
+        frame = PriceFrame.from_df(_provider_df(), ticker="AAPL")
+        assert PriceFrame.from_records(frame.to_records()) == frame
+        assert frame.to_records()[0] == Price(**frame.to_records()[0]).model_dump()
+
+    def test_empty_frame_is_falsy(self):
+        frame = PriceFrame.empty("AAPL")
+        assert not frame
+        assert frame.to_records() == []
+        assert PriceFrame.from_df(pd.DataFrame(), ticker="AAPL") == frame
+
+
+class TestPriceFrameSequence:
+    """Test list[Price] compatibility."""
+
+    def test_index_and_iterate_yield_prices(self):
+        frame = PriceFrame.from_df(_provider_df(), ticker="AAPL")
+
+        assert isinstance(frame[0], Price)
+        assert frame[-1].close == 103.0
+        assert [p.volume for p in frame] == [1000, 2000, 3000]
+        with pytest.raises(IndexError):
+            frame[3]
+
+    def test_slice_is_a_view(self):
+        frame = PriceFrame.from_df(_provider_df(), ticker="AAPL")
+        tail = frame[-2:]
+
+        assert isinstance(tail, PriceFrame)
+        assert np.shares_memory(tail.close, frame.close)
+        assert [p.close for p in tail] == [102.0, 103.0]
+
+    def test_price_list_is_built_lazily_once(self):
+        frame = PriceFrame.from_df(_provider_df(), ticker="AAPL")
+        assert frame._prices is None
+        assert frame.prices is frame.prices
+
+
+class TestPricesToDf:
+    """Test the prices_to_df fast path."""
+
+    def test_matches_price_list_conversion(self):
+        from src.tools.api import prices_to_df
+
+        frame = PriceFrame.from_df(_provider_df(), ticker="AAPL")
+        from_frame = prices_to_df(frame)
+        from_list = prices_to_df(list(frame))
+
+        assert list(from_frame.columns) == list(from_list.columns)
+        pd.testing.assert_frame_equal(from_frame, from_list, check_index_type=False, check_freq=False)
+
+
+class TestGetPricesReturnsFrame:
+    """Test get_prices returning PriceFrames."""
+
+    def test_fmp_path_builds_frame(self):
+        from src.tools import api
+
+        client = MagicMock()
+        client.is_configured.return_value = True
+        client.get_historical_prices.return_value = _provider_df()
+        api._provider_router.misses.clear()
+        with patch.dict(os.environ, {"PRIMARY_DATA_SOURCE": "fmp", "PRICE_STORE_DIR": ""}), \
+             patch("src.tools.fmp_data.get_fmp_data_client", return_value=client):
+            prices = api.get_prices("AAPL", "2023-04-03", "2023-04-05")
+
+        assert isinstance(prices, PriceFrame)
+        assert [p.close for p in prices] == [101.0, 102.0, 103.0]
+        assert prices[0].ticker == "AAPL"
+
+    def test_bad_fmp_bars_fall_back_to_alpaca(self):
+        from src.tools import api
+
+        bad = _provider_df().astype({"volume": object})
+        bad.loc[0, "volume"] = None
+        fmp, alpaca = MagicMock(), MagicMock()
+        fmp.get_historical_prices.return_value = bad
+        alpaca.get_bars.return_value = _provider_df()
+        api._provider_router.misses.clear()
+        with patch.dict(os.environ, {"PRIMARY_DATA_SOURCE": "fmp", "PRICE_STORE_DIR": ""}), \
+             patch("src.tools.fmp_data.get_fmp_data_client", return_value=fmp), \
+             patch("src.tools.alpaca_data.get_alpaca_data_client", return_value=alpaca):
+            prices = api.get_prices("MSFT", "2023-04-03", "2023-04-05")
+
+        alpaca.get_bars.assert_called_once()
+        assert [p.volume for p in prices] == [1000, 2000, 3000]
+
+    def test_price_store_serves_frame(self, tmp_path):
+        from src.tools import api
+
+        reset_price_store()
+        try:
+            with patch.dict(os.environ, {"PRICE_STORE_DIR": str(tmp_path)}):
+                store = api.get_price_store()
+                store.write("AAPL", "2024-01-01", "2024-01-31", PriceFrame.from_df(_provider_df(), "AAPL").to_records())
+                with patch.object(api, "_fetch_prices") as mock_fetch:
+                    prices = api.get_prices("AAPL", "2024-01-03", "2024-01-10")
+            mock_fetch.assert_not_called()
+            assert isinstance(prices, PriceFrame)
+            assert prices.close.tolist() == [102.0, 103.0]
+        finally:
+            reset_price_store()
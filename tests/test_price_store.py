@@ -0,0 +1,141 @@
+"""
+Tests for the local columnar price store.
+
+Tests:
+- Coverage index and gap detection
+- Append/merge of bars across fetched ranges
+- get_prices serving covered ranges from disk and fetching only gaps
+- Empty gaps only marked covered when they hold no trading days
+"""
+
+import os
+import pytest
+from unittest.mock import patch
+
+from src.data.models import Price
+from src.data.price_store import PriceStore, get_price_store, reset_price_store
+
+
+def _bar(day: str, close: float) -> dict:
+    return {
+        "ticker": "AAPL",
+        "time": f"{day}T00:00:00",
+        "open": close - 1,
+        "high": close + 1,
+        "low": close - 2,
+        "close": close,
+        "volume": 1000,
+    }
+
+
+@pytest.fixture
+def store(tmp_path):
+    return PriceStore(str(tmp_path))
+
+
+class TestPriceStoreCoverage:
+    """Test the interval coverage index."""
+
+    def test_empty_store_reports_full_range_missing(self, store):
+        assert store.missing_ranges("AAPL", "2024-01-01", "2024-01-31") == [("2024-01-01", "2024-01-31")]
+
+    def test_covered_range_has_no_gaps(self, store):
+        store.write("AAPL", "2024-01-01", "2024-01-31", [_bar("2024-01-02", 100.0)])
+        assert store.missing_ranges("AAPL", "2024-01-05", "2024-01-20") == []
+
+    def test_only_uncovered_edges_are_missing(self, store):
+        store.write("AAPL", "2024-01-10", "2024-01-20", [_bar("2024-01-10", 100.0)])
+        gaps = store.missing_ranges("AAPL", "2024-01-01", "2024-01-31")
+        assert gaps == [("2024-01-01", "2024-01-09"), ("2024-01-21", "2024-01-31")]
+
+    def test_adjacent_ranges_merge(self, store):
+        store.write("AAPL", "2024-01-01", "2024-01-10", [_bar("2024-01-02", 100.0)])
+        store.write("AAPL", "2024-01-11", "2024-01-20", [_bar("2024-01-12", 101.0)])
+        assert store.missing_ranges("AAPL", "2024-01-01", "2024-01-20") == []
+
+
+class TestPriceStoreBars:
+    """Test reading and appending bars."""
+
+    def test_read_filters_to_window(self, store):
+        store.write("AAPL", "2024-01-01", "2024-01-31", [
+            _bar("2024-01-02", 100.0),
+            _bar("2024-01-03", 101.0),
+            _bar("2024-01-04", 102.0),
+        ])
+        bars = store.read("AAPL", "2024-01-03", "2024-01-04")
+        assert [b["close"] for b in bars] == [101.0, 102.0]
+        assert bars[0]["time"] == "2024-01-03T00:00:00"
+
+    def test_append_keeps_bars_sorted_and_replaces_same_day(self, store):
+        store.write("AAPL", "2024-01-10", "2024-01-20", [_bar("2024-01-10", 110.0)])
+        store.write("AAPL", "2024-01-01", "2024-01-10", [_bar("2024-01-02", 102.0), _bar("2024-01-10", 111.0)])
+        bars = store.read("AAPL", "2024-01-01", "2024-01-31")
+        assert [b["close"] for b in bars] == [102.0, 111.0]
+
+    def test_bars_round_trip_to_price_model(self, store):
+        store.write("AAPL", "2024-01-01", "2024-01-31", [_bar("2024-01-02", 100.0)])
+        price = Price(**store.read("AAPL", "2024-01-01", "2024-01-31")[0])
+        assert price.close == 100.0
+        assert price.volume == 1000
+
+
+class TestGetPricesWithStore:
+    """Test get_prices routing through the price store."""
+
+    @pytest.fixture(autouse=True)
+    def enable_store(self, tmp_path):
+        reset_price_store()
+        with patch.dict(os.environ, {"PRICE_STORE_DIR": str(tmp_path)}):
+            yield
+        reset_price_store()
+
+    def test_store_disabled_without_env(self):
+        with patch.dict(os.environ, {"PRICE_STORE_DIR": ""}):
+            assert get_price_store() is None
+
+    def test_covered_range_served_without_fetch(self):
+        from src.tools import api
+
+        get_price_store().write("AAPL", "2024-01-01", "2024-01-31", [_bar("2024-01-02", 100.0)])
+        with patch.object(api, "_fetch_prices") as mock_fetch:
+            prices = api.get_prices("AAPL", "2024-01-01", "2024-01-15")
+
+        mock_fetch.assert_not_called()
+        assert len(prices) == 1
+        assert prices[0].close == 100.0
+
+    def test_only_gaps_are_fetched(self):
+        from src.tools import api
+
+        get_price_store().write("AAPL", "2024-01-01", "2024-01-15", [_bar("2024-01-02", 100.0)])
+        with patch.object(api, "_fetch_prices", return_value=[Price(**_bar("2024-01-16", 105.0))]) as mock_fetch:
+            prices = api.get_prices("AAPL", "2024-01-01", "2024-01-20")
+
+        mock_fetch.assert_called_once_with("AAPL", "2024-01-16", "2024-01-20", None)
+        assert [p.close for p in prices] == [100.0, 105.0]
+        assert get_price_store().missing_ranges("AAPL", "2024-01-01", "2024-01-20") == []
+
+    def test_failed_gap_not_marked_covered(self):
+        from src.tools import api
+
+        get_price_store().write("AAPL", "2024-01-08", "2024-01-12", [_bar("2024-01-08", 100.0)])
+
+        def fetch(ticker, start, end, api_key):
+            # First gap fails (provider error swallowed into an empty frame)
+            return [] if start == "2024-01-01" else [Price(**_bar("2024-01-16", 105.0))]
+
+        with patch.object(api, "_fetch_prices", side_effect=fetch):
+            api.get_prices("AAPL", "2024-01-01", "2024-01-20")
+
+        assert get_price_store().missing_ranges("AAPL", "2024-01-01", "2024-01-20") == [("2024-01-01", "2024-01-07")]
+
+    def test_empty_weekend_gap_marked_covered(self):
+        from src.tools import api
+
+        get_price_store().write("AAPL", "2024-01-08", "2024-01-12", [_bar("2024-01-08", 100.0)])
+        with patch.object(api, "_fetch_prices", return_value=[]) as mock_fetch:
+            api.get_prices("AAPL", "2024-01-08", "2024-01-14")
+            api.get_prices("AAPL", "2024-01-08", "2024-01-14")
+
+        mock_fetch.assert_called_once_with("AAPL", "2024-01-13", "2024-01-14", None)
@@ -0,0 +1,206 @@
+"""
+Tests for primary/secondary provider routing with optional hedging.
+
+Tests:
+- Sequential mode keeps the primary → secondary fallback order
+- Hedged mode races the secondary when the primary is slow
+- Outcomes feed the FallbackTracker
+- Hedge delay follows the primary's latency percentile
+- Known provider misses are skipped and re-probed in the background
+- Misses for date-windowed fetches only apply to the same window
+"""
+
+import time
+import pytest
+
+from src.tools.api import FallbackTracker, ProviderMissCache, ProviderRouter
+
+
+def _slow(value, delay):
+    def fetch():
+        time.sleep(delay)
+        return value
+    return fetch
+
+
+@pytest.fixture
+def tracker():
+    return FallbackTracker()
+
+
+@pytest.fixture
+def hedged(monkeypatch):
+    monkeypatch.setenv("HEDGED_REQUESTS", "true")
+
+
+class TestSequentialRouting:
+    """Test the default sequential fallback."""
+
+    def test_primary_success_is_not_fallback(self, tracker, monkeypatch):
+        monkeypatch.delenv("HEDGED_REQUESTS", raising=False)
+        router = ProviderRouter(tracker)
+        result = router.fetch("prices", "AAPL", ("FMP", lambda: ["fmp"]), ("Alpaca", lambda: ["alpaca"]))
+
+        assert result == ["fmp"]
+        assert tracker.get_stats()["fallback_count"] == 0
+
+    def test_secondary_used_when_primary_empty(self, tracker, monkeypatch):
+        monkeypatch.delenv("HEDGED_REQUESTS", raising=False)
+        router = ProviderRouter(tracker)
+        result = router.fetch("prices", "AAPL", ("FMP", lambda: None), ("Alpaca", lambda: ["alpaca"]))
+
+        assert result == ["alpaca"]
+        assert tracker.get_stats()["fallback_count"] == 1
+
+    def test_returns_none_when_both_fail(self, tracker, monkeypatch):
+        monkeypatch.delenv("HEDGED_REQUESTS", raising=False)
+        router = ProviderRouter(tracker)
+        assert router.fetch("news", "AAPL", ("FMP", lambda: None), ("Alpaca", lambda: [])) is None
+
+
+class TestHedgedRouting:
+    """Test hedged requests."""
+
+    def test_slow_primary_is_hedged(self, tracker, hedged):
+        router = ProviderRouter(tracker, default_delay=0.05)
+
+        start = time.time()
+        result = router.fetch("prices", "AAPL", ("FMP", _slow(["fmp"], 1.0)), ("Alpaca", _slow(["alpaca"], 0.05)))
+        elapsed = time.time() - start
+
+        assert result == ["alpaca"]
+        assert elapsed < 0.5
+        stats = router.get_stats()
+        assert stats["hedges_fired"] == 1
+        assert stats["hedges_won"] == 1
+        assert tracker.get_stats()["fallback_count"] == 1
+
+    def test_fast_primary_never_fires_secondary(self, tracker, hedged):
+        router = ProviderRouter(tracker, default_delay=0.5)
+        calls = []
+
+        result = router.fetch("prices", "AAPL", ("FMP", lambda: ["fmp"]), ("Alpaca", lambda: calls.append(1)))
+
+        assert result == ["fmp"]
+        assert calls == []
+        assert router.get_stats()["hedges_fired"] == 0
+
+    def test_primary_can_still_win_after_hedge(self, tracker, hedged):
+        router = ProviderRouter(tracker, default_delay=0.05)
+        result = router.fetch("prices", "AAPL", ("FMP", _slow(["fmp"], 0.1)), ("Alpaca", _slow(None, 0.01)))
+
+        assert result == ["fmp"]
+        assert tracker.get_stats()["fallback_count"] == 0
+
+    def test_empty_primary_falls_through_to_secondary(self, tracker, hedged):
+        router = ProviderRouter(tracker, default_delay=0.5)
+        result = router.fetch("news", "AAPL", ("FMP", lambda: None), ("Alpaca", lambda: ["alpaca"]))
+
+        assert result == ["alpaca"]
+        assert tracker.get_stats()["fallback_count"] == 1
+
+
+class TestHedgeDelay:
+    """Test hedge delay derivation."""
+
+    def test_default_delay_until_enough_samples(self, tracker):
+        router = ProviderRouter(tracker, default_delay=2.0, min_samples=20)
+        for _ in range(5):
+            router._record_latency("prices", "FMP", 0.1)
+        assert router.hedge_delay("prices", "FMP") == 2.0
+
+    def test_delay_tracks_percentile(self, tracker):
+        router = ProviderRouter(tracker, percentile=90, min_delay=0.0, min_samples=10)
+        for i in range(100):
+            router._record_latency("prices", "FMP", i / 100)
+        assert router.hedge_delay("prices", "FMP") == pytest.approx(0.891, abs=0.01)
+
+
+class TestProviderMisses:
+    """Test negative caching of provider misses."""
+
+    @pytest.fixture(autouse=True)
+    def sequential(self, monkeypatch):
+        monkeypatch.delenv("HEDGED_REQUESTS", raising=False)
+        monkeypatch.delenv("PROVIDER_MISS_CACHE", raising=False)
+
+    def test_known_miss_skipped(self, tracker):
+        router = ProviderRouter(tracker)
+        fmp_calls = []
+
+        def fmp():
+            fmp_calls.append(1)
+            return None
+
+        router.fetch("prices", "DELIST", ("FMP", fmp), ("Alpaca", lambda: ["alpaca"]))
+        result = router.fetch("prices", "DELIST", ("FMP", fmp), ("Alpaca", lambda: ["alpaca"]))
+
+        assert result == ["alpaca"]
+        assert fmp_calls == [1]
+        assert router.misses.get("FMP", "prices", "DELIST")["reason"] == ProviderMissCache.NO_DATA
+        # Only the first request counts as a fallback
+        assert tracker.get_stats()["fallback_count"] == 1
+
+    def test_miss_is_per_ticker_and_data_type(self, tracker):
+        router = ProviderRouter(tracker)
+        router.misses.record_miss("FMP", "prices", "DELIST", ProviderMissCache.NO_DATA)
+
+        assert router.fetch("news", "DELIST", ("FMP", lambda: ["fmp"]), ("Alpaca", lambda: None)) == ["fmp"]
+        assert router.fetch("prices", "AAPL", ("FMP", lambda: ["fmp"]), ("Alpaca", lambda: None)) == ["fmp"]
+
+    def test_miss_is_per_window(self, tracker):
+        router = ProviderRouter(tracker)
+        fmp_calls = []
+
+        def fmp(value):
+            def fetch():
+                fmp_calls.append(1)
+                return value
+            return fetch
+
+        weekend = router.fetch(
+            "prices", "AAPL", ("FMP", fmp(None)), ("Alpaca", lambda: None), window=("2024-01-06", "2024-01-07")
+        )
+        weekday = router.fetch(
+            "prices", "AAPL", ("FMP", fmp(["bar"])), ("Alpaca", lambda: None), window=("2024-01-08", "2024-01-12")
+        )
+
+        assert weekend is None
+        assert weekday == ["bar"]
+        assert fmp_calls == [1, 1]
+        assert router.misses.get("FMP", "prices", "AAPL[2024-01-06..2024-01-07]") is not None
+
+    def test_raising_provider_recorded_as_error(self, tracker):
+        router = ProviderRouter(tracker)
+
+        def broken():
+            raise RuntimeError("boom")
+
+        assert router.fetch("prices", "DELIST", ("FMP", broken), ("Alpaca", lambda: None)) is None
+        assert router.misses.get("FMP", "prices", "DELIST")["reason"] == ProviderMissCache.ERROR
+        assert router.misses.get("Alpaca", "prices", "DELIST")["reason"] == ProviderMissCache.NO_DATA
+
+    def test_miss_expires(self, tracker):
+        router = ProviderRouter(tracker, ProviderMissCache(ttl=0.05))
+        router.misses.record_miss("FMP", "prices", "DELIST", ProviderMissCache.NO_DATA)
+        time.sleep(0.1)
+
+        assert router.fetch("prices", "DELIST", ("FMP", lambda: ["fmp"]), ("Alpaca", lambda: None)) == ["fmp"]
+
+    def test_background_probe_clears_recovered_miss(self, tracker):
+        router = ProviderRouter(tracker, ProviderMissCache(probe_interval=0.0))
+        router.misses.record_miss("FMP", "prices", "DELIST", ProviderMissCache.NO_DATA)
+
+        result = router.fetch("prices", "DELIST", ("FMP", lambda: ["fmp"]), ("Alpaca", lambda: ["alpaca"]))
+        router._executor.shutdown(wait=True)
+
+        assert result == ["alpaca"]
+        assert router.misses.get("FMP", "prices", "DELIST") is None
+        assert router.get_stats()["provider_misses"]["recovered"] == 1
+
+    def test_disabled(self, tracker, monkeypatch):
+        monkeypatch.setenv("PROVIDER_MISS_CACHE", "false")
+        router = ProviderRouter(tracker)
+        router.misses.record_miss("FMP", "prices", "DELIST", ProviderMissCache.NO_DATA)
+
+        assert router.fetch("prices", "DELIST", ("FMP", lambda: ["fmp"]), ("Alpaca", lambda: None)) == ["fmp"]
@@ -0,0 +1,143 @@
+"""
+Tests for stale-while-revalidate quote/intraday caching and the market clock.
+
+Tests:
+- Market clock sessions, holidays and open-market seconds
+- Fresh, stale (served + background refresh) and expired entries
+- Per-call staleness bounds
+- Entries kept from the close until the next open, refreshed once after
+  the close when fetched before it
+"""
+
+import pytest
+from datetime import date, datetime, timedelta, timezone
+from unittest.mock import MagicMock, patch
+
+from src.data.cache import RedisCache
+from src.utils import market_clock
+
+
+class _InlineExecutor:
+    """Runs background refreshes synchronously."""
+
+    def submit(self, fn):
+        fn()
+
+
+@pytest.fixture
+def cache():
+    with patch.object(RedisCache, "_connect_redis"):
+        cache = RedisCache()
+    with patch("src.data.cache._get_refresh_executor", return_value=_InlineExecutor()):
+        yield cache
+
+
+@pytest.fixture
+def age():
+    """Market-seconds age reported for every cached entry (no close since the fetch)."""
+    value = [0.0]
+    with patch("src.data.cache.market_seconds_between", side_effect=lambda *a: value[0]), \
+         patch("src.data.cache.last_market_close", return_value=datetime(2000, 1, 3, tzinfo=timezone.utc)):
+        yield value
+
+
+class TestMarketClock:
+    """Test the regular-session calendar."""
+
+    def test_session_hours(self):
+        assert market_clock.is_market_hours(datetime(2026, 10, 16, 10, 0))
+        assert not market_clock.is_market_hours(datetime(2026, 10, 16, 16, 30))
+        assert not market_clock.is_market_hours(datetime(2026, 10, 17, 10, 0))  # Saturday
+
+    def test_holidays(self):
+        holidays = market_clock.market_holidays(2026)
+        assert date(2026, 4, 3) in holidays  # Good Friday
+        assert date(2026, 7, 3) in holidays  # July 4th observed
+        assert date(2026, 11, 26) in holidays  # Thanksgiving
+        assert not market_clock.is_market_hours(datetime(2026, 11, 26, 12, 0))
+
+    def test_market_seconds_skip_closed_time(self):
+        # Friday 15:59 -> Monday 9:31 is two open-market minutes
+        seconds = market_clock.market_seconds_between(datetime(2026, 10, 16, 15, 59), datetime(2026, 10, 19, 9, 31))
+        assert seconds == 120
+
+    def test_seconds_until_elapsed_spans_the_weekend(self):
+        wall = market_clock.seconds_until_market_elapsed(120, datetime(2026, 10, 16, 15, 59))
+        # One minute Friday, then one minute after Monday's open
+        assert wall == (datetime(2026, 10, 19, 9, 31) - datetime(2026, 10, 16, 15, 59)).total_seconds()
+
+    def test_last_close(self):
+        assert market_clock.last_market_close(datetime(2026, 10, 17, 10, 0)).date() == date(2026, 10, 16)  # Saturday
+        assert market_clock.last_market_close(datetime(2026, 10, 16, 15, 59)).date() == date(2026, 10, 15)
+        assert market_clock.last_market_close(datetime(2026, 10, 16, 16, 0)).date() == date(2026, 10, 16)
+
+    def test_next_open_after_holiday(self):
+        assert market_clock.next_market_open(datetime(2026, 11, 26, 12, 0)).date() == date(2026, 11, 27)
+
+
+class TestStaleWhileRevalidate:
+    """Test RedisCache.get_or_refresh and the quote helpers."""
+
+    def test_fresh_entry_served_without_fetch(self, cache, age):
+        fetch = MagicMock(return_value={"price": 1.0})
+        cache.get_quote_or_fetch("AAPL", fetch)
+        age[0] = cache.TTL_QUOTES - 1
+
+        assert cache.get_quote_or_fetch("AAPL", fetch) == {"price": 1.0}
+        assert fetch.call_count == 1
+
+    def test_stale_entry_served_then_refreshed(self, cache, age):
+        fetch = MagicMock(side_effect=[{"price": 1.0}, {"price": 2.0}])
+        cache.get_quote_or_fetch("AAPL", fetch)
+        age[0] = cache.TTL_QUOTES + 1
+
+        assert cache.get_quote_or_fetch("AAPL", fetch) == {"price": 1.0}
+        assert fetch.call_count == 2
+        age[0] = 0
+        assert cache.get_quote("AAPL") == {"price": 2.0}
+        assert cache.get_stats()["stale_while_revalidate"]["refreshes"] == 1
+
+    def test_entry_from_before_the_close_refreshed(self, cache, age):
+        fetch = MagicMock(side_effect=[{"price": 1.0}, {"price": 2.0}])
+        cache.get_quote_or_fetch("AAPL", fetch)
+        age[0] = 30  # 15:59:30 fetch, read on Saturday
+
+        with patch("src.data.cache.last_market_close", return_value=datetime.now(timezone.utc) + timedelta(seconds=1)):
+            assert cache.get_quote_or_fetch("AAPL", fetch) == {"price": 1.0}
+
+        assert fetch.call_count == 2
+        assert cache.get_quote_or_fetch("AAPL", fetch) == {"price": 2.0}
+
+    def test_past_bound_fetched_in_caller(self, cache, age):
+        fetch = MagicMock(side_effect=[{"price": 1.0}, {"price": 2.0}])
+        cache.get_quote_or_fetch("AAPL", fetch)
+        age[0] = cache.MAX_STALE_QUOTES + 1
+
+        assert cache.get_quote_or_fetch("AAPL", fetch) == {"price": 2.0}
+
+    def test_per_call_bound(self, cache, age):
+        fetch = MagicMock(side_effect=[{"price": 1.0}, {"price": 2.0}])
+        cache.get_quote_or_fetch("AAPL", fetch)
+        age[0] = 10
+
+        assert cache.get_quote_or_fetch("AAPL", fetch, max_staleness=5) == {"price": 2.0}
+
+    def test_failed_fetch_not_cached(self, cache, age):
+        fetch = MagicMock(side_effect=[None, {"price": 2.0}])
+
+        assert cache.get_quote_or_fetch("AAPL", fetch) is None
+        assert cache.get_quote_or_fetch("AAPL", fetch) == {"price": 2.0}
+
+    def test_quote_kept_until_bound_elapses_in_market_time(self, cache):
+        with patch("src.data.cache.seconds_until_market_elapsed", return_value=60000) as until, \
+             patch.object(cache, "_set_many") as set_many:
+            cache.set_quote("AAPL", {"price": 1.0})
+
+        until.assert_called_once_with(cache.MAX_STALE_QUOTES)
+        assert set_many.call_args.args[1] == 60000
+
+    def test_get_quotes_many_unwraps(self, cache):
+        cache.set_quotes_many({"AAPL": {"price": 1.0}})
+        cache._l1.set("quote:MSFT", {"price": 2.0}, ttl=60)  # written without a fetch time
+
+        assert cache.get_quotes_many(["AAPL", "MSFT"]) == {"AAPL": {"price": 1.0}, "MSFT": {"price": 2.0}}
@@ -0,0 +1,133 @@
+"""
+Tests for the run-scoped agent data context.
+
+Tests:
+- Contexts are shared per workflow id and released at the end of a run
+- Memoized results serve repeat and smaller-limit requests
+- Line item requests are unioned into one fetch per ticker, per run
+"""
+
+import pytest
+from unittest.mock import patch
+
+from src.data.models import FinancialMetrics, LineItem
+from src.data.run_context import (
+    RunDataContext,
+    get_data_context,
+    release_data_context,
+    reset_data_contexts,
+)
+from src.tools import api
+
+
+@pytest.fixture(autouse=True)
+def fresh_contexts():
+    reset_data_contexts()
+    yield
+    reset_data_contexts()
+
+
+def _line_item(**fields) -> LineItem:
+    return LineItem(ticker="AAPL", report_period="2024-09-30", period="ttm", currency="USD", **fields)
+
+
+def _metrics(n: int) -> list:
+    return [
+        FinancialMetrics.model_construct(ticker="AAPL", report_period=f"2024-0{i + 1}-01", period="ttm")
+        for i in range(n)
+    ]
+
+
+class TestContextRegistry:
+    """Test workflow-id keyed context lookup."""
+
+    def test_same_workflow_shares_context(self):
+        state = {"metadata": {"workflow_id": "wf-1"}, "data": {}}
+        assert get_data_context(state) is get_data_context(state)
+
+    def test_different_workflows_get_separate_contexts(self):
+        a = get_data_context({"metadata": {"workflow_id": "wf-1"}})
+        b = get_data_context({"metadata": {"workflow_id": "wf-2"}})
+        assert a is not b
+
+    def test_release_drops_context(self):
+        state = {"metadata": {"workflow_id": "wf-1"}}
+        context = get_data_context(state)
+        assert release_data_context("wf-1")["workflow_id"] == "wf-1"
+        assert get_data_context(state) is not context
+
+
+class TestMemoization:
+    """Test repeat requests are served from the context."""
+
+    def test_smaller_limit_served_from_larger_fetch(self):
+        context = RunDataContext("wf")
+        with patch.object(api, "get_financial_metrics", return_value=_metrics(10)) as mock_fetch:
+            context.get_financial_metrics("AAPL", "2024-12-31", period="ttm", limit=10)
+            result = context.get_financial_metrics("AAPL", "2024-12-31", period="ttm", limit=5)
+
+        mock_fetch.assert_called_once()
+        assert len(result) == 5
+        assert context.get_stats()["hits"] == 1
+
+    def test_larger_limit_refetches(self):
+        context = RunDataContext("wf")
+        with patch.object(api, "get_financial_metrics", side_effect=[_metrics(5), _metrics(10)]) as mock_fetch:
+            context.get_financial_metrics("AAPL", "2024-12-31", limit=5)
+            result = context.get_financial_metrics("AAPL", "2024-12-31", limit=10)
+
+        assert mock_fetch.call_count == 2
+        assert len(result) == 10
+
+    def test_empty_results_are_not_pinned(self):
+        context = RunDataContext("wf")
+        with patch.object(api, "get_market_cap", side_effect=[None, 1e12]) as mock_fetch:
+            assert context.get_market_cap("AAPL", "2024-12-31") is None
+            assert context.get_market_cap("AAPL", "2024-12-31") == 1e12
+        assert mock_fetch.call_count == 2
+
+
+class TestLineItemUnion:
+    """Test line item requests across agents share one fetch."""
+
+    def test_union_of_known_fields_is_fetched(self):
+        context = RunDataContext("wf")
+        item = _line_item(revenue=1.0, net_income=2.0, free_cash_flow=3.0)
+
+        with patch.object(api, "search_line_items", return_value=[item]) as mock_fetch:
+            # First ticker teaches the union; the second ticker fetches it in one call
+            context.search_line_items("MSFT", ["revenue", "net_income"], "2024-12-31")
+            context.search_line_items("MSFT", ["free_cash_flow"], "2024-12-31")
+            mock_fetch.reset_mock()
+
+            first = context.search_line_items("AAPL", ["revenue"], "2024-12-31")
+            second = context.search_line_items("AAPL", ["net_income", "free_cash_flow"], "2024-12-31")
+
+        mock_fetch.assert_called_once()
+        assert mock_fetch.call_args.args[1] == ["free_cash_flow", "net_income", "revenue"]
+        assert first[0].revenue == 1.0
+        assert not hasattr(first[0], "net_income")
+        assert second[0].free_cash_flow == 3.0
+
+    def test_union_not_shared_between_runs(self):
+        item = _line_item(revenue=1.0, net_income=2.0)
+
+        with patch.object(api, "search_line_items", return_value=[item]) as mock_fetch:
+            RunDataContext("wf-1").search_line_items("MSFT", ["net_income"], "2024-12-31")
+            RunDataContext("wf-2").search_line_items("AAPL", ["revenue"], "2024-12-31")
+
+        assert mock_fetch.call_args.args[1] == ["revenue"]
+
+    def test_falls_back_to_requested_fields_when_union_fails(self):
+        context = RunDataContext("wf")
+        item = _line_item(revenue=1.0)
+
+        with patch.object(api, "search_line_items", return_value=[item]):
+            context.search_line_items("MSFT", ["bogus_field"], "2024-12-31")
+
+        with patch.object(api, "search_line_items", side_effect=[[], [item]]) as mock_fetch:
+            result = context.search_line_items("AAPL", ["revenue"], "2024-12-31")
+
+        assert mock_fetch.call_count == 2
+        assert mock_fetch.call_args.args[1] == ["revenue"]
+        assert result[0].revenue == 1.0
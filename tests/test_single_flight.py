@@ -0,0 +1,137 @@
+"""
+Tests for single-flight coalescing of concurrent data fetches.
+
+Tests:
+- Concurrent identical calls share one underlying fetch
+- Distinct keys fetch independently
+- Errors propagate to every waiting caller
+- Public api.py fetchers coalesce on normalized arguments
+"""
+
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+from src.tools.api import SingleFlight
+
+
+def _run_concurrently(n: int, target):
+    """Start n threads on target behind a barrier and collect results/errors."""
+    barrier = threading.Barrier(n)
+    results, errors = [], []
+
+    def worker():
+        barrier.wait()
+        try:
+            results.append(target())
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker) for _ in range(n)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join(timeout=5)
+    return results, errors
+
+
+class TestSingleFlight:
+    """Test the SingleFlight group directly."""
+
+    def test_concurrent_identical_calls_share_one_fetch(self):
+        group = SingleFlight()
+        calls = []
+
+        def fetch():
+            calls.append(1)
+            time.sleep(0.1)
+            return ["bar"]
+
+        results, errors = _run_concurrently(8, lambda: group.do(("prices", "AAPL"), fetch))
+
+        assert errors == []
+        assert len(calls) == 1
+        assert results == [["bar"]] * 8
+        stats = group.get_stats()
+        assert stats["fetches"] == 1
+        assert stats["coalesced"] == 7
+        assert stats["in_flight"] == 0
+
+    def test_followers_get_independent_lists(self):
+        group = SingleFlight()
+        results, _ = _run_concurrently(4, lambda: group.do(("k",), lambda: time.sleep(0.1) or [1, 2]))
+        results[0].append(3)
+        assert all(r == [1, 2] for r in results[1:])
+
+    def test_distinct_keys_fetch_independently(self):
+        group = SingleFlight()
+        assert group.do(("a",), lambda: 1) == 1
+        assert group.do(("b",), lambda: 2) == 2
+        assert group.get_stats()["fetches"] == 2
+
+    def test_error_propagates_to_all_waiters(self):
+        group = SingleFlight()
+
+        def fetch():
+            time.sleep(0.1)
+            raise ValueError("provider down")
+
+        results, errors = _run_concurrently(4, lambda: group.do(("k",), fetch))
+
+        assert results == []
+        assert len(errors) == 4
+        assert all(isinstance(e, ValueError) for e in errors)
+
+    def test_completed_call_is_not_retained(self):
+        group = SingleFlight()
+        calls = []
+        group.do(("k",), lambda: calls.append(1))
+        group.do(("k",), lambda: calls.append(1))
+        assert len(calls) == 2
+
+
+class TestApiCoalescing:
+    """Test coalescing through the public api.py fetchers."""
+
+    def test_search_line_items_ignores_line_item_order(self):
+        from src.tools import api
+
+        def slow_request(*args, **kwargs):
+            time.sleep(0.1)
+            return MagicMock(status_code=404)
+
+        orders = [["revenue", "net_income"], ["net_income", "revenue"]]
+        counter = iter(range(100))
+        counter_lock = threading.Lock()
+
+        def call():
+            with counter_lock:
+                items = orders[next(counter) % 2]
+            return api.search_line_items("AAPL", items, "2024-12-31")
+
+        with patch.object(api, "_make_api_request", side_effect=slow_request) as mock_request:
+            results, errors = _run_concurrently(6, call)
+
+        assert errors == []
+        assert results == [[]] * 6
+        mock_request.assert_called_once()
+
+    def test_different_tickers_are_not_coalesced(self):
+        from src.tools import api
+
+        def slow_request(*args, **kwargs):
+            time.sleep(0.1)
+            return MagicMock(status_code=404)
+
+        tickers = iter(["AAPL", "MSFT"])
+        ticker_lock = threading.Lock()
+
+        def call():
+            with ticker_lock:
+                ticker = next(tickers)
+            return api.search_line_items(ticker, ["revenue"], "2024-12-31")
+
+        with patch.object(api, "_make_api_request", side_effect=slow_request) as mock_request:
+            _run_concurrently(2, call)
+
+        assert mock_request.call_count == 2
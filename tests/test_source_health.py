@@ -0,0 +1,178 @@
+"""
+Tests for data source health tracking and latency-aware routing.
+
+Tests:
+- Circuit breaker transitions (closed -> open -> half-open -> closed/open)
+- Error-rate tripping over the rolling window
+- Expected latency ranking
+- MultiSourceDataProvider routing around open circuits and slow sources
+- Client errors swallowed into empty results counted as failures, genuinely
+  empty answers as successes
+"""
+
+import os
+import pytest
+import pandas as pd
+from unittest.mock import patch
+
+from src.tools import data_providers
+from src.tools.data_providers import CircuitState, DataSource, MultiSourceDataProvider, SourceHealth
+from src.tools.provider_errors import collect_provider_errors, report_provider_error
+
+
+@pytest.fixture
+def clock():
+    now = [1000.0]
+    with patch("src.tools.data_providers.time.time", side_effect=lambda: now[0]):
+        yield now
+
+
+class TestSourceHealth:
+    """Test the per source breaker and statistics."""
+
+    def test_opens_after_consecutive_failures(self, clock):
+        health = SourceHealth(failure_threshold=3)
+        for _ in range(2):
+            health.record(0.1, success=False)
+        assert health.state == CircuitState.CLOSED
+
+        health.record(0.1, success=False)
+        assert health.state == CircuitState.OPEN
+        assert not health.allow_request()
+
+    def test_half_open_allows_one_probe(self, clock):
+        health = SourceHealth(failure_threshold=1, open_timeout=60)
+        health.record(0.1, success=False)
+
+        clock[0] += 61
+        assert health.state == CircuitState.HALF_OPEN
+        assert health.allow_request()
+        assert not health.allow_request()
+
+        health.record(0.1, success=True)
+        assert health.state == CircuitState.CLOSED
+        assert health.allow_request()
+
+    def test_failed_probe_reopens(self, clock):
+        health = SourceHealth(failure_threshold=1, open_timeout=60)
+        health.record(0.1, success=False)
+        clock[0] += 61
+        assert health.allow_request()
+
+        health.record(0.1, success=False)
+        assert health.state == CircuitState.OPEN
+        assert health.get_stats()["times_opened"] == 2
+
+    def test_opens_on_error_rate(self, clock):
+        health = SourceHealth(failure_threshold=10, error_rate_threshold=0.5, min_requests=10)
+        for _ in range(5):
+            health.record(0.1, success=True)
+            health.record(0.1, success=False)
+
+        assert health.state == CircuitState.OPEN
+
+    def test_expected_latency_uses_prior_until_measured(self):
+        health = SourceHealth()
+        health.record(0.2, success=True)
+        assert health.expected_latency(prior=1.0) == 1.0
+
+        for _ in range(3):
+            health.record(0.2, success=True)
+        assert health.expected_latency(prior=1.0) == pytest.approx(0.2)
+
+    def test_expected_latency_penalises_errors(self):
+        health = SourceHealth(failure_threshold=10, min_requests=100)
+        for _ in range(3):
+            health.record(0.2, success=True)
+            health.record(0.2, success=False)
+
+        assert health.expected_latency(prior=1.0) == pytest.approx(0.4)
+
+
+class TestLatencyRouting:
+    """Test MultiSourceDataProvider routing on source health."""
+
+    @pytest.fixture
+    def provider(self):
+        provider = MultiSourceDataProvider.__new__(MultiSourceDataProvider)
+        provider._rate_limit_tracker = {}
+        provider._health = {}
+        provider._health_lock = data_providers.Lock()
+        provider._failure_cooldown = data_providers.timedelta(minutes=5)
+        provider._available_sources = [DataSource.FMP, DataSource.YFINANCE, DataSource.ALPACA_DATA]
+        return provider
+
+    @pytest.fixture(autouse=True)
+    def env(self):
+        with patch.dict(os.environ, {"PRIMARY_DATA_SOURCE": "fmp", "DATA_SOURCE_LATENCY_ROUTING": "true"}):
+            yield
+
+    def test_primary_first_until_measured(self, provider):
+        sources = provider.get_routing_order("prices")
+        assert sources[0] == DataSource.FMP
+
+    def test_faster_source_preferred(self, provider):
+        for _ in range(3):
+            provider._health_for(DataSource.FMP, "prices").record(2.0, success=True)
+            provider._health_for(DataSource.YFINANCE, "prices").record(0.3, success=True)
+
+        sources = provider.get_routing_order("prices")
+        assert sources.index(DataSource.YFINANCE) < sources.index(DataSource.FMP)
+
+    def test_open_circuit_excluded_per_data_type(self, provider):
+        for _ in range(3):
+            provider._health_for(DataSource.FMP, "prices").record(0.1, success=False)
+
+        assert DataSource.FMP not in provider.get_routing_order("prices")
+        assert DataSource.FMP in provider.get_routing_order("news")
+
+    def test_get_prices_falls_back_and_records(self, provider):
+        df = pd.DataFrame({"close": [1.0]})
+        with patch.object(provider, "_get_prices_fmp", side_effect=RuntimeError("down")), \
+             patch.object(provider, "_get_prices_alpaca", return_value=df), \
+             patch.object(provider, "_get_prices_yfinance", return_value=df):
+            result, source = provider.get_prices("AAPL", "2024-01-01", "2024-01-05")
+
+        assert source != DataSource.FMP and not result.empty
+        stats = provider.get_source_stats()
+        assert stats["fmp"]["prices"]["error_rate"] == 1.0
+        assert stats[source.value]["prices"]["requests"] == 1
+
+    def test_empty_news_for_many_tickers_keeps_circuit_closed(self, provider):
+        with patch.object(provider, "_get_news_fmp", return_value=[]), \
+             patch.object(provider, "_get_news_alpaca", return_value=[]):
+            for ticker in ("SPY", "QQQ", "IWM", "DIA", "GLD"):
+                provider.get_news(ticker)
+
+        stats = provider.get_source_stats()["fmp"]["news"]
+        assert stats["error_rate"] == 0.0
+        assert stats["state"] == CircuitState.CLOSED.value
+        assert DataSource.FMP in provider.get_routing_order("news")
+
+    def test_swallowed_client_error_counts_as_failure(self, provider):
+        def rate_limited(*args):
+            report_provider_error("fmp: FMP API rate limited (429)")
+            return pd.DataFrame()
+
+        df = pd.DataFrame({"close": [1.0]})
+        with patch.object(provider, "_get_prices_fmp", side_effect=rate_limited), \
+             patch.object(provider, "_get_prices_alpaca", return_value=df), \
+             patch.object(provider, "_get_prices_yfinance", return_value=df):
+            for _ in range(3):
+                result, source = provider.get_prices("AAPL", "2024-01-01", "2024-01-05")
+                assert source != DataSource.FMP and not result.empty
+
+        stats = provider.get_source_stats()["fmp"]["prices"]
+        assert stats["error_rate"] == 1.0
+        assert stats["state"] == CircuitState.OPEN.value
+        assert DataSource.FMP not in provider.get_routing_order("prices")
+
+    def test_fmp_client_reports_swallowed_errors(self):
+        from src.tools.fmp_data import FMPDataClient
+
+        client = FMPDataClient(api_key="test-api-key")
+        with patch.object(client, "_send", side_effect=Exception("FMP API rate limited (429)")), \
+             collect_provider_errors() as errors:
+            assert client.get_key_metrics("AAPL") == []
+
+        assert errors == ["fmp: FMP API rate limited (429)"]
@@ -9,6 +9,13 @@ from datetime import datetime
 class TestGetQuote:
     """Tests for AlpacaService.get_quote()"""
     
+    @pytest.fixture(autouse=True)
+    def empty_quote_cache(self):
+        """Quotes are cached; start every test from a cold in-process cache."""
+        from tests.fake_redis import fake_cache
+        with patch("src.data.cache.get_cache", return_value=fake_cache()):
+            yield
+    
     def test_get_quote_success(self):
         """Test successful quote fetch."""
         from src.trading.alpaca_service import AlpacaService
@@ -25,7 +32,7 @@ class TestGetQuote:
             }
         }
         
-        with patch('src.trading.alpaca_service.requests.get', return_value=mock_response):
+        with patch('requests.Session.get', return_value=mock_response):
             service = AlpacaService.__new__(AlpacaService)
             service.api_key = "test-key"
             service.secret_key = "test-secret"
@@ -48,7 +55,7 @@ class TestGetQuote:
         mock_response = Mock()
         mock_response.status_code = 404
         
-        with patch('src.trading.alpaca_service.requests.get', return_value=mock_response):
+        with patch('requests.Session.get', return_value=mock_response):
             service = AlpacaService.__new__(AlpacaService)
             service.api_key = "test-key"
             service.secret_key = "test-secret"
@@ -62,7 +69,7 @@ class TestGetQuote:
         """Test quote returns None on network error."""
         from src.trading.alpaca_service import AlpacaService
         
-        with patch('src.trading.alpaca_service.requests.get', side_effect=Exception("Network error")):
+        with patch('requests.Session.get', side_effect=Exception("Network error")):
             service = AlpacaService.__new__(AlpacaService)
             service.api_key = "test-key"
             service.secret_key = "test-secret"
@@ -90,7 +97,7 @@ class TestGetLastTrade:
             }
         }
         
-        with patch('src.trading.alpaca_service.requests.get', return_value=mock_response):
+        with patch('requests.Session.get', return_value=mock_response):
             service = AlpacaService.__new__(AlpacaService)
             service.api_key = "test-key"
             service.secret_key = "test-secret"
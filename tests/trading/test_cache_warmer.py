@@ -0,0 +1,134 @@
+"""
+Tests for the pre-market cache warmer
+
+Covers:
+- get_warm_universe: Positions and watchlist always included, no duplicates
+- warm_cache_for_universe: Per data type coverage and failures reported,
+  concurrency capped by the aggregator's per-provider limits
+- get_company_news: FMP/Alpaca results cached so warmed news is reused
+"""
+
+import os
+import threading
+import time
+import pytest
+from unittest.mock import MagicMock, patch
+
+from src.trading import cache_warmer
+
+
+@pytest.fixture
+def no_prices_or_scores():
+    with patch.object(cache_warmer, "_warm_prices", return_value={}), \
+         patch.object(cache_warmer, "_warm_danelfin", return_value={}):
+        yield
+
+
+class TestWarmUniverse:
+    """Test building the universe to warm."""
+
+    def test_positions_and_watchlist_first_without_duplicates(self):
+        service = MagicMock()
+        service.alpaca.get_positions.return_value = [MagicMock(symbol="AAPL")]
+        service._get_screening_universe.return_value = ["AAPL", "MSFT", "NVDA"]
+        watchlist = MagicMock()
+        watchlist.get_watchlist.return_value = [MagicMock(ticker="TSLA"), MagicMock(ticker="AAPL")]
+
+        with patch("src.trading.automated_trading.get_automated_trading_service", return_value=service), \
+             patch("src.trading.watchlist_service.get_watchlist_service", return_value=watchlist):
+            tickers = cache_warmer.get_warm_universe()
+
+        assert tickers == ["AAPL", "TSLA", "MSFT", "NVDA"]
+
+    def test_screening_failure_keeps_positions(self):
+        service = MagicMock()
+        service.alpaca.get_positions.return_value = [MagicMock(symbol="AAPL")]
+        service._get_screening_universe.side_effect = RuntimeError("alpaca down")
+
+        with patch("src.trading.automated_trading.get_automated_trading_service", return_value=service), \
+             patch("src.trading.watchlist_service.get_watchlist_service", side_effect=ImportError):
+            assert cache_warmer.get_warm_universe() == ["AAPL"]
+
+
+class TestWarmCacheForUniverse:
+    """Test the warm-up fan-out and coverage report."""
+
+    def test_coverage_per_data_type(self, no_prices_or_scores):
+        from src.tools import api
+
+        with patch.object(api, "get_financial_metrics", side_effect=lambda t, *a, **k: [1] if t == "AAPL" else []), \
+             patch.object(api, "get_company_profile", return_value={"symbol": "X"}):
+            report = cache_warmer.warm_cache_for_universe(
+                ["AAPL", "MSFT"], ("financial_metrics", "profiles"), end_date="2024-03-01"
+            )
+
+        assert report["coverage"] == {"financial_metrics": 0.5, "profiles": 1.0}
+        assert report["overall_coverage"] == 0.75
+        assert report["missing"] == {"financial_metrics": ["MSFT"]}
+
+    def test_both_periods_warmed_for_end_date(self, no_prices_or_scores):
+        from src.tools import api
+
+        with patch.object(api, "get_financial_metrics", return_value=[1]) as get_metrics:
+            cache_warmer.warm_cache_for_universe(["AAPL"], ("financial_metrics",), end_date="2024-03-01")
+
+        periods = sorted(call.kwargs["period"] for call in get_metrics.call_args_list)
+        assert periods == ["annual", "ttm"]
+        assert all(call.args[1] == "2024-03-01" for call in get_metrics.call_args_list)
+
+    def test_errors_reported_not_raised(self, no_prices_or_scores):
+        from src.tools import api
+
+        with patch.object(api, "get_company_profile", side_effect=RuntimeError("429")):
+            report = cache_warmer.warm_cache_for_universe(["AAPL"], ("profiles",), end_date="2024-03-01")
+
+        assert report["coverage"] == {"profiles": 0.0}
+        assert report["errors"] == ["AAPL profiles: 429"]
+
+    def test_provider_limits_shared_with_aggregator(self, no_prices_or_scores):
+        from src.tools import api
+        from src.utils import data_aggregator
+
+        active, peak = [0], [0]
+        lock = threading.Lock()
+
+        def profile(ticker):
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.05)
+            with lock:
+                active[0] -= 1
+            return {"symbol": ticker}
+
+        with patch.dict(os.environ, {"CACHE_WARM_MAX_WORKERS": "4"}), \
+             patch.object(api, "get_company_profile", side_effect=profile), \
+             patch.object(data_aggregator, "get_provider_for", return_value="fmp") as provider_for, \
+             patch.object(data_aggregator, "get_provider_limits", return_value={"fmp": threading.BoundedSemaphore(1)}):
+            cache_warmer.warm_cache_for_universe(["A", "B", "C", "D"], ("profiles",), end_date="2024-03-01")
+
+        assert peak[0] == 1
+        provider_for.assert_called_with("profiles")
+
+    def test_prices_cover_every_window(self):
+        with patch.object(cache_warmer, "_price_windows", return_value=["2024-01-01", "2024-02-01"]), \
+             patch("src.tools.api.get_prices_many", side_effect=[{"AAPL": [1], "MSFT": [1]}, {"AAPL": [1]}]):
+            report = cache_warmer.warm_cache_for_universe(["AAPL", "MSFT"], ("prices",), end_date="2024-03-01")
+
+        assert report["coverage"] == {"prices": 0.5}
+
+
+class TestNewsCaching:
+    """Test that provider-routed news is cached for the warm-up to be useful."""
+
+    def test_fmp_news_served_from_cache_on_second_call(self):
+        from src.tools import api
+
+        article = api.CompanyNews(ticker="ZZNW", title="t", source="s", url="u", date="2024-03-01")
+        with patch.dict(os.environ, {"PRIMARY_DATA_SOURCE": "fmp"}), \
+             patch.object(api._provider_router, "fetch", return_value=[article]) as fetch:
+            api.get_company_news("ZZNW", "2024-03-01", limit=50)
+            news = api.get_company_news("ZZNW", "2024-03-01", limit=50)
+
+        assert fetch.call_count == 1
+        assert [n.title for n in news] == ["t"]